@@ -1,11 +1,12 @@
 """ABR Run Log Pull."""
 from typing import Set, Dict, Any
 import argparse
+import asyncio
 import os
 import json
 import requests
 import sys
-from abr_testing.data_collection import read_robot_logs
+from abr_testing.data_collection import read_robot_logs, run_log_collector
 from abr_testing.automation import google_drive_tool
 
 
@@ -94,6 +95,7 @@ def get_all_run_logs(storage_directory: str) -> None:
     Connect to each ABR robot to read run log data.
     Read each robot's list of unique run log IDs and compare them to all IDs in storage.
     Any ID that is not in storage, download the run log and put it in storage.
+    Robots are read concurrently, see `run_log_collector.collect_run_logs`.
     """
     ip_json_file = os.path.join(storage_directory, "IPs.json")
     try:
@@ -103,14 +105,12 @@ def get_all_run_logs(storage_directory: str) -> None:
         sys.exit()
     ip_address_list = ip_file["ip_address_list"]
     runs_from_storage = read_robot_logs.get_run_ids_from_google_drive(google_drive)
-    for ip in ip_address_list:
-        try:
-            runs = get_run_ids_from_robot(ip)
-            runs_to_save = read_robot_logs.get_unseen_run_ids(runs, runs_from_storage)
-            save_runs(runs_to_save, ip, storage_directory)
-            google_drive.upload_missing_files(storage_directory)
-        except Exception:
-            print(f"ERROR: Failed to read IP address: {ip}.")
+    asyncio.run(
+        run_log_collector.collect_run_logs(
+            ip_address_list, storage_directory, skip_run_ids=runs_from_storage
+        )
+    )
+    google_drive.upload_missing_files(storage_directory)
 
 
 if __name__ == "__main__":
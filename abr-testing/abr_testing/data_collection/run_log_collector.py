@@ -0,0 +1,237 @@
+"""Concurrent, incremental run log collection from ABR robots."""
+from typing import Any, Dict, Iterable, List, Optional, Set
+import asyncio
+import json
+import os
+import aiohttp
+from abr_testing.data_collection import read_robot_logs
+
+ROBOT_PORT = 31950
+HEADERS = {"opentrons-version": "3"}
+# Not a .json file, so that it isn't mistaken for a run log or uploaded with them.
+RUN_INDEX_FILE_NAME = ".run_index"
+
+
+class RunIndex:
+    """A local record of every run log that has already been saved.
+
+    The index is a single JSON file in the storage directory, so checking for new
+    runs doesn't require opening every run log in storage. If the index doesn't
+    exist yet, it is built once from the run logs that are already in storage.
+    """
+
+    def __init__(self, storage_directory: str) -> None:
+        """Load the index for a storage directory."""
+        self._path = os.path.join(storage_directory, RUN_INDEX_FILE_NAME)
+        self._run_files: Dict[str, str] = {}
+        if os.path.exists(self._path):
+            with open(self._path) as index_file:
+                self._run_files = json.load(index_file)
+        else:
+            for file_name in os.listdir(storage_directory):
+                if file_name.endswith(".json"):
+                    with open(os.path.join(storage_directory, file_name)) as run_file:
+                        file_results = json.load(run_file)
+                    # The storage directory also holds config files, like IPs.json.
+                    if isinstance(file_results, dict) and file_results.get("run_id"):
+                        self._run_files[file_results["run_id"]] = file_name
+
+    @property
+    def run_ids(self) -> Set[str]:
+        """The IDs of every run that has been saved."""
+        return set(self._run_files)
+
+    def add(self, run_id: str, saved_file_path: str) -> None:
+        """Record a saved run, and write the index to storage straight away.
+
+        That way, runs saved before an interrupted collection aren't downloaded
+        again by the next one.
+        """
+        self._run_files[run_id] = os.path.basename(saved_file_path)
+        self.save()
+
+    def save(self) -> None:
+        """Write the index to storage.
+
+        The index is replaced in one step, so it's never left half-written.
+        """
+        temporary_path = self._path + ".tmp"
+        with open(temporary_path, mode="w") as index_file:
+            json.dump(self._run_files, index_file)
+        os.replace(temporary_path, self._path)
+
+
+class RobotClient:
+    """Read run data from one robot, with a limit on concurrent requests."""
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        ip: str,
+        port: int = ROBOT_PORT,
+        max_concurrent_requests: int = 4,
+        page_length: int = 100,
+    ) -> None:
+        """Create a client for the robot at `ip`."""
+        self.ip = ip
+        self._session = session
+        self._base_url = f"http://{ip}:{port}"
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
+        self._page_length = page_length
+        self._robot_info: Optional[Dict[str, Any]] = None
+        self._robot_info_lock = asyncio.Lock()
+
+    async def _get(self, path: str, **params: int) -> Dict[str, Any]:
+        async with self._semaphore:
+            async with self._session.get(
+                self._base_url + path, headers=HEADERS, params=params
+            ) as response:
+                response.raise_for_status()
+                data: Dict[str, Any] = await response.json()
+                return data
+
+    async def get_run_ids(self) -> Set[str]:
+        """Get all completed runs from the robot."""
+        run_data = await self._get("/runs")
+        return {run["id"] for run in run_data["data"] if not run["current"]}
+
+    async def get_commands(self, run_id: str) -> List[Dict[str, Any]]:
+        """Get all of a run's commands, fetching pages in parallel."""
+        path = f"/runs/{run_id}/commands"
+        first_page = await self._get(path, cursor=0, pageLength=0)
+        command_count = first_page["meta"]["totalLength"]
+        pages = await asyncio.gather(
+            *(
+                self._get(path, cursor=cursor, pageLength=self._page_length)
+                for cursor in range(0, command_count, self._page_length)
+            )
+        )
+        return [command for page in pages for command in page["data"]]
+
+    async def get_robot_info(self) -> Dict[str, Any]:
+        """Get the robot's health and attached instruments.
+
+        These describe the robot rather than any run,
+        so they are only fetched once per client.
+        """
+        async with self._robot_info_lock:
+            if self._robot_info is None:
+                health_data, instrument_data = await asyncio.gather(
+                    self._get("/health"), self._get("/instruments")
+                )
+                robot_info = {
+                    "robot_name": health_data.get("name", ""),
+                    "API_Version": health_data.get("api_version", ""),
+                    "robot_serial": health_data.get("robot_serial", ""),
+                }
+                for instrument in instrument_data["data"]:
+                    robot_info[instrument["mount"]] = instrument["serialNumber"]
+                self._robot_info = robot_info
+            return self._robot_info
+
+    async def get_run_data(self, run_id: str) -> Dict[str, Any]:
+        """Get command, health, and protocol data for a run.
+
+        The result matches `get_run_logs.get_run_data`.
+        """
+        commands, run_meta_data, robot_info = await asyncio.gather(
+            self.get_commands(run_id),
+            self._get(f"/runs/{run_id}"),
+            self.get_robot_info(),
+        )
+        protocol_data = await self._get(
+            f"/protocols/{run_meta_data['data']['protocolId']}"
+        )
+        run: Dict[str, Any] = {"commands": commands}
+        run.update(run_meta_data["data"])
+        run["protocol"] = protocol_data["data"]
+        run.update(robot_info)
+        run["run_id"] = run_id
+        return run
+
+
+async def collect_robot_run_logs(
+    client: RobotClient,
+    storage_directory: str,
+    run_index: RunIndex,
+    skip_run_ids: Iterable[str] = (),
+) -> Set[str]:
+    """Save every run from one robot that isn't in the index or `skip_run_ids`.
+
+    Each run is saved and indexed as soon as it has been read. A run that
+    can't be read, like one whose protocol was deleted, is reported and skipped.
+    """
+    run_ids = await client.get_run_ids()
+    runs_to_save = read_robot_logs.get_unseen_run_ids(
+        run_ids, run_index.run_ids | set(skip_run_ids)
+    )
+
+    async def save_run(run_id: str) -> Optional[str]:
+        try:
+            data = await client.get_run_data(run_id)
+        except Exception as error:
+            print(
+                f"ERROR: Failed to read run {run_id} from robot"
+                f" with IP address {client.ip}: {error}"
+            )
+            return None
+        saved_file_path = read_robot_logs.save_run_log_to_json(
+            client.ip, data, storage_directory
+        )
+        run_index.add(run_id, saved_file_path)
+        return saved_file_path
+
+    results = await asyncio.gather(*(save_run(run_id) for run_id in runs_to_save))
+    saved_file_paths = {path for path in results if path is not None}
+    print(
+        f"Saved {len(saved_file_paths)} run(s) from robot"
+        f" with IP address {client.ip}."
+    )
+    return saved_file_paths
+
+
+async def collect_run_logs(
+    ip_address_list: List[str],
+    storage_directory: str,
+    skip_run_ids: Iterable[str] = (),
+    port: int = ROBOT_PORT,
+    max_concurrent_requests_per_robot: int = 4,
+) -> Set[str]:
+    """Save new run logs from every robot, reading from all robots at once.
+
+    Runs that are already in the storage directory's run index, or in
+    `skip_run_ids`, are not downloaded again. A robot or run that can't be read
+    is reported and skipped.
+
+    Returns:
+        The paths of the run logs that were saved.
+    """
+    os.makedirs(storage_directory, exist_ok=True)
+    run_index = RunIndex(storage_directory)
+    skip_run_ids = set(skip_run_ids)
+    async with aiohttp.ClientSession() as session:
+        clients = [
+            RobotClient(
+                session,
+                ip,
+                port=port,
+                max_concurrent_requests=max_concurrent_requests_per_robot,
+            )
+            for ip in ip_address_list
+        ]
+        results = await asyncio.gather(
+            *(
+                collect_robot_run_logs(
+                    client, storage_directory, run_index, skip_run_ids
+                )
+                for client in clients
+            ),
+            return_exceptions=True,
+        )
+    saved_file_paths: Set[str] = set()
+    for ip, result in zip(ip_address_list, results):
+        if isinstance(result, BaseException):
+            print(f"ERROR: Failed to read IP address: {ip}.")
+        else:
+            saved_file_paths |= result
+    return saved_file_paths
@@ -0,0 +1,176 @@
+"""Tests for the concurrent run log collector."""
+from typing import Any, Dict, List, Sequence
+import asyncio
+import json
+import os
+from pathlib import Path
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from abr_testing.data_collection import run_log_collector
+
+COMMAND_COUNT = 250
+
+
+class StubRobotServer:
+    """A local stand-in for a robot's HTTP API, serving the endpoints we read."""
+
+    def __init__(self, run_ids: List[str], broken_run_ids: Sequence[str] = ()) -> None:
+        """Serve completed runs with the given IDs, and one current run.
+
+        Reading any run in `broken_run_ids` fails with a server error.
+        """
+        self.run_ids = run_ids
+        self.broken_run_ids = broken_run_ids
+        self.requests: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def build_app(self) -> web.Application:
+        """Build an app that serves this robot, in the running event loop."""
+        app = web.Application(middlewares=[self._count_requests])
+        app.add_routes(
+            [
+                web.get("/runs", self._get_runs),
+                web.get("/runs/{run_id}", self._get_run),
+                web.get("/runs/{run_id}/commands", self._get_commands),
+                web.get("/protocols/{protocol_id}", self._get_protocol),
+                web.get("/health", self._get_health),
+                web.get("/instruments", self._get_instruments),
+            ]
+        )
+        return app
+
+    @web.middleware
+    async def _count_requests(self, request: web.Request, handler: Any) -> Any:
+        self.requests.append(request.path)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # Give concurrent requests a chance to overlap.
+            await asyncio.sleep(0.01)
+            return await handler(request)
+        finally:
+            self.in_flight -= 1
+
+    async def _get_runs(self, request: web.Request) -> web.Response:
+        runs = [{"id": run_id, "current": False} for run_id in self.run_ids]
+        return web.json_response({"data": runs + [{"id": "current", "current": True}]})
+
+    async def _get_run(self, request: web.Request) -> web.Response:
+        run_id = request.match_info["run_id"]
+        if run_id in self.broken_run_ids:
+            raise web.HTTPInternalServerError()
+        return web.json_response(
+            {"data": {"id": run_id, "protocolId": f"protocol-{run_id}"}}
+        )
+
+    async def _get_commands(self, request: web.Request) -> web.Response:
+        cursor = int(request.query["cursor"])
+        page_length = int(request.query["pageLength"])
+        commands = [
+            {"id": f"command-{index}"}
+            for index in range(cursor, min(cursor + page_length, COMMAND_COUNT))
+        ]
+        return web.json_response(
+            {"data": commands, "meta": {"cursor": cursor, "totalLength": COMMAND_COUNT}}
+        )
+
+    async def _get_protocol(self, request: web.Request) -> web.Response:
+        return web.json_response({"data": {"id": request.match_info["protocol_id"]}})
+
+    async def _get_health(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"name": "robot", "api_version": "7.3.0", "robot_serial": "FLX-1"}
+        )
+
+    async def _get_instruments(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"data": [{"mount": "left", "serialNumber": "P1KS-1"}]}
+        )
+
+
+async def _collect(
+    robot: StubRobotServer, storage_directory: str
+) -> List[Dict[str, Any]]:
+    """Collect run logs from the stub robot, and read back what was saved."""
+    server = TestServer(robot.build_app(), host="127.0.0.1")
+    await server.start_server()
+    assert server.port is not None
+    try:
+        saved = await run_log_collector.collect_run_logs(
+            ["127.0.0.1"],
+            storage_directory,
+            port=server.port,
+            max_concurrent_requests_per_robot=2,
+        )
+    finally:
+        await server.close()
+    runs = []
+    for saved_file_path in sorted(saved):
+        with open(saved_file_path) as saved_file:
+            runs.append(json.load(saved_file))
+    return runs
+
+
+def test_collect_run_logs(tmp_path: Path) -> None:
+    """It should save every completed run, with all of its commands."""
+    robot = StubRobotServer(run_ids=["run-1", "run-2"])
+
+    runs = asyncio.run(_collect(robot, str(tmp_path)))
+
+    assert [run["run_id"] for run in runs] == ["run-1", "run-2"]
+    for run in runs:
+        assert [command["id"] for command in run["commands"]] == [
+            f"command-{index}" for index in range(COMMAND_COUNT)
+        ]
+        assert run["protocol"] == {"id": f"protocol-{run['run_id']}"}
+        assert run["robot_name"] == "robot"
+        assert run["left"] == "P1KS-1"
+    assert robot.requests.count("/health") == 1
+    assert 1 < robot.max_in_flight <= 2
+
+
+def test_collect_run_logs_incrementally(tmp_path: Path) -> None:
+    """It should only download runs that haven't already been saved."""
+    robot = StubRobotServer(run_ids=["run-1"])
+    asyncio.run(_collect(robot, str(tmp_path)))
+
+    robot.run_ids = ["run-1", "run-2"]
+    robot.requests.clear()
+    runs = asyncio.run(_collect(robot, str(tmp_path)))
+
+    assert [run["run_id"] for run in runs] == ["run-2"]
+    assert "/runs/run-1" not in robot.requests
+    assert os.path.exists(tmp_path / run_log_collector.RUN_INDEX_FILE_NAME)
+
+
+def test_collect_run_logs_skips_broken_runs(tmp_path: Path) -> None:
+    """It should save the runs it can read, even if another run can't be read."""
+    robot = StubRobotServer(
+        run_ids=["run-1", "run-2", "run-3"], broken_run_ids=["run-2"]
+    )
+
+    runs = asyncio.run(_collect(robot, str(tmp_path)))
+
+    assert [run["run_id"] for run in runs] == ["run-1", "run-3"]
+    assert run_log_collector.RunIndex(str(tmp_path)).run_ids == {"run-1", "run-3"}
+
+
+def test_run_index_saved_on_add(tmp_path: Path) -> None:
+    """It should write the index to storage as soon as a run is added."""
+    subject = run_log_collector.RunIndex(str(tmp_path))
+
+    subject.add("run-1", str(tmp_path / "ip_run-1.json"))
+
+    assert run_log_collector.RunIndex(str(tmp_path)).run_ids == {"run-1"}
+    assert os.listdir(tmp_path) == [run_log_collector.RUN_INDEX_FILE_NAME]
+
+
+def test_run_index_from_existing_logs(tmp_path: Path) -> None:
+    """It should build the index from run logs that were saved without one."""
+    (tmp_path / "IPs.json").write_text(json.dumps({"ip_address_list": []}))
+    (tmp_path / "ip_run-1.json").write_text(json.dumps({"run_id": "run-1"}))
+
+    subject = run_log_collector.RunIndex(str(tmp_path))
+
+    assert subject.run_ids == {"run-1"}
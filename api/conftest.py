@@ -3,15 +3,34 @@
 Contains settings and configuration that must be in
 the root of the project.
 """
+from typing import List
+
 import pytest
 
 # Options must be added at the root level for pytest to properly
 # pick them up. Technically, the main conftest that we use in
 # tests/opentrons is not the root level.
 def pytest_addoption(parser: pytest.Parser) -> None:
-    """Add --ot2-only option to pytest CLI."""
+    """Add --ot2-only and --benchmark options to pytest CLI."""
     parser.addoption(
         "--ot2-only",
         action="store_true",
         help="only run OT2 based tests",
     )
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        help="also run benchmarks, which are skipped by default",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: List[pytest.Item]
+) -> None:
+    """Skip benchmarks unless --benchmark is given."""
+    if config.getoption("--benchmark"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="benchmarks only run with --benchmark")
+    for item in items:
+        if item.get_closest_marker("benchmark"):
+            item.add_marker(skip_benchmark)
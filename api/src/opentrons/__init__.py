@@ -1,17 +1,10 @@
 import os
 
+from importlib import import_module
 from pathlib import Path
 import logging
 import re
-from typing import Any, List, Tuple
-
-from opentrons.drivers.serial_communication import get_ports_by_name
-from opentrons.hardware_control import (
-    API as HardwareAPI,
-    ThreadManager,
-    ThreadManagedHardware,
-    types as hw_types,
-)
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
 from opentrons.config import (
     feature_flags as ff,
@@ -26,6 +19,9 @@ from opentrons.protocols.api_support.types import APIVersion
 
 from ._version import version
 
+if TYPE_CHECKING:
+    from opentrons.hardware_control import ThreadManagedHardware
+
 HERE = os.path.abspath(os.path.dirname(__file__))
 __version__ = version
 
@@ -33,16 +29,37 @@ __version__ = version
 LEGACY_MODULES = ["robot", "reset", "instruments", "containers", "labware", "modules"]
 
 
+# Names that used to be imported eagerly into this module, mapped to the module
+# and attribute they come from. Importing the hardware controller and serial
+# drivers costs most of a second, which every `import opentrons.<anything>`
+# would otherwise pay, so they're only loaded on first access.
+_LAZY_ATTRIBUTES: Dict[str, Tuple[str, str]] = {
+    "HardwareAPI": ("opentrons.hardware_control", "API"),
+    "ThreadManager": ("opentrons.hardware_control", "ThreadManager"),
+    "ThreadManagedHardware": ("opentrons.hardware_control", "ThreadManagedHardware"),
+    "hw_types": ("opentrons.hardware_control", "types"),
+    "get_ports_by_name": (
+        "opentrons.drivers.serial_communication",
+        "get_ports_by_name",
+    ),
+}
+
+
 __all__ = ["version", "__version__", "HERE", "config"]
 
 
-def __getattr__(attrname: str) -> None:
+def __getattr__(attrname: str) -> Any:
     """
     Prevent import of legacy modules from global to officially
-    deprecate Python API Version 1.0.
+    deprecate Python API Version 1.0, and load heavy attributes on demand.
     """
     if attrname in LEGACY_MODULES:
         raise ApiDeprecationError(APIVersion(1, 0))
+    if attrname in _LAZY_ATTRIBUTES:
+        module_name, module_attrname = _LAZY_ATTRIBUTES[attrname]
+        value = getattr(import_module(module_name), module_attrname)
+        globals()[attrname] = value
+        return value
     raise AttributeError(attrname)
 
 
@@ -76,6 +93,8 @@ def _find_smoothie_file() -> Tuple[Path, str]:
 
 
 def _get_motor_control_serial_port() -> Any:
+    from opentrons.drivers.serial_communication import get_ports_by_name
+
     port = os.environ.get("OT_SMOOTHIE_EMULATOR_URI")
 
     if port is None:
@@ -100,12 +119,18 @@ def should_use_ot3() -> bool:
     return False
 
 
-async def _create_thread_manager() -> ThreadManagedHardware:
+async def _create_thread_manager() -> "ThreadManagedHardware":
     """Build the hardware controller wrapped in a ThreadManager.
 
     .. deprecated:: 4.6
         ThreadManager is on its way out.
     """
+    from opentrons.hardware_control import (
+        API as HardwareAPI,
+        ThreadManager,
+        types as hw_types,
+    )
+
     if os.environ.get("ENABLE_VIRTUAL_SMOOTHIE"):
         log.info("Initialized robot using virtual Smoothie")
         thread_manager: ThreadManagedHardware = ThreadManager(
@@ -139,7 +164,7 @@ async def _create_thread_manager() -> ThreadManagedHardware:
     return thread_manager
 
 
-async def initialize() -> ThreadManagedHardware:
+async def initialize() -> "ThreadManagedHardware":
     """
     Initialize the Opentrons hardware returning a hardware instance.
     """
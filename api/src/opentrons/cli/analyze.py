@@ -8,8 +8,9 @@ from pydantic import BaseModel
 from typing import Any, Dict, List, Optional, Sequence, Union
 from typing_extensions import Literal
 
-from opentrons.protocol_engine.types import RunTimeParameter
+from opentrons.protocol_engine.types import RunTimeParameter, CommandTypeTiming
 from opentrons.protocols.api_support.types import APIVersion
+from opentrons.protocols.duration import DurationEstimate, estimate_duration
 from opentrons.protocol_reader import (
     ProtocolReader,
     ProtocolFileRole,
@@ -42,13 +43,33 @@ from opentrons_shared_data.robot.dev_types import RobotType
     help="Return analysis results as machine-readable JSON.",
     type=click.Path(path_type=AsyncPath),
 )
-def analyze(files: Sequence[Path], json_output: Optional[Path]) -> None:
+@click.option(
+    "--command-timing",
+    is_flag=True,
+    default=False,
+    help=(
+        "Include per-command-type execution timing histograms"
+        " in the analysis results."
+    ),
+)
+@click.option(
+    "--estimate-duration",
+    is_flag=True,
+    default=False,
+    help="Include how long each command, and the whole protocol, should take to run.",
+)
+def analyze(
+    files: Sequence[Path],
+    json_output: Optional[Path],
+    command_timing: bool,
+    estimate_duration: bool,
+) -> None:
     """Analyze a protocol.
 
     You can use `opentrons analyze` to get a protocol's expected
     equipment and commands.
     """
-    run(_analyze, files, json_output)
+    run(_analyze, files, json_output, command_timing, estimate_duration)
 
 
 def _get_input_files(files_and_dirs: Sequence[Path]) -> List[Path]:
@@ -66,6 +87,8 @@ def _get_input_files(files_and_dirs: Sequence[Path]) -> List[Path]:
 async def _analyze(
     files_and_dirs: Sequence[Path],
     json_output: Optional[AsyncPath],
+    command_timing: bool = False,
+    duration_estimate: bool = False,
 ) -> None:
     input_files = _get_input_files(files_and_dirs)
 
@@ -78,7 +101,9 @@ async def _analyze(
         raise click.ClickException(str(error))
 
     runner = await create_simulating_runner(
-        robot_type=protocol_source.robot_type, protocol_config=protocol_source.config
+        robot_type=protocol_source.robot_type,
+        protocol_config=protocol_source.config,
+        enable_command_timing=command_timing,
     )
     analysis = await runner.run(deck_configuration=[], protocol_source=protocol_source)
 
@@ -107,6 +132,12 @@ async def _analyze(
             pipettes=analysis.state_summary.pipettes,
             modules=analysis.state_summary.modules,
             liquids=analysis.state_summary.liquids,
+            commandTimings=runner.get_command_timing(),
+            estimatedDuration=(
+                estimate_duration(analysis.commands, protocol_source.robot_type)
+                if duration_estimate
+                else None
+            ),
         )
 
         await json_output.write_text(
@@ -165,3 +196,9 @@ class AnalyzeResults(BaseModel):
     modules: List[LoadedModule]
     liquids: List[Liquid]
     errors: List[ErrorOccurrence]
+
+    # Only present when requested with `--command-timing`:
+    commandTimings: Optional[List[CommandTypeTiming]]
+
+    # Only present when requested with `--estimate-duration`:
+    estimatedDuration: Optional[DurationEstimate]
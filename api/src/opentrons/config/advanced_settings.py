@@ -255,6 +255,17 @@ settings = [
         robot_type=[RobotTypeEnum.OT2, RobotTypeEnum.FLEX],
         internal_only=True,
     ),
+    SettingDefinition(
+        _id="enableAnalysisDurationEstimates",
+        title="Enable analysis duration estimates",
+        description=(
+            "Do not enable."
+            " This is an Opentrons internal setting to estimate how long each command"
+            " in a protocol analysis will take. It makes analyses slower."
+        ),
+        robot_type=[RobotTypeEnum.OT2, RobotTypeEnum.FLEX],
+        internal_only=True,
+    ),
 ]
 
 if (
@@ -734,6 +745,16 @@ def _migrate32to33(previous: SettingsMap) -> SettingsMap:
     return newmap
 
 
+def _migrate33to34(previous: SettingsMap) -> SettingsMap:
+    """Migrate to version 34 of the feature flags file.
+
+    - Adds the enableAnalysisDurationEstimates config element.
+    """
+    newmap = {k: v for k, v in previous.items()}
+    newmap["enableAnalysisDurationEstimates"] = None
+    return newmap
+
+
 _MIGRATIONS = [
     _migrate0to1,
     _migrate1to2,
@@ -768,6 +789,7 @@ _MIGRATIONS = [
     _migrate30to31,
     _migrate31to32,
     _migrate32to33,
+    _migrate33to34,
 ]
 """
 List of all migrations to apply, indexed by (version - 1). See _migrate below
@@ -2,8 +2,8 @@ from typing import Any, Dict, cast, List, Iterable, Tuple
 from typing_extensions import Final
 from dataclasses import asdict
 
-from opentrons.hardware_control.types import OT3AxisKind
 from .types import (
+    OT3AxisKind,
     OT3Config,
     ByGantryLoad,
     OT3CurrentSettings,
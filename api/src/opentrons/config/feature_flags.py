@@ -82,5 +82,11 @@ def enable_performance_metrics(robot_type: RobotTypeEnum) -> bool:
     return advs.get_setting_with_env_overload("enablePerformanceMetrics", robot_type)
 
 
+def enable_analysis_duration_estimates(robot_type: RobotTypeEnum) -> bool:
+    return advs.get_setting_with_env_overload(
+        "enableAnalysisDurationEstimates", robot_type
+    )
+
+
 def oem_mode_enabled() -> bool:
     return advs.get_setting_with_env_overload("enableOEMMode", RobotTypeEnum.FLEX)
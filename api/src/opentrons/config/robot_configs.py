@@ -7,8 +7,7 @@ from typing import Any, Dict, List, Union, Optional, cast
 from typing_extensions import Literal
 
 from . import CONFIG, defaults_ot3, defaults_ot2, gripper_config, feature_flags as ff
-from opentrons.hardware_control.types import BoardRevision
-from .types import CurrentDict, RobotConfig, AxisDict, OT3Config
+from .types import BoardRevision, CurrentDict, RobotConfig, AxisDict, OT3Config
 
 log = logging.getLogger(__name__)
 
@@ -1,8 +1,65 @@
-from enum import Enum
+from enum import Enum, auto
 from dataclasses import dataclass, asdict, fields
-from typing import Dict, Tuple, TypeVar, Generic, List, cast, Optional
+from typing import Dict, Tuple, TypeVar, Generic, List, Union, cast, Optional
 from typing_extensions import TypedDict, Literal
-from opentrons.hardware_control.types import OT3AxisKind
+
+
+class OT3AxisKind(Enum):
+    """An enum of the different kinds of axis we have.
+
+    The machine may have different numbers of specific axes implementing
+    each axis kind.
+    """
+
+    X = 0
+    #: Gantry X axis
+    Y = 1
+    #: Gantry Y axis
+    Z = 2
+    #: Z axis (of the left and right)
+    P = 3
+    #: Plunger axis (of the left and right pipettes)
+    Z_G = 4
+    #: Gripper Z axis
+    Q = 6
+    #: High-throughput tip grabbing axis
+    OTHER = 6
+    #: The internal axes of high throughput pipettes, for instance
+
+    def __str__(self) -> str:
+        return self.name
+
+    def is_z_axis(self) -> bool:
+        return self in [OT3AxisKind.Z, OT3AxisKind.Z_G]
+
+
+RevisionLiteral = Literal["2.1", "A", "B", "C", "UNKNOWN"]
+
+
+class BoardRevision(Enum):
+    UNKNOWN = auto()
+    OG = auto()
+    A = auto()
+    B = auto()
+    C = auto()
+    FLEX_B2 = auto()
+
+    @classmethod
+    def by_bits(cls, rev_bits: Tuple[bool, bool]) -> "BoardRevision":
+        br = {
+            (True, True): cls.OG,
+            (False, True): cls.A,
+            (True, False): cls.B,
+            (False, False): cls.C,
+        }
+        return br[rev_bits]
+
+    def real_name(self) -> Union[RevisionLiteral, Literal["UNKNOWN"]]:
+        rn = "2.1" if self.name == "OG" else self.name
+        return cast(Union[RevisionLiteral, Literal["UNKNOWN"]], rn)
+
+    def __str__(self) -> str:
+        return self.real_name()
 
 
 class AxisDict(TypedDict):
@@ -3,10 +3,15 @@ from typing import Optional, Dict
 from opentrons.util.async_helpers import ensure_yield
 from opentrons.drivers.thermocycler.abstract import AbstractThermocyclerDriver
 from opentrons.drivers.types import Temperature, PlateTemperature, ThermocyclerLidStatus
-from opentrons.hardware_control.modules.types import ThermocyclerModuleModel
+from opentrons_shared_data.module.dev_types import ThermocyclerModuleModel
 from opentrons.drivers.asyncio.communication.errors import ErrorResponse
 
 
+# Not `hardware_control.modules.types.ThermocyclerModuleModel`, because the
+# hardware controller's modules import this driver.
+_THERMOCYCLER_V1: ThermocyclerModuleModel = "thermocyclerModuleV1"
+
+
 class SimulatingDriver(AbstractThermocyclerDriver):
     DEFAULT_TEMP = 23
 
@@ -19,7 +24,7 @@ class SimulatingDriver(AbstractThermocyclerDriver):
         self._plate_temperature = PlateTemperature(
             current=self.DEFAULT_TEMP, target=None, hold=None
         )
-        self._model = model if model else "thermocyclerModuleV1"
+        self._model = model if model else _THERMOCYCLER_V1
         self._serial_number = serial_number
 
     def model(self) -> str:
@@ -47,7 +52,7 @@ class SimulatingDriver(AbstractThermocyclerDriver):
 
     @ensure_yield
     async def lift_plate(self) -> None:
-        if self._model == ThermocyclerModuleModel.THERMOCYCLER_V1.value:
+        if self._model == _THERMOCYCLER_V1:
             raise NotImplementedError()
         if self._lid_status != ThermocyclerLidStatus.OPEN:
             raise ErrorResponse(port="sim_port", response="Lid is not open")
@@ -117,7 +122,7 @@ class SimulatingDriver(AbstractThermocyclerDriver):
 
     @ensure_yield
     async def jog_lid(self, angle: float) -> None:
-        if self._model == ThermocyclerModuleModel.THERMOCYCLER_V1.value:
+        if self._model == _THERMOCYCLER_V1:
             raise NotImplementedError()
         self._lid_status = (
             ThermocyclerLidStatus.IN_BETWEEN
@@ -9,37 +9,88 @@ or axis)  to a deck-absolute point (not a Smoothie-coordinate point).
 This module is not for use outside the opentrons api module. Higher-level
 functions are available elsewhere.
 """
-from .adapters import SynchronousAdapter
-from .api import API
-from .pause_manager import PauseManager
-from .backends import Controller, Simulator
-from .types import CriticalPoint, ExecutionState, OT3Mount
-from .constants import DROP_TIP_RELEASE_DISTANCE
-from .thread_manager import ThreadManager
-from .execution_manager import ExecutionManager
-from .threaded_async_lock import ThreadedAsyncLock, ThreadedAsyncForbidden
-from .protocols import HardwareControlInterface, FlexHardwareControlInterface
-from .instruments import AbstractInstrument, Gripper
-from typing import Union
-from .ot3_calibration import OT3Transforms
-from .robot_calibration import RobotCalibration
-from opentrons.config.types import RobotConfig, OT3Config
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict
 
-from opentrons.types import Mount
+if TYPE_CHECKING:
+    from .adapters import SynchronousAdapter
+    from .api import API
+    from .pause_manager import PauseManager
+    from .backends import Controller, Simulator
+    from .types import CriticalPoint, ExecutionState, OT3Mount
+    from .constants import DROP_TIP_RELEASE_DISTANCE
+    from .thread_manager import ThreadManager
+    from .execution_manager import ExecutionManager
+    from .threaded_async_lock import ThreadedAsyncLock, ThreadedAsyncForbidden
+    from .protocols import HardwareControlInterface, FlexHardwareControlInterface
+    from .instruments import AbstractInstrument, Gripper
+    from .ot3_calibration import OT3Transforms
+    from .robot_calibration import RobotCalibration
 
-# TODO (lc 12-05-2022) We should 1. figure out if we need
-# to globally export a class that is strictly used in the hardware controller
-# and 2. how to properly export an ot2 and ot3 pipette.
-from .instruments.ot2.pipette import Pipette
+    # TODO (lc 12-05-2022) We should 1. figure out if we need
+    # to globally export a class that is strictly used in the hardware controller
+    # and 2. how to properly export an ot2 and ot3 pipette.
+    from .instruments.ot2.pipette import Pipette
 
-OT2HardwareControlAPI = HardwareControlInterface[RobotCalibration, Mount, RobotConfig]
-OT3HardwareControlAPI = FlexHardwareControlInterface[
-    OT3Transforms, Union[Mount, OT3Mount], OT3Config
-]
-HardwareControlAPI = Union[OT2HardwareControlAPI, OT3HardwareControlAPI]
+    from ._aliases import (
+        OT2HardwareControlAPI,
+        OT3HardwareControlAPI,
+        HardwareControlAPI,
+        ThreadManagedHardware,
+        SyncHardwareAPI,
+    )
+
+
+# This package's exports are loaded on first access, not when the package is
+# imported. Importing the whole hardware controller takes most of a second, and
+# lots of modules only need something small like `.types` or `.modules.types`,
+# which would otherwise pull in everything else through this file.
+_LAZY_EXPORTS: Dict[str, str] = {
+    "SynchronousAdapter": ".adapters",
+    "API": ".api",
+    "PauseManager": ".pause_manager",
+    "Controller": ".backends",
+    "Simulator": ".backends",
+    "CriticalPoint": ".types",
+    "ExecutionState": ".types",
+    "OT3Mount": ".types",
+    "DROP_TIP_RELEASE_DISTANCE": ".constants",
+    "ThreadManager": ".thread_manager",
+    "ExecutionManager": ".execution_manager",
+    "ThreadedAsyncLock": ".threaded_async_lock",
+    "ThreadedAsyncForbidden": ".threaded_async_lock",
+    "HardwareControlInterface": ".protocols",
+    "FlexHardwareControlInterface": ".protocols",
+    "AbstractInstrument": ".instruments",
+    "Gripper": ".instruments",
+    "OT3Transforms": ".ot3_calibration",
+    "RobotCalibration": ".robot_calibration",
+    "Pipette": ".instruments.ot2.pipette",
+    "OT2HardwareControlAPI": "._aliases",
+    "OT3HardwareControlAPI": "._aliases",
+    "HardwareControlAPI": "._aliases",
+    "ThreadManagedHardware": "._aliases",
+    "SyncHardwareAPI": "._aliases",
+}
+
+
+if not TYPE_CHECKING:
+
+    def __getattr__(name: str) -> Any:
+        if name in _LAZY_EXPORTS:
+            value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        else:
+            # Importing this package used to import most of its submodules as a
+            # side effect, so keep `hardware_control.<submodule>` working.
+            try:
+                value = import_module(f".{name}", __name__)
+            except ModuleNotFoundError as e:
+                raise AttributeError(
+                    f"module {__name__!r} has no attribute {name!r}"
+                ) from e
+        globals()[name] = value
+        return value
 
-ThreadManagedHardware = ThreadManager[HardwareControlAPI]
-SyncHardwareAPI = SynchronousAdapter[HardwareControlAPI]
 
 __all__ = [
     "API",
@@ -52,6 +103,7 @@ __all__ = [
     "SynchronousAdapter",
     "HardwareControlAPI",
     "CriticalPoint",
+    "OT3Mount",
     "DROP_TIP_RELEASE_DISTANCE",
     "ThreadManager",
     "ExecutionManager",
@@ -62,4 +114,8 @@ __all__ = [
     "SyncHardwareAPI",
     "OT2HardwareControlAPI",
     "OT3HardwareControlAPI",
+    "HardwareControlInterface",
+    "FlexHardwareControlInterface",
+    "OT3Transforms",
+    "RobotCalibration",
 ]
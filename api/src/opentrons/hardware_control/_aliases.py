@@ -0,0 +1,25 @@
+"""Type aliases for the hardware controller, exported by `opentrons.hardware_control`.
+
+These live in their own module so that `opentrons.hardware_control` can export them
+without importing the whole hardware controller up front.
+"""
+from typing import Union
+
+from opentrons.config.types import RobotConfig, OT3Config
+from opentrons.types import Mount
+
+from .adapters import SynchronousAdapter
+from .ot3_calibration import OT3Transforms
+from .protocols import HardwareControlInterface, FlexHardwareControlInterface
+from .robot_calibration import RobotCalibration
+from .thread_manager import ThreadManager
+from .types import OT3Mount
+
+OT2HardwareControlAPI = HardwareControlInterface[RobotCalibration, Mount, RobotConfig]
+OT3HardwareControlAPI = FlexHardwareControlInterface[
+    OT3Transforms, Union[Mount, OT3Mount], OT3Config
+]
+HardwareControlAPI = Union[OT2HardwareControlAPI, OT3HardwareControlAPI]
+
+ThreadManagedHardware = ThreadManager[HardwareControlAPI]
+SyncHardwareAPI = SynchronousAdapter[HardwareControlAPI]
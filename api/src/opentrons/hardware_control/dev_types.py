@@ -3,13 +3,16 @@ from __future__ import annotations
 # this file defines types that require dev dependencies
 # and are only relevant for static typechecking. this file should only
 # be imported if typing.TYPE_CHECKING is True
-from typing import Optional, Dict, List, Union
+from typing import TYPE_CHECKING, Optional, Dict, List, Union
 
 from typing_extensions import TypedDict, Literal
 
-from opentrons.hardware_control.instruments.ot3.instrument_calibration import (
-    GripperCalibrationOffset,
-)
+if TYPE_CHECKING:
+    # The instruments package imports this module, so this can only be imported
+    # for type checking.
+    from opentrons.hardware_control.instruments.ot3.instrument_calibration import (
+        GripperCalibrationOffset,
+    )
 from opentrons_shared_data.pipette.dev_types import (
     PipetteModel,
     PipetteName,
@@ -63,21 +63,19 @@ class HeaterShakerEmulator(AbstractEmulator):
         self._temperature = Temperature(
             per_tick=self._settings.temperature.degrees_per_tick,
             current=self._settings.temperature.starting,
+            ticks_per_poll=self._settings.temperature.ticks_per_poll,
         )
         self._rpm = RPM(
             per_tick=self._settings.rpm.rpm_per_tick,
             current=self._settings.rpm.starting,
+            ticks_per_poll=self._settings.rpm.ticks_per_poll,
         )
         self._rpm.set_target(0.0)
         self._latch_status = HeaterShakerLabwareLatchStatus.IDLE_OPEN
 
     def _handle(self, command: Command) -> Optional[str]:
-        """
-        Handle a command.
-
-        TODO: AL 20210218 create dispatch map and remove 'noqa(C901)'
-        """
-        logger.info(f"Got command {command}")
+        """Handle a command."""
+        logger.info("Got command %s", command)
         func_to_run = self._gcode_to_function_mapping.get(command.gcode)
         res = None if func_to_run is None else func_to_run(command)
         return None if not isinstance(res, str) else f"{res} {HS_ACK}"
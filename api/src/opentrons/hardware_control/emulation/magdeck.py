@@ -22,6 +22,15 @@ class MagDeckEmulator(AbstractEmulator):
     def __init__(self, parser: Parser, settings: MagDeckSettings) -> None:
         self._settings = settings
         self._parser = parser
+        self._gcode_to_function_mapping = {
+            GCODE.HOME.value: self._home,
+            GCODE.MOVE.value: self._move,
+            GCODE.PROBE_PLATE.value: self._probe_plate,
+            GCODE.GET_PLATE_HEIGHT.value: self._get_plate_height,
+            GCODE.GET_CURRENT_POSITION.value: self._get_current_position,
+            GCODE.DEVICE_INFO.value: self._get_device_info,
+            GCODE.PROGRAMMING_MODE.value: self._enter_programming_mode,
+        }
         self.reset()
 
     def handle(self, line: str) -> Optional[str]:
@@ -36,25 +45,33 @@ class MagDeckEmulator(AbstractEmulator):
 
     def _handle(self, command: Command) -> Optional[str]:
         """Handle a command."""
-        logger.info(f"Got command {command}")
-        if command.gcode == GCODE.HOME:
-            self.height = 0
-        elif command.gcode == GCODE.MOVE:
-            position = command.params["Z"]
-            assert isinstance(position, float), f"invalid position '{position}'"
-            self.position = position
-        elif command.gcode == GCODE.PROBE_PLATE:
-            self.height = 45
-        elif command.gcode == GCODE.GET_PLATE_HEIGHT:
-            return f"height:{self.height}"
-        elif command.gcode == GCODE.GET_CURRENT_POSITION:
-            return f"Z:{self.position}"
-        elif command.gcode == GCODE.DEVICE_INFO:
-            return (
-                f"serial:{self._settings.serial_number} "
-                f"model:{self._settings.model} "
-                f"version:{self._settings.version}"
-            )
-        elif command.gcode == GCODE.PROGRAMMING_MODE:
-            pass
-        return None
+        logger.info("Got command %s", command)
+        func_to_run = self._gcode_to_function_mapping.get(command.gcode)
+        return None if func_to_run is None else func_to_run(command)
+
+    def _home(self, command: Command) -> None:
+        self.height = 0
+
+    def _move(self, command: Command) -> None:
+        position = command.params["Z"]
+        assert isinstance(position, float), f"invalid position '{position}'"
+        self.position = position
+
+    def _probe_plate(self, command: Command) -> None:
+        self.height = 45
+
+    def _get_plate_height(self, command: Command) -> str:
+        return f"height:{self.height}"
+
+    def _get_current_position(self, command: Command) -> str:
+        return f"Z:{self.position}"
+
+    def _get_device_info(self, command: Command) -> str:
+        return (
+            f"serial:{self._settings.serial_number} "
+            f"model:{self._settings.model} "
+            f"version:{self._settings.version}"
+        )
+
+    def _enter_programming_mode(self, command: Command) -> None:
+        pass
@@ -1,6 +1,10 @@
 import re
 from dataclasses import dataclass
-from typing import Dict, Generator, Optional
+from functools import lru_cache
+from typing import Dict, Generator, Optional, Tuple
+
+PARSED_LINE_CACHE_SIZE = 1024
+"""How many distinct lines to keep parsed. Drivers repeat the same status polls."""
 
 
 @dataclass
@@ -30,11 +34,29 @@ class Parser:
         Returns:
             Command object
         """
-        line = line.strip()
+        yield from self._parse_line(line.strip())
+
+    @staticmethod
+    @lru_cache(maxsize=PARSED_LINE_CACHE_SIZE)
+    def _parse_line(line: str) -> Tuple[Command, ...]:
+        """
+        Parse a stripped line. The commands are shared between calls.
+
+        Args:
+            line: a stripped line.
+
+        Returns:
+            The line's commands.
+        """
+        return tuple(Parser._iter_commands(line))
+
+    @staticmethod
+    def _iter_commands(line: str) -> Generator[Command, None, None]:
+        """Create the commands of a stripped line."""
         previous = None
-        for i in self.GCODE_RE.finditer(line):
+        for i in Parser.GCODE_RE.finditer(line):
             if previous:
-                yield self._create_command(
+                yield Parser._create_command(
                     line[previous.start() : previous.end()],
                     line[previous.end() : i.start()],
                 )
@@ -46,7 +68,7 @@ class Parser:
             previous = i
         if previous:
             # Create command from final GCODE and remainder of the line.
-            yield self._create_command(
+            yield Parser._create_command(
                 line[previous.start() : previous.end()], line[previous.end() :]
             )
         elif line:
@@ -29,11 +29,15 @@ class BaseModuleSettings(BaseModel):
 class TemperatureModelSettings(BaseModel):
     degrees_per_tick: float = 2.0
     starting: float = float(TEMPERATURE_ROOM)
+    # Ticks of virtual time that pass on every status poll. Raise it to
+    # finish long ramps and holds in fewer polls.
+    ticks_per_poll: int = 1
 
 
 class RPMModelSettings(BaseModel):
     rpm_per_tick: float = 100.0
     starting: float = 0.0
+    ticks_per_poll: int = 1
 
 
 class MagDeckSettings(BaseModuleSettings):
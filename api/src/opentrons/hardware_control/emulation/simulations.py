@@ -1,3 +1,4 @@
+import math
 from typing import Optional
 
 
@@ -6,34 +7,50 @@ class Simulation:
         pass
 
 
+def _approach(current: float, target: float, per_tick: float, ticks: int) -> float:
+    """Move current towards target by per_tick, ticks times over."""
+    diff = target - current
+    if abs(diff) < per_tick * ticks:
+        return target
+    elif diff > 0:
+        return current + per_tick * ticks
+    else:
+        return current - per_tick * ticks
+
+
+def _ticks_to_reach(current: float, target: float, per_tick: float) -> int:
+    """How many ticks it takes current to reach target."""
+    if current == target:
+        return 0
+    return math.ceil(abs(target - current) / per_tick)
+
+
 class Temperature(Simulation):
     """A model with a current and target temperature. The current temperature is
     always moving towards the target.
     """
 
-    def __init__(self, per_tick: float, current: float) -> None:
+    def __init__(
+        self, per_tick: float, current: float, ticks_per_poll: int = 1
+    ) -> None:
         """Construct a temperature simulation.
 
         Args:
             per_tick: amount to move per tick,
             current: the starting temperature
+            ticks_per_poll: how many ticks of virtual time pass on each tick()
         """
         self._per_tick = per_tick
         self._current = current
+        self._ticks_per_poll = ticks_per_poll
         self._target: Optional[float] = None
 
     def tick(self) -> None:
         if self._target is None:
             return
-
-        diff = self._target - self._current
-
-        if abs(diff) < self._per_tick:
-            self._current = self._target
-        elif diff > 0:
-            self._current += self._per_tick
-        else:
-            self._current -= self._per_tick
+        self._current = _approach(
+            self._current, self._target, self._per_tick, self._ticks_per_poll
+        )
 
     def deactivate(self, temperature: float) -> None:
         """Deactivate and reset to temperature"""
@@ -57,32 +74,26 @@ class RPM(Simulation):
     always moving towards the target.
     """
 
-    def __init__(self, per_tick: float, current: float) -> None:
+    def __init__(
+        self, per_tick: float, current: float, ticks_per_poll: int = 1
+    ) -> None:
         """Construct a rpm simulation.
 
         Args:
             per_tick: amount to move per tick,
             current: the starting rpm
+            ticks_per_poll: how many ticks of virtual time pass on each tick()
         """
         self._per_tick = per_tick
         self._current = current
+        self._ticks_per_poll = ticks_per_poll
         self._target: Optional[float] = None
 
     def tick(self) -> None:
-
-        if self._target is None:
-            target = 0.0
-        else:
-            target = self._target
-
-        diff = target - self._current
-
-        if abs(diff) < self._per_tick:
-            self._current = target
-        elif diff > 0:
-            self._current += self._per_tick
-        else:
-            self._current -= self._per_tick
+        target = 0.0 if self._target is None else self._target
+        self._current = _approach(
+            self._current, target, self._per_tick, self._ticks_per_poll
+        )
 
     def deactivate(self, rpm: float) -> None:
         """Deactivate and reset to rpm"""
@@ -109,16 +120,26 @@ class TemperatureWithHold(Temperature):
     decrements once per tick.
     """
 
-    def __init__(self, per_tick: float, current: float) -> None:
+    def __init__(
+        self, per_tick: float, current: float, ticks_per_poll: int = 1
+    ) -> None:
         """Construct a temperature with hold simulation."""
-        super().__init__(per_tick=per_tick, current=current)
+        super().__init__(
+            per_tick=per_tick, current=current, ticks_per_poll=ticks_per_poll
+        )
         self._total_hold: Optional[float] = None
         self._hold: Optional[float] = None
 
     def tick(self) -> None:
+        start = self._current
         super().tick()
-        if self.target == self._current and self._hold is not None:
-            self._hold = max(0, self._hold - 1)
+        target = self._target
+        if target == self._current and target is not None and self._hold is not None:
+            # Only the ticks from the one that reached the target onwards count
+            # towards the hold.
+            ramp_ticks = _ticks_to_reach(start, target, self._per_tick)
+            held_ticks = self._ticks_per_poll - max(ramp_ticks - 1, 0)
+            self._hold = max(0, self._hold - max(held_ticks, 1))
 
     def set_hold(self, hold: float) -> None:
         self._total_hold = hold
@@ -158,7 +158,7 @@ class SmoothieEmulator(AbstractEmulator):
 
     def _handle(self, command: Command) -> Optional[str]:
         """Handle a command."""
-        logger.info(f"Got command {command}")
+        logger.info("Got command %s", command)
         func_to_run = self._gcode_to_function_mapping.get(command.gcode)
         return None if func_to_run is None else func_to_run(command)
 
@@ -26,6 +26,13 @@ class TempDeckEmulator(AbstractEmulator):
     def __init__(self, parser: Parser, settings: TempDeckSettings) -> None:
         self._settings = settings
         self._parser = parser
+        self._gcode_to_function_mapping = {
+            GCODE.GET_TEMP.value: self._get_temperature,
+            GCODE.SET_TEMP.value: self._set_temperature,
+            GCODE.DISENGAGE.value: self._disengage,
+            GCODE.DEVICE_INFO.value: self._get_device_info,
+            GCODE.PROGRAMMING_MODE.value: self._enter_programming_mode,
+        }
         self.reset()
 
     def handle(self, line: str) -> Optional[str]:
@@ -38,32 +45,37 @@ class TempDeckEmulator(AbstractEmulator):
         self._temperature = Temperature(
             per_tick=self._settings.temperature.degrees_per_tick,
             current=self._settings.temperature.starting,
+            ticks_per_poll=self._settings.temperature.ticks_per_poll,
         )
 
     def _handle(self, command: Command) -> Optional[str]:
         """Handle a command."""
-        logger.info(f"Got command {command}")
-        if command.gcode == GCODE.GET_TEMP:
-            res = (
-                f"T:{util.OptionalValue(self._temperature.target)} "
-                f"C:{self._temperature.current}"
-            )
-            self._temperature.tick()
-            return res
-        elif command.gcode == GCODE.SET_TEMP:
-            temperature = command.params["S"]
-            assert isinstance(
-                temperature, float
-            ), f"invalid temperature '{temperature}'"
-            self._temperature.set_target(temperature)
-        elif command.gcode == GCODE.DISENGAGE:
-            self._temperature.deactivate(util.TEMPERATURE_ROOM)
-        elif command.gcode == GCODE.DEVICE_INFO:
-            return (
-                f"serial:{self._settings.serial_number} "
-                f"model:{self._settings.model} "
-                f"version:{self._settings.version}"
-            )
-        elif command.gcode == GCODE.PROGRAMMING_MODE:
-            pass
-        return None
+        logger.info("Got command %s", command)
+        func_to_run = self._gcode_to_function_mapping.get(command.gcode)
+        return None if func_to_run is None else func_to_run(command)
+
+    def _get_temperature(self, command: Command) -> str:
+        res = (
+            f"T:{util.OptionalValue(self._temperature.target)} "
+            f"C:{self._temperature.current}"
+        )
+        self._temperature.tick()
+        return res
+
+    def _set_temperature(self, command: Command) -> None:
+        temperature = command.params["S"]
+        assert isinstance(temperature, float), f"invalid temperature '{temperature}'"
+        self._temperature.set_target(temperature)
+
+    def _disengage(self, command: Command) -> None:
+        self._temperature.deactivate(util.TEMPERATURE_ROOM)
+
+    def _get_device_info(self, command: Command) -> str:
+        return (
+            f"serial:{self._settings.serial_number} "
+            f"model:{self._settings.model} "
+            f"version:{self._settings.version}"
+        )
+
+    def _enter_programming_mode(self, command: Command) -> None:
+        pass
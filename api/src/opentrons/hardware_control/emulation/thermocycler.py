@@ -29,6 +29,21 @@ class ThermocyclerEmulator(AbstractEmulator):
     def __init__(self, parser: Parser, settings: ThermocyclerSettings) -> None:
         self._parser = parser
         self._settings = settings
+        self._gcode_to_function_mapping = {
+            GCODE.OPEN_LID.value: self._open_lid,
+            GCODE.CLOSE_LID.value: self._close_lid,
+            GCODE.GET_LID_STATUS.value: self._get_lid_status,
+            GCODE.SET_LID_TEMP.value: self._set_lid_temperature,
+            GCODE.GET_LID_TEMP.value: self._get_lid_temperature,
+            GCODE.EDIT_PID_PARAMS.value: self._edit_pid_params,
+            GCODE.SET_PLATE_TEMP.value: self._set_plate_temperature,
+            GCODE.GET_PLATE_TEMP.value: self._get_plate_temperature,
+            GCODE.SET_RAMP_RATE.value: self._set_ramp_rate,
+            GCODE.DEACTIVATE_ALL.value: self._deactivate_all,
+            GCODE.DEACTIVATE_LID.value: self._deactivate_lid,
+            GCODE.DEACTIVATE_BLOCK.value: self._deactivate_block,
+            GCODE.DEVICE_INFO.value: self._get_device_info,
+        }
         self.reset()
 
     def handle(self, line: str) -> Optional[str]:
@@ -41,87 +56,95 @@ class ThermocyclerEmulator(AbstractEmulator):
         self._lid_temperature = Temperature(
             per_tick=self._settings.lid_temperature.degrees_per_tick,
             current=self._settings.lid_temperature.starting,
+            ticks_per_poll=self._settings.lid_temperature.ticks_per_poll,
         )
         self._plate_temperature = TemperatureWithHold(
             per_tick=self._settings.plate_temperature.degrees_per_tick,
             current=self._settings.plate_temperature.starting,
+            ticks_per_poll=self._settings.plate_temperature.ticks_per_poll,
         )
         self.lid_status = ThermocyclerLidStatus.OPEN
         self.plate_volume = util.OptionalValue[float]()
         self.plate_ramp_rate = util.OptionalValue[float]()
 
-    def _handle(self, command: Command) -> Optional[str]:  # noqa: C901
-        """
-        Handle a command.
-
-        TODO: AL 20210218 create dispatch map and remove 'noqa(C901)'
-        """
-        logger.info(f"Got command {command}")
-        if command.gcode == GCODE.OPEN_LID:
-            self.lid_status = ThermocyclerLidStatus.OPEN
-        elif command.gcode == GCODE.CLOSE_LID:
-            self.lid_status = ThermocyclerLidStatus.CLOSED
-        elif command.gcode == GCODE.GET_LID_STATUS:
-            return f"Lid:{self.lid_status}"
-        elif command.gcode == GCODE.SET_LID_TEMP:
-            temperature = command.params["S"]
-            assert isinstance(
-                temperature, float
-            ), f"invalid temperature '{temperature}'"
-            self._lid_temperature.set_target(temperature)
-        elif command.gcode == GCODE.GET_LID_TEMP:
-            res = (
-                f"T:{util.OptionalValue(self._lid_temperature.target)} "
-                f"C:{self._lid_temperature.current} "
-                f"H:none Total_H:none"
-            )
-            self._lid_temperature.tick()
-            return res
-        elif command.gcode == GCODE.EDIT_PID_PARAMS:
-            pass
-        elif command.gcode == GCODE.SET_PLATE_TEMP:
-            for prefix, value in command.params.items():
-                assert isinstance(value, float), f"invalid value '{value}'"
-                if prefix == "S":
-                    self._plate_temperature.set_target(value)
-                elif prefix == "V":
-                    self.plate_volume.val = value
-                elif prefix == "H":
-                    self._plate_temperature.set_hold(value)
-        elif command.gcode == GCODE.GET_PLATE_TEMP:
-            plate_target = util.OptionalValue(self._plate_temperature.target)
-            plate_current = self._plate_temperature.current
-            plate_time_remaining = util.OptionalValue(
-                self._plate_temperature.time_remaining
-            )
-            plate_total_hold_time = util.OptionalValue(
-                self._plate_temperature.total_hold
-            )
-
-            res = (
-                f"T:{plate_target} "
-                f"C:{plate_current} "
-                f"H:{plate_time_remaining} "
-                f"Total_H:{plate_total_hold_time} "
-            )
-            self._plate_temperature.tick()
-            return res
-        elif command.gcode == GCODE.SET_RAMP_RATE:
-            self.plate_ramp_rate.val = command.params["S"]
-        elif command.gcode == GCODE.DEACTIVATE_ALL:
-            self._plate_temperature.deactivate(temperature=util.TEMPERATURE_ROOM)
-            self._lid_temperature.deactivate(temperature=util.TEMPERATURE_ROOM)
-        elif command.gcode == GCODE.DEACTIVATE_LID:
-            self._lid_temperature.deactivate(temperature=util.TEMPERATURE_ROOM)
-        elif command.gcode == GCODE.DEACTIVATE_BLOCK:
-            self._plate_temperature.deactivate(temperature=util.TEMPERATURE_ROOM)
-        elif command.gcode == GCODE.DEVICE_INFO:
-            return (
-                f"serial:{self._settings.serial_number} "
-                f"model:{self._settings.model} "
-                f"version:{self._settings.version}"
-            )
-        return None
+    def _handle(self, command: Command) -> Optional[str]:
+        """Handle a command."""
+        logger.info("Got command %s", command)
+        func_to_run = self._gcode_to_function_mapping.get(command.gcode)
+        return None if func_to_run is None else func_to_run(command)
+
+    def _open_lid(self, command: Command) -> None:
+        self.lid_status = ThermocyclerLidStatus.OPEN
+
+    def _close_lid(self, command: Command) -> None:
+        self.lid_status = ThermocyclerLidStatus.CLOSED
+
+    def _get_lid_status(self, command: Command) -> str:
+        return f"Lid:{self.lid_status}"
+
+    def _set_lid_temperature(self, command: Command) -> None:
+        temperature = command.params["S"]
+        assert isinstance(temperature, float), f"invalid temperature '{temperature}'"
+        self._lid_temperature.set_target(temperature)
+
+    def _get_lid_temperature(self, command: Command) -> str:
+        res = (
+            f"T:{util.OptionalValue(self._lid_temperature.target)} "
+            f"C:{self._lid_temperature.current} "
+            f"H:none Total_H:none"
+        )
+        self._lid_temperature.tick()
+        return res
+
+    def _edit_pid_params(self, command: Command) -> None:
+        pass
+
+    def _set_plate_temperature(self, command: Command) -> None:
+        for prefix, value in command.params.items():
+            assert isinstance(value, float), f"invalid value '{value}'"
+            if prefix == "S":
+                self._plate_temperature.set_target(value)
+            elif prefix == "V":
+                self.plate_volume.val = value
+            elif prefix == "H":
+                self._plate_temperature.set_hold(value)
+
+    def _get_plate_temperature(self, command: Command) -> str:
+        plate_target = util.OptionalValue(self._plate_temperature.target)
+        plate_current = self._plate_temperature.current
+        plate_time_remaining = util.OptionalValue(
+            self._plate_temperature.time_remaining
+        )
+        plate_total_hold_time = util.OptionalValue(self._plate_temperature.total_hold)
+
+        res = (
+            f"T:{plate_target} "
+            f"C:{plate_current} "
+            f"H:{plate_time_remaining} "
+            f"Total_H:{plate_total_hold_time} "
+        )
+        self._plate_temperature.tick()
+        return res
+
+    def _set_ramp_rate(self, command: Command) -> None:
+        self.plate_ramp_rate.val = command.params["S"]
+
+    def _deactivate_all(self, command: Command) -> None:
+        self._plate_temperature.deactivate(temperature=util.TEMPERATURE_ROOM)
+        self._lid_temperature.deactivate(temperature=util.TEMPERATURE_ROOM)
+
+    def _deactivate_lid(self, command: Command) -> None:
+        self._lid_temperature.deactivate(temperature=util.TEMPERATURE_ROOM)
+
+    def _deactivate_block(self, command: Command) -> None:
+        self._plate_temperature.deactivate(temperature=util.TEMPERATURE_ROOM)
+
+    def _get_device_info(self, command: Command) -> str:
+        return (
+            f"serial:{self._settings.serial_number} "
+            f"model:{self._settings.model} "
+            f"version:{self._settings.version}"
+        )
 
     @staticmethod
     def get_terminator() -> bytes:
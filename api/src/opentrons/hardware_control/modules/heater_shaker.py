@@ -76,7 +76,9 @@ class HeaterShaker(mod_abc.AbstractModule):
             poll_interval_seconds = poll_interval_seconds or SIMULATING_POLL_PERIOD
 
         reader = HeaterShakerReader(driver=driver)
-        poller = Poller(reader=reader, interval=poll_interval_seconds)
+        poller = Poller(
+            reader=reader, interval=poll_interval_seconds, read_on_wait=simulating
+        )
         module = cls(
             port=port,
             usb_port=usb_port,
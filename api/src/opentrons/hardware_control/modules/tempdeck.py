@@ -67,7 +67,9 @@ class TempDeck(mod_abc.AbstractModule):
             poll_interval_seconds = poll_interval_seconds or SIM_TEMP_POLL_INTERVAL_SECS
 
         reader = TempDeckReader(driver=driver)
-        poller = Poller(reader=reader, interval=poll_interval_seconds)
+        poller = Poller(
+            reader=reader, interval=poll_interval_seconds, read_on_wait=simulating
+        )
         module = cls(
             port=port,
             usb_port=usb_port,
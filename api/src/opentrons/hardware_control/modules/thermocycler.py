@@ -92,7 +92,9 @@ class Thermocycler(mod_abc.AbstractModule):
             poll_interval_seconds = poll_interval_seconds or SIM_POLLING_FREQUENCY_SEC
 
         reader = ThermocyclerReader(driver=driver)
-        poller = Poller(reader=reader, interval=poll_interval_seconds)
+        poller = Poller(
+            reader=reader, interval=poll_interval_seconds, read_on_wait=simulating
+        )
         module = cls(
             port=port,
             usb_port=usb_port,
@@ -24,13 +24,20 @@ class Poller:
     Args:
         reader: An interface to read data.
         interval: The poll interval, in seconds.
+        read_on_wait: Read as soon as anything waits for the next poll,
+            instead of at the next interval. For simulated modules, which
+            reach their targets instantly and shouldn't wait in real time
+            to report it.
     """
 
     interval: float
 
-    def __init__(self, reader: Reader, interval: float) -> None:
+    def __init__(
+        self, reader: Reader, interval: float, read_on_wait: bool = False
+    ) -> None:
         self.interval = interval
         self._reader = reader
+        self._read_on_wait = read_on_wait
         self._read_lock: Optional["asyncio.Lock"] = None
         self._poll_waiters: List["asyncio.Future[None]"] = []
         self._poll_forever_task: Optional["asyncio.Task[None]"] = None
@@ -64,6 +71,8 @@ class Poller:
 
         poll_future = asyncio.get_running_loop().create_future()
         self._poll_waiters.append(poll_future)
+        if self._read_on_wait:
+            await self._poll_once()
         await poll_future
 
     @contextlib.asynccontextmanager
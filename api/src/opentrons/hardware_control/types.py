@@ -7,6 +7,14 @@ from opentrons import types as top_types
 from opentrons_shared_data.pipette.types import PipetteChannelType
 from opentrons.config import feature_flags
 
+# These are defined alongside the robot config, which needs them, so that
+# loading the config doesn't have to import the whole hardware controller.
+from opentrons.config.types import (  # noqa: F401
+    BoardRevision as BoardRevision,
+    OT3AxisKind as OT3AxisKind,
+    RevisionLiteral as RevisionLiteral,
+)
+
 MODULE_LOG = logging.getLogger(__name__)
 
 
@@ -43,35 +51,6 @@ class OT3Mount(enum.Enum):
         return [cls.LEFT, cls.RIGHT]
 
 
-class OT3AxisKind(enum.Enum):
-    """An enum of the different kinds of axis we have.
-
-    The machine may have different numbers of specific axes implementing
-    each axis kind.
-    """
-
-    X = 0
-    #: Gantry X axis
-    Y = 1
-    #: Gantry Y axis
-    Z = 2
-    #: Z axis (of the left and right)
-    P = 3
-    #: Plunger axis (of the left and right pipettes)
-    Z_G = 4
-    #: Gripper Z axis
-    Q = 6
-    #: High-throughput tip grabbing axis
-    OTHER = 6
-    #: The internal axes of high throughput pipettes, for instance
-
-    def __str__(self) -> str:
-        return self.name
-
-    def is_z_axis(self) -> bool:
-        return self in [OT3AxisKind.Z, OT3AxisKind.Z_G]
-
-
 class Axis(enum.Enum):
     X = 0  # gantry
     Y = 1
@@ -436,35 +415,6 @@ HardwareEventHandler = Callable[[HardwareEvent], None]
 HardwareEventUnsubscriber = Callable[[], None]
 
 
-RevisionLiteral = Literal["2.1", "A", "B", "C", "UNKNOWN"]
-
-
-class BoardRevision(enum.Enum):
-    UNKNOWN = enum.auto()
-    OG = enum.auto()
-    A = enum.auto()
-    B = enum.auto()
-    C = enum.auto()
-    FLEX_B2 = enum.auto()
-
-    @classmethod
-    def by_bits(cls, rev_bits: Tuple[bool, bool]) -> "BoardRevision":
-        br = {
-            (True, True): cls.OG,
-            (False, True): cls.A,
-            (True, False): cls.B,
-            (False, False): cls.C,
-        }
-        return br[rev_bits]
-
-    def real_name(self) -> Union[RevisionLiteral, Literal["UNKNOWN"]]:
-        rn = "2.1" if self.name == "OG" else self.name
-        return cast(Union[RevisionLiteral, Literal["UNKNOWN"]], rn)
-
-    def __str__(self) -> str:
-        return self.real_name()
-
-
 class CriticalPoint(enum.Enum):
     """Possibilities for the point to move in a move call.
 
@@ -44,6 +44,10 @@ class LegacyBroker:
 
         return unsubscribe
 
+    def has_subscribers(self, topic: Literal["command"]) -> bool:
+        """Whether anything is subscribed to `topic`."""
+        return bool(self.subscriptions.get(topic))
+
     def publish(  # noqa: D102
         self, topic: Literal["command"], message: types.CommandMessage
     ) -> None:
@@ -1,5 +1,6 @@
 import functools
 import inspect
+import logging
 from contextlib import contextmanager
 from typing import Any, Callable, Iterator, Optional, TypeVar, cast
 from uuid import uuid4
@@ -42,19 +43,24 @@ FuncT = TypeVar("FuncT", bound=Callable[..., Any])
 def publish(command: CommandPayloadCreator) -> Callable[[FuncT], FuncT]:
     """Publish messages before and after the decorated function has run."""
 
+    message_creator_arg_names = set(inspect.signature(command).parameters.keys())
+
     def _decorator(func: FuncT) -> FuncT:
+        func_sig = inspect.signature(func)
+
         @functools.wraps(func)
         def _decorated(*args: Any, **kwargs: Any) -> Any:
             """Use the args passed to wrapped `func` to build the message payload.
 
-            1. Inspect signature of `func` and bind arguments to signature to map
-               argument names to called (and/or default) values.
-            2. Inspect signature of `command` and map values from `func` call to
-               argument names expected by `command`.
+            1. Bind arguments to the signature of `func` to map argument names
+               to called (and/or default) values.
+            2. Map values from `func` call to argument names expected by `command`.
             3. Map `self` argument of `func` to the `instrument` argument of `command`,
                where applicable.
             4. Construct the command payload and publish it using `publish_context`
             5. Return the value of calling `func` with `*args` and `**kwargs`
+
+            If nothing would see the messages, skip straight to step 5.
             """
 
             broker = getattr(args[0], "broker", None)
@@ -63,13 +69,13 @@ def publish(command: CommandPayloadCreator) -> Callable[[FuncT], FuncT]:
                 broker, LegacyBroker
             ), "Only methods of CommandPublisher classes should be decorated."
 
-            func_sig = _inspect_signature(func)
+            if not _is_observed(broker):
+                return func(*args, **kwargs)
+
             bound_func_args = func_sig.bind(*args, **kwargs)
             bound_func_args.apply_defaults()
             func_args = bound_func_args.arguments
 
-            message_creator_sig = _inspect_signature(command)
-            message_creator_arg_names = set(message_creator_sig.parameters.keys())
             message_creator_args = {
                 n: func_args[n] for n in message_creator_arg_names if n in func_args
             }
@@ -106,6 +112,10 @@ def publish_context(broker: LegacyBroker, command: CommandPayload) -> Iterator[N
     If an `error` is raised in the `with` block, it will be published in the "after"
     message and re-raised.
     """
+    if not _is_observed(broker):
+        yield
+        return
+
     message_id = str(uuid4())
     _do_publish(broker=broker, message_id=message_id, command=command, when="before")
 
@@ -124,10 +134,11 @@ def publish_context(broker: LegacyBroker, command: CommandPayload) -> Iterator[N
         _do_publish(broker=broker, message_id=message_id, command=command, when="after")
 
 
-@functools.lru_cache(maxsize=None)
-def _inspect_signature(func: Callable[..., Any]) -> inspect.Signature:
-    """Inspect function signatures, memoized because it is called very often."""
-    return inspect.signature(func)
+def _is_observed(broker: LegacyBroker) -> bool:
+    """Whether publishing a command would be seen by a subscriber or the log."""
+    return broker.has_subscribers(COMMAND_TOPIC) or broker.logger.isEnabledFor(
+        logging.INFO
+    )
 
 
 def _do_publish(
@@ -148,7 +159,7 @@ def _do_publish(
         "error": error,
     }
 
-    if when == "before":
+    if when == "before" and broker.logger.isEnabledFor(logging.INFO):
         payload_str = ", ".join(f"{k}: {v}" for k, v in payload.items() if k != "text")
         broker.logger.info(f"{name}: {payload_str}")
 
@@ -1,7 +1,8 @@
 """ProtocolEngine-based InstrumentContext core implementation."""
 from __future__ import annotations
 
-from typing import Optional, TYPE_CHECKING, cast, Union
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, TYPE_CHECKING, cast, Union
 from opentrons.protocols.api_support.types import APIVersion
 
 from opentrons.types import Location, Mount
@@ -26,6 +27,12 @@ from opentrons.protocol_engine.types import (
     NozzleLayoutConfigurationType,
     AddressableOffsetVector,
 )
+from opentrons.protocol_engine.commands import (
+    BulkAspirateStep,
+    BulkBlowOutStep,
+    BulkDispenseStep,
+    BulkLiquidHandlingStep,
+)
 from opentrons.protocol_engine.errors.exceptions import TipNotAttachedError
 from opentrons.protocol_engine.clients import SyncClient as EngineClient
 from opentrons.protocols.api_support.definitions import MAX_SUPPORTED_VERSION
@@ -67,6 +74,8 @@ class InstrumentCore(AbstractInstrument[WellCore]):
         self._engine_client = engine_client
         self._sync_hardware_api = sync_hardware_api
         self._protocol_core = protocol_core
+        # Steps deferred by `bulk_liquid_handling`, or `None` outside of it.
+        self._bulk_steps: Optional[List[BulkLiquidHandlingStep]] = None
 
         # TODO(jbl 2022-11-03) flow_rates should not live in the cores, and should be moved to the protocol context
         #   along with other rate related refactors (for the hardware API)
@@ -120,6 +129,7 @@ class InstrumentCore(AbstractInstrument[WellCore]):
             in_place: whether this is a in-place command.
         """
         if well_core is None:
+            self._flush_bulk_steps()
             if not in_place:
                 self._engine_client.move_to_coordinates(
                     pipette_id=self._pipette_id,
@@ -153,14 +163,25 @@ class InstrumentCore(AbstractInstrument[WellCore]):
                 well_name=well_name,
                 well_location=well_location,
             )
-            self._engine_client.aspirate(
-                pipette_id=self._pipette_id,
-                labware_id=labware_id,
-                well_name=well_name,
-                well_location=well_location,
-                volume=volume,
-                flow_rate=flow_rate,
-            )
+            if self._bulk_steps is not None:
+                self._bulk_steps.append(
+                    BulkAspirateStep(
+                        labwareId=labware_id,
+                        wellName=well_name,
+                        wellLocation=well_location,
+                        volume=volume,
+                        flowRate=flow_rate,
+                    )
+                )
+            else:
+                self._engine_client.aspirate(
+                    pipette_id=self._pipette_id,
+                    labware_id=labware_id,
+                    well_name=well_name,
+                    well_location=well_location,
+                    volume=volume,
+                    flow_rate=flow_rate,
+                )
 
         self._protocol_core.set_last_location(location=location, mount=self.get_mount())
 
@@ -194,6 +215,7 @@ class InstrumentCore(AbstractInstrument[WellCore]):
             pass
 
         if well_core is None:
+            self._flush_bulk_steps()
             if not in_place:
                 if isinstance(location, (TrashBin, WasteChute)):
                     self._move_to_disposal_location(
@@ -236,15 +258,27 @@ class InstrumentCore(AbstractInstrument[WellCore]):
                 well_name=well_name,
                 well_location=well_location,
             )
-            self._engine_client.dispense(
-                pipette_id=self._pipette_id,
-                labware_id=labware_id,
-                well_name=well_name,
-                well_location=well_location,
-                volume=volume,
-                flow_rate=flow_rate,
-                push_out=push_out,
-            )
+            if self._bulk_steps is not None:
+                self._bulk_steps.append(
+                    BulkDispenseStep(
+                        labwareId=labware_id,
+                        wellName=well_name,
+                        wellLocation=well_location,
+                        volume=volume,
+                        flowRate=flow_rate,
+                        pushOut=push_out,
+                    )
+                )
+            else:
+                self._engine_client.dispense(
+                    pipette_id=self._pipette_id,
+                    labware_id=labware_id,
+                    well_name=well_name,
+                    well_location=well_location,
+                    volume=volume,
+                    flow_rate=flow_rate,
+                    push_out=push_out,
+                )
 
         if isinstance(location, (TrashBin, WasteChute)):
             self._protocol_core.set_last_location(location=None, mount=self.get_mount())
@@ -268,6 +302,7 @@ class InstrumentCore(AbstractInstrument[WellCore]):
         """
         flow_rate = self.get_blow_out_flow_rate(1.0)
         if well_core is None:
+            self._flush_bulk_steps()
             if not in_place:
                 if isinstance(location, (TrashBin, WasteChute)):
                     self._move_to_disposal_location(
@@ -307,15 +342,25 @@ class InstrumentCore(AbstractInstrument[WellCore]):
                 well_name=well_name,
                 well_location=well_location,
             )
-            self._engine_client.blow_out(
-                pipette_id=self._pipette_id,
-                labware_id=labware_id,
-                well_name=well_name,
-                well_location=well_location,
-                # TODO(jbl 2022-11-07) PAPIv2 does not have an argument for rate and
-                #   this also needs to be refactored along with other flow rate related issues
-                flow_rate=flow_rate,
-            )
+            if self._bulk_steps is not None:
+                self._bulk_steps.append(
+                    BulkBlowOutStep(
+                        labwareId=labware_id,
+                        wellName=well_name,
+                        wellLocation=well_location,
+                        flowRate=flow_rate,
+                    )
+                )
+            else:
+                self._engine_client.blow_out(
+                    pipette_id=self._pipette_id,
+                    labware_id=labware_id,
+                    well_name=well_name,
+                    well_location=well_location,
+                    # TODO(jbl 2022-11-07) PAPIv2 does not have an argument for rate and
+                    #   this also needs to be refactored along with other flow rate related issues
+                    flow_rate=flow_rate,
+                )
 
         if isinstance(location, (TrashBin, WasteChute)):
             self._protocol_core.set_last_location(location=None, mount=self.get_mount())
@@ -324,6 +369,35 @@ class InstrumentCore(AbstractInstrument[WellCore]):
                 location=location, mount=self.get_mount()
             )
 
+    @contextmanager
+    def bulk_liquid_handling(self) -> Iterator[None]:
+        """Run the aspirates, dispenses, and blow-outs into wells within this context together.
+
+        Those steps are deferred and sent as one ``bulkLiquidHandling`` command,
+        just before a step that doesn't target a well, or when the context exits.
+        Other methods of this core must not be called within the context.
+        """
+        assert self._bulk_steps is None, "Bulk liquid handling cannot be nested."
+        self._bulk_steps = []
+        try:
+            yield
+        finally:
+            # Steps that were deferred before an error would have run without
+            # this context, so they still run here.
+            steps, self._bulk_steps = self._bulk_steps, None
+            self._send_bulk_steps(steps)
+
+    def _flush_bulk_steps(self) -> None:
+        if self._bulk_steps:
+            steps, self._bulk_steps = self._bulk_steps, []
+            self._send_bulk_steps(steps)
+
+    def _send_bulk_steps(self, steps: List[BulkLiquidHandlingStep]) -> None:
+        if steps:
+            self._engine_client.bulk_liquid_handling(
+                pipette_id=self._pipette_id, steps=steps
+            )
+
     def touch_tip(
         self,
         location: Location,
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import abstractmethod, ABC
-from typing import Any, Generic, Optional, TypeVar, Union
+from typing import Any, ContextManager, Generic, Optional, TypeVar, Union
 
 from opentrons import types
 from opentrons.hardware_control.dev_types import PipetteDict
@@ -84,6 +84,14 @@ class AbstractInstrument(ABC, Generic[WellCoreType]):
         """
         ...
 
+    @abstractmethod
+    def bulk_liquid_handling(self) -> ContextManager[None]:
+        """Group the aspirates, dispenses, and blow-outs within the context.
+
+        They may be deferred and run together, at the latest when the context exits.
+        """
+        ...
+
     @abstractmethod
     def touch_tip(
         self,
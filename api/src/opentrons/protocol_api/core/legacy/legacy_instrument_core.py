@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, ContextManager, Optional, Union
 
 from opentrons import types
 from opentrons.hardware_control import CriticalPoint
@@ -164,6 +164,10 @@ class LegacyInstrumentCore(AbstractInstrument[LegacyWellCore]):
             self.move_to(location=location)
         self._protocol_interface.get_hardware().blow_out(self._mount)
 
+    def bulk_liquid_handling(self) -> ContextManager[None]:
+        """This will never be called because it was added in API 2.18."""
+        assert False, "bulk_liquid_handling only supported in API 2.18 & later"
+
     def touch_tip(
         self,
         location: types.Location,
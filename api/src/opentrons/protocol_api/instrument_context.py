@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import itertools
 import logging
-from contextlib import ExitStack
+from contextlib import ExitStack, nullcontext
 from typing import Any, List, Optional, Sequence, Union, cast, Dict
 from opentrons_shared_data.errors.exceptions import (
     CommandPreconditionViolated,
@@ -60,6 +61,9 @@ _PARTIAL_NOZZLE_CONFIGURATION_ADDED_IN = APIVersion(2, 16)
 """The version after which a partial nozzle configuration became available for the 96 Channel Pipette."""
 _PARTIAL_NOZZLE_CONFIGURATION_AUTOMATIC_TIP_TRACKING_IN = APIVersion(2, 18)
 """The version after which automatic tip tracking supported partially configured nozzle layouts."""
+_BULK_LIQUID_HANDLING_IN_TRANSFERS_ADDED_IN = APIVersion(2, 18)
+"""The version after which transfers run their aspirates, dispenses, and blow-outs as bulk liquid handling commands."""
+_BULK_TRANSFER_METHODS = {"aspirate", "dispense", "blow_out"}
 
 
 class InstrumentContext(publisher.CommandPublisher):
@@ -1432,8 +1436,19 @@ class InstrumentContext(publisher.CommandPublisher):
         return self
 
     def _execute_transfer(self, plan: transfers.TransferPlan) -> None:
-        for cmd in plan:
-            getattr(self, cmd["method"])(*cmd["args"], **cmd["kwargs"])
+        if self.api_version < _BULK_LIQUID_HANDLING_IN_TRANSFERS_ADDED_IN:
+            for cmd in plan:
+                getattr(self, cmd["method"])(*cmd["args"], **cmd["kwargs"])
+            return
+
+        # Each run of consecutive aspirates, dispenses, and blow-outs between
+        # other steps, like tip changes or mixes, is sent as one command.
+        for is_bulk, steps in itertools.groupby(
+            plan, key=lambda cmd: cmd["method"] in _BULK_TRANSFER_METHODS
+        ):
+            with self._core.bulk_liquid_handling() if is_bulk else nullcontext():
+                for cmd in steps:
+                    getattr(self, cmd["method"])(*cmd["args"], **cmd["kwargs"])
 
     @requires_version(2, 0)
     def delay(self, *args: Any, **kwargs: Any) -> None:
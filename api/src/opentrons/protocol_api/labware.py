@@ -341,15 +341,11 @@ class Labware:
         self._protocol_core = protocol_core
         self._core_map = core_map
 
-        well_columns = core.get_well_columns()
-        self._well_grid = well_grid.create(columns=well_columns)
-        self._wells_by_name = {
-            well_name: Well(
-                parent=self, core=core.get_well_core(well_name), api_version=api_version
-            )
-            for column in well_columns
-            for well_name in column
-        }
+        # Wells and their grid are created on first access, since most protocols
+        # only ever touch a few wells of most of their labware.
+        self._wells_by_name: Optional[Dict[str, Well]] = None
+        self._rows_by_name: Optional[Dict[str, List[Well]]] = None
+        self._columns_by_name: Optional[Dict[str, List[Well]]] = None
 
     @property
     def separate_calibration(self) -> bool:
@@ -369,7 +365,7 @@ class Labware:
         return self._api_version
 
     def __getitem__(self, key: str) -> Well:
-        return self.wells_by_name()[key]
+        return self._get_wells_by_name()[key]
 
     @property
     @requires_version(2, 0)
@@ -625,7 +621,7 @@ class Labware:
         if isinstance(idx, int):
             return self.wells()[idx]
         elif isinstance(idx, str):
-            return self.wells_by_name()[idx]
+            return self._get_wells_by_name()[idx]
         else:
             raise TypeError(
                 f"`Labware.well` must be called with an `int` or `str`, but got {idx}"
@@ -651,14 +647,14 @@ class Labware:
         :return: Ordered list of all wells in a labware.
         """
         if not args:
-            return list(self._wells_by_name.values())
+            return list(self._get_wells_by_name().values())
 
         elif validation.is_all_integers(args):
             wells = self.wells()
             return [wells[idx] for idx in args]
 
         elif validation.is_all_strings(args):
-            wells_by_name = self.wells_by_name()
+            wells_by_name = self._get_wells_by_name()
             return [wells_by_name[idx] for idx in args]
 
         else:
@@ -677,7 +673,50 @@ class Labware:
 
         :return: Dictionary of :py:class:`.Well` objects keyed by well name.
         """
-        return dict(self._wells_by_name)
+        return dict(self._get_wells_by_name())
+
+    def _get_wells_by_name(self) -> Dict[str, Well]:
+        """Get every well keyed by name, creating the wells on first access.
+
+        The returned dict is shared; public accessors must copy it.
+        """
+        if self._wells_by_name is None:
+            self._wells_by_name = {
+                well_name: Well(
+                    parent=self,
+                    core=self._core.get_well_core(well_name),
+                    api_version=self._api_version,
+                )
+                for column in self._core.get_well_columns()
+                for well_name in column
+            }
+        return self._wells_by_name
+
+    def _get_rows_by_name(self) -> Dict[str, List[Well]]:
+        """Get the wells of each row keyed by row name. Shared like `_get_wells_by_name`."""
+        if self._rows_by_name is None:
+            self._create_well_grid()
+        assert self._rows_by_name is not None
+        return self._rows_by_name
+
+    def _get_columns_by_name(self) -> Dict[str, List[Well]]:
+        """Get the wells of each column keyed by column name. Shared like `_get_wells_by_name`."""
+        if self._columns_by_name is None:
+            self._create_well_grid()
+        assert self._columns_by_name is not None
+        return self._columns_by_name
+
+    def _create_well_grid(self) -> None:
+        wells_by_name = self._get_wells_by_name()
+        grid = well_grid.create(columns=self._core.get_well_columns())
+        self._rows_by_name = {
+            row_name: [wells_by_name[well_name] for well_name in row]
+            for row_name, row in grid.rows_by_name.items()
+        }
+        self._columns_by_name = {
+            column_name: [wells_by_name[well_name] for well_name in column]
+            for column_name, column in grid.columns_by_name.items()
+        }
 
     @requires_version(2, 0)
     def wells_by_index(self) -> Dict[str, Well]:
@@ -709,18 +748,15 @@ class Labware:
         :return: A list of row lists.
         """
         if not args:
-            return [
-                [self._wells_by_name[well_name] for well_name in row]
-                for row in self._well_grid.rows_by_name.values()
-            ]
+            return [list(row) for row in self._get_rows_by_name().values()]
 
         elif validation.is_all_integers(args):
             rows = self.rows()
             return [rows[idx] for idx in args]
 
         elif validation.is_all_strings(args):
-            rows_by_name = self.rows_by_name()
-            return [rows_by_name[idx] for idx in args]
+            rows_by_name = self._get_rows_by_name()
+            return [list(rows_by_name[idx]) for idx in args]
 
         else:
             raise TypeError(
@@ -741,8 +777,7 @@ class Labware:
         :return: Dictionary of :py:class:`.Well` lists keyed by row name.
         """
         return {
-            row_name: [self._wells_by_name[well_name] for well_name in row]
-            for row_name, row in self._well_grid.rows_by_name.items()
+            row_name: list(row) for row_name, row in self._get_rows_by_name().items()
         }
 
     @requires_version(2, 0)
@@ -774,18 +809,15 @@ class Labware:
         :return: A list of column lists.
         """
         if not args:
-            return [
-                [self._wells_by_name[well_name] for well_name in column]
-                for column in self._well_grid.columns_by_name.values()
-            ]
+            return [list(column) for column in self._get_columns_by_name().values()]
 
         elif validation.is_all_integers(args):
             columns = self.columns()
             return [columns[idx] for idx in args]
 
         elif validation.is_all_strings(args):
-            columns_by_name = self.columns_by_name()
-            return [columns_by_name[idx] for idx in args]
+            columns_by_name = self._get_columns_by_name()
+            return [list(columns_by_name[idx]) for idx in args]
 
         else:
             raise TypeError(
@@ -806,8 +838,8 @@ class Labware:
         :return: Dictionary of :py:class:`.Well` lists keyed by column name.
         """
         return {
-            column_name: [self._wells_by_name[well_name] for well_name in column]
-            for column_name, column in self._well_grid.columns_by_name.items()
+            column_name: list(column)
+            for column_name, column in self._get_columns_by_name().items()
         }
 
     @requires_version(2, 0)
@@ -912,7 +944,7 @@ class Labware:
             nozzle_map=nozzle_map,
         )
 
-        return self._wells_by_name[well_name] if well_name is not None else None
+        return self._get_wells_by_name()[well_name] if well_name is not None else None
 
     def use_tips(self, start_well: Well, num_channels: int = 1) -> None:
         """
@@ -996,7 +1028,7 @@ class Labware:
             .get_tip_tracker()
             .previous_tip(num_tips=num_tips)
         )
-        return self._wells_by_name[well_core.get_name()] if well_core else None
+        return self._get_wells_by_name()[well_core.get_name()] if well_core else None
 
     # TODO(mc, 2022-11-09): implementation detail; deprecate public method
     def return_tips(self, start_well: Well, num_channels: int = 1) -> None:
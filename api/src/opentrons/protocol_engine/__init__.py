@@ -60,6 +60,8 @@ from .types import (
     RowNozzleLayoutConfiguration,
     ColumnNozzleLayoutConfiguration,
     QuadrantNozzleLayoutConfiguration,
+    CommandTimingHistogram,
+    CommandTypeTiming,
 )
 
 
@@ -121,6 +123,8 @@ __all__ = [
     "RowNozzleLayoutConfiguration",
     "ColumnNozzleLayoutConfiguration",
     "QuadrantNozzleLayoutConfiguration",
+    "CommandTimingHistogram",
+    "CommandTypeTiming",
     # plugins
     "AbstractPlugin",
 ]
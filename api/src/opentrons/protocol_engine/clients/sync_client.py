@@ -513,6 +513,21 @@ class SyncClient:
         result = self._transport.execute_command(request=request)
         return cast(commands.BlowOutInPlaceResult, result)
 
+    def bulk_liquid_handling(
+        self,
+        pipette_id: str,
+        steps: List[commands.BulkLiquidHandlingStep],
+    ) -> commands.BulkLiquidHandlingResult:
+        """Execute a ``BulkLiquidHandling`` command and return the result."""
+        request = commands.BulkLiquidHandlingCreate(
+            params=commands.BulkLiquidHandlingParams(
+                pipetteId=pipette_id,
+                steps=steps,
+            )
+        )
+        result = self._transport.execute_command(request=request)
+        return cast(commands.BulkLiquidHandlingResult, result)
+
     def touch_tip(
         self,
         pipette_id: str,
@@ -56,6 +56,19 @@ from .aspirate_in_place import (
     AspirateInPlaceCommandType,
 )
 
+from .bulk_liquid_handling import (
+    BulkLiquidHandling,
+    BulkLiquidHandlingParams,
+    BulkLiquidHandlingCreate,
+    BulkLiquidHandlingResult,
+    BulkLiquidHandlingCommandType,
+    BulkAspirateStep,
+    BulkDispenseStep,
+    BulkBlowOutStep,
+    BulkLiquidHandlingStep,
+    BulkLiquidHandlingStepResult,
+)
+
 from .comment import (
     Comment,
     CommentParams,
@@ -348,6 +361,17 @@ __all__ = [
     "AspirateInPlaceParams",
     "AspirateInPlaceResult",
     "AspirateInPlaceCommandType",
+    # bulk liquid handling command models
+    "BulkLiquidHandling",
+    "BulkLiquidHandlingCreate",
+    "BulkLiquidHandlingParams",
+    "BulkLiquidHandlingResult",
+    "BulkLiquidHandlingCommandType",
+    "BulkAspirateStep",
+    "BulkDispenseStep",
+    "BulkBlowOutStep",
+    "BulkLiquidHandlingStep",
+    "BulkLiquidHandlingStepResult",
     # comment command models
     "Comment",
     "CommentParams",
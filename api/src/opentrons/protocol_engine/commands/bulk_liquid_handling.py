@@ -0,0 +1,266 @@
+"""Bulk liquid handling command request, result, and implementation models."""
+from __future__ import annotations
+from typing import TYPE_CHECKING, List, Optional, Type, Union
+from typing_extensions import Annotated, Literal
+
+from pydantic import BaseModel, Field
+
+from opentrons_shared_data.errors.exceptions import (
+    EnumeratedError,
+    EStopActivatedError,
+    PythonException,
+)
+
+from ..errors.exceptions import BulkLiquidHandlingStepError, InvalidDispenseVolumeError
+from ..types import CurrentWell, DeckPoint, WellLocation, WellOrigin
+from .pipetting_common import (
+    PipetteIdMixin,
+    AspirateVolumeMixin,
+    DispenseVolumeMixin,
+    FlowRateMixin,
+    WellLocationMixin,
+    DestinationPositionResult,
+)
+from .command import AbstractCommandImpl, BaseCommand, BaseCommandCreate
+
+if TYPE_CHECKING:
+    from ..execution import MovementHandler, PipettingHandler
+    from ..notes import CommandNoteAdder
+    from ..state import StateView
+
+
+BulkLiquidHandlingCommandType = Literal["bulkLiquidHandling"]
+
+
+class BulkAspirateStep(AspirateVolumeMixin, FlowRateMixin, WellLocationMixin):
+    """Move to and aspirate from a well, like an `aspirate` command."""
+
+    stepType: Literal["aspirate"] = "aspirate"
+
+
+class BulkDispenseStep(DispenseVolumeMixin, FlowRateMixin, WellLocationMixin):
+    """Move to and dispense into a well, like a `dispense` command."""
+
+    stepType: Literal["dispense"] = "dispense"
+    pushOut: Optional[float] = Field(
+        None,
+        description="push the plunger a small amount farther than necessary for accurate low-volume dispensing",
+    )
+
+
+class BulkBlowOutStep(FlowRateMixin, WellLocationMixin):
+    """Move to and blow out into a well, like a `blowout` command."""
+
+    stepType: Literal["blowout"] = "blowout"
+
+
+BulkLiquidHandlingStep = Annotated[
+    Union[BulkAspirateStep, BulkDispenseStep, BulkBlowOutStep],
+    Field(discriminator="stepType"),
+]
+
+
+class BulkLiquidHandlingParams(PipetteIdMixin):
+    """Payload required to run a sequence of liquid handling steps."""
+
+    steps: List[BulkLiquidHandlingStep] = Field(
+        ...,
+        description=(
+            "The steps to run, in order, with the pipette's current tip."
+            " Steps are validated against each other, so, for example, a dispense"
+            " can use liquid aspirated by an earlier step."
+        ),
+        min_items=1,
+    )
+
+
+class BulkLiquidHandlingStepResult(BaseModel):
+    """Result data from one step of a bulk liquid handling command."""
+
+    volume: Optional[float] = Field(
+        None,
+        description=(
+            "The volume of liquid that the step aspirated or dispensed, in µL."
+            " Omitted for blow-out steps."
+        ),
+    )
+
+
+class BulkLiquidHandlingResult(DestinationPositionResult):
+    """Result data from the execution of a bulk liquid handling command.
+
+    `position` is where the pipette ended up, after the last step.
+    """
+
+    steps: List[BulkLiquidHandlingStepResult] = Field(
+        ...,
+        description="The result of each step, in the same order as the steps.",
+    )
+
+
+class BulkLiquidHandlingImplementation(
+    AbstractCommandImpl[BulkLiquidHandlingParams, BulkLiquidHandlingResult]
+):
+    """Bulk liquid handling command implementation.
+
+    State is only updated once this command completes, so the implementation
+    keeps track of the pipette's location and aspirated volume between steps itself.
+    """
+
+    def __init__(
+        self,
+        movement: MovementHandler,
+        pipetting: PipettingHandler,
+        state_view: StateView,
+        command_note_adder: CommandNoteAdder,
+        **kwargs: object,
+    ) -> None:
+        self._movement = movement
+        self._pipetting = pipetting
+        self._state_view = state_view
+        self._command_note_adder = command_note_adder
+
+    async def execute(
+        self, params: BulkLiquidHandlingParams
+    ) -> BulkLiquidHandlingResult:
+        """Run each step in turn.
+
+        Raises:
+            BulkLiquidHandlingStepError: if a step fails, wrapping its error, like:
+                TipNotAttachedError if no tip is attached to the pipette,
+                InvalidAspirateVolumeError if a step aspirates more than the tip can hold,
+                or InvalidDispenseVolumeError if a step dispenses more than is aspirated.
+        """
+        pipette_id = params.pipetteId
+        ready_to_aspirate = self._pipetting.get_is_ready_to_aspirate(
+            pipette_id=pipette_id
+        )
+        aspirated_volume = self._state_view.pipettes.get_aspirated_volume(pipette_id)
+        # `None` until the first step has moved the pipette, while the state's
+        # current location is still accurate.
+        current_well: Optional[CurrentWell] = None
+        step_results: List[BulkLiquidHandlingStepResult] = []
+        position = None
+
+        try:
+            for step in params.steps:
+                if isinstance(step, BulkAspirateStep) and not ready_to_aspirate:
+                    await self._movement.move_to_well(
+                        pipette_id=pipette_id,
+                        labware_id=step.labwareId,
+                        well_name=step.wellName,
+                        well_location=WellLocation(origin=WellOrigin.TOP),
+                        current_well=current_well,
+                    )
+                    await self._pipetting.prepare_for_aspirate(pipette_id=pipette_id)
+                    ready_to_aspirate = True
+                    aspirated_volume = 0
+                    current_well = CurrentWell(
+                        pipette_id=pipette_id,
+                        labware_id=step.labwareId,
+                        well_name=step.wellName,
+                    )
+
+                position = await self._movement.move_to_well(
+                    pipette_id=pipette_id,
+                    labware_id=step.labwareId,
+                    well_name=step.wellName,
+                    well_location=step.wellLocation,
+                    current_well=current_well,
+                )
+                current_well = CurrentWell(
+                    pipette_id=pipette_id,
+                    labware_id=step.labwareId,
+                    well_name=step.wellName,
+                )
+
+                volume: Optional[float]
+                if isinstance(step, BulkAspirateStep):
+                    volume = await self._pipetting.aspirate_in_place(
+                        pipette_id=pipette_id,
+                        volume=step.volume,
+                        flow_rate=step.flowRate,
+                        command_note_adder=self._command_note_adder,
+                        current_volume=aspirated_volume or 0,
+                    )
+                    aspirated_volume = (aspirated_volume or 0) + volume
+
+                elif isinstance(step, BulkDispenseStep):
+                    if aspirated_volume is None:
+                        raise InvalidDispenseVolumeError(
+                            "Cannot perform a dispense if there is no volume in attached tip."
+                        )
+                    volume = await self._pipetting.dispense_in_place(
+                        pipette_id=pipette_id,
+                        volume=step.volume,
+                        flow_rate=step.flowRate,
+                        push_out=step.pushOut,
+                        current_volume=aspirated_volume,
+                    )
+                    aspirated_volume -= volume
+                    # Dispensing with a push-out leaves the plunger below the
+                    # bottom, so the next aspirate has to prepare again.
+                    ready_to_aspirate = self._pipetting.get_is_ready_to_aspirate(
+                        pipette_id=pipette_id, current_volume=aspirated_volume
+                    )
+
+                else:
+                    await self._pipetting.blow_out_in_place(
+                        pipette_id=pipette_id, flow_rate=step.flowRate
+                    )
+                    volume = None
+                    ready_to_aspirate = False
+                    aspirated_volume = None
+
+                step_results.append(BulkLiquidHandlingStepResult(volume=volume))
+        except EStopActivatedError:
+            raise
+        except Exception as error:
+            raise BulkLiquidHandlingStepError(
+                failed_step_index=len(step_results),
+                completed_step_volumes=[result.volume for result in step_results],
+                wrapping=[
+                    error
+                    if isinstance(error, EnumeratedError)
+                    else PythonException(error)
+                ],
+            ) from error
+
+        assert position is not None, "Bulk liquid handling requires at least one step."
+        return BulkLiquidHandlingResult(
+            position=DeckPoint(x=position.x, y=position.y, z=position.z),
+            steps=step_results,
+        )
+
+
+class BulkLiquidHandling(
+    BaseCommand[BulkLiquidHandlingParams, BulkLiquidHandlingResult]
+):
+    """Bulk liquid handling command model.
+
+    Runs a whole sequence of aspirate, dispense, and blow-out steps with one
+    command, instead of one command per step. This is much cheaper for
+    protocols that move a lot of liquid, like transfers across whole plates.
+
+    Tips aren't picked up or dropped by this command, so a transfer that changes
+    tips is split into one of these commands per tip. If a step fails, the command
+    fails with a `BulkLiquidHandlingStepError`. The steps before it have still run,
+    and state is updated to reflect them, but the pipette's location becomes unknown.
+    """
+
+    commandType: BulkLiquidHandlingCommandType = "bulkLiquidHandling"
+    params: BulkLiquidHandlingParams
+    result: Optional[BulkLiquidHandlingResult]
+
+    _ImplementationCls: Type[
+        BulkLiquidHandlingImplementation
+    ] = BulkLiquidHandlingImplementation
+
+
+class BulkLiquidHandlingCreate(BaseCommandCreate[BulkLiquidHandlingParams]):
+    """Create bulk liquid handling command request model."""
+
+    commandType: BulkLiquidHandlingCommandType = "bulkLiquidHandling"
+    params: BulkLiquidHandlingParams
+
+    _CommandCls: Type[BulkLiquidHandling] = BulkLiquidHandling
@@ -36,6 +36,14 @@ from .aspirate_in_place import (
     AspirateInPlaceCommandType,
 )
 
+from .bulk_liquid_handling import (
+    BulkLiquidHandling,
+    BulkLiquidHandlingParams,
+    BulkLiquidHandlingCreate,
+    BulkLiquidHandlingResult,
+    BulkLiquidHandlingCommandType,
+)
+
 from .comment import (
     Comment,
     CommentParams,
@@ -291,6 +299,7 @@ Command = Annotated[
     Union[
         Aspirate,
         AspirateInPlace,
+        BulkLiquidHandling,
         Comment,
         Custom,
         Dispense,
@@ -355,6 +364,7 @@ Command = Annotated[
 CommandParams = Union[
     AspirateParams,
     AspirateInPlaceParams,
+    BulkLiquidHandlingParams,
     CommentParams,
     ConfigureForVolumeParams,
     ConfigureNozzleLayoutParams,
@@ -418,6 +428,7 @@ CommandParams = Union[
 CommandType = Union[
     AspirateCommandType,
     AspirateInPlaceCommandType,
+    BulkLiquidHandlingCommandType,
     CommentCommandType,
     ConfigureForVolumeCommandType,
     ConfigureNozzleLayoutCommandType,
@@ -481,6 +492,7 @@ CommandCreate = Annotated[
     Union[
         AspirateCreate,
         AspirateInPlaceCreate,
+        BulkLiquidHandlingCreate,
         CommentCreate,
         ConfigureForVolumeCreate,
         ConfigureNozzleLayoutCreate,
@@ -545,6 +557,7 @@ CommandCreate = Annotated[
 CommandResult = Union[
     AspirateResult,
     AspirateInPlaceResult,
+    BulkLiquidHandlingResult,
     CommentResult,
     ConfigureForVolumeResult,
     ConfigureNozzleLayoutResult,
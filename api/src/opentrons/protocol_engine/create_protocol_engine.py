@@ -10,7 +10,7 @@ from opentrons.util.async_helpers import async_context_manager_in_thread
 from .protocol_engine import ProtocolEngine
 from .resources import DeckDataProvider, ModuleDataProvider
 from .state import Config, StateStore
-from .types import PostRunHardwareState, DeckConfigurationType
+from .types import PostRunHardwareState, DeckConfigurationType, ModuleOffsetData
 
 
 # TODO(mm, 2023-06-16): Arguably, this not being a context manager makes us prone to forgetting to
@@ -21,6 +21,10 @@ async def create_protocol_engine(
     load_fixed_trash: bool = False,
     deck_configuration: typing.Optional[DeckConfigurationType] = None,
     notify_publishers: typing.Optional[typing.Callable[[], None]] = None,
+    deck_data: typing.Optional[DeckDataProvider] = None,
+    module_calibration_offsets: typing.Optional[
+        typing.Dict[str, ModuleOffsetData]
+    ] = None,
 ) -> ProtocolEngine:
     """Create a ProtocolEngine instance.
 
@@ -30,15 +34,21 @@ async def create_protocol_engine(
         load_fixed_trash: Automatically load fixed trash labware in engine.
         deck_configuration: The initial deck configuration the engine will be instantiated with.
         notify_publishers: Notifies robot server publishers of internal state change.
+        deck_data: Where to get the deck definition and fixed labware from.
+            Pass the same one to every call to only load them once.
+            Must be for `config.deck_type`.
+        module_calibration_offsets: The module calibrations to use,
+            if already loaded. Otherwise, they're loaded from storage.
     """
-    deck_data = DeckDataProvider(config.deck_type)
+    deck_data = deck_data or DeckDataProvider(config.deck_type)
     deck_definition = await deck_data.get_deck_definition()
     deck_fixed_labware = (
         await deck_data.get_deck_fixed_labware(deck_definition)
         if load_fixed_trash
         else []
     )
-    module_calibration_offsets = ModuleDataProvider.load_module_calibrations()
+    if module_calibration_offsets is None:
+        module_calibration_offsets = ModuleDataProvider.load_module_calibrations()
 
     state_store = StateStore(
         config=config,
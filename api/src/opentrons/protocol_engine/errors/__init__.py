@@ -52,6 +52,7 @@ from .exceptions import (
     InvalidTargetSpeedError,
     InvalidTargetTemperatureError,
     InvalidBlockVolumeError,
+    BulkLiquidHandlingStepError,
     InvalidHoldTimeError,
     CannotPerformModuleAction,
     PauseNotAllowedError,
@@ -122,6 +123,7 @@ __all__ = [
     "InvalidTargetTemperatureError",
     "InvalidTargetSpeedError",
     "InvalidBlockVolumeError",
+    "BulkLiquidHandlingStepError",
     "InvalidHoldTimeError",
     "CannotPerformModuleAction",
     "PauseNotAllowedError",
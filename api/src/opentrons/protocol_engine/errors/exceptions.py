@@ -924,6 +924,31 @@ class InvalidDispenseVolumeError(ProtocolEngineError):
         super().__init__(ErrorCodes.GENERAL_ERROR, message, details, wrapping)
 
 
+class BulkLiquidHandlingStepError(ProtocolEngineError):
+    """Raised when a step of a bulkLiquidHandling command fails.
+
+    The steps before it have still run. The volume each of them handled is
+    kept, so that state can be updated to reflect them.
+    """
+
+    def __init__(
+        self,
+        failed_step_index: int,
+        completed_step_volumes: Sequence[Optional[float]],
+        wrapping: Sequence[EnumeratedError],
+    ) -> None:
+        """Build a BulkLiquidHandlingStepError."""
+        self.failed_step_index = failed_step_index
+        self.completed_step_volumes = list(completed_step_volumes)
+        super().__init__(
+            wrapping[0].code,
+            f"Step {failed_step_index} of bulk liquid handling failed:"
+            f" {wrapping[0].message}",
+            {"failedStepIndex": str(failed_step_index)},
+            wrapping,
+        )
+
+
 class InvalidPushOutVolumeError(ProtocolEngineError):
     """Raised when attempting to use an invalid volume for dispense push_out."""
 
@@ -1,6 +1,7 @@
 """Command execution module."""
 
 from .command_executor import CommandExecutor
+from .command_timing import CommandTimingTracker
 from .create_queue_worker import create_queue_worker
 from .equipment import (
     EquipmentHandler,
@@ -26,6 +27,7 @@ from .status_bar import StatusBarHandler
 
 __all__ = [
     "CommandExecutor",
+    "CommandTimingTracker",
     "create_queue_worker",
     "EquipmentHandler",
     "LoadedLabwareData",
@@ -1,6 +1,7 @@
 """Command side-effect execution logic container."""
 import asyncio
 from logging import getLogger
+from time import perf_counter
 from typing import Optional, List, Protocol
 
 from opentrons.hardware_control import HardwareControlAPI
@@ -39,6 +40,7 @@ from .tip_handler import TipHandler
 from .run_control import RunControlHandler
 from .rail_lights import RailLightsHandler
 from .status_bar import StatusBarHandler
+from .command_timing import CommandTimingTracker
 
 
 log = getLogger(__name__)
@@ -91,6 +93,7 @@ class CommandExecutor:
         error_recovery_policy: ErrorRecoveryPolicy,
         model_utils: Optional[ModelUtils] = None,
         command_note_tracker_provider: Optional[CommandNoteTrackerProvider] = None,
+        command_timing: Optional[CommandTimingTracker] = None,
     ) -> None:
         """Initialize the CommandExecutor with access to its dependencies."""
         self._hardware_api = hardware_api
@@ -110,6 +113,7 @@ class CommandExecutor:
             command_note_tracker_provider or _NoteTracker
         )
         self._error_recovery_policy = error_recovery_policy
+        self._command_timing = command_timing
 
     async def execute(self, command_id: str) -> None:
         """Run a given command's execution procedure.
@@ -137,10 +141,13 @@ class CommandExecutor:
 
         started_at = self._model_utils.get_timestamp()
 
+        state_update_start = perf_counter()
         self._action_dispatcher.dispatch(
             RunCommandAction(command_id=queued_command.id, started_at=started_at)
         )
         running_command = self._state_store.commands.get(queued_command.id)
+        execute_start = perf_counter()
+        state_update_duration = execute_start - state_update_start
 
         try:
             log.debug(
@@ -153,6 +160,7 @@ class CommandExecutor:
                 result, private_result = await command_impl.execute(running_command.params)  # type: ignore[arg-type]
 
         except (Exception, asyncio.CancelledError) as error:
+            execute_end = perf_counter()
             log.warning(f"Execution of {running_command.id} failed", exc_info=error)
             # TODO(mc, 2022-11-14): mark command as stopped rather than failed
             # https://opentrons.atlassian.net/browse/RCORE-390
@@ -163,6 +171,7 @@ class CommandExecutor:
             elif not isinstance(error, EnumeratedError):
                 error = PythonException(error)
 
+            state_update_start = perf_counter()
             self._action_dispatcher.dispatch(
                 FailCommandAction(
                     error=error,
@@ -185,6 +194,7 @@ class CommandExecutor:
                 )
             )
         else:
+            execute_end = perf_counter()
             update = {
                 "result": result,
                 "status": CommandStatus.SUCCEEDED,
@@ -192,8 +202,18 @@ class CommandExecutor:
                 "notes": note_tracker.get_notes(),
             }
             succeeded_command = running_command.copy(update=update)
+            state_update_start = perf_counter()
             self._action_dispatcher.dispatch(
                 SucceedCommandAction(
                     command=succeeded_command, private_result=private_result
                 ),
             )
+
+        if self._command_timing is not None:
+            state_update_duration += perf_counter() - state_update_start
+            self._command_timing.record(
+                command_type=running_command.commandType,
+                queue_wait_sec=(started_at - running_command.createdAt).total_seconds(),
+                execute_sec=execute_end - execute_start,
+                state_update_sec=state_update_duration,
+            )
@@ -0,0 +1,103 @@
+"""Per-command-type execution timing instrumentation."""
+from bisect import bisect_left
+from typing import Dict, List, Optional
+
+from typing_extensions import Final
+
+from ..types import CommandTimingHistogram, CommandTypeTiming
+
+
+# 1-2-5 series from 100 microseconds to 500 seconds.
+COMMAND_TIMING_BUCKET_UPPER_BOUNDS_SEC: Final = tuple(
+    mantissa * 10.0**exponent for exponent in range(-4, 3) for mantissa in (1, 2, 5)
+)
+
+
+class _Histogram:
+    """A fixed-bucket histogram of durations, in seconds."""
+
+    def __init__(self) -> None:
+        self._bucket_counts = [0] * (len(COMMAND_TIMING_BUCKET_UPPER_BOUNDS_SEC) + 1)
+        self._count = 0
+        self._total = 0.0
+        self._min: Optional[float] = None
+        self._max: Optional[float] = None
+
+    def record(self, duration_sec: float) -> None:
+        duration_sec = max(duration_sec, 0.0)
+        self._bucket_counts[
+            bisect_left(COMMAND_TIMING_BUCKET_UPPER_BOUNDS_SEC, duration_sec)
+        ] += 1
+        self._count += 1
+        self._total += duration_sec
+        if self._min is None or duration_sec < self._min:
+            self._min = duration_sec
+        if self._max is None or duration_sec > self._max:
+            self._max = duration_sec
+
+    def summarize(self) -> CommandTimingHistogram:
+        return CommandTimingHistogram.construct(
+            count=self._count,
+            totalSec=self._total,
+            minSec=self._min,
+            maxSec=self._max,
+            bucketUpperBoundsSec=list(COMMAND_TIMING_BUCKET_UPPER_BOUNDS_SEC),
+            bucketCounts=list(self._bucket_counts),
+        )
+
+
+class _CommandTypeHistograms:
+    def __init__(self) -> None:
+        self.queue_wait = _Histogram()
+        self.execute = _Histogram()
+        self.state_update = _Histogram()
+
+
+class CommandTimingTracker:
+    """Accumulates latency histograms for executed commands, keyed by `commandType`.
+
+    This is opt-in instrumentation, enabled with `Config.enable_command_timing`.
+    It lives outside of the ProtocolEngine's state so recording a sample
+    never dispatches an action.
+    """
+
+    def __init__(self) -> None:
+        self._histograms_by_command_type: Dict[str, _CommandTypeHistograms] = {}
+
+    def record(
+        self,
+        command_type: str,
+        queue_wait_sec: float,
+        execute_sec: float,
+        state_update_sec: float,
+    ) -> None:
+        """Record the phase durations of a single executed command.
+
+        Arguments:
+            command_type: The `commandType` of the executed command.
+            queue_wait_sec: Time from the command's creation until it started.
+            execute_sec: Time spent in the command's implementation.
+            state_update_sec: Time spent dispatching the command's
+                start and completion actions to state.
+        """
+        histograms = self._histograms_by_command_type.get(command_type)
+        if histograms is None:
+            histograms = _CommandTypeHistograms()
+            self._histograms_by_command_type[command_type] = histograms
+        histograms.queue_wait.record(queue_wait_sec)
+        histograms.execute.record(execute_sec)
+        histograms.state_update.record(state_update_sec)
+
+    def get_summary(self) -> List[CommandTypeTiming]:
+        """Get the accumulated histograms for every command type, sorted by type."""
+        return [
+            CommandTypeTiming.construct(
+                commandType=command_type,
+                queueWait=histograms.queue_wait.summarize(),
+                execute=histograms.execute.summarize(),
+                stateUpdate=histograms.state_update.summarize(),
+            )
+            for command_type, histograms in sorted(
+                self._histograms_by_command_type.items()
+            )
+        ]
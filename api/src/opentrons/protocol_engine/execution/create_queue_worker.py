@@ -1,10 +1,13 @@
 """QueueWorker and dependency factory."""
+from typing import Optional
+
 from opentrons.hardware_control import HardwareControlAPI
 from opentrons.protocol_engine.error_recovery_policy import ErrorRecoveryPolicy
 from opentrons.protocol_engine.execution.rail_lights import RailLightsHandler
 
 from ..state import StateStore
 from ..actions import ActionDispatcher
+from ..resources import Clock, ModelUtils
 from .equipment import EquipmentHandler
 from .movement import MovementHandler
 from .gantry_mover import create_gantry_mover
@@ -15,6 +18,7 @@ from .run_control import RunControlHandler
 from .command_executor import CommandExecutor
 from .queue_worker import QueueWorker
 from .status_bar import StatusBarHandler
+from .command_timing import CommandTimingTracker
 
 
 def create_queue_worker(
@@ -22,6 +26,8 @@ def create_queue_worker(
     state_store: StateStore,
     action_dispatcher: ActionDispatcher,
     error_recovery_policy: ErrorRecoveryPolicy,
+    command_timing: Optional[CommandTimingTracker] = None,
+    clock: Optional[Clock] = None,
 ) -> QueueWorker:
     """Create a ready-to-use QueueWorker instance.
 
@@ -30,6 +36,8 @@ def create_queue_worker(
         state_store: StateStore to pass down to dependencies.
         action_dispatcher: ActionDispatcher to pass down to dependencies.
         error_recovery_policy: ErrorRecoveryPolicy to pass down to dependencies.
+        command_timing: Where to record command execution timing, if anywhere.
+        clock: Where to take command timestamps from and wait for delays with.
     """
     gantry_mover = create_gantry_mover(
         hardware_api=hardware_api,
@@ -68,6 +76,7 @@ def create_queue_worker(
     run_control_handler = RunControlHandler(
         state_store=state_store,
         action_dispatcher=action_dispatcher,
+        clock=clock,
     )
     rail_lights_handler = RailLightsHandler(
         hardware_api=hardware_api,
@@ -89,6 +98,8 @@ def create_queue_worker(
         rail_lights=rail_lights_handler,
         status_bar=status_bar_handler,
         error_recovery_policy=error_recovery_policy,
+        command_timing=command_timing,
+        model_utils=ModelUtils(clock=clock),
     )
 
     return QueueWorker(
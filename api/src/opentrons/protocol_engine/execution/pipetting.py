@@ -29,8 +29,14 @@ _VOLUME_ROUNDING_ERROR_TOLERANCE = 1e-9
 class PipettingHandler(TypingProtocol):
     """Liquid handling commands."""
 
-    def get_is_ready_to_aspirate(self, pipette_id: str) -> bool:
-        """Get whether a pipette is ready to aspirate."""
+    def get_is_ready_to_aspirate(
+        self, pipette_id: str, current_volume: Optional[float] = None
+    ) -> bool:
+        """Get whether a pipette is ready to aspirate.
+
+        `current_volume` overrides the volume that state says is in the tip,
+        for commands that aspirate and dispense more than once.
+        """
 
     async def prepare_for_aspirate(self, pipette_id: str) -> None:
         """Prepare for pipette aspiration."""
@@ -41,8 +47,13 @@ class PipettingHandler(TypingProtocol):
         volume: float,
         flow_rate: float,
         command_note_adder: CommandNoteAdder,
+        current_volume: Optional[float] = None,
     ) -> float:
-        """Set flow-rate and aspirate."""
+        """Set flow-rate and aspirate.
+
+        `current_volume` overrides the volume that state says is in the tip,
+        for commands that aspirate and dispense more than once.
+        """
 
     async def dispense_in_place(
         self,
@@ -50,8 +61,13 @@ class PipettingHandler(TypingProtocol):
         volume: float,
         flow_rate: float,
         push_out: Optional[float],
+        current_volume: Optional[float] = None,
     ) -> float:
-        """Set flow-rate and dispense."""
+        """Set flow-rate and dispense.
+
+        `current_volume` overrides the volume that state says is in the tip,
+        for commands that aspirate and dispense more than once.
+        """
 
     async def blow_out_in_place(
         self,
@@ -69,16 +85,17 @@ class HardwarePipettingHandler(PipettingHandler):
         self._state_view = state_view
         self._hardware_api = hardware_api
 
-    def get_is_ready_to_aspirate(self, pipette_id: str) -> bool:
+    def get_is_ready_to_aspirate(
+        self, pipette_id: str, current_volume: Optional[float] = None
+    ) -> bool:
         """Get whether a pipette is ready to aspirate."""
         hw_pipette = self._state_view.pipettes.get_hardware_pipette(
             pipette_id=pipette_id,
             attached_pipettes=self._hardware_api.attached_instruments,
         )
-        return (
-            self._state_view.pipettes.get_aspirated_volume(pipette_id) is not None
-            and hw_pipette.config["ready_to_aspirate"]
-        )
+        if current_volume is None:
+            current_volume = self._state_view.pipettes.get_aspirated_volume(pipette_id)
+        return current_volume is not None and hw_pipette.config["ready_to_aspirate"]
 
     async def prepare_for_aspirate(self, pipette_id: str) -> None:
         """Prepare for pipette aspiration."""
@@ -91,6 +108,7 @@ class HardwarePipettingHandler(PipettingHandler):
         volume: float,
         flow_rate: float,
         command_note_adder: CommandNoteAdder,
+        current_volume: Optional[float] = None,
     ) -> float:
         """Set flow-rate and aspirate."""
         # get mount and config data from state and hardware controller
@@ -99,6 +117,7 @@ class HardwarePipettingHandler(PipettingHandler):
             pipette_id=pipette_id,
             aspirate_volume=volume,
             command_note_adder=command_note_adder,
+            current_volume=current_volume,
         )
         hw_pipette = self._state_view.pipettes.get_hardware_pipette(
             pipette_id=pipette_id,
@@ -117,10 +136,14 @@ class HardwarePipettingHandler(PipettingHandler):
         volume: float,
         flow_rate: float,
         push_out: Optional[float],
+        current_volume: Optional[float] = None,
     ) -> float:
         """Dispense liquid without moving the pipette."""
         adjusted_volume = _validate_dispense_volume(
-            state_view=self._state_view, pipette_id=pipette_id, dispense_volume=volume
+            state_view=self._state_view,
+            pipette_id=pipette_id,
+            dispense_volume=volume,
+            current_volume=current_volume,
         )
         hw_pipette = self._state_view.pipettes.get_hardware_pipette(
             pipette_id=pipette_id,
@@ -193,9 +216,13 @@ class VirtualPipettingHandler(PipettingHandler):
         """Initialize a PipettingHandler instance."""
         self._state_view = state_view
 
-    def get_is_ready_to_aspirate(self, pipette_id: str) -> bool:
+    def get_is_ready_to_aspirate(
+        self, pipette_id: str, current_volume: Optional[float] = None
+    ) -> bool:
         """Get whether a pipette is ready to aspirate."""
-        return self._state_view.pipettes.get_aspirated_volume(pipette_id) is not None
+        if current_volume is None:
+            current_volume = self._state_view.pipettes.get_aspirated_volume(pipette_id)
+        return current_volume is not None
 
     async def prepare_for_aspirate(self, pipette_id: str) -> None:
         """Virtually prepare to aspirate (no-op)."""
@@ -206,6 +233,7 @@ class VirtualPipettingHandler(PipettingHandler):
         volume: float,
         flow_rate: float,
         command_note_adder: CommandNoteAdder,
+        current_volume: Optional[float] = None,
     ) -> float:
         """Virtually aspirate (no-op)."""
         self._validate_tip_attached(pipette_id=pipette_id, command_name="aspirate")
@@ -214,6 +242,7 @@ class VirtualPipettingHandler(PipettingHandler):
             pipette_id=pipette_id,
             aspirate_volume=volume,
             command_note_adder=command_note_adder,
+            current_volume=current_volume,
         )
 
     async def dispense_in_place(
@@ -222,6 +251,7 @@ class VirtualPipettingHandler(PipettingHandler):
         volume: float,
         flow_rate: float,
         push_out: Optional[float],
+        current_volume: Optional[float] = None,
     ) -> float:
         """Virtually dispense (no-op)."""
         # TODO (tz, 8-23-23): add a check for push_out not larger that the max volume allowed when working on this https://opentrons.atlassian.net/browse/RSS-329
@@ -231,7 +261,10 @@ class VirtualPipettingHandler(PipettingHandler):
             )
         self._validate_tip_attached(pipette_id=pipette_id, command_name="dispense")
         return _validate_dispense_volume(
-            state_view=self._state_view, pipette_id=pipette_id, dispense_volume=volume
+            state_view=self._state_view,
+            pipette_id=pipette_id,
+            dispense_volume=volume,
+            current_volume=current_volume,
         )
 
     async def blow_out_in_place(
@@ -266,6 +299,7 @@ def _validate_aspirate_volume(
     pipette_id: str,
     aspirate_volume: float,
     command_note_adder: CommandNoteAdder,
+    current_volume: Optional[float] = None,
 ) -> float:
     """Get whether the given volume is valid to aspirate right now.
 
@@ -274,9 +308,10 @@ def _validate_aspirate_volume(
     """
     working_volume = state_view.pipettes.get_working_volume(pipette_id=pipette_id)
 
-    current_volume = (
-        state_view.pipettes.get_aspirated_volume(pipette_id=pipette_id) or 0
-    )
+    if current_volume is None:
+        current_volume = (
+            state_view.pipettes.get_aspirated_volume(pipette_id=pipette_id) or 0
+        )
 
     # TODO(mm, 2024-01-11): We should probably just use
     # state_view.pipettes.get_available_volume()? Its whole `None` return vs. exception
@@ -316,14 +351,21 @@ def _validate_aspirate_volume(
 
 
 def _validate_dispense_volume(
-    state_view: StateView, pipette_id: str, dispense_volume: float
+    state_view: StateView,
+    pipette_id: str,
+    dispense_volume: float,
+    current_volume: Optional[float] = None,
 ) -> float:
     """Get whether the given volume is valid to dispense right now.
 
     Return the volume to dispense, possibly clamped, or raise an
     InvalidDispenseVolumeError.
     """
-    aspirated_volume = state_view.pipettes.get_aspirated_volume(pipette_id)
+    aspirated_volume = (
+        current_volume
+        if current_volume is not None
+        else state_view.pipettes.get_aspirated_volume(pipette_id)
+    )
     if aspirated_volume is None:
         raise InvalidDispenseVolumeError(
             "Cannot perform a dispense if there is no volume in attached tip."
@@ -1,8 +1,9 @@
 """Run control command side-effect logic."""
-import asyncio
+from typing import Optional
 
 from ..state import StateStore
 from ..actions import ActionDispatcher, PauseAction, PauseSource
+from ..resources import Clock
 
 
 class RunControlHandler:
@@ -14,10 +15,12 @@ class RunControlHandler:
         self,
         state_store: StateStore,
         action_dispatcher: ActionDispatcher,
+        clock: Optional[Clock] = None,
     ) -> None:
         """Initialize a RunControlHandler instance."""
         self._state_store = state_store
         self._action_dispatcher = action_dispatcher
+        self._clock = clock or Clock()
 
     async def wait_for_resume(self) -> None:
         """Issue a PauseAction to the store, pausing the run."""
@@ -30,4 +33,4 @@ class RunControlHandler:
     async def wait_for_duration(self, seconds: float) -> None:
         """Delay protocol execution for a duration."""
         if not self._state_store.config.ignore_pause:
-            await asyncio.sleep(seconds)
+            await self._clock.sleep(seconds)
@@ -1,7 +1,7 @@
 """ProtocolEngine class definition."""
 from contextlib import AsyncExitStack
 from logging import getLogger
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Union
 from opentrons.protocol_engine.actions.actions import ResumeFromRecoveryAction
 from opentrons.protocol_engine.error_recovery_policy import (
     ErrorRecoveryPolicy,
@@ -21,7 +21,7 @@ from opentrons_shared_data.errors import (
 from .errors import ProtocolCommandFailedError, ErrorOccurrence
 from .errors.exceptions import EStopActivatedError
 from . import commands, slot_standardization
-from .resources import ModelUtils, ModuleDataProvider
+from .resources import Clock, ModelUtils, ModuleDataProvider, VirtualClock
 from .types import (
     LabwareOffset,
     LabwareOffsetCreate,
@@ -32,8 +32,10 @@ from .types import (
     PostRunHardwareState,
     DeckConfigurationType,
     AddressableAreaLocation,
+    CommandTypeTiming,
 )
 from .execution import (
+    CommandTimingTracker,
     QueueWorker,
     create_queue_worker,
     DoorWatcher,
@@ -106,7 +108,8 @@ class ProtocolEngine:
         """
         self._hardware_api = hardware_api
         self._state_store = state_store
-        self._model_utils = model_utils or ModelUtils()
+        clock = VirtualClock() if state_store.config.use_virtual_clock else Clock()
+        self._model_utils = model_utils or ModelUtils(clock=clock)
 
         self._action_dispatcher = action_dispatcher or ActionDispatcher(
             sink=self._state_store
@@ -115,11 +118,16 @@ class ProtocolEngine:
             state=self._state_store,
             action_dispatcher=self._action_dispatcher,
         )
+        self._command_timing: Optional[CommandTimingTracker] = None
+        if queue_worker is None and state_store.config.enable_command_timing:
+            self._command_timing = CommandTimingTracker()
         self._queue_worker = queue_worker or create_queue_worker(
             hardware_api=hardware_api,
             state_store=self._state_store,
             action_dispatcher=self._action_dispatcher,
             error_recovery_policy=error_recovery_policy,
+            command_timing=self._command_timing,
+            clock=clock,
         )
         self._hardware_stopper = hardware_stopper or HardwareStopper(
             hardware_api=hardware_api,
@@ -140,6 +148,17 @@ class ProtocolEngine:
         """Get an interface to retrieve calculated state values."""
         return self._state_store
 
+    def get_command_timing(self) -> Optional[List[CommandTypeTiming]]:
+        """Get per-command-type execution timing histograms.
+
+        Returns:
+            The accumulated histograms for every command type executed so far,
+            or `None` if the engine was not configured with `enable_command_timing`.
+        """
+        if self._command_timing is None:
+            return None
+        return self._command_timing.get_summary()
+
     def add_plugin(self, plugin: AbstractPlugin) -> None:
         """Add a plugin to the engine to customize behavior."""
         self._plugin_starter.start(plugin)
@@ -527,6 +546,20 @@ class ProtocolEngine:
             )
         )
 
+    async def discard(self) -> None:
+        """Clean up an engine that was never played, without touching the hardware.
+
+        Unlike `finish()`, this doesn't halt or home the gantry, drop tips,
+        or change the engine's state. It only stops the engine's background
+        tasks. After an engine has been discarded, it can't be used.
+        """
+        self._queue_worker.cancel()
+        exit_stack = AsyncExitStack()
+        exit_stack.push_async_callback(self._plugin_starter.stop)  # Last step.
+        exit_stack.callback(self._door_watcher.stop)
+        exit_stack.push_async_callback(self._queue_worker.join)  # First step.
+        await exit_stack.aclose()
+
     def add_labware_offset(self, request: LabwareOffsetCreate) -> LabwareOffset:
         """Add a new labware offset and return it.
 
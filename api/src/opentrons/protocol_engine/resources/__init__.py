@@ -5,6 +5,7 @@ as needed. Some classes may contain solely static methods.
 """
 from . import pipette_data_provider
 from . import labware_validation
+from .clock import Clock, VirtualClock
 from .model_utils import ModelUtils
 from .deck_data_provider import DeckDataProvider, DeckFixedLabware
 from .labware_data_provider import LabwareDataProvider
@@ -13,6 +14,8 @@ from .ot3_validation import ensure_ot3_hardware
 
 
 __all__ = [
+    "Clock",
+    "VirtualClock",
     "ModelUtils",
     "LabwareDataProvider",
     "DeckDataProvider",
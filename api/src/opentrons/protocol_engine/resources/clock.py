@@ -0,0 +1,37 @@
+"""Time resource providers."""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+
+class Clock:
+    """The real time, passing in real time."""
+
+    def now(self) -> datetime:
+        """Get the current time."""
+        return datetime.now(tz=timezone.utc)
+
+    async def sleep(self, seconds: float) -> None:
+        """Wait for a duration to pass."""
+        await asyncio.sleep(seconds)
+
+
+class VirtualClock(Clock):
+    """Simulated time, where sleeping takes no real time at all.
+
+    The time is the real time plus everything slept so far, so timestamps
+    stay in order and a delay ends as long after it starts as it would on
+    a robot.
+    """
+
+    def __init__(self) -> None:
+        self._time_slept = timedelta()
+
+    def now(self) -> datetime:
+        """Get the current simulated time."""
+        return super().now() + self._time_slept
+
+    async def sleep(self, seconds: float) -> None:
+        """Advance the simulated time by a duration without waiting for it."""
+        self._time_slept += timedelta(seconds=max(seconds, 0))
+        # Yield like a real sleep would, so other tasks still get to run.
+        await asyncio.sleep(0)
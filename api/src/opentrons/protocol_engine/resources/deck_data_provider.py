@@ -1,6 +1,6 @@
 """Deck data resource provider."""
 from dataclasses import dataclass
-from typing import List, Optional, cast
+from typing import Dict, List, Optional, cast
 from typing_extensions import final
 
 import anyio
@@ -28,9 +28,16 @@ class DeckFixedLabware:
 
 
 class DeckDataProvider:
-    """Provider class to wrap deck definition and data retrieval."""
+    """Provider class to wrap deck definition and data retrieval.
+
+    Deck definitions and fixed labware don't change while the software is running,
+    so each provider loads them only once. Keep a provider around to skip loading
+    them again for every new ProtocolEngine.
+    """
 
     _labware_data: LabwareDataProvider
+    _deck_definition: Optional[DeckDefinitionV5]
+    _fixed_labware_by_deck: Dict[str, List[DeckFixedLabware]]
 
     def __init__(
         self, deck_type: DeckType, labware_data: Optional[LabwareDataProvider] = None
@@ -38,6 +45,8 @@ class DeckDataProvider:
         """Initialize a DeckDataProvider."""
         self._deck_type = deck_type
         self._labware_data = labware_data or LabwareDataProvider()
+        self._deck_definition = None
+        self._fixed_labware_by_deck = {}
 
     async def get_deck_definition(self) -> DeckDefinitionV5:
         """Get a labware definition given the labware's identification."""
@@ -47,13 +56,19 @@ class DeckDataProvider:
                 name=self._deck_type.value, version=DEFAULT_DECK_DEFINITION_VERSION
             )
 
-        return await anyio.to_thread.run_sync(sync)
+        if self._deck_definition is None:
+            self._deck_definition = await anyio.to_thread.run_sync(sync)
+        return self._deck_definition
 
     async def get_deck_fixed_labware(
         self,
         deck_definition: DeckDefinitionV5,
     ) -> List[DeckFixedLabware]:
         """Get a list of all labware fixtures from a given deck definition."""
+        cached = self._fixed_labware_by_deck.get(deck_definition["otId"])
+        if cached is not None:
+            return list(cached)
+
         labware: List[DeckFixedLabware] = []
 
         for fixture in deck_definition["locations"]["legacyFixtures"]:
@@ -77,4 +92,5 @@ class DeckDataProvider:
                     )
                 )
 
-        return labware
+        self._fixed_labware_by_deck[deck_definition["otId"]] = labware
+        return list(labware)
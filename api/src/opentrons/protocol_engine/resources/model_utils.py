@@ -1,12 +1,18 @@
 """Unique ID generation provider."""
-from datetime import datetime, timezone
+from datetime import datetime
 from uuid import uuid4
 from typing import Optional
 
+from .clock import Clock
+
 
 class ModelUtils:
     """Common resource model utilities provider."""
 
+    def __init__(self, clock: Optional[Clock] = None) -> None:
+        """Initialize the provider, with the clock to take timestamps from."""
+        self._clock = clock or Clock()
+
     @staticmethod
     def generate_id(prefix: str = "") -> str:
         """Generate a unique identifier.
@@ -26,7 +32,6 @@ class ModelUtils:
         """
         return maybe_id if maybe_id is not None else ModelUtils.generate_id()
 
-    @staticmethod
-    def get_timestamp() -> datetime:
+    def get_timestamp(self) -> datetime:
         """Get a timestamp of the current time."""
-        return datetime.now(tz=timezone.utc)
+        return self._clock.now()
@@ -480,6 +480,10 @@ class CommandView(HasState[CommandState]):
         """
         return self._state.command_history.get_all_commands()
 
+    def get_count(self) -> int:
+        """Get the number of commands in state, without building a list of them."""
+        return self._state.command_history.length()
+
     def get_slice(
         self,
         cursor: Optional[int],
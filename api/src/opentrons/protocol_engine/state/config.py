@@ -27,6 +27,12 @@ class Config:
             configuration instead of loading a provided configuration
         block_on_door_open: Protocol execution should pause if the
             front door is opened.
+        enable_command_timing: The engine should accumulate per-command-type
+            execution timing histograms, retrievable with
+            `ProtocolEngine.get_command_timing()`.
+        use_virtual_clock: Delays should pass instantly instead of in real time,
+            with command timestamps moved forward as if they had been waited out.
+            Meant for simulated hardware.
     """
 
     robot_type: RobotType
@@ -37,3 +43,5 @@ class Config:
     use_virtual_gripper: bool = False
     use_simulated_deck_config: bool = False
     block_on_door_open: bool = False
+    enable_command_timing: bool = False
+    use_virtual_clock: bool = False
@@ -28,6 +28,10 @@ from ..commands import (
     LoadPipetteResult,
     AspirateResult,
     AspirateInPlaceResult,
+    BulkAspirateStep,
+    BulkDispenseStep,
+    BulkLiquidHandling,
+    BulkLiquidHandlingResult,
     DispenseResult,
     DispenseInPlaceResult,
     MoveLabwareResult,
@@ -55,6 +59,7 @@ from ..commands.configuring_common import (
 )
 from ..actions import (
     Action,
+    FailCommandAction,
     SetPipetteMovementSpeedAction,
     SucceedCommandAction,
 )
@@ -152,6 +157,8 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
         """Modify state in reaction to an action."""
         if isinstance(action, SucceedCommandAction):
             self._handle_command(action.command, action.private_result)
+        elif isinstance(action, FailCommandAction):
+            self._handle_failed_command(action)
         elif isinstance(action, SetPipetteMovementSpeedAction):
             self._state.movement_speed_by_id[action.pipette_id] = action.speed
 
@@ -285,7 +292,42 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
             pipette_id = command.params.pipetteId
             self._state.aspirated_volume_by_id[pipette_id] = 0
 
-    def _update_current_location(self, command: Command) -> None:
+        elif isinstance(command, BulkLiquidHandling) and command.result is not None:
+            self._replay_bulk_liquid_handling(
+                command, [step_result.volume for step_result in command.result.steps]
+            )
+
+    def _handle_failed_command(self, action: FailCommandAction) -> None:
+        command = action.running_command
+        if isinstance(command, BulkLiquidHandling) and isinstance(
+            action.error, errors.BulkLiquidHandlingStepError
+        ):
+            # The steps before the failed one still ran.
+            self._replay_bulk_liquid_handling(
+                command, action.error.completed_step_volumes
+            )
+            # The failed step may have left the pipette anywhere.
+            self._state.current_location = None
+            self._state.current_deck_point = CurrentDeckPoint(
+                mount=None, deck_point=None
+            )
+
+    def _replay_bulk_liquid_handling(
+        self, command: BulkLiquidHandling, step_volumes: List[Optional[float]]
+    ) -> None:
+        """Update the aspirated volume as if each step had been its own command."""
+        pipette_id = command.params.pipetteId
+        volume = self._state.aspirated_volume_by_id[pipette_id]
+        for step, step_volume in zip(command.params.steps, step_volumes):
+            if isinstance(step, BulkAspirateStep):
+                volume = (volume or 0) + (step_volume or 0)
+            elif isinstance(step, BulkDispenseStep):
+                volume = (volume or 0) - (step_volume or 0)
+            else:
+                volume = None
+        self._state.aspirated_volume_by_id[pipette_id] = volume
+
+    def _update_current_location(self, command: Command) -> None:  # noqa: C901
         # These commands leave the pipette in a new location.
         # Update current_location to reflect that.
         if isinstance(
@@ -306,6 +348,14 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
                 well_name=command.params.wellName,
             )
 
+        elif isinstance(command, BulkLiquidHandling) and command.result is not None:
+            last_step = command.params.steps[-1]
+            self._state.current_location = CurrentWell(
+                pipette_id=command.params.pipetteId,
+                labware_id=last_step.labwareId,
+                well_name=last_step.wellName,
+            )
+
         elif isinstance(
             command.result,
             (MoveToAddressableAreaResult, MoveToAddressableAreaForDropTipResult),
@@ -376,6 +426,7 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
                 DispenseResult,
                 BlowOutResult,
                 TouchTipResult,
+                BulkLiquidHandlingResult,
             ),
         ):
             pipette_id = command.params.pipetteId
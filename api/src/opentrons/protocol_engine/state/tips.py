@@ -1,7 +1,7 @@
 """Tip state tracking."""
 from dataclasses import dataclass
-from enum import Enum
-from typing import Dict, Optional, List, Union
+from functools import lru_cache
+from typing import Dict, Optional, List, Tuple
 
 from .abstract_store import HasState, HandlesActions
 from ..actions import (
@@ -27,22 +27,32 @@ from ..error_recovery_policy import ErrorRecoveryType
 from opentrons.hardware_control.nozzle_manager import NozzleMap
 
 
-class TipRackWellState(Enum):
-    """The state of a single tip in a tip rack's well."""
+@dataclass
+class TipRackState:
+    """The tips of a tip rack, as bitmasks over its grid of wells.
 
-    CLEAN = "clean"
-    USED = "used"
+    Bit ``column * row_count + row`` of a mask stands for the well in that
+    column and row, so bits follow the rack's ordering, column by column.
+    """
 
+    columns: List[List[str]]
+    row_count: int
+    bit_by_well_name: Dict[str, int]
+    wells: int
+    """Bits of the grid that hold a well."""
+    used: int
+    """Bits of the wells whose tip has been used."""
 
-TipRackStateByWellName = Dict[str, TipRackWellState]
+    def get_well_name(self, bit: int) -> str:
+        """Get the name of the well at a bit."""
+        return self.columns[bit // self.row_count][bit % self.row_count]
 
 
 @dataclass
 class TipState:
     """State of all tips."""
 
-    tips_by_labware_id: Dict[str, TipRackStateByWellName]
-    column_by_labware_id: Dict[str, List[List[str]]]
+    tips_by_labware_id: Dict[str, TipRackState]
     channels_by_pipette_id: Dict[str, int]
     length_by_pipette_id: Dict[str, float]
     active_channels_by_pipette_id: Dict[str, int]
@@ -58,7 +68,6 @@ class TipStore(HasState[TipState], HandlesActions):
         """Initialize a liquid store and its state."""
         self._state = TipState(
             tips_by_labware_id={},
-            column_by_labware_id={},
             channels_by_pipette_id={},
             length_by_pipette_id={},
             active_channels_by_pipette_id={},
@@ -93,12 +102,7 @@ class TipStore(HasState[TipState], HandlesActions):
             self._handle_failed_command(action)
 
         elif isinstance(action, ResetTipsAction):
-            labware_id = action.labware_id
-
-            for well_name in self._state.tips_by_labware_id[labware_id].keys():
-                self._state.tips_by_labware_id[labware_id][
-                    well_name
-                ] = TipRackWellState.CLEAN
+            self._state.tips_by_labware_id[action.labware_id].used = 0
 
     def _handle_succeeded_command(self, command: Command) -> None:
         if (
@@ -107,14 +111,9 @@ class TipStore(HasState[TipState], HandlesActions):
         ):
             labware_id = command.result.labwareId
             definition = command.result.definition
-            self._state.tips_by_labware_id[labware_id] = {
-                well_name: TipRackWellState.CLEAN
-                for column in definition.ordering
-                for well_name in column
-            }
-            self._state.column_by_labware_id[labware_id] = [
-                column for column in definition.ordering
-            ]
+            self._state.tips_by_labware_id[labware_id] = _build_tip_rack(
+                [column for column in definition.ordering]
+            )
 
         elif isinstance(command.result, PickUpTipResult):
             labware_id = command.params.labwareId
@@ -152,46 +151,40 @@ class TipStore(HasState[TipState], HandlesActions):
             # Note: We're logically removing the tip from the tip rack,
             # but we're not logically updating the pipette to have that tip on it.
 
-    def _set_used_tips(  # noqa: C901
-        self, pipette_id: str, well_name: str, labware_id: str
-    ) -> None:
-        columns = self._state.column_by_labware_id.get(labware_id, [])
-        wells = self._state.tips_by_labware_id.get(labware_id, {})
+    def _set_used_tips(self, pipette_id: str, well_name: str, labware_id: str) -> None:
         nozzle_map = self._state.nozzle_map_by_pipette_id[pipette_id]
+        tip_rack = self._state.tips_by_labware_id.get(labware_id)
+        if tip_rack is None or not tip_rack.wells:
+            return
 
         # TODO (cb, 02-28-2024): Transition from using partial nozzle map to full instrument map for the set used logic
         num_nozzle_cols = len(nozzle_map.columns)
         num_nozzle_rows = len(nozzle_map.rows)
+        column_count = len(tip_rack.columns)
 
-        critical_column = 0
-        critical_row = 0
-        for column in columns:
-            if well_name in column:
-                critical_row = column.index(well_name)
-                critical_column = columns.index(column)
+        critical_column, critical_row = divmod(
+            tip_rack.bit_by_well_name.get(well_name, 0), tip_rack.row_count
+        )
+        # The nozzles spread right and down from an A1 starting nozzle,
+        # left and down from A12, right and up from H1, and left and up from H12.
+        if nozzle_map.starting_nozzle in ("A1", "H1"):
+            first_column = critical_column
+            last_column = min(critical_column + num_nozzle_cols, column_count)
+        elif nozzle_map.starting_nozzle in ("A12", "H12"):
+            first_column = max(critical_column - num_nozzle_cols + 1, 0)
+            last_column = critical_column + 1
+        else:
+            return
+        if nozzle_map.starting_nozzle in ("A1", "A12"):
+            first_row = critical_row
+            last_row = min(critical_row + num_nozzle_rows, tip_rack.row_count)
+        else:
+            first_row = max(critical_row - num_nozzle_rows + 1, 0)
+            last_row = critical_row + 1
 
-        for i in range(num_nozzle_cols):
-            for j in range(num_nozzle_rows):
-                if nozzle_map.starting_nozzle == "A1":
-                    if (critical_column + i < len(columns)) and (
-                        critical_row + j < len(columns[critical_column])
-                    ):
-                        well = columns[critical_column + i][critical_row + j]
-                        wells[well] = TipRackWellState.USED
-                elif nozzle_map.starting_nozzle == "A12":
-                    if (critical_column - i >= 0) and (
-                        critical_row + j < len(columns[critical_column])
-                    ):
-                        well = columns[critical_column - i][critical_row + j]
-                        wells[well] = TipRackWellState.USED
-                elif nozzle_map.starting_nozzle == "H1":
-                    if (critical_column + i < len(columns)) and (critical_row - j >= 0):
-                        well = columns[critical_column + i][critical_row - j]
-                        wells[well] = TipRackWellState.USED
-                elif nozzle_map.starting_nozzle == "H12":
-                    if (critical_column - i >= 0) and (critical_row - j >= 0):
-                        well = columns[critical_column - i][critical_row - j]
-                        wells[well] = TipRackWellState.USED
+        tip_rack.used |= tip_rack.wells & _get_block_mask(
+            tip_rack.row_count, first_row, last_row, first_column, last_column
+        )
 
 
 class TipView(HasState[TipState]):
@@ -215,180 +208,12 @@ class TipView(HasState[TipState]):
         nozzle_map: Optional[NozzleMap],
     ) -> Optional[str]:
         """Get the next available clean tip. Does not support use of a starting tip if the pipette used is in a partial configuration."""
-        wells = self._state.tips_by_labware_id.get(labware_id, {})
-        columns = self._state.column_by_labware_id.get(labware_id, [])
-
-        def _identify_tip_cluster(
-            active_columns: int,
-            active_rows: int,
-            critical_column: int,
-            critical_row: int,
-            entry_well: str,
-        ) -> Optional[List[str]]:
-            tip_cluster = []
-            for i in range(active_columns):
-                if entry_well == "A1" or entry_well == "H1":
-                    if critical_column - i >= 0:
-                        column = columns[critical_column - i]
-                    else:
-                        return None
-                elif entry_well == "A12" or entry_well == "H12":
-                    if critical_column + i < len(columns):
-                        column = columns[critical_column + i]
-                    else:
-                        return None
-                else:
-                    raise ValueError(
-                        f"Invalid entry well {entry_well} for tip cluster identification."
-                    )
-                for j in range(active_rows):
-                    if entry_well == "A1" or entry_well == "A12":
-                        if critical_row - j >= 0:
-                            well = column[critical_row - j]
-                        else:
-                            return None
-                    elif entry_well == "H1" or entry_well == "H12":
-                        if critical_row + j < len(column):
-                            well = column[critical_row + j]
-                        else:
-                            return None
-                    tip_cluster.append(well)
-
-            if any(well not in [*wells] for well in tip_cluster):
-                return None
-
-            return tip_cluster
-
-        def _validate_tip_cluster(
-            active_columns: int, active_rows: int, tip_cluster: List[str]
-        ) -> Union[str, int, None]:
-            if not any(wells[well] == TipRackWellState.USED for well in tip_cluster):
-                return tip_cluster[0]
-            elif all(wells[well] == TipRackWellState.USED for well in tip_cluster):
-                return None
-            else:
-                # The tip cluster list is ordered: Each row from a column in order by columns
-                tip_cluster_final_column = []
-                for i in range(active_rows):
-                    tip_cluster_final_column.append(
-                        tip_cluster[((active_columns * active_rows) - 1) - i]
-                    )
-                tip_cluster_final_row = []
-                for i in range(active_columns):
-                    tip_cluster_final_row.append(
-                        tip_cluster[(active_rows - 1) + (i * active_rows)]
-                    )
-                if all(
-                    wells[well] == TipRackWellState.USED
-                    for well in tip_cluster_final_column
-                ):
-                    return None
-                elif all(
-                    wells[well] == TipRackWellState.USED
-                    for well in tip_cluster_final_row
-                ):
-                    return None
-                else:
-                    # Tiprack has no valid tip selection, cannot progress
-                    return -1
-
-        # Search through the tiprack beginning at A1
-        def _cluster_search_A1(active_columns: int, active_rows: int) -> Optional[str]:
-            critical_column = active_columns - 1
-            critical_row = active_rows - 1
-
-            while critical_column <= len(columns):
-                tip_cluster = _identify_tip_cluster(
-                    active_columns, active_rows, critical_column, critical_row, "A1"
-                )
-                if tip_cluster is not None:
-                    result = _validate_tip_cluster(
-                        active_columns, active_rows, tip_cluster
-                    )
-                    if isinstance(result, str):
-                        return result
-                    elif isinstance(result, int) and result == -1:
-                        return None
-                if critical_row + active_rows < len(columns[0]):
-                    critical_row = critical_row + active_rows
-                else:
-                    critical_column = critical_column + 1
-                    critical_row = active_rows - 1
-            return None
-
-        # Search through the tiprack beginning at A12
-        def _cluster_search_A12(active_columns: int, active_rows: int) -> Optional[str]:
-            critical_column = len(columns) - active_columns
-            critical_row = active_rows - 1
-
-            while critical_column >= 0:
-                tip_cluster = _identify_tip_cluster(
-                    active_columns, active_rows, critical_column, critical_row, "A12"
-                )
-                if tip_cluster is not None:
-                    result = _validate_tip_cluster(
-                        active_columns, active_rows, tip_cluster
-                    )
-                    if isinstance(result, str):
-                        return result
-                    elif isinstance(result, int) and result == -1:
-                        return None
-                if critical_row + active_rows < len(columns[0]):
-                    critical_row = critical_row + active_rows
-                else:
-                    critical_column = critical_column - 1
-                    critical_row = active_rows - 1
-            return None
-
-        # Search through the tiprack beginning at H1
-        def _cluster_search_H1(active_columns: int, active_rows: int) -> Optional[str]:
-            critical_column = active_columns - 1
-            critical_row = len(columns[critical_column]) - active_rows
-
-            while critical_column <= len(columns):  # change to max size of labware
-                tip_cluster = _identify_tip_cluster(
-                    active_columns, active_rows, critical_column, critical_row, "H1"
-                )
-                if tip_cluster is not None:
-                    result = _validate_tip_cluster(
-                        active_columns, active_rows, tip_cluster
-                    )
-                    if isinstance(result, str):
-                        return result
-                    elif isinstance(result, int) and result == -1:
-                        return None
-                if critical_row - active_rows >= 0:
-                    critical_row = critical_row - active_rows
-                else:
-                    critical_column = critical_column + 1
-                    critical_row = len(columns[critical_column]) - active_rows
-            return None
-
-        # Search through the tiprack beginning at H12
-        def _cluster_search_H12(active_columns: int, active_rows: int) -> Optional[str]:
-            critical_column = len(columns) - active_columns
-            critical_row = len(columns[critical_column]) - active_rows
-
-            while critical_column >= 0:
-                tip_cluster = _identify_tip_cluster(
-                    active_columns, active_rows, critical_column, critical_row, "H12"
-                )
-                if tip_cluster is not None:
-                    result = _validate_tip_cluster(
-                        active_columns, active_rows, tip_cluster
-                    )
-                    if isinstance(result, str):
-                        return result
-                    elif isinstance(result, int) and result == -1:
-                        return None
-                if critical_row - active_rows >= 0:
-                    critical_row = critical_row - active_rows
-                else:
-                    critical_column = critical_column - 1
-                    critical_row = len(columns[critical_column]) - active_rows
+        tip_rack = self._state.tips_by_labware_id.get(labware_id)
+        if tip_rack is None or not tip_rack.wells:
             return None
+        columns = tip_rack.columns
 
-        if starting_tip_name is None and nozzle_map is not None and columns:
+        if starting_tip_name is None and nozzle_map is not None:
             num_channels = len(nozzle_map.full_instrument_map_store)
             num_nozzle_cols = len(nozzle_map.columns)
             num_nozzle_rows = len(nozzle_map.rows)
@@ -400,21 +225,23 @@ class TipView(HasState[TipState]):
             #   The 96 channel will then progress towards the opposite corner, either going up or down, left or right depending on configuration.
 
             if num_channels == 1:
-                return _cluster_search_A1(num_nozzle_cols, num_nozzle_rows)
+                entry_well = "A1"
             elif num_channels == 8:
                 if nozzle_map.starting_nozzle == "A1":
-                    return _cluster_search_H1(num_nozzle_cols, num_nozzle_rows)
+                    entry_well = "H1"
                 elif nozzle_map.starting_nozzle == "H1":
-                    return _cluster_search_A1(num_nozzle_cols, num_nozzle_rows)
+                    entry_well = "A1"
+                else:
+                    return None
             elif num_channels == 96:
                 if nozzle_map.starting_nozzle == "A1":
-                    return _cluster_search_H12(num_nozzle_cols, num_nozzle_rows)
+                    entry_well = "H12"
                 elif nozzle_map.starting_nozzle == "A12":
-                    return _cluster_search_H1(num_nozzle_cols, num_nozzle_rows)
+                    entry_well = "H1"
                 elif nozzle_map.starting_nozzle == "H1":
-                    return _cluster_search_A12(num_nozzle_cols, num_nozzle_rows)
+                    entry_well = "A12"
                 elif nozzle_map.starting_nozzle == "H12":
-                    return _cluster_search_A1(num_nozzle_cols, num_nozzle_rows)
+                    entry_well = "A1"
                 else:
                     raise ValueError(
                         f"Nozzle {nozzle_map.starting_nozzle} is an invalid starting tip for automatic tip pickup."
@@ -423,39 +250,46 @@ class TipView(HasState[TipState]):
                 raise RuntimeError(
                     "Invalid number of channels for automatic tip tracking."
                 )
-        else:
-            if columns and num_tips == len(columns[0]):  # Get next tips for 8-channel
-                column_head = [column[0] for column in columns]
-                starting_column_index = 0
-
-                if starting_tip_name:
-                    for idx, column in enumerate(columns):
-                        if starting_tip_name in column:
-                            if starting_tip_name not in column_head:
-                                starting_column_index = idx + 1
-                            else:
-                                starting_column_index = idx
-
-                for column in columns[starting_column_index:]:
-                    if not any(wells[well] == TipRackWellState.USED for well in column):
-                        return column[0]
-
-            elif num_tips == len(wells.keys()):  # Get next tips for 96 channel
-                if starting_tip_name and starting_tip_name != columns[0][0]:
-                    return None
+            return _cluster_search(
+                tip_rack, num_nozzle_cols, num_nozzle_rows, entry_well
+            )
 
-                if not any(
-                    tip_state == TipRackWellState.USED for tip_state in wells.values()
-                ):
-                    return next(iter(wells))
+        clean = tip_rack.wells & ~tip_rack.used
+        if num_tips == len(columns[0]):  # Get next tips for 8-channel
+            column_head = [column[0] for column in columns]
+            starting_column_index = 0
 
-            else:  # Get next tips for single channel
-                if starting_tip_name is not None:
-                    wells = _drop_wells_before_starting_tip(wells, starting_tip_name)
+            if starting_tip_name in tip_rack.bit_by_well_name:
+                starting_column_index = (
+                    tip_rack.bit_by_well_name[starting_tip_name] // tip_rack.row_count
+                )
+                if starting_tip_name not in column_head:
+                    starting_column_index += 1
+
+            for index in range(starting_column_index, len(columns)):
+                column_mask = _get_block_mask(
+                    tip_rack.row_count, 0, len(columns[index]), index, index + 1
+                )
+                if not tip_rack.used & column_mask:
+                    return columns[index][0]
 
-                for well_name, tip_state in wells.items():
-                    if tip_state == TipRackWellState.CLEAN:
-                        return well_name
+        elif num_tips == len(tip_rack.bit_by_well_name):  # Get next tips for 96 channel
+            if starting_tip_name and starting_tip_name != columns[0][0]:
+                return None
+
+            if not tip_rack.used:
+                return columns[0][0]
+
+        else:  # Get next tips for single channel
+            if starting_tip_name is not None:
+                starting_bit = tip_rack.bit_by_well_name.get(starting_tip_name)
+                if starting_bit is None:
+                    return None
+                # Drop the wells before the starting tip.
+                clean = clean >> starting_bit << starting_bit
+
+            if clean:
+                return tip_rack.get_well_name(_lowest_bit(clean))
         return None
 
     def get_pipette_channels(self, pipette_id: str) -> int:
@@ -482,24 +316,149 @@ class TipView(HasState[TipState]):
             otherwise False.
         """
         tip_rack = self._state.tips_by_labware_id.get(labware_id)
-        well_state = tip_rack.get(well_name) if tip_rack else None
+        bit = tip_rack.bit_by_well_name.get(well_name) if tip_rack else None
+        if tip_rack is None or bit is None:
+            return False
 
-        return well_state == TipRackWellState.CLEAN
+        return not tip_rack.used & (1 << bit)
 
     def get_tip_length(self, pipette_id: str) -> float:
         """Return the given pipette's tip length."""
         return self._state.length_by_pipette_id.get(pipette_id, 0)
 
 
-def _drop_wells_before_starting_tip(
-    wells: TipRackStateByWellName, starting_tip_name: str
-) -> TipRackStateByWellName:
-    """Drop any wells that come before the starting tip and return the remaining ones after."""
-    seen_starting_well = False
-    remaining_wells = {}
-    for well_name, tip_state in wells.items():
-        if well_name == starting_tip_name:
-            seen_starting_well = True
-        if seen_starting_well:
-            remaining_wells[well_name] = tip_state
-    return remaining_wells
+@dataclass(frozen=True)
+class _TipCluster:
+    """A block of wells that a partial nozzle layout could pick up at once."""
+
+    mask: int
+    final_column_mask: int
+    """The column of the block the search finishes on."""
+    final_row_mask: int
+    """The row of the block the search finishes on."""
+    critical_bit: int
+    """The well to pick the block up from."""
+
+
+def _build_tip_rack(columns: List[List[str]]) -> TipRackState:
+    row_count = max((len(column) for column in columns), default=0)
+    bit_by_well_name = {
+        well_name: column_index * row_count + row_index
+        for column_index, column in enumerate(columns)
+        for row_index, well_name in enumerate(column)
+    }
+    wells = 0
+    for bit in bit_by_well_name.values():
+        wells |= 1 << bit
+    return TipRackState(
+        columns=columns,
+        row_count=row_count,
+        bit_by_well_name=bit_by_well_name,
+        wells=wells,
+        used=0,
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_block_mask(
+    row_count: int, first_row: int, last_row: int, first_column: int, last_column: int
+) -> int:
+    """Get the mask of the wells in a block of rows and columns, ends exclusive."""
+    if last_row <= first_row or last_column <= first_column:
+        return 0
+    column_mask = ((1 << (last_row - first_row)) - 1) << first_row
+    mask = 0
+    for column in range(first_column, last_column):
+        mask |= column_mask << (column * row_count)
+    return mask
+
+
+def _lowest_bit(mask: int) -> int:
+    return (mask & -mask).bit_length() - 1
+
+
+@lru_cache(maxsize=None)
+def _get_tip_clusters(
+    column_count: int,
+    row_count: int,
+    active_columns: int,
+    active_rows: int,
+    entry_well: str,
+) -> Tuple[_TipCluster, ...]:
+    """Get the tip clusters a search from an entry well visits, in order.
+
+    A search entering at A1 or H1 moves across the columns from the left, one
+    column at a time, and one entering at A12 or H12 moves from the right. Within
+    each step it visits the blocks of rows from the top when entering at A1 or
+    A12, and from the bottom when entering at H1 or H12.
+    """
+    if entry_well not in ("A1", "A12", "H1", "H12"):
+        raise ValueError(
+            f"Invalid entry well {entry_well} for tip cluster identification."
+        )
+    if active_columns > column_count or active_rows > row_count:
+        return ()
+
+    first_columns = range(column_count - active_columns + 1)
+    if entry_well in ("A12", "H12"):
+        first_columns = first_columns[::-1]
+    first_rows = range(0, row_count - active_rows + 1, active_rows)
+    if entry_well in ("H1", "H12"):
+        first_rows = range(row_count - active_rows, -1, -active_rows)
+
+    clusters = []
+    for first_column in first_columns:
+        last_column = first_column + active_columns
+        if entry_well in ("A1", "H1"):
+            critical_column, final_column = last_column - 1, first_column
+        else:
+            critical_column, final_column = first_column, last_column - 1
+        for first_row in first_rows:
+            last_row = first_row + active_rows
+            if entry_well in ("A1", "A12"):
+                critical_row, final_row = last_row - 1, first_row
+            else:
+                critical_row, final_row = first_row, last_row - 1
+            clusters.append(
+                _TipCluster(
+                    mask=_get_block_mask(
+                        row_count, first_row, last_row, first_column, last_column
+                    ),
+                    final_column_mask=_get_block_mask(
+                        row_count, first_row, last_row, final_column, final_column + 1
+                    ),
+                    final_row_mask=_get_block_mask(
+                        row_count, final_row, final_row + 1, first_column, last_column
+                    ),
+                    critical_bit=critical_column * row_count + critical_row,
+                )
+            )
+    return tuple(clusters)
+
+
+def _cluster_search(
+    tip_rack: TipRackState, active_columns: int, active_rows: int, entry_well: str
+) -> Optional[str]:
+    """Find the next clean cluster of tips, searching from the entry well."""
+    for cluster in _get_tip_clusters(
+        len(tip_rack.columns),
+        tip_rack.row_count,
+        active_columns,
+        active_rows,
+        entry_well,
+    ):
+        if cluster.mask & ~tip_rack.wells:
+            continue
+        used = tip_rack.used & cluster.mask
+        if not used:
+            return tip_rack.get_well_name(cluster.critical_bit)
+        elif used == cluster.mask:
+            continue
+        elif tip_rack.used & cluster.final_column_mask == cluster.final_column_mask:
+            continue
+        elif tip_rack.used & cluster.final_row_mask == cluster.final_row_mask:
+            continue
+        else:
+            # Tiprack has no valid tip selection, cannot progress
+            return None
+    return None
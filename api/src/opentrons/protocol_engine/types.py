@@ -941,3 +941,56 @@ RunTimeParameter = Union[NumberParameter, EnumParameter, BooleanParameter]
 RunTimeParamValuesType = Dict[
     str, Union[float, bool, str]
 ]  # update value types as more RTP types are added
+
+
+class CommandTimingHistogram(BaseModel):
+    """A latency histogram for one phase of one type of command."""
+
+    count: int = Field(..., description="How many durations were recorded.")
+    totalSec: float = Field(
+        ..., description="The sum of all recorded durations, in seconds."
+    )
+    minSec: Optional[float] = Field(
+        None, description="The shortest recorded duration, in seconds."
+    )
+    maxSec: Optional[float] = Field(
+        None, description="The longest recorded duration, in seconds."
+    )
+    bucketUpperBoundsSec: List[float] = Field(
+        ...,
+        description=(
+            "The inclusive upper bound of each histogram bucket, in seconds,"
+            " in ascending order."
+        ),
+    )
+    bucketCounts: List[int] = Field(
+        ...,
+        description=(
+            "How many durations fell into each bucket."
+            " This has one more element than `bucketUpperBoundsSec`:"
+            " the last element counts durations longer than the last upper bound."
+        ),
+    )
+
+
+class CommandTypeTiming(BaseModel):
+    """Where time went for every executed command of a single command type."""
+
+    commandType: str = Field(
+        ..., description="The `commandType` these timings are for."
+    )
+    queueWait: CommandTimingHistogram = Field(
+        ...,
+        description="Time from when a command was created until it started running.",
+    )
+    execute: CommandTimingHistogram = Field(
+        ...,
+        description="Time spent in the command's implementation.",
+    )
+    stateUpdate: CommandTimingHistogram = Field(
+        ...,
+        description=(
+            "Time spent applying the command's start and completion"
+            " to the ProtocolEngine's state."
+        ),
+    )
@@ -18,10 +18,15 @@ from .protocol_runner import create_protocol_runner, AbstractRunner
 
 
 async def create_simulating_runner(
-    robot_type: RobotType, protocol_config: ProtocolConfig
+    robot_type: RobotType,
+    protocol_config: ProtocolConfig,
+    enable_command_timing: bool = False,
 ) -> AbstractRunner:
     """Create a AbstractRunner wired to a simulating HardwareControlAPI.
 
+    If `enable_command_timing` is set, per-command-type execution timing
+    histograms will be available from `AbstractRunner.get_command_timing()`.
+
     Example:
         ```python
         from pathlib import Path
@@ -59,6 +64,7 @@ async def create_simulating_runner(
             use_virtual_gripper=True,
             use_simulated_deck_config=True,
             use_virtual_pipettes=(not feature_flags.disable_fast_protocol_upload()),
+            enable_command_timing=enable_command_timing,
         ),
         load_fixed_trash=should_load_fixed_trash(protocol_config),
     )
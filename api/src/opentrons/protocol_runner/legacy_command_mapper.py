@@ -111,6 +111,9 @@ class LegacyCommandMapper:
             pe_types.ModuleModel, pe_types.ModuleDefinition
         ] = {}
         self._module_data_provider = module_data_provider or ModuleDataProvider()
+        # Legacy protocols delay on the hardware API, not on the engine's clock,
+        # so their commands are timestamped with the real time.
+        self._model_utils = ModelUtils()
 
     def map_command(  # noqa: C901
         self,
@@ -137,7 +140,7 @@ class LegacyCommandMapper:
         # TODO(mc, 2021-12-08): use message ID as command ID directly once
         # https://github.com/Opentrons/opentrons/issues/8986 is resolved
         broker_id = command["id"]
-        now = ModelUtils.get_timestamp()
+        now = self._model_utils.get_timestamp()
 
         results: List[pe_actions.Action] = []
 
@@ -592,7 +595,7 @@ class LegacyCommandMapper:
         self, labware_load_info: LegacyLabwareLoadInfo
     ) -> List[pe_actions.Action]:
         """Map a legacy labware load to a ProtocolEngine command."""
-        now = ModelUtils.get_timestamp()
+        now = self._model_utils.get_timestamp()
         count = self._command_count["LOAD_LABWARE"]
         slot = labware_load_info.deck_slot
         location: pe_types.LabwareLocation
@@ -664,7 +667,7 @@ class LegacyCommandMapper:
         Also creates a `AddPipetteConfigAction`, which is not necessary for the run,
         but is needed for stop so tip geometry is in state for the HardwareStopper.
         """
-        now = ModelUtils.get_timestamp()
+        now = self._model_utils.get_timestamp()
         count = self._command_count["LOAD_PIPETTE"]
         command_id = f"commands.LOAD_PIPETTE-{count}"
         pipette_id = f"pipette-{count}"
@@ -719,7 +722,7 @@ class LegacyCommandMapper:
         self, module_load_info: LegacyModuleLoadInfo
     ) -> List[pe_actions.Action]:
         """Map a legacy module load to a Protocol Engine command."""
-        now = ModelUtils.get_timestamp()
+        now = self._model_utils.get_timestamp()
 
         count = self._command_count["LOAD_MODULE"]
         command_id = f"commands.LOAD_MODULE-{count}"
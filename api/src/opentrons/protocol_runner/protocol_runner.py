@@ -42,6 +42,7 @@ from ..protocol_engine.types import (
     DeckConfigurationType,
     RunTimeParameter,
     RunTimeParamValuesType,
+    CommandTypeTiming,
 )
 
 
@@ -118,6 +119,10 @@ class AbstractRunner(ABC):
         """See `ProtocolEngine.resume_from_recovery()`."""
         self._protocol_engine.resume_from_recovery()
 
+    def get_command_timing(self) -> Optional[List[CommandTypeTiming]]:
+        """See `ProtocolEngine.get_command_timing()`."""
+        return self._protocol_engine.get_command_timing()
+
     @abstractmethod
     async def run(
         self,
@@ -346,6 +346,10 @@ def clamp_value(
 FuncT = TypeVar("FuncT", bound=Callable[..., Any])
 
 
+# Protocols requesting versions before this are never rejected.
+_FIRST_CHECKED_VERSION = APIVersion(2, 0)
+
+
 def requires_version(major: int, minor: int) -> Callable[[FuncT], FuncT]:
     """Decorator. Apply to Protocol API methods or attributes to indicate
     the first version in which the method or attribute was present.
@@ -363,23 +367,41 @@ def requires_version(major: int, minor: int) -> Callable[[FuncT], FuncT]:
             docstr += f"\n\n        .. versionadded:: {added_version}\n\n"
             decorated_obj.__doc__ = docstr
 
+        method_name = getattr(decorated_obj, "__name__", None)
+        # Whether instances of each class reach this wrapper as a plain method,
+        # rather than as a property or through an override's super() call.
+        binds_by_class: Dict[type, bool] = {}
+
         @functools.wraps(decorated_obj)
         def _check_version_wrapper(*args: Any, **kwargs: Any) -> Any:
             slf = args[0]
-            added_in = decorated_obj.__opentrons_version_added  # type: ignore
             current_version = slf._api_version
 
-            if APIVersion(2, 0) <= current_version < added_in:
+            if _FIRST_CHECKED_VERSION <= current_version < added_version:
                 # __qualname__ is *probably* set on every kind of object we care
                 # about, but the docs leave it ambiguous, so fall back to str().
                 name = getattr(decorated_obj, "__qualname__", str(decorated_obj))
 
                 raise APIVersionError(
-                    f"{name} was added in {added_in}, but your "
+                    f"{name} was added in {added_version}, but your "
                     f"protocol requested version {current_version}. You "
-                    f"must increase your API version to {added_in} to "
+                    f"must increase your API version to {added_version} to "
                     "use this functionality."
                 )
+
+            # An object's API version never changes, so once a plain method has
+            # passed its check, bind it to the instance. Later calls then skip
+            # this wrapper entirely.
+            slf_type = type(slf)
+            binds = binds_by_class.get(slf_type)
+            if binds is None:
+                binds = binds_by_class[slf_type] = (
+                    method_name is not None
+                    and getattr(slf_type, method_name, None) is _check_version_wrapper
+                )
+            if binds:
+                slf.__dict__[method_name] = decorated_obj.__get__(slf, slf_type)
+
             return decorated_obj(*args, **kwargs)
 
         return cast(FuncT, _check_version_wrapper)
@@ -1,4 +1,16 @@
 from .estimator import DurationEstimator
+from .command_estimator import (
+    CommandDurationEstimate,
+    CommandDurationEstimator,
+    DurationEstimate,
+    estimate_duration,
+)
 
 
-__all__ = ["DurationEstimator"]
+__all__ = [
+    "DurationEstimator",
+    "CommandDurationEstimate",
+    "CommandDurationEstimator",
+    "DurationEstimate",
+    "estimate_duration",
+]
@@ -0,0 +1,544 @@
+"""Estimate how long a protocol will take to run from its protocol engine commands.
+
+Unlike `DurationEstimator`, which listens to the legacy command broker,
+this works from a completed command list, like the one in a protocol analysis.
+Gantry moves are timed with the same motion planner and axis constraints that
+the Flex uses to execute them, and module temperature changes are timed with
+the ramp models that `DurationEstimator` has always used.
+
+The motion planner comes from the optional `opentrons_hardware` package.
+Without it, moves are timed with a simple trapezoidal speed profile instead.
+"""
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+from pydantic import BaseModel, Field
+from typing_extensions import Final
+
+from opentrons_shared_data.pipette.dev_types import PipetteNameType
+from opentrons_shared_data.robot.dev_types import RobotType
+
+from opentrons.config import robot_configs
+from opentrons.config.types import GantryLoad
+from opentrons.hardware_control.types import Axis
+from opentrons.motion_planning import MoveType, get_waypoints
+from opentrons.protocol_engine import DeckPoint
+from opentrons.protocol_engine import commands as cmd
+from opentrons.types import Point
+
+from .estimator import DurationEstimator, START_MODULE_TEMPERATURE
+
+if TYPE_CHECKING:
+    from opentrons_hardware.hardware_control.motion_planning import (
+        MoveManager,
+        SystemConstraints,
+    )
+
+
+# Times for mechanisms that don't move the gantry, determined by testing on
+# hardware. These are the same figures that `DurationEstimator` uses.
+PICK_UP_TIP_DURATION: Final = 4.0
+DROP_TIP_DURATION: Final = 10.0
+BLOW_OUT_DURATION: Final = 0.5
+TOUCH_TIP_DURATION: Final = 0.5
+THERMOCYCLER_LID_DURATION: Final = 24.0
+THERMOCYCLER_LID_TEMPERATURE_DURATION: Final = 60.0
+
+# Rough figures for the Heater-Shaker and Magnetic Module, which
+# `DurationEstimator` doesn't time at all.
+HEATER_SHAKER_HEATING_RATE: Final = 0.2
+"""How fast a Heater-Shaker heats up, in °C per second."""
+HEATER_SHAKER_COOLING_RATE: Final = 0.05
+"""How fast a Heater-Shaker cools down, in °C per second. It has no active cooling."""
+HEATER_SHAKER_SHAKE_RAMP_DURATION: Final = 5.0
+HEATER_SHAKER_LATCH_DURATION: Final = 2.0
+MAGNETIC_MODULE_MAGNET_SPEED: Final = 5.0
+"""How fast a Magnetic Module raises and lowers its magnets, in mm per second."""
+
+_GANTRY_AXES: Final = (Axis.X, Axis.Y, Axis.Z_L)
+
+RampModel = Callable[[float, float], float]
+"""Get the seconds a module takes to go from one temperature to another."""
+
+
+class _AxisLimits(NamedTuple):
+    max_speed: float
+    acceleration: float
+
+
+class CommandDurationEstimate(BaseModel):
+    """How long a single command is expected to take."""
+
+    commandId: str = Field(..., description="The ID of the command.")
+    commandType: str = Field(..., description="The `commandType` of the command.")
+    duration: float = Field(
+        ...,
+        description="The command's expected duration, in seconds.",
+    )
+
+
+class DurationEstimate(BaseModel):
+    """How long a protocol's commands are expected to take."""
+
+    totalDuration: float = Field(
+        ...,
+        description="The expected duration of all of the commands, in seconds.",
+    )
+    commands: List[CommandDurationEstimate] = Field(
+        ...,
+        description="The expected duration of each command, in command order.",
+    )
+
+
+@dataclass
+class _TemperatureRamp:
+    """A module heating or cooling towards a target temperature."""
+
+    start_celsius: float
+    target_celsius: float
+    start_time: float
+    end_time: float
+
+    def get_celsius(self, time: float) -> float:
+        """Get the temperature at `time`, assuming a linear ramp."""
+        if time >= self.end_time or self.end_time <= self.start_time:
+            return self.target_celsius
+        progress = (time - self.start_time) / (self.end_time - self.start_time)
+        return self.start_celsius + progress * (
+            self.target_celsius - self.start_celsius
+        )
+
+
+def heater_shaker_ramp(temp0: float, temp1: float) -> float:
+    """Get the seconds a Heater-Shaker takes to go from temp0 to temp1."""
+    if temp1 >= temp0:
+        return (temp1 - temp0) / HEATER_SHAKER_HEATING_RATE
+    return (temp0 - temp1) / HEATER_SHAKER_COOLING_RATE
+
+
+@lru_cache(maxsize=None)
+def _has_motion_planner() -> bool:
+    """Get whether the optional `opentrons_hardware` package is installed."""
+    try:
+        import opentrons_hardware.hardware_control.motion_planning  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _get_axis_limits(
+    robot_type: RobotType, gantry_load: GantryLoad
+) -> Dict[Axis, _AxisLimits]:
+    """Get the default gantry axis limits, without the motion planner's types."""
+    if robot_type == "OT-3 Standard":
+        motion_settings = robot_configs.build_config_ot3(
+            {}
+        ).motion_settings.by_gantry_load(gantry_load)
+        return {
+            axis: _AxisLimits(
+                max_speed=motion_settings["default_max_speed"][Axis.to_kind(axis)],
+                acceleration=motion_settings["acceleration"][Axis.to_kind(axis)],
+            )
+            for axis in _GANTRY_AXES
+        }
+
+    ot2_config = robot_configs.build_config_ot2({})
+    return {
+        Axis.X: _AxisLimits(
+            ot2_config.default_max_speed["X"], ot2_config.acceleration["X"]
+        ),
+        Axis.Y: _AxisLimits(
+            ot2_config.default_max_speed["Y"], ot2_config.acceleration["Y"]
+        ),
+        Axis.Z_L: _AxisLimits(
+            ot2_config.default_max_speed["Z"], ot2_config.acceleration["Z"]
+        ),
+    }
+
+
+def build_system_constraints(
+    robot_type: RobotType, gantry_load: GantryLoad = GantryLoad.LOW_THROUGHPUT
+) -> "SystemConstraints[Axis]":
+    """Get the default gantry axis constraints for a type of robot.
+
+    This needs the optional `opentrons_hardware` package.
+    """
+    from opentrons_hardware.hardware_control.motion_planning import AxisConstraints
+
+    if robot_type == "OT-3 Standard":
+        from opentrons.hardware_control.backends.ot3utils import (
+            get_system_constraints,
+        )
+
+        ot3_config = robot_configs.build_config_ot3({})
+        return get_system_constraints(ot3_config.motion_settings, gantry_load)
+
+    # The OT-2's Smoothie starts and ends every move at rest,
+    # so there are no speed discontinuities to allow for.
+    ot2_config = robot_configs.build_config_ot2({})
+    return {
+        Axis.X: AxisConstraints.build(
+            ot2_config.acceleration["X"], 0, 0, ot2_config.default_max_speed["X"]
+        ),
+        Axis.Y: AxisConstraints.build(
+            ot2_config.acceleration["Y"], 0, 0, ot2_config.default_max_speed["Y"]
+        ),
+        Axis.Z_L: AxisConstraints.build(
+            ot2_config.acceleration["Z"], 0, 0, ot2_config.default_max_speed["Z"]
+        ),
+    }
+
+
+class CommandDurationEstimator:
+    """Estimate the duration of protocol engine commands, one at a time.
+
+    Commands must be passed to `estimate` in the order they ran, because
+    the estimator tracks where the pipette is and what modules are doing
+    from one command to the next.
+    """
+
+    def __init__(self, robot_type: RobotType) -> None:
+        self._robot_type = robot_type
+        self._gantry_load = GantryLoad.LOW_THROUGHPUT
+        self._move_manager: Optional["MoveManager[Axis]"] = None
+        self._axis_limits: Optional[Dict[Axis, _AxisLimits]] = None
+        # Seconds since the first command started.
+        self._time = 0.0
+        self._position: Optional[DeckPoint] = None
+        self._labware_id: Optional[str] = None
+        self._temperature_ramps: Dict[str, _TemperatureRamp] = {}
+        self._block_hold_times: Dict[str, float] = {}
+        self._lid_ready_times: Dict[str, float] = {}
+        self._magnet_heights: Dict[str, float] = {}
+
+    def estimate(self, command: cmd.Command) -> float:
+        """Get the expected duration of the next command, in seconds."""
+        duration = self._get_motion_duration(command)
+        duration += self._get_command_duration(command, start_time=self._time)
+        self._time += duration
+        return duration
+
+    def _get_motion_duration(self, command: cmd.Command) -> float:
+        if isinstance(command, cmd.Home):
+            # Homed positions aren't reported in deck coordinates,
+            # so the next move can't be timed.
+            self._position = None
+            return 0.0
+
+        if isinstance(command, cmd.LoadPipette):
+            if command.params.pipetteName == PipetteNameType.P1000_96:
+                self._gantry_load = GantryLoad.HIGH_THROUGHPUT
+                self._move_manager = None
+                self._axis_limits = None
+            return 0.0
+
+        position = getattr(command.result, "position", None)
+        if not isinstance(position, DeckPoint):
+            return 0.0
+
+        labware_id = getattr(command.params, "labwareId", None)
+        origin = self._position
+        self._position = position
+        previous_labware_id = self._labware_id
+        self._labware_id = labware_id
+
+        if origin is None:
+            return 0.0
+
+        if (
+            (origin.x, origin.y) == (position.x, position.y)
+            or isinstance(command, cmd.MoveRelative)
+            or getattr(command.params, "forceDirect", False)
+        ):
+            move_type = MoveType.DIRECT
+        elif labware_id is not None and labware_id == previous_labware_id:
+            move_type = MoveType.IN_LABWARE_ARC
+        else:
+            move_type = MoveType.GENERAL_ARC
+
+        # The real arc height depends on the labware and modules along the way,
+        # which a command list doesn't describe, so arc just above the highest
+        # of the two ends of the move.
+        waypoints = get_waypoints(
+            origin=Point(x=origin.x, y=origin.y, z=origin.z),
+            dest=Point(x=position.x, y=position.y, z=position.z),
+            max_travel_z=math.inf,
+            min_travel_z=max(origin.z, position.z),
+            move_type=move_type,
+        )
+        duration = 0.0
+        start = Point(x=origin.x, y=origin.y, z=origin.z)
+        for waypoint in waypoints:
+            duration += self._get_straight_move_duration(start, waypoint.position)
+            start = waypoint.position
+        return duration
+
+    def _get_straight_move_duration(self, origin: Point, dest: Point) -> float:
+        """Plan a move between two points the way the Flex's controller does."""
+        if not _has_motion_planner():
+            return self._get_trapezoidal_move_duration(origin, dest)
+
+        from opentrons_hardware.hardware_control.motion_planning import (
+            MoveManager,
+            MoveTarget,
+            ZeroLengthMoveError,
+        )
+
+        if self._move_manager is None:
+            self._move_manager = MoveManager(
+                constraints=build_system_constraints(
+                    self._robot_type, self._gantry_load
+                )
+            )
+
+        constraints = self._move_manager.get_constraints()
+        max_speed = max(float(constraints[axis].max_speed) for axis in _GANTRY_AXES)
+        try:
+            _, move_list = self._move_manager.plan_motion(
+                origin=dict(zip(_GANTRY_AXES, origin)),
+                target_list=[
+                    MoveTarget.build(
+                        position=dict(zip(_GANTRY_AXES, dest)), max_speed=max_speed
+                    )
+                ],
+            )
+        except ZeroLengthMoveError:
+            return 0.0
+
+        return float(sum(block.time for move in move_list[0] for block in move.blocks))
+
+    def _get_trapezoidal_move_duration(self, origin: Point, dest: Point) -> float:
+        """Time a move that speeds up, cruises, and slows down, from and to rest.
+
+        The speed and acceleration along the move are limited so that no
+        axis goes over its own limits.
+        """
+        if self._axis_limits is None:
+            self._axis_limits = _get_axis_limits(self._robot_type, self._gantry_load)
+
+        deltas = [abs(d - o) for o, d in zip(origin, dest)]
+        distance = math.sqrt(sum(delta**2 for delta in deltas))
+        if distance == 0:
+            return 0.0
+        moving_axes = [
+            (self._axis_limits[axis], delta)
+            for axis, delta in zip(_GANTRY_AXES, deltas)
+            if delta > 0
+        ]
+        max_speed = min(
+            limits.max_speed * distance / delta for limits, delta in moving_axes
+        )
+        acceleration = min(
+            limits.acceleration * distance / delta for limits, delta in moving_axes
+        )
+
+        if distance >= max_speed**2 / acceleration:
+            return distance / max_speed + max_speed / acceleration
+        # The move is too short to reach full speed.
+        return 2 * math.sqrt(distance / acceleration)
+
+    def _get_command_duration(  # noqa: C901
+        self, command: cmd.Command, start_time: float
+    ) -> float:
+        if isinstance(command, (cmd.Aspirate, cmd.AspirateInPlace)):
+            volume = command.result.volume if command.result else command.params.volume
+            return volume / command.params.flowRate
+
+        elif isinstance(command, (cmd.Dispense, cmd.DispenseInPlace)):
+            volume = command.result.volume if command.result else command.params.volume
+            return volume / command.params.flowRate
+
+        elif isinstance(command, cmd.BulkLiquidHandling):
+            duration = 0.0
+            for step in command.params.steps:
+                if isinstance(step, cmd.BulkBlowOutStep):
+                    duration += BLOW_OUT_DURATION
+                else:
+                    duration += step.volume / step.flowRate
+            return duration
+
+        elif isinstance(command, (cmd.BlowOut, cmd.BlowOutInPlace)):
+            return BLOW_OUT_DURATION
+
+        elif isinstance(command, cmd.TouchTip):
+            return TOUCH_TIP_DURATION
+
+        elif isinstance(command, cmd.PickUpTip):
+            return PICK_UP_TIP_DURATION
+
+        elif isinstance(command, (cmd.DropTip, cmd.DropTipInPlace)):
+            return DROP_TIP_DURATION
+
+        elif isinstance(command, cmd.WaitForDuration):
+            return command.params.seconds
+
+        elif isinstance(command, cmd.temperature_module.SetTargetTemperature):
+            self._start_ramp(
+                command.params.moduleId,
+                command.params.celsius,
+                start_time,
+                DurationEstimator.temperature_module,
+            )
+
+        elif isinstance(command, cmd.temperature_module.DeactivateTemperature):
+            self._start_ramp(
+                command.params.moduleId,
+                START_MODULE_TEMPERATURE,
+                start_time,
+                DurationEstimator.temperature_module,
+            )
+
+        elif isinstance(command, cmd.temperature_module.WaitForTemperature):
+            return self._get_ramp_remaining(command.params.moduleId, start_time)
+
+        elif isinstance(command, cmd.thermocycler.SetTargetBlockTemperature):
+            self._start_ramp(
+                command.params.moduleId,
+                command.params.celsius,
+                start_time,
+                DurationEstimator.thermocycler_handler,
+            )
+            self._block_hold_times[command.params.moduleId] = (
+                command.params.holdTimeSeconds or 0.0
+            )
+
+        elif isinstance(command, cmd.thermocycler.WaitForBlockTemperature):
+            return self._get_ramp_remaining(
+                command.params.moduleId, start_time
+            ) + self._block_hold_times.pop(command.params.moduleId, 0.0)
+
+        elif isinstance(command, cmd.thermocycler.RunProfile):
+            duration = 0.0
+            for profile_step in command.params.profile:
+                self._start_ramp(
+                    command.params.moduleId,
+                    profile_step.celsius,
+                    start_time + duration,
+                    DurationEstimator.thermocycler_handler,
+                )
+                duration += self._get_ramp_remaining(
+                    command.params.moduleId, start_time + duration
+                )
+                duration += profile_step.holdSeconds
+            return duration
+
+        elif isinstance(command, cmd.thermocycler.SetTargetLidTemperature):
+            self._lid_ready_times[command.params.moduleId] = (
+                start_time + THERMOCYCLER_LID_TEMPERATURE_DURATION
+            )
+
+        elif isinstance(command, cmd.thermocycler.WaitForLidTemperature):
+            ready_time = self._lid_ready_times.get(command.params.moduleId, start_time)
+            return max(ready_time - start_time, 0.0)
+
+        elif isinstance(command, (cmd.thermocycler.OpenLid, cmd.thermocycler.CloseLid)):
+            return THERMOCYCLER_LID_DURATION
+
+        elif isinstance(command, cmd.heater_shaker.SetTargetTemperature):
+            self._start_ramp(
+                command.params.moduleId,
+                command.params.celsius,
+                start_time,
+                heater_shaker_ramp,
+            )
+
+        elif isinstance(command, cmd.heater_shaker.DeactivateHeater):
+            self._start_ramp(
+                command.params.moduleId,
+                START_MODULE_TEMPERATURE,
+                start_time,
+                heater_shaker_ramp,
+            )
+
+        elif isinstance(command, cmd.heater_shaker.WaitForTemperature):
+            return self._get_ramp_remaining(command.params.moduleId, start_time)
+
+        elif isinstance(
+            command,
+            (
+                cmd.heater_shaker.SetAndWaitForShakeSpeed,
+                cmd.heater_shaker.DeactivateShaker,
+            ),
+        ):
+            return HEATER_SHAKER_SHAKE_RAMP_DURATION
+
+        elif isinstance(
+            command,
+            (cmd.heater_shaker.OpenLabwareLatch, cmd.heater_shaker.CloseLabwareLatch),
+        ):
+            return HEATER_SHAKER_LATCH_DURATION
+
+        elif isinstance(command, cmd.magnetic_module.Engage):
+            # The engage height is measured from the labware, not from the
+            # magnets' home position, so this is only approximate.
+            previous_height = self._magnet_heights.get(command.params.moduleId, 0.0)
+            self._magnet_heights[command.params.moduleId] = command.params.height
+            return (
+                abs(command.params.height - previous_height)
+                / MAGNETIC_MODULE_MAGNET_SPEED
+            )
+
+        elif isinstance(command, cmd.magnetic_module.Disengage):
+            previous_height = self._magnet_heights.pop(command.params.moduleId, 0.0)
+            return abs(previous_height) / MAGNETIC_MODULE_MAGNET_SPEED
+
+        return 0.0
+
+    def _start_ramp(
+        self,
+        module_id: str,
+        target_celsius: float,
+        time: float,
+        get_ramp_duration: RampModel,
+    ) -> None:
+        previous_ramp = self._temperature_ramps.get(module_id)
+        start_celsius = (
+            previous_ramp.get_celsius(time)
+            if previous_ramp is not None
+            else START_MODULE_TEMPERATURE
+        )
+        self._temperature_ramps[module_id] = _TemperatureRamp(
+            start_celsius=start_celsius,
+            target_celsius=target_celsius,
+            start_time=time,
+            end_time=time + get_ramp_duration(start_celsius, target_celsius),
+        )
+
+    def _get_ramp_remaining(self, module_id: str, time: float) -> float:
+        ramp = self._temperature_ramps.get(module_id)
+        return max(ramp.end_time - time, 0.0) if ramp is not None else 0.0
+
+
+def estimate_duration(
+    commands: Sequence[cmd.Command], robot_type: RobotType
+) -> DurationEstimate:
+    """Estimate how long a list of commands, like an analysis', will take to run.
+
+    Args:
+        commands: Every command in the protocol, in the order they ran.
+        robot_type: The robot the commands ran on, which determines the
+            gantry's speed and acceleration limits.
+    """
+    estimator = CommandDurationEstimator(robot_type=robot_type)
+    estimates = [
+        CommandDurationEstimate(
+            commandId=command.id,
+            commandType=command.commandType,
+            duration=estimator.estimate(command),
+        )
+        for command in commands
+    ]
+    return DurationEstimate(
+        totalDuration=sum(estimate.duration for estimate in estimates),
+        commands=estimates,
+    )
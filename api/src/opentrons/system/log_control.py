@@ -7,13 +7,16 @@ This is the implementation of the endpoints in
 import asyncio
 import logging
 import subprocess
-from typing import List
+from typing import AsyncGenerator, List, Optional
 
 
 LOG = logging.getLogger(__name__)
 
 MAX_RECORDS = 100000
 DEFAULT_RECORDS = 50000
+STREAM_CHUNK_SIZE = 64 * 1024
+# How much of journalctl's stderr to keep, to explain a failure
+STDERR_TAIL_SIZE = 4 * 1024
 
 UNIT_SELECTORS = ["opentrons-robot-server", "opentrons-robot-app"]
 SERIAL_SPECIAL = "ALL_SERIAL"
@@ -24,13 +27,9 @@ SERIAL_SELECTORS = [
 ]
 
 
-async def get_records_dumb(selector: str, records: int, mode: str) -> bytes:
-    """Dump the log files.
-
-    :param selector: The syslog selector to limit responses to
-    :param records: The maximum number of records to print
-    :param mode: A journalctl dump mode. Should be either "short-precise" or "json".
-    """
+def _journalctl_command(
+    selector: str, records: int, mode: str, *extra_args: str
+) -> List[str]:
     selector_array: List[str] = []
     if selector == SERIAL_SPECIAL:
         for serial_selector in SERIAL_SELECTORS:
@@ -40,16 +39,117 @@ async def get_records_dumb(selector: str, records: int, mode: str) -> bytes:
     else:
         selector_array.extend(["-t", selector])
 
-    proc = await asyncio.create_subprocess_exec(
+    return [
         "journalctl",
         "--no-pager",
         *selector_array,
+        *extra_args,
         "-n",
         str(records),
         "-o",
         mode,
         "-a",
+    ]
+
+
+async def get_records_dumb(selector: str, records: int, mode: str) -> bytes:
+    """Dump the log files.
+
+    :param selector: The syslog selector to limit responses to
+    :param records: The maximum number of records to print
+    :param mode: A journalctl dump mode. Should be either "short-precise" or "json".
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *_journalctl_command(selector, records, mode),
         stdout=subprocess.PIPE,
     )
     stdout, _ = await proc.communicate()
     return stdout
+
+
+class LogReadError(RuntimeError):
+    """journalctl failed before writing any records."""
+
+
+async def stream_records(
+    selector: str,
+    records: int,
+    mode: str,
+    after_cursor: Optional[str] = None,
+) -> AsyncGenerator[bytes, None]:
+    """Start journalctl, and get an iterator that streams its output.
+
+    journalctl is started, and its first chunk of output read, before this
+    returns, so that a failure to read the logs (like a malformed cursor)
+    raises here instead of partway through a response.
+
+    Text output ends with a ``-- cursor: <cursor>`` line, and every JSON
+    record has a ``__CURSOR`` field. Passing the last cursor seen back in as
+    ``after_cursor`` gets only the records written since.
+
+    :param selector: The syslog selector to limit responses to
+    :param records: The maximum number of records to print
+    :param mode: A journalctl dump mode. Should be either "short-precise" or "json".
+    :param after_cursor: Only print records after the one at this cursor
+    :raises LogReadError: If journalctl exits with an error before any output
+    """
+    cursor_args: List[str] = []
+    if after_cursor is not None:
+        cursor_args.append(f"--after-cursor={after_cursor}")
+    if mode != "json":
+        # JSON records carry their own __CURSOR field
+        cursor_args.append("--show-cursor")
+    proc = await asyncio.create_subprocess_exec(
+        *_journalctl_command(selector, records, mode, *cursor_args),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    assert proc.stdout is not None
+    assert proc.stderr is not None
+    # journalctl blocks if its stderr pipe fills up, so read it the whole time
+    stderr_task = asyncio.create_task(_read_tail(proc.stderr))
+    try:
+        first_chunk = await proc.stdout.read(STREAM_CHUNK_SIZE)
+    except BaseException:
+        proc.kill()
+        await proc.wait()
+        await stderr_task
+        raise
+    if not first_chunk:
+        stderr = await stderr_task
+        if await proc.wait() != 0:
+            raise LogReadError(
+                stderr.decode(errors="replace").strip()
+                or f"journalctl exited with code {proc.returncode}"
+            )
+    return _stream_output(proc, first_chunk, stderr_task)
+
+
+async def _read_tail(stream: asyncio.StreamReader) -> bytes:
+    tail = b""
+    while True:
+        chunk = await stream.read(STREAM_CHUNK_SIZE)
+        if not chunk:
+            return tail
+        tail = (tail + chunk)[-STDERR_TAIL_SIZE:]
+
+
+async def _stream_output(
+    proc: "asyncio.subprocess.Process",
+    first_chunk: bytes,
+    stderr_task: "asyncio.Task[bytes]",
+) -> AsyncGenerator[bytes, None]:
+    assert proc.stdout is not None
+    try:
+        chunk = first_chunk
+        while chunk:
+            yield chunk
+            chunk = await proc.stdout.read(STREAM_CHUNK_SIZE)
+        await proc.wait()
+    finally:
+        # The client went away before the end of the output
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        # journalctl has exited, so its stderr is at its end
+        await stderr_task
@@ -26,7 +26,9 @@ class _AnalysisCLIResult:
     stdout_stderr: str
 
 
-def _get_analysis_result(protocol_files: List[Path]) -> _AnalysisCLIResult:
+def _get_analysis_result(
+    protocol_files: List[Path], extra_args: Optional[List[str]] = None
+) -> _AnalysisCLIResult:
     """Run `protocol_files` as a single protocol through the analysis CLI.
 
     Returns:
@@ -43,6 +45,7 @@ def _get_analysis_result(protocol_files: List[Path]) -> _AnalysisCLIResult:
             [
                 "--json-output",
                 str(analysis_output_file),
+                *(extra_args or []),
                 *[str(p.resolve()) for p in protocol_files],
             ],
         )
@@ -73,6 +76,51 @@ def test_analyze(
     assert "labware" in result.json_output
     assert "liquids" in result.json_output
     assert "modules" in result.json_output
+    assert "commandTimings" not in result.json_output
+    assert "estimatedDuration" not in result.json_output
+
+
+def test_analyze_command_timing() -> None:
+    """Should include per-command-type timing histograms when asked for them."""
+    fixture_path = next(_list_fixtures(6))
+    result = _get_analysis_result([fixture_path], ["--command-timing"])
+
+    assert result.exit_code == 0
+    assert result.json_output is not None
+
+    command_timings = result.json_output["commandTimings"]
+    command_type_counts: Dict[str, int] = {}
+    for command in result.json_output["commands"]:
+        command_type = command["commandType"]
+        command_type_counts[command_type] = command_type_counts.get(command_type, 0) + 1
+
+    assert {
+        timing["commandType"]: timing["execute"]["count"] for timing in command_timings
+    } == command_type_counts
+    for timing in command_timings:
+        for phase in ("queueWait", "execute", "stateUpdate"):
+            histogram = timing[phase]
+            assert sum(histogram["bucketCounts"]) == histogram["count"]
+
+
+def test_analyze_estimate_duration() -> None:
+    """Should include per-command and total duration estimates when asked for them."""
+    fixture_path = next(
+        path for path in _list_fixtures(6) if path.name == "simpleV6.json"
+    )
+    result = _get_analysis_result([fixture_path], ["--estimate-duration"])
+
+    assert result.exit_code == 0
+    assert result.json_output is not None
+
+    estimate = result.json_output["estimatedDuration"]
+    assert [command["commandId"] for command in estimate["commands"]] == [
+        command["id"] for command in result.json_output["commands"]
+    ]
+    assert estimate["totalDuration"] == pytest.approx(
+        sum(command["duration"] for command in estimate["commands"])
+    )
+    assert estimate["totalDuration"] > 0
 
 
 _DECK_DEFINITION_TEST_SLOT = 2
@@ -8,7 +8,7 @@ from opentrons.config.advanced_settings import _migrate, _ensure
 
 @pytest.fixture
 def migrated_file_version() -> int:
-    return 33
+    return 34
 
 
 # make sure to set a boolean value in default_file_settings only if
@@ -32,6 +32,7 @@ def default_file_settings() -> Dict[str, Any]:
         "enableErrorRecoveryExperiments": None,
         "enableOEMMode": None,
         "enablePerformanceMetrics": None,
+        "enableAnalysisDurationEstimates": None,
     }
 
 
@@ -405,6 +406,18 @@ def v33_config(v32_config: Dict[str, Any]) -> Dict[str, Any]:
     return r
 
 
+@pytest.fixture
+def v34_config(v33_config: Dict[str, Any]) -> Dict[str, Any]:
+    r = v33_config.copy()
+    r.update(
+        {
+            "_version": 34,
+            "enableAnalysisDurationEstimates": None,
+        }
+    )
+    return r
+
+
 @pytest.fixture(
     scope="session",
     params=[
@@ -443,6 +456,7 @@ def v33_config(v32_config: Dict[str, Any]) -> Dict[str, Any]:
         lazy_fixture("v31_config"),
         lazy_fixture("v32_config"),
         lazy_fixture("v33_config"),
+        lazy_fixture("v34_config"),
     ],
 )
 def old_settings(request: SubRequest) -> Dict[str, Any]:
@@ -537,4 +551,5 @@ def test_ensures_config() -> None:
         "enableErrorRecoveryExperiments": None,
         "enableOEMMode": None,
         "enablePerformanceMetrics": None,
+        "enableAnalysisDurationEstimates": None,
     }
@@ -0,0 +1,72 @@
+import asyncio
+from time import perf_counter
+from typing import AsyncIterator, Callable, Tuple
+
+import pytest
+
+from opentrons.hardware_control.emulation.connection_handler import ConnectionHandler
+from opentrons.hardware_control.emulation.parser import Parser
+from opentrons.hardware_control.emulation.settings import Settings
+from opentrons.hardware_control.emulation.smoothie import SmoothieEmulator
+
+Streams = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+COMMANDS = 2000
+SMOOTHIE_LINES = [
+    "G0 X100.5 Y20.25 Z-3.0 F6000",
+    "M114.2",
+    "G0 A12.0 B-4.5",
+    "G28.6",
+    "M114.2",
+]
+
+
+@pytest.fixture
+async def smoothie() -> AsyncIterator[Streams]:
+    """A driver connection to a smoothie emulator."""
+    emulator = SmoothieEmulator(Parser(), Settings().smoothie)
+    server = await asyncio.start_server(ConnectionHandler(emulator), "localhost", 0)
+    port = server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("localhost", port)
+    yield reader, writer
+    writer.close()
+    await writer.wait_closed()
+    server.close()
+    await server.wait_closed()
+
+
+async def test_connection_handler_answers_every_command(smoothie: Streams) -> None:
+    """It should answer every command sent over a connection, in order."""
+    reader, writer = smoothie
+    ack = SmoothieEmulator.get_ack()
+
+    for index in range(COMMANDS):
+        line = SMOOTHIE_LINES[index % len(SMOOTHIE_LINES)]
+        writer.write(f"{line}\r\n\r\n".encode())
+        await reader.readuntil(ack)
+
+    writer.write(b"M114.2\r\n\r\n")
+    response = await reader.readuntil(ack)
+    assert b"X:100.5 Y:20.25 Z:-3.0" in response
+
+
+@pytest.mark.benchmark
+async def test_connection_handler_throughput(
+    smoothie: Streams, record_property: Callable[[str, object], None]
+) -> None:
+    """Measure how many commands per second a connection handles.
+
+    Run with ``--benchmark --junitxml=<file>``; the rate is reported there
+    as the ``commands_per_second`` property.
+    """
+    reader, writer = smoothie
+    ack = SmoothieEmulator.get_ack()
+
+    start = perf_counter()
+    for index in range(COMMANDS):
+        line = SMOOTHIE_LINES[index % len(SMOOTHIE_LINES)]
+        writer.write(f"{line}\r\n\r\n".encode())
+        await reader.readuntil(ack)
+    commands_per_second = COMMANDS / (perf_counter() - start)
+
+    record_property("commands_per_second", round(commands_per_second))
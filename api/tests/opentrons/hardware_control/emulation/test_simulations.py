@@ -0,0 +1,47 @@
+import pytest
+
+from opentrons.hardware_control.emulation.simulations import (
+    RPM,
+    Temperature,
+    TemperatureWithHold,
+)
+
+
+@pytest.mark.parametrize(argnames=["ticks_per_poll"], argvalues=[[2], [7], [100]])
+@pytest.mark.parametrize(
+    argnames=["current", "target"],
+    argvalues=[[23.0, 95.0], [95.0, 4.0], [23.0, 23.0], [23.0, 24.5]],
+)
+def test_ticks_per_poll_matches_single_ticks(
+    ticks_per_poll: int, current: float, target: float
+) -> None:
+    """A poll should advance the model as far as that many single ticks."""
+    single = TemperatureWithHold(per_tick=2.0, current=current)
+    compressed = TemperatureWithHold(
+        per_tick=2.0, current=current, ticks_per_poll=ticks_per_poll
+    )
+    for subject in (single, compressed):
+        subject.set_target(target)
+        subject.set_hold(30)
+
+    for _ in range(3):
+        for _ in range(ticks_per_poll):
+            single.tick()
+        compressed.tick()
+
+        assert compressed.current == pytest.approx(single.current)
+        assert compressed.time_remaining == single.time_remaining
+
+
+def test_temperature_without_target_does_not_move() -> None:
+    """It should stay put until it has a target."""
+    subject = Temperature(per_tick=2.0, current=23.0, ticks_per_poll=10)
+    subject.tick()
+    assert subject.current == 23.0
+
+
+def test_rpm_spins_down_without_target() -> None:
+    """It should spin down towards 0 when it has no target."""
+    subject = RPM(per_tick=100.0, current=1000.0, ticks_per_poll=3)
+    subject.tick()
+    assert subject.current == 700.0
@@ -0,0 +1,15 @@
+from opentrons.hardware_control.emulation.parser import Parser
+from opentrons.hardware_control.emulation.settings import Settings
+from opentrons.hardware_control.emulation.thermocycler import ThermocyclerEmulator
+
+
+def test_ticks_per_poll_finishes_ramp_and_hold() -> None:
+    """It should finish a plate ramp and hold in a single poll."""
+    settings = Settings().thermocycler
+    settings.plate_temperature.ticks_per_poll = 1000
+    subject = ThermocyclerEmulator(Parser(), settings)
+
+    subject.handle("M104 S95.0 H30.0")
+    subject.handle("M105")
+
+    assert subject.handle("M105") == "T:95.0 C:95.0 H:0 Total_H:30.0 "
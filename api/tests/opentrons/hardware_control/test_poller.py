@@ -69,6 +69,18 @@ async def test_poller(decoy: Decoy, mock_reader: Reader, subject: Poller) -> Non
     decoy.verify(await mock_reader.read(), times=2)
 
 
+async def test_poller_read_on_wait(mock_reader: Reader) -> None:
+    """It should read as soon as it is waited on, if configured to."""
+    subject = Poller(reader=mock_reader, interval=60, read_on_wait=True)
+    await subject.start()
+
+    # Without reading on wait, each of these would take a whole interval.
+    await asyncio.wait_for(subject.wait_next_poll(), timeout=1)
+    await asyncio.wait_for(subject.wait_next_poll(), timeout=1)
+
+    await subject.stop()
+
+
 async def test_poller_concurrency(
     mock_reader_flow_control: None,
     read_started_event: asyncio.Event,
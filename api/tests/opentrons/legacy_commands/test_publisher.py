@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import pytest
 from decoy import Decoy, matchers
+import logging
 from typing import Any, Dict, cast
 from opentrons.legacy_broker import LegacyBroker
 from opentrons.legacy_commands.types import Command as CommandDict, CommandMessage
@@ -15,8 +16,10 @@ from opentrons.legacy_commands.publisher import (
 
 @pytest.fixture
 def broker(decoy: Decoy) -> LegacyBroker:
-    """Return a mocked out Broker."""
-    return decoy.mock(cls=LegacyBroker)
+    """Return a mocked out Broker with a subscriber."""
+    broker = decoy.mock(cls=LegacyBroker)
+    decoy.when(broker.has_subscribers("command")).then_return(True)
+    return broker
 
 
 def test_publish_decorator(decoy: Decoy, broker: LegacyBroker) -> None:
@@ -325,3 +328,25 @@ def test_publish_context_with_error(decoy: Decoy, broker: LegacyBroker) -> None:
     )
 
     assert before_message_id.value == after_message_id.value
+
+
+def test_publish_without_subscribers_or_logging(decoy: Decoy) -> None:
+    """It should not build or publish messages when nothing would see them."""
+    _act = decoy.mock(name="_act")
+    _get_command_payload = decoy.mock(name="_get_command_payload")
+    broker = LegacyBroker()
+    broker.set_logger(logging.getLogger("test_publisher.quiet"))
+    broker.logger.setLevel(logging.WARNING)
+
+    class _Subject(CommandPublisher):
+        @publish(command=_get_command_payload)
+        def act(self) -> None:
+            _act()
+
+    subject = _Subject(broker=broker)
+    subject.act()
+    with publish_context(broker=broker, command=_get_command_payload()):
+        _act()
+
+    decoy.verify(_act(), times=2)
+    decoy.verify(_get_command_payload(), times=1)
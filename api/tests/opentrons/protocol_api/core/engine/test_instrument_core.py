@@ -19,6 +19,7 @@ from opentrons.protocol_engine import (
     DropTipWellLocation,
     DropTipWellOrigin,
 )
+from opentrons.protocol_engine import commands
 from opentrons.protocol_engine.clients.sync_client import SyncClient
 from opentrons.protocol_engine.errors.exceptions import TipNotAttachedError
 from opentrons.protocol_engine.clients import SyncClient as EngineClient
@@ -1036,6 +1037,115 @@ def test_home_plunger(
     )
 
 
+def test_bulk_liquid_handling(
+    decoy: Decoy,
+    mock_engine_client: EngineClient,
+    mock_protocol_core: ProtocolCore,
+    subject: InstrumentCore,
+) -> None:
+    """It should send the steps into wells within the context as bulk commands."""
+    location = Location(point=Point(1, 2, 3), labware=None)
+    well_location = WellLocation(
+        origin=WellOrigin.TOP, offset=WellOffset(x=3, y=2, z=1)
+    )
+    well_core = WellCore(
+        name="my cool well", labware_id="123abc", engine_client=mock_engine_client
+    )
+
+    decoy.when(mock_protocol_core.api_version).then_return(MAX_SUPPORTED_VERSION)
+    decoy.when(
+        mock_engine_client.state.geometry.get_relative_well_location(
+            labware_id="123abc", well_name="my cool well", absolute_point=Point(1, 2, 3)
+        )
+    ).then_return(well_location)
+
+    with subject.bulk_liquid_handling():
+        subject.aspirate(
+            location=location,
+            well_core=well_core,
+            volume=12.34,
+            rate=5.6,
+            flow_rate=7.8,
+            in_place=False,
+        )
+        subject.dispense(
+            location=location,
+            well_core=well_core,
+            volume=12.34,
+            rate=5.6,
+            flow_rate=6.0,
+            in_place=False,
+            push_out=7,
+        )
+        subject.aspirate(
+            location=location,
+            well_core=None,
+            volume=1.2,
+            rate=5.6,
+            flow_rate=7.8,
+            in_place=True,
+        )
+        subject.dispense(
+            location=location,
+            well_core=well_core,
+            volume=1.2,
+            rate=5.6,
+            flow_rate=6.0,
+            in_place=False,
+            push_out=None,
+        )
+
+    decoy.verify(
+        mock_engine_client.bulk_liquid_handling(
+            pipette_id="abc123",
+            steps=[
+                commands.BulkAspirateStep(
+                    labwareId="123abc",
+                    wellName="my cool well",
+                    wellLocation=well_location,
+                    volume=12.34,
+                    flowRate=7.8,
+                ),
+                commands.BulkDispenseStep(
+                    labwareId="123abc",
+                    wellName="my cool well",
+                    wellLocation=well_location,
+                    volume=12.34,
+                    flowRate=6.0,
+                    pushOut=7,
+                ),
+            ],
+        ),
+        mock_engine_client.aspirate_in_place(
+            pipette_id="abc123", volume=1.2, flow_rate=7.8
+        ),
+        mock_engine_client.bulk_liquid_handling(
+            pipette_id="abc123",
+            steps=[
+                commands.BulkDispenseStep(
+                    labwareId="123abc",
+                    wellName="my cool well",
+                    wellLocation=well_location,
+                    volume=1.2,
+                    flowRate=6.0,
+                    pushOut=None,
+                ),
+            ],
+        ),
+    )
+    decoy.verify(
+        mock_engine_client.aspirate(
+            pipette_id="abc123",
+            labware_id="123abc",
+            well_name="my cool well",
+            well_location=well_location,
+            volume=12.34,
+            flow_rate=7.8,
+        ),
+        times=0,
+    )
+
+
 def test_touch_tip(
     decoy: Decoy,
     subject: InstrumentCore,
@@ -234,6 +234,40 @@ def test_wells(
     assert subject.columns_by_name() == {"1": [result_a1, result_b1]}
 
 
+def test_wells_created_on_first_access(
+    decoy: Decoy,
+    mock_labware_core: LabwareCore,
+    mock_protocol_core: ProtocolCore,
+    mock_map_core: LoadedCoreMap,
+    api_version: APIVersion,
+) -> None:
+    """It should create its wells once, when they are first accessed."""
+    mock_well_core = decoy.mock(cls=WellCore)
+    grid = well_grid.WellGrid(columns_by_name={"1": ["A1"]}, rows_by_name={"A": ["A1"]})
+
+    decoy.when(mock_labware_core.get_well_columns()).then_return([["A1"]])
+    decoy.when(mock_labware_core.get_well_core("A1")).then_return(mock_well_core)
+    decoy.when(well_grid.create([["A1"]])).then_return(grid)
+
+    subject = Labware(
+        core=mock_labware_core,
+        api_version=api_version,
+        protocol_core=mock_protocol_core,
+        core_map=mock_map_core,
+    )
+    decoy.verify(mock_labware_core.get_well_core("A1"), times=0)
+
+    result = subject["A1"]
+    subject.wells_by_name().clear()
+    subject.rows_by_name()["A"].clear()
+    subject.columns()[0].clear()
+
+    assert subject.wells() == [result]
+    assert subject.rows() == [[result]]
+    assert subject.columns_by_name() == {"1": [result]}
+    decoy.verify(mock_labware_core.get_well_core("A1"), times=1)
+
+
 def test_reset_tips(
     decoy: Decoy, mock_labware_core: LabwareCore, subject: Labware
 ) -> None:
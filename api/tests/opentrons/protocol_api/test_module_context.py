@@ -36,7 +36,9 @@ def mock_protocol_core(decoy: Decoy) -> ProtocolCore:
 @pytest.fixture
 def mock_broker(decoy: Decoy) -> LegacyBroker:
     """Get a mock command message broker."""
-    return decoy.mock(cls=LegacyBroker)
+    mock_broker = decoy.mock(cls=LegacyBroker)
+    decoy.when(mock_broker.has_subscribers("command")).then_return(True)
+    return mock_broker
 
 
 @pytest.fixture
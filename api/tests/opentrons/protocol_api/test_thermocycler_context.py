@@ -43,7 +43,9 @@ def mock_core_map(decoy: Decoy) -> LoadedCoreMap:
 @pytest.fixture
 def mock_broker(decoy: Decoy) -> LegacyBroker:
     """Get a mock command message broker."""
-    return decoy.mock(cls=LegacyBroker)
+    mock_broker = decoy.mock(cls=LegacyBroker)
+    decoy.when(mock_broker.has_subscribers("command")).then_return(True)
+    return mock_broker
 
 
 @pytest.fixture
@@ -8,7 +8,7 @@ the subject's methods in a synchronous context in a child thread to ensure:
 - In the main thread, the Protocol Engine does its work in the main event
     loop, without blocking.
 """
-from typing import Optional
+from typing import List, Optional
 
 import pytest
 from decoy import Decoy
@@ -929,6 +929,39 @@ def test_blow_out(
     assert result == response
 
 
+def test_bulk_liquid_handling(
+    decoy: Decoy,
+    transport: ChildThreadTransport,
+    subject: SyncClient,
+) -> None:
+    """It should execute a bulk liquid handling command."""
+    steps: List[commands.BulkLiquidHandlingStep] = [
+        commands.BulkAspirateStep(
+            labwareId="456", wellName="A1", volume=10, flowRate=1.2
+        ),
+        commands.BulkDispenseStep(
+            labwareId="456", wellName="A2", volume=10, flowRate=3.4
+        ),
+    ]
+    request = commands.BulkLiquidHandlingCreate(
+        params=commands.BulkLiquidHandlingParams(pipetteId="123", steps=steps)
+    )
+
+    response = commands.BulkLiquidHandlingResult(
+        position=DeckPoint(x=4, y=5, z=6),
+        steps=[
+            commands.BulkLiquidHandlingStepResult(volume=10),
+            commands.BulkLiquidHandlingStepResult(volume=10),
+        ],
+    )
+
+    decoy.when(transport.execute_command(request=request)).then_return(response)
+
+    result = subject.bulk_liquid_handling(pipette_id="123", steps=steps)
+
+    assert result == response
+
+
 def test_blow_out_in_place(
     decoy: Decoy,
     transport: ChildThreadTransport,
@@ -0,0 +1,409 @@
+"""Test bulk liquid handling commands."""
+import pytest
+from decoy import Decoy, matchers
+
+from opentrons_shared_data.errors.exceptions import PythonException
+
+from opentrons.types import Point
+from opentrons.protocol_engine import WellLocation, WellOrigin, WellOffset, DeckPoint
+from opentrons.protocol_engine.commands.bulk_liquid_handling import (
+    BulkAspirateStep,
+    BulkBlowOutStep,
+    BulkDispenseStep,
+    BulkLiquidHandlingImplementation,
+    BulkLiquidHandlingParams,
+    BulkLiquidHandlingResult,
+    BulkLiquidHandlingStepResult,
+)
+from opentrons.protocol_engine.errors.exceptions import (
+    BulkLiquidHandlingStepError,
+    InvalidDispenseVolumeError,
+)
+from opentrons.protocol_engine.execution import MovementHandler, PipettingHandler
+from opentrons.protocol_engine.notes import CommandNoteAdder
+from opentrons.protocol_engine.state import StateView
+from opentrons.protocol_engine.types import CurrentWell
+
+
+@pytest.fixture
+def subject(
+    state_view: StateView,
+    movement: MovementHandler,
+    pipetting: PipettingHandler,
+    mock_command_note_adder: CommandNoteAdder,
+) -> BulkLiquidHandlingImplementation:
+    """Get the implementation subject."""
+    return BulkLiquidHandlingImplementation(
+        movement=movement,
+        pipetting=pipetting,
+        state_view=state_view,
+        command_note_adder=mock_command_note_adder,
+    )
+
+
+async def test_bulk_liquid_handling_implementation(
+    decoy: Decoy,
+    state_view: StateView,
+    movement: MovementHandler,
+    pipetting: PipettingHandler,
+    mock_command_note_adder: CommandNoteAdder,
+    subject: BulkLiquidHandlingImplementation,
+) -> None:
+    """It should run each step, tracking location and volume between them."""
+    location = WellLocation(origin=WellOrigin.BOTTOM, offset=WellOffset(x=0, y=0, z=1))
+    source = CurrentWell(pipette_id="pipette-id", labware_id="source", well_name="A1")
+    dest_1 = CurrentWell(pipette_id="pipette-id", labware_id="dest", well_name="A1")
+    dest_2 = CurrentWell(pipette_id="pipette-id", labware_id="dest", well_name="B1")
+
+    params = BulkLiquidHandlingParams(
+        pipetteId="pipette-id",
+        steps=[
+            BulkAspirateStep(
+                labwareId="source",
+                wellName="A1",
+                wellLocation=location,
+                volume=100,
+                flowRate=1.1,
+            ),
+            BulkDispenseStep(
+                labwareId="dest", wellName="A1", volume=50, flowRate=2.2, pushOut=3
+            ),
+            BulkDispenseStep(labwareId="dest", wellName="B1", volume=50, flowRate=2.2),
+            BulkBlowOutStep(labwareId="dest", wellName="B1", flowRate=4.4),
+        ],
+    )
+
+    decoy.when(pipetting.get_is_ready_to_aspirate(pipette_id="pipette-id")).then_return(
+        False
+    )
+    decoy.when(state_view.pipettes.get_aspirated_volume("pipette-id")).then_return(None)
+    decoy.when(
+        await movement.move_to_well(
+            pipette_id="pipette-id",
+            labware_id="source",
+            well_name="A1",
+            well_location=location,
+            current_well=source,
+        )
+    ).then_return(Point(x=1, y=1, z=1))
+    decoy.when(
+        await pipetting.aspirate_in_place(
+            pipette_id="pipette-id",
+            volume=100,
+            flow_rate=1.1,
+            command_note_adder=mock_command_note_adder,
+            current_volume=0,
+        )
+    ).then_return(100)
+    decoy.when(
+        await movement.move_to_well(
+            pipette_id="pipette-id",
+            labware_id="dest",
+            well_name="A1",
+            well_location=WellLocation(),
+            current_well=source,
+        )
+    ).then_return(Point(x=2, y=2, z=2))
+    decoy.when(
+        await pipetting.dispense_in_place(
+            pipette_id="pipette-id",
+            volume=50,
+            flow_rate=2.2,
+            push_out=3,
+            current_volume=100,
+        )
+    ).then_return(50)
+    decoy.when(
+        await movement.move_to_well(
+            pipette_id="pipette-id",
+            labware_id="dest",
+            well_name="B1",
+            well_location=WellLocation(),
+            current_well=dest_1,
+        )
+    ).then_return(Point(x=3, y=3, z=3))
+    decoy.when(
+        await pipetting.dispense_in_place(
+            pipette_id="pipette-id",
+            volume=50,
+            flow_rate=2.2,
+            push_out=None,
+            current_volume=50,
+        )
+    ).then_return(50)
+    decoy.when(
+        await movement.move_to_well(
+            pipette_id="pipette-id",
+            labware_id="dest",
+            well_name="B1",
+            well_location=WellLocation(),
+            current_well=dest_2,
+        )
+    ).then_return(Point(x=4, y=4, z=4))
+
+    result = await subject.execute(params)
+
+    assert result == BulkLiquidHandlingResult(
+        position=DeckPoint(x=4, y=4, z=4),
+        steps=[
+            BulkLiquidHandlingStepResult(volume=100),
+            BulkLiquidHandlingStepResult(volume=50),
+            BulkLiquidHandlingStepResult(volume=50),
+            BulkLiquidHandlingStepResult(volume=None),
+        ],
+    )
+    decoy.verify(
+        await movement.move_to_well(
+            pipette_id="pipette-id",
+            labware_id="source",
+            well_name="A1",
+            well_location=WellLocation(origin=WellOrigin.TOP),
+            current_well=None,
+        ),
+        await pipetting.prepare_for_aspirate(pipette_id="pipette-id"),
+    )
+    decoy.verify(
+        await pipetting.blow_out_in_place(pipette_id="pipette-id", flow_rate=4.4)
+    )
+
+
+async def test_bulk_liquid_handling_prepares_after_blow_out(
+    decoy: Decoy,
+    state_view: StateView,
+    movement: MovementHandler,
+    pipetting: PipettingHandler,
+    mock_command_note_adder: CommandNoteAdder,
+    subject: BulkLiquidHandlingImplementation,
+) -> None:
+    """It should prepare to aspirate again after a blow-out step."""
+    location = WellLocation(origin=WellOrigin.BOTTOM)
+    params = BulkLiquidHandlingParams(
+        pipetteId="pipette-id",
+        steps=[
+            BulkBlowOutStep(labwareId="labware-id", wellName="A1", flowRate=1),
+            BulkAspirateStep(
+                labwareId="labware-id",
+                wellName="A2",
+                wellLocation=location,
+                volume=10,
+                flowRate=1,
+            ),
+        ],
+    )
+
+    decoy.when(pipetting.get_is_ready_to_aspirate(pipette_id="pipette-id")).then_return(
+        True
+    )
+    decoy.when(state_view.pipettes.get_aspirated_volume("pipette-id")).then_return(20)
+    decoy.when(
+        await movement.move_to_well(
+            pipette_id="pipette-id",
+            labware_id="labware-id",
+            well_name="A2",
+            well_location=location,
+            current_well=matchers.Anything(),
+        )
+    ).then_return(Point(x=1, y=2, z=3))
+    decoy.when(
+        await pipetting.aspirate_in_place(
+            pipette_id="pipette-id",
+            volume=10,
+            flow_rate=1,
+            command_note_adder=mock_command_note_adder,
+            current_volume=0,
+        )
+    ).then_return(10)
+
+    result = await subject.execute(params)
+
+    assert result.steps == [
+        BulkLiquidHandlingStepResult(volume=None),
+        BulkLiquidHandlingStepResult(volume=10),
+    ]
+    decoy.verify(
+        await pipetting.blow_out_in_place(pipette_id="pipette-id", flow_rate=1),
+        await movement.move_to_well(
+            pipette_id="pipette-id",
+            labware_id="labware-id",
+            well_name="A2",
+            well_location=WellLocation(origin=WellOrigin.TOP),
+            current_well=CurrentWell(
+                pipette_id="pipette-id", labware_id="labware-id", well_name="A1"
+            ),
+        ),
+        await pipetting.prepare_for_aspirate(pipette_id="pipette-id"),
+    )
+
+
+async def test_bulk_liquid_handling_dispense_without_volume(
+    decoy: Decoy,
+    state_view: StateView,
+    subject: BulkLiquidHandlingImplementation,
+) -> None:
+    """It should raise if a step dispenses when nothing has been aspirated."""
+    params = BulkLiquidHandlingParams(
+        pipetteId="pipette-id",
+        steps=[
+            BulkBlowOutStep(labwareId="labware-id", wellName="A1", flowRate=1),
+            BulkDispenseStep(
+                labwareId="labware-id", wellName="A2", volume=10, flowRate=1
+            ),
+        ],
+    )
+
+    decoy.when(state_view.pipettes.get_aspirated_volume("pipette-id")).then_return(20)
+
+    with pytest.raises(BulkLiquidHandlingStepError) as exc_info:
+        await subject.execute(params)
+
+    assert exc_info.value.failed_step_index == 1
+    assert exc_info.value.completed_step_volumes == [None]
+    assert isinstance(exc_info.value.wrapping[0], InvalidDispenseVolumeError)
+
+
+async def test_bulk_liquid_handling_prepares_after_push_out(
+    decoy: Decoy,
+    state_view: StateView,
+    movement: MovementHandler,
+    pipetting: PipettingHandler,
+    mock_command_note_adder: CommandNoteAdder,
+    subject: BulkLiquidHandlingImplementation,
+) -> None:
+    """It should prepare to aspirate again if a dispense pushed out."""
+    location = WellLocation(origin=WellOrigin.BOTTOM)
+    params = BulkLiquidHandlingParams(
+        pipetteId="pipette-id",
+        steps=[
+            BulkDispenseStep(
+                labwareId="labware-id", wellName="A1", volume=20, flowRate=1
+            ),
+            BulkAspirateStep(
+                labwareId="labware-id",
+                wellName="A2",
+                wellLocation=location,
+                volume=10,
+                flowRate=1,
+            ),
+        ],
+    )
+
+    decoy.when(pipetting.get_is_ready_to_aspirate(pipette_id="pipette-id")).then_return(
+        True
+    )
+    decoy.when(state_view.pipettes.get_aspirated_volume("pipette-id")).then_return(20)
+    decoy.when(
+        await pipetting.dispense_in_place(
+            pipette_id="pipette-id",
+            volume=20,
+            flow_rate=1,
+            push_out=None,
+            current_volume=20,
+        )
+    ).then_return(20)
+    decoy.when(
+        pipetting.get_is_ready_to_aspirate(pipette_id="pipette-id", current_volume=0)
+    ).then_return(False)
+    decoy.when(
+        await movement.move_to_well(
+            pipette_id="pipette-id",
+            labware_id="labware-id",
+            well_name="A2",
+            well_location=location,
+            current_well=matchers.Anything(),
+        )
+    ).then_return(Point(x=1, y=2, z=3))
+    decoy.when(
+        await pipetting.aspirate_in_place(
+            pipette_id="pipette-id",
+            volume=10,
+            flow_rate=1,
+            command_note_adder=mock_command_note_adder,
+            current_volume=0,
+        )
+    ).then_return(10)
+
+    result = await subject.execute(params)
+
+    assert result.steps == [
+        BulkLiquidHandlingStepResult(volume=20),
+        BulkLiquidHandlingStepResult(volume=10),
+    ]
+    decoy.verify(
+        await pipetting.dispense_in_place(
+            pipette_id="pipette-id",
+            volume=20,
+            flow_rate=1,
+            push_out=None,
+            current_volume=20,
+        ),
+        await movement.move_to_well(
+            pipette_id="pipette-id",
+            labware_id="labware-id",
+            well_name="A2",
+            well_location=WellLocation(origin=WellOrigin.TOP),
+            current_well=CurrentWell(
+                pipette_id="pipette-id", labware_id="labware-id", well_name="A1"
+            ),
+        ),
+        await pipetting.prepare_for_aspirate(pipette_id="pipette-id"),
+    )
+
+
+async def test_bulk_liquid_handling_wraps_hardware_errors(
+    decoy: Decoy,
+    state_view: StateView,
+    movement: MovementHandler,
+    pipetting: PipettingHandler,
+    subject: BulkLiquidHandlingImplementation,
+) -> None:
+    """It should wrap errors that aren't enumerated, keeping the completed steps."""
+    params = BulkLiquidHandlingParams(
+        pipetteId="pipette-id",
+        steps=[
+            BulkBlowOutStep(labwareId="labware-id", wellName="A1", flowRate=1),
+            BulkBlowOutStep(labwareId="labware-id", wellName="A2", flowRate=1),
+        ],
+    )
+    decoy.when(state_view.pipettes.get_aspirated_volume("pipette-id")).then_return(20)
+    decoy.when(
+        await movement.move_to_well(
+            pipette_id="pipette-id",
+            labware_id="labware-id",
+            well_name="A2",
+            well_location=WellLocation(),
+            current_well=matchers.Anything(),
+        )
+    ).then_raise(RuntimeError("oh no"))
+
+    with pytest.raises(BulkLiquidHandlingStepError) as exc_info:
+        await subject.execute(params)
+
+    assert exc_info.value.failed_step_index == 1
+    assert exc_info.value.completed_step_volumes == [None]
+    assert isinstance(exc_info.value.wrapping[0], PythonException)
+
+
+def test_steps_are_parsed_by_step_type() -> None:
+    """It should parse each step into the model for its step type."""
+    params = BulkLiquidHandlingParams.parse_obj(
+        {
+            "pipetteId": "pipette-id",
+            "steps": [
+                {
+                    "stepType": "aspirate",
+                    "labwareId": "labware-id",
+                    "wellName": "A1",
+                    "volume": 10,
+                    "flowRate": 1,
+                },
+                {
+                    "stepType": "blowout",
+                    "labwareId": "labware-id",
+                    "wellName": "A1",
+                    "flowRate": 1,
+                },
+            ],
+        }
+    )
+
+    assert [type(step) for step in params.steps] == [BulkAspirateStep, BulkBlowOutStep]
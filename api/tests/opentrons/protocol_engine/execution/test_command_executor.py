@@ -48,6 +48,7 @@ from opentrons.protocol_engine.execution import (
 from opentrons.protocol_engine.execution.command_executor import (
     CommandNoteTrackerProvider,
 )
+from opentrons.protocol_engine.execution.command_timing import CommandTimingTracker
 
 from opentrons_shared_data.errors.exceptions import EStopActivatedError, PythonException
 from opentrons.protocol_engine.notes import CommandNoteTracker, CommandNote
@@ -509,3 +510,109 @@ async def test_execute_raises_protocol_engine_error(
             )
         ),
     )
+
+
+async def test_execute_records_command_timing(
+    decoy: Decoy,
+    hardware_api: HardwareControlAPI,
+    state_store: StateStore,
+    action_dispatcher: ActionDispatcher,
+    equipment: EquipmentHandler,
+    movement: MovementHandler,
+    mock_gantry_mover: GantryMover,
+    labware_movement: LabwareMovementHandler,
+    pipetting: PipettingHandler,
+    mock_tip_handler: TipHandler,
+    run_control: RunControlHandler,
+    rail_lights: RailLightsHandler,
+    status_bar: StatusBarHandler,
+    model_utils: ModelUtils,
+    command_note_tracker_provider: CommandNoteTrackerProvider,
+    command_note_tracker: CommandNoteTracker,
+    error_recovery_policy: ErrorRecoveryPolicy,
+) -> None:
+    """It should record the command's phase durations, if timing is enabled."""
+    command_timing = decoy.mock(cls=CommandTimingTracker)
+    subject = CommandExecutor(
+        hardware_api=hardware_api,
+        state_store=state_store,
+        action_dispatcher=action_dispatcher,
+        equipment=equipment,
+        movement=movement,
+        gantry_mover=mock_gantry_mover,
+        labware_movement=labware_movement,
+        pipetting=pipetting,
+        tip_handler=mock_tip_handler,
+        run_control=run_control,
+        model_utils=model_utils,
+        rail_lights=rail_lights,
+        status_bar=status_bar,
+        command_note_tracker_provider=command_note_tracker_provider,
+        error_recovery_policy=error_recovery_policy,
+        command_timing=command_timing,
+    )
+
+    TestCommandImplCls = decoy.mock(func=_TestCommandImpl)
+    command_impl = decoy.mock(cls=_TestCommandImpl)
+
+    class _TestCommand(BaseCommand[_TestCommandParams, _TestCommandResult]):
+        commandType: str = "testCommand"
+        params: _TestCommandParams
+        result: Optional[_TestCommandResult]
+
+        @property
+        def _ImplementationCls(self) -> Type[_TestCommandImpl]:
+            return TestCommandImplCls
+
+    command_params = _TestCommandParams()
+    queued_command = cast(
+        Command,
+        _TestCommand(
+            id="command-id",
+            key="command-key",
+            createdAt=datetime(year=2022, month=2, day=2, second=1),
+            status=CommandStatus.QUEUED,
+            params=command_params,
+        ),
+    )
+
+    decoy.when(state_store.commands.get(command_id="command-id")).then_return(
+        queued_command
+    )
+    decoy.when(
+        queued_command._ImplementationCls(
+            state_view=state_store,
+            hardware_api=hardware_api,
+            equipment=equipment,
+            movement=movement,
+            gantry_mover=mock_gantry_mover,
+            labware_movement=labware_movement,
+            pipetting=pipetting,
+            tip_handler=mock_tip_handler,
+            run_control=run_control,
+            rail_lights=rail_lights,
+            status_bar=status_bar,
+            command_note_adder=command_note_tracker,
+        )
+    ).then_return(
+        command_impl  # type: ignore[arg-type]
+    )
+    decoy.when(command_note_tracker.get_notes()).then_return([])
+    decoy.when(await command_impl.execute(command_params)).then_return(
+        _TestCommandResult()
+    )
+    decoy.when(model_utils.get_timestamp()).then_return(
+        datetime(year=2022, month=2, day=2, second=3),
+        datetime(year=2022, month=2, day=2, second=4),
+    )
+
+    await subject.execute("command-id")
+
+    decoy.verify(
+        command_timing.record(
+            command_type="testCommand",
+            queue_wait_sec=2.0,
+            execute_sec=matchers.IsA(float),
+            state_update_sec=matchers.IsA(float),
+        )
+    )
@@ -0,0 +1,83 @@
+"""Tests for CommandTimingTracker."""
+import pytest
+
+from opentrons.protocol_engine.execution.command_timing import (
+    COMMAND_TIMING_BUCKET_UPPER_BOUNDS_SEC,
+    CommandTimingTracker,
+)
+
+
+def test_empty_summary() -> None:
+    """It should report nothing before any command is recorded."""
+    assert CommandTimingTracker().get_summary() == []
+
+
+def test_record_and_summarize() -> None:
+    """It should accumulate a histogram per command type and phase."""
+    subject = CommandTimingTracker()
+
+    subject.record(
+        command_type="home",
+        queue_wait_sec=0.001,
+        execute_sec=2.5,
+        state_update_sec=0.0003,
+    )
+    subject.record(
+        command_type="aspirate",
+        queue_wait_sec=0.0,
+        execute_sec=0.15,
+        state_update_sec=0.0001,
+    )
+    subject.record(
+        command_type="aspirate",
+        queue_wait_sec=0.002,
+        execute_sec=0.25,
+        state_update_sec=0.0002,
+    )
+
+    result = subject.get_summary()
+
+    assert [timing.commandType for timing in result] == ["aspirate", "home"]
+
+    aspirate_execute = result[0].execute
+    assert aspirate_execute.count == 2
+    assert aspirate_execute.totalSec == pytest.approx(0.4)
+    assert aspirate_execute.minSec == 0.15
+    assert aspirate_execute.maxSec == 0.25
+    assert aspirate_execute.bucketUpperBoundsSec == list(
+        COMMAND_TIMING_BUCKET_UPPER_BOUNDS_SEC
+    )
+    assert len(aspirate_execute.bucketCounts) == (
+        len(COMMAND_TIMING_BUCKET_UPPER_BOUNDS_SEC) + 1
+    )
+    assert sum(aspirate_execute.bucketCounts) == 2
+    # 0.15 s falls in the (0.1, 0.2] bucket and 0.25 s in the (0.2, 0.5] bucket.
+    assert (
+        aspirate_execute.bucketCounts[COMMAND_TIMING_BUCKET_UPPER_BOUNDS_SEC.index(0.2)]
+        == 1
+    )
+    assert (
+        aspirate_execute.bucketCounts[COMMAND_TIMING_BUCKET_UPPER_BOUNDS_SEC.index(0.5)]
+        == 1
+    )
+
+    assert result[1].queueWait.count == 1
+    assert result[1].stateUpdate.maxSec == 0.0003
+
+
+def test_record_overflow() -> None:
+    """It should count durations past the largest bucket in the overflow bucket."""
+    subject = CommandTimingTracker()
+
+    subject.record(
+        command_type="waitForDuration",
+        queue_wait_sec=-1.0,
+        execute_sec=COMMAND_TIMING_BUCKET_UPPER_BOUNDS_SEC[-1] * 2,
+        state_update_sec=0.0,
+    )
+
+    [result] = subject.get_summary()
+    assert result.execute.bucketCounts[-1] == 1
+    # Clock skew should not produce negative durations.
+    assert result.queueWait.minSec == 0.0
+    assert result.queueWait.bucketCounts[0] == 1
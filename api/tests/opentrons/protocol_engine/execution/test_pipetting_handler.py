@@ -105,6 +105,34 @@ def test_hw_get_is_ready_to_aspirate(
     assert hardware_subject.get_is_ready_to_aspirate("pipette-id") == expected
 
 
+@pytest.mark.parametrize("ready_to_aspirate", [True, False])
+def test_hw_get_is_ready_to_aspirate_with_current_volume(
+    decoy: Decoy,
+    mock_state_view: StateView,
+    mock_hardware_api: HardwareAPI,
+    hardware_subject: HardwarePipettingHandler,
+    ready_to_aspirate: bool,
+) -> None:
+    """It should check the hardware against a volume other than the state's."""
+    decoy.when(mock_hardware_api.attached_instruments).then_return({})
+    decoy.when(mock_state_view.pipettes.get_aspirated_volume("pipette-id")).then_return(
+        None
+    )
+    decoy.when(
+        mock_state_view.pipettes.get_hardware_pipette("pipette-id", {})
+    ).then_return(
+        HardwarePipette(
+            mount=Mount.RIGHT,
+            config=cast(PipetteDict, {"ready_to_aspirate": ready_to_aspirate}),
+        )
+    )
+
+    assert (
+        hardware_subject.get_is_ready_to_aspirate("pipette-id", current_volume=0)
+        == ready_to_aspirate
+    )
+
+
 def test_hw_get_is_ready_to_aspirate_raises_no_tip_attached(
     decoy: Decoy,
     mock_state_view: StateView,
@@ -588,3 +616,63 @@ async def test_dispense_volume_validation(
             await subject.dispense_in_place(
                 pipette_id="pipette-id", volume=not_ok_volume, flow_rate=5, push_out=7
             )
+
+
+async def test_volume_validation_with_current_volume(
+    decoy: Decoy,
+    mock_state_view: StateView,
+    mock_hardware_api: HardwareAPI,
+    hardware_subject: HardwarePipettingHandler,
+    mock_command_note_adder: CommandNoteAdder,
+) -> None:
+    """It should validate against `current_volume` instead of state, if given."""
+    virtual_subject = VirtualPipettingHandler(state_view=mock_state_view)
+
+    decoy.when(mock_state_view.pipettes.get_attached_tip("pipette-id")).then_return(
+        TipGeometry(length=1, diameter=2, volume=3)
+    )
+    decoy.when(mock_state_view.pipettes.get_working_volume("pipette-id")).then_return(3)
+    decoy.when(mock_state_view.pipettes.get_aspirated_volume("pipette-id")).then_return(
+        None
+    )
+
+    # Stuff that only matters for the hardware subject:
+    decoy.when(mock_hardware_api.attached_instruments).then_return({})
+    decoy.when(
+        mock_state_view.pipettes.get_hardware_pipette(
+            pipette_id="pipette-id",
+            attached_pipettes={},
+        )
+    ).then_return(
+        HardwarePipette(
+            mount=Mount.LEFT,
+            config=cast(
+                PipetteDict,
+                {
+                    "aspirate_flow_rate": 1.23,
+                    "dispense_flow_rate": 4.56,
+                    "blow_out_flow_rate": 7.89,
+                },
+            ),
+        )
+    )
+
+    for subject in [virtual_subject, hardware_subject]:
+        assert (
+            await subject.dispense_in_place(
+                pipette_id="pipette-id",
+                volume=1,
+                flow_rate=5,
+                push_out=None,
+                current_volume=2,
+            )
+            == 1
+        )
+        with pytest.raises(InvalidAspirateVolumeError):
+            await subject.aspirate_in_place(
+                pipette_id="pipette-id",
+                volume=2,
+                flow_rate=1,
+                command_note_adder=mock_command_note_adder,
+                current_volume=2,
+            )
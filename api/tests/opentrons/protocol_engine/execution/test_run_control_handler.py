@@ -1,4 +1,5 @@
 """Run control side-effect handler."""
+from datetime import timedelta
 from time import monotonic as time_monotonic
 
 import pytest
@@ -6,6 +7,7 @@ from decoy import Decoy, matchers
 
 from opentrons.protocol_engine.actions import ActionDispatcher, PauseAction, PauseSource
 from opentrons.protocol_engine.execution.run_control import RunControlHandler
+from opentrons.protocol_engine.resources import VirtualClock
 from opentrons.protocol_engine.state import Config, StateStore
 from opentrons.protocol_engine.types import DeckType
 
@@ -118,3 +120,25 @@ async def test_wait_for_duration_ignore_pause(
     # NOTE: margin of error selected empirically
     # this is flakey test risk in CI
     assert end - start <= 0.1
+
+
+async def test_wait_for_duration_virtual_clock(
+    decoy: Decoy,
+    mock_state_store: StateStore,
+    mock_action_dispatcher: ActionDispatcher,
+) -> None:
+    """It should let a duration pass on its clock instead of waiting for it."""
+    clock = VirtualClock()
+    subject = RunControlHandler(
+        state_store=mock_state_store,
+        action_dispatcher=mock_action_dispatcher,
+        clock=clock,
+    )
+    decoy.when(mock_state_store.config).then_return(_make_config(ignore_pause=False))
+    start = time_monotonic()
+    clock_start = clock.now()
+    await subject.wait_for_duration(seconds=600)
+    end = time_monotonic()
+
+    assert end - start <= 0.1
+    assert clock.now() - clock_start >= timedelta(seconds=600)
@@ -0,0 +1,44 @@
+"""Tests for the Clock and VirtualClock providers."""
+from datetime import timedelta, timezone
+from time import monotonic as time_monotonic
+
+from opentrons.protocol_engine.resources import Clock, ModelUtils, VirtualClock
+
+
+async def test_clock() -> None:
+    """It should tell the real time, and sleep in real time."""
+    subject = Clock()
+    start = time_monotonic()
+    clock_start = subject.now()
+    await subject.sleep(0.2)
+
+    assert clock_start.tzinfo is timezone.utc
+    assert time_monotonic() - start >= 0.1
+    assert subject.now() - clock_start >= timedelta(seconds=0.1)
+
+
+async def test_virtual_clock() -> None:
+    """It should tell the real time, plus all the time slept without waiting."""
+    subject = VirtualClock()
+    start = time_monotonic()
+    clock_start = subject.now()
+    await subject.sleep(3600)
+    await subject.sleep(-5)
+    clock_end = subject.now()
+
+    assert time_monotonic() - start <= 0.1
+    assert clock_start.tzinfo is timezone.utc
+    assert (
+        timedelta(hours=1) <= clock_end - clock_start <= timedelta(hours=1, seconds=1)
+    )
+
+
+async def test_model_utils_timestamps_from_clock() -> None:
+    """It should take its timestamps from the given clock."""
+    clock = VirtualClock()
+    subject = ModelUtils(clock=clock)
+    await clock.sleep(60)
+
+    assert subject.get_timestamp() - ModelUtils().get_timestamp() >= timedelta(
+        seconds=59
+    )
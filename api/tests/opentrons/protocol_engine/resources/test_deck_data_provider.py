@@ -130,3 +130,38 @@ async def test_get_deck_labware_fixtures_ot3_standard(
             definition=ot3_fixed_trash_def,
         )
     ]
+
+
+async def test_deck_data_is_loaded_once(
+    decoy: Decoy,
+    ot2_standard_deck_def: DeckDefinitionV5,
+    ot2_fixed_trash_def: LabwareDefinition,
+    mock_labware_data_provider: LabwareDataProvider,
+) -> None:
+    """It should only load the deck definition and its fixed labware once."""
+    subject = DeckDataProvider(
+        deck_type=DeckType.OT2_STANDARD, labware_data=mock_labware_data_provider
+    )
+
+    decoy.when(
+        await mock_labware_data_provider.get_labware_definition(
+            load_name="opentrons_1_trash_1100ml_fixed",
+            namespace="opentrons",
+            version=1,
+        )
+    ).then_return(ot2_fixed_trash_def)
+
+    assert await subject.get_deck_definition() is await subject.get_deck_definition()
+
+    first = await subject.get_deck_fixed_labware(ot2_standard_deck_def)
+    second = await subject.get_deck_fixed_labware(ot2_standard_deck_def)
+
+    assert first == second
+    decoy.verify(
+        await mock_labware_data_provider.get_labware_definition(
+            load_name="opentrons_1_trash_1100ml_fixed",
+            namespace="opentrons",
+            version=1,
+        ),
+        times=1,
+    )
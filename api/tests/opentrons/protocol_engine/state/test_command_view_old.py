@@ -128,6 +128,17 @@ def test_get_all() -> None:
     assert subject.get_all() == [command_1, command_2, command_3]
 
 
+def test_get_count() -> None:
+    """It should get the number of commands in state."""
+    command_1 = create_succeeded_command(command_id="command-id-1")
+    command_2 = create_running_command(command_id="command-id-2")
+    command_3 = create_queued_command(command_id="command-id-3")
+
+    subject = get_command_view(commands=[command_1, command_2, command_3])
+
+    assert subject.get_count() == 3
+
+
 def test_get_next_to_execute_returns_first_queued() -> None:
     """It should return the next queued command ID."""
     subject = get_command_view(
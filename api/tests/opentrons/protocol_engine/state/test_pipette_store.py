@@ -1,13 +1,18 @@
 """Tests for pipette state changes in the protocol_engine state store."""
 import pytest
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from opentrons_shared_data.pipette.dev_types import PipetteNameType
 from opentrons_shared_data.pipette import pipette_definition
 
 from opentrons.types import DeckSlotName, MountType, Point
 from opentrons.protocol_engine import commands as cmd
+from opentrons.protocol_engine.error_recovery_policy import ErrorRecoveryType
+from opentrons.protocol_engine.errors.exceptions import (
+    BulkLiquidHandlingStepError,
+    InvalidDispenseVolumeError,
+)
 from opentrons.protocol_engine.types import (
     DeckPoint,
     DeckSlotLocation,
@@ -19,6 +24,7 @@ from opentrons.protocol_engine.types import (
     TipGeometry,
 )
 from opentrons.protocol_engine.actions import (
+    FailCommandAction,
     SetPipetteMovementSpeedAction,
     SucceedCommandAction,
 )
@@ -924,3 +930,133 @@ def test_prepare_to_aspirate_marks_pipette_ready(
         SucceedCommandAction(private_result=None, command=prepare_to_aspirate_command)
     )
     assert subject.state.aspirated_volume_by_id["pipette-id"] == 0.0
+
+
+@pytest.mark.parametrize(
+    ("steps", "expected_volume"),
+    [
+        (
+            [
+                cmd.BulkAspirateStep(
+                    labwareId="labware-id", wellName="A1", volume=42, flowRate=1
+                ),
+                cmd.BulkDispenseStep(
+                    labwareId="labware-id", wellName="B1", volume=10, flowRate=1
+                ),
+            ],
+            32,
+        ),
+        (
+            [
+                cmd.BulkAspirateStep(
+                    labwareId="labware-id", wellName="A1", volume=42, flowRate=1
+                ),
+                cmd.BulkBlowOutStep(labwareId="labware-id", wellName="B1", flowRate=1),
+            ],
+            None,
+        ),
+    ],
+)
+def test_bulk_liquid_handling_updates_pipette(
+    subject: PipetteStore,
+    steps: List[cmd.BulkLiquidHandlingStep],
+    expected_volume: Optional[float],
+) -> None:
+    """It should update the pipette as if each step were its own command."""
+    load_command = create_load_pipette_command(
+        pipette_id="pipette-id",
+        pipette_name=PipetteNameType.P300_SINGLE,
+        mount=MountType.LEFT,
+    )
+    bulk_command = cmd.BulkLiquidHandling(
+        id="command-id",
+        key="command-key",
+        status=cmd.CommandStatus.SUCCEEDED,
+        createdAt=datetime.now(),
+        params=cmd.BulkLiquidHandlingParams(pipetteId="pipette-id", steps=steps),
+        result=cmd.BulkLiquidHandlingResult(
+            position=DeckPoint(x=1, y=2, z=3),
+            steps=[
+                cmd.BulkLiquidHandlingStepResult(volume=getattr(step, "volume", None))
+                for step in steps
+            ],
+        ),
+    )
+
+    subject.handle_action(
+        SucceedCommandAction(private_result=None, command=load_command)
+    )
+    subject.handle_action(
+        SucceedCommandAction(private_result=None, command=bulk_command)
+    )
+
+    assert subject.state.aspirated_volume_by_id["pipette-id"] == expected_volume
+    assert subject.state.current_location == CurrentWell(
+        pipette_id="pipette-id", labware_id="labware-id", well_name="B1"
+    )
+    assert subject.state.current_deck_point == CurrentDeckPoint(
+        mount=MountType.LEFT, deck_point=DeckPoint(x=1, y=2, z=3)
+    )
+
+
+def test_failed_bulk_liquid_handling_updates_pipette(subject: PipetteStore) -> None:
+    """It should replay the steps that ran before a failed one."""
+    load_command = create_load_pipette_command(
+        pipette_id="pipette-id",
+        pipette_name=PipetteNameType.P300_SINGLE,
+        mount=MountType.LEFT,
+    )
+    move_command = create_move_to_well_command(
+        pipette_id="pipette-id",
+        labware_id="labware-id",
+        well_name="A1",
+        destination=DeckPoint(x=1, y=2, z=3),
+    )
+    bulk_command = cmd.BulkLiquidHandling(
+        id="command-id",
+        key="command-key",
+        status=cmd.CommandStatus.RUNNING,
+        createdAt=datetime.now(),
+        params=cmd.BulkLiquidHandlingParams(
+            pipetteId="pipette-id",
+            steps=[
+                cmd.BulkAspirateStep(
+                    labwareId="labware-id", wellName="A1", volume=42, flowRate=1
+                ),
+                cmd.BulkDispenseStep(
+                    labwareId="labware-id", wellName="B1", volume=10, flowRate=1
+                ),
+                cmd.BulkDispenseStep(
+                    labwareId="labware-id", wellName="C1", volume=100, flowRate=1
+                ),
+            ],
+        ),
+    )
+
+    subject.handle_action(
+        SucceedCommandAction(private_result=None, command=load_command)
+    )
+    subject.handle_action(
+        SucceedCommandAction(private_result=None, command=move_command)
+    )
+    subject.handle_action(
+        FailCommandAction(
+            command_id="command-id",
+            running_command=bulk_command,
+            error_id="error-id",
+            failed_at=datetime.now(),
+            error=BulkLiquidHandlingStepError(
+                failed_step_index=2,
+                completed_step_volumes=[42, 10],
+                wrapping=[InvalidDispenseVolumeError()],
+            ),
+            notes=[],
+            type=ErrorRecoveryType.WAIT_FOR_RECOVERY,
+        )
+    )
+
+    assert subject.state.aspirated_volume_by_id["pipette-id"] == 32
+    assert subject.state.current_location is None
+    assert subject.state.current_deck_point == CurrentDeckPoint(
+        mount=None, deck_point=None
+    )
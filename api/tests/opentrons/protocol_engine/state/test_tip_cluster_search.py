@@ -0,0 +1,331 @@
+"""Tests that bitmask tip tracking matches the well-by-well tip tracking it replaced."""
+import random
+from typing import Dict, Iterator, List, Optional, Union
+
+import pytest
+
+from opentrons.hardware_control.nozzle_manager import NozzleMap
+from opentrons.protocol_engine import actions, commands
+from opentrons.protocol_engine.state.tips import TipStore, TipView
+from opentrons.protocol_engine.types import DeckPoint
+
+from ..pipette_fixtures import NINETY_SIX_COLS, NINETY_SIX_MAP, NINETY_SIX_ROWS
+from .test_tip_state import _tip_rack_parameters
+
+from opentrons_shared_data.labware.labware_definition import LabwareDefinition
+
+ROWS = "ABCDEFGH"
+COLUMNS = [[f"{row}{column}" for row in ROWS] for column in range(1, 13)]
+USED_STATES_PER_LAYOUT = 12
+
+LegacyWells = Dict[str, bool]
+"""Well name to whether its tip is used, in rack order."""
+
+
+def _legacy_cluster_search(  # noqa: C901
+    wells: LegacyWells,
+    columns: List[List[str]],
+    active_columns: int,
+    active_rows: int,
+    entry_well: str,
+) -> Optional[str]:
+    """The well-by-well cluster search that was replaced, as a reference."""
+
+    def _identify_tip_cluster(
+        critical_column: int, critical_row: int
+    ) -> Optional[List[str]]:
+        tip_cluster = []
+        for i in range(active_columns):
+            if entry_well == "A1" or entry_well == "H1":
+                if critical_column - i >= 0:
+                    column = columns[critical_column - i]
+                else:
+                    return None
+            else:
+                if critical_column + i < len(columns):
+                    column = columns[critical_column + i]
+                else:
+                    return None
+            for j in range(active_rows):
+                if entry_well == "A1" or entry_well == "A12":
+                    if critical_row - j >= 0:
+                        well = column[critical_row - j]
+                    else:
+                        return None
+                else:
+                    if critical_row + j < len(column):
+                        well = column[critical_row + j]
+                    else:
+                        return None
+                tip_cluster.append(well)
+        return tip_cluster
+
+    def _validate_tip_cluster(tip_cluster: List[str]) -> Union[str, int, None]:
+        if not any(wells[well] for well in tip_cluster):
+            return tip_cluster[0]
+        elif all(wells[well] for well in tip_cluster):
+            return None
+        final_column = [
+            tip_cluster[((active_columns * active_rows) - 1) - i]
+            for i in range(active_rows)
+        ]
+        final_row = [
+            tip_cluster[(active_rows - 1) + (i * active_rows)]
+            for i in range(active_columns)
+        ]
+        if all(wells[well] for well in final_column):
+            return None
+        elif all(wells[well] for well in final_row):
+            return None
+        return -1
+
+    if entry_well in ("A1", "H1"):
+        critical_column = active_columns - 1
+        column_step = 1
+    else:
+        critical_column = len(columns) - active_columns
+        column_step = -1
+    if entry_well in ("A1", "A12"):
+        first_row = active_rows - 1
+    else:
+        first_row = len(columns[critical_column]) - active_rows
+    critical_row = first_row
+
+    while 0 <= critical_column <= len(columns):
+        tip_cluster = _identify_tip_cluster(critical_column, critical_row)
+        if tip_cluster is not None:
+            result = _validate_tip_cluster(tip_cluster)
+            if isinstance(result, str):
+                return result
+            elif result == -1:
+                return None
+        if entry_well in ("A1", "A12") and critical_row + active_rows < len(columns[0]):
+            critical_row = critical_row + active_rows
+        elif entry_well in ("H1", "H12") and critical_row - active_rows >= 0:
+            critical_row = critical_row - active_rows
+        else:
+            critical_column = critical_column + column_step
+            critical_row = first_row
+    return None
+
+
+def _legacy_set_used_tips(  # noqa: C901
+    wells: LegacyWells, columns: List[List[str]], nozzle_map: NozzleMap, well_name: str
+) -> None:
+    """The well-by-well tip marking that was replaced, as a reference."""
+    critical_column = 0
+    critical_row = 0
+    for column in columns:
+        if well_name in column:
+            critical_row = column.index(well_name)
+            critical_column = columns.index(column)
+
+    for i in range(len(nozzle_map.columns)):
+        for j in range(len(nozzle_map.rows)):
+            if nozzle_map.starting_nozzle == "A1":
+                if (critical_column + i < len(columns)) and (
+                    critical_row + j < len(columns[critical_column])
+                ):
+                    wells[columns[critical_column + i][critical_row + j]] = True
+            elif nozzle_map.starting_nozzle == "A12":
+                if (critical_column - i >= 0) and (
+                    critical_row + j < len(columns[critical_column])
+                ):
+                    wells[columns[critical_column - i][critical_row + j]] = True
+            elif nozzle_map.starting_nozzle == "H1":
+                if (critical_column + i < len(columns)) and (critical_row - j >= 0):
+                    wells[columns[critical_column + i][critical_row - j]] = True
+            elif nozzle_map.starting_nozzle == "H12":
+                if (critical_column - i >= 0) and (critical_row - j >= 0):
+                    wells[columns[critical_column - i][critical_row - j]] = True
+
+
+# The corner a 96-channel search enters the tip rack from, by starting nozzle.
+ENTRY_WELL_BY_STARTING_NOZZLE = {"A1": "H12", "A12": "H1", "H1": "A12", "H12": "A1"}
+
+
+def _nozzle_maps() -> Iterator[NozzleMap]:
+    """Every rectangular 96-channel layout, from each of its corners."""
+    for starting_nozzle in ENTRY_WELL_BY_STARTING_NOZZLE:
+        for row_count in range(1, 9):
+            for column_count in range(1, 13):
+                if starting_nozzle.startswith("A"):
+                    rows = ROWS[:row_count]
+                else:
+                    rows = ROWS[-row_count:]
+                if starting_nozzle.endswith("12"):
+                    first_column, last_column = 13 - column_count, 12
+                else:
+                    first_column, last_column = 1, column_count
+                yield NozzleMap.build(
+                    physical_nozzles=NINETY_SIX_MAP,
+                    physical_rows=NINETY_SIX_ROWS,
+                    physical_columns=NINETY_SIX_COLS,
+                    starting_nozzle=starting_nozzle,
+                    back_left_nozzle=f"{rows[0]}{first_column}",
+                    front_right_nozzle=f"{rows[-1]}{last_column}",
+                )
+
+
+def _used_masks(rand: random.Random) -> Iterator[int]:
+    """Used tip masks: empty, full, sparse, dense, and partly used racks."""
+    yield 0
+    yield (1 << 96) - 1
+    for _ in range(USED_STATES_PER_LAYOUT):
+        sparse = rand.getrandbits(96) & rand.getrandbits(96) & rand.getrandbits(96)
+        yield sparse
+        yield rand.getrandbits(96) | rand.getrandbits(96)
+        yield (1 << rand.randrange(97)) - 1
+        yield ((1 << rand.randrange(97)) - 1) ^ sparse
+
+
+def _legacy_wells(used: int) -> LegacyWells:
+    return {
+        well_name: bool(used >> (column * 8 + row) & 1)
+        for column, wells in enumerate(COLUMNS)
+        for row, well_name in enumerate(wells)
+    }
+
+
+@pytest.fixture
+def subject() -> TipStore:
+    """A tip store with a 96 tip rack loaded."""
+    store = TipStore()
+    load_labware = commands.LoadLabware.construct(  # type: ignore[call-arg]
+        result=commands.LoadLabwareResult.construct(
+            labwareId="cool-labware",
+            definition=LabwareDefinition.construct(  # type: ignore[call-arg]
+                ordering=COLUMNS, parameters=_tip_rack_parameters
+            ),
+        )
+    )
+    store.handle_action(
+        actions.SucceedCommandAction(private_result=None, command=load_labware)
+    )
+    return store
+
+
+def _configure(subject: TipStore, nozzle_map: NozzleMap) -> None:
+    subject.handle_action(
+        actions.SucceedCommandAction(
+            private_result=commands.ConfigureNozzleLayoutPrivateResult(
+                pipette_id="pipette-id", nozzle_map=nozzle_map
+            ),
+            command=commands.ConfigureNozzleLayout.construct(  # type: ignore[call-arg]
+                result=commands.ConfigureNozzleLayoutResult()
+            ),
+        )
+    )
+
+
+def _pick_up(subject: TipStore, well_name: str) -> None:
+    subject.handle_action(
+        actions.SucceedCommandAction(
+            private_result=None,
+            command=commands.PickUpTip.construct(  # type: ignore[call-arg]
+                params=commands.PickUpTipParams.construct(
+                    pipetteId="pipette-id",
+                    labwareId="cool-labware",
+                    wellName=well_name,
+                ),
+                result=commands.PickUpTipResult.construct(
+                    position=DeckPoint(x=0, y=0, z=0), tipLength=1.23
+                ),
+            ),
+        )
+    )
+
+
+def _legacy_next_tip(wells: LegacyWells, nozzle_map: NozzleMap) -> Optional[str]:
+    try:
+        return _legacy_cluster_search(
+            wells,
+            COLUMNS,
+            len(nozzle_map.columns),
+            len(nozzle_map.rows),
+            ENTRY_WELL_BY_STARTING_NOZZLE[nozzle_map.starting_nozzle],
+        )
+    except IndexError:
+        # The old search ran off the end of the rack when entering from the
+        # left with no clean cluster left; running out of tips is now None.
+        return None
+
+
+@pytest.mark.parametrize(
+    "nozzle_map",
+    [
+        pytest.param(
+            nozzle_map,
+            id=f"{nozzle_map.starting_nozzle}-{len(nozzle_map.rows)}x{len(nozzle_map.columns)}",
+        )
+        for nozzle_map in _nozzle_maps()
+    ],
+)
+def test_next_tip_matches_well_by_well_search(
+    subject: TipStore, nozzle_map: NozzleMap
+) -> None:
+    """It should pick the same cluster as the well-by-well search, for any used tips."""
+    rand = random.Random(f"{nozzle_map.starting_nozzle}{nozzle_map.tip_count}")
+    tip_rack = subject.state.tips_by_labware_id["cool-labware"]
+
+    for used in _used_masks(rand):
+        tip_rack.used = used
+        result = TipView(subject.state).get_next_tip(
+            labware_id="cool-labware",
+            num_tips=nozzle_map.tip_count,
+            starting_tip_name=None,
+            nozzle_map=nozzle_map,
+        )
+        assert result == _legacy_next_tip(_legacy_wells(used), nozzle_map), hex(used)
+
+
+@pytest.mark.parametrize("starting_nozzle", list(ENTRY_WELL_BY_STARTING_NOZZLE))
+def test_pick_up_marks_same_tips_as_well_by_well(
+    subject: TipStore, starting_nozzle: str
+) -> None:
+    """It should mark the same tips used as the well-by-well marking, from any well."""
+    for nozzle_map in _nozzle_maps():
+        if nozzle_map.starting_nozzle != starting_nozzle:
+            continue
+        _configure(subject, nozzle_map)
+        for well_name in [*(well for column in COLUMNS for well in column), "Z99"]:
+            subject.handle_action(actions.ResetTipsAction(labware_id="cool-labware"))
+            _pick_up(subject, well_name)
+
+            expected = _legacy_wells(0)
+            _legacy_set_used_tips(expected, COLUMNS, nozzle_map, well_name)
+            view = TipView(subject.state)
+            assert {
+                well: not view.has_clean_tip("cool-labware", well) for well in expected
+            } == expected
+
+
+@pytest.mark.parametrize("starting_nozzle", list(ENTRY_WELL_BY_STARTING_NOZZLE))
+def test_tip_sequence_matches_well_by_well(
+    subject: TipStore, starting_nozzle: str
+) -> None:
+    """It should use up a rack in the same order, switching layouts as it goes."""
+    rand = random.Random(starting_nozzle)
+    nozzle_maps = [
+        nozzle_map
+        for nozzle_map in _nozzle_maps()
+        if nozzle_map.starting_nozzle == starting_nozzle
+    ]
+    for _ in range(10):
+        subject.handle_action(actions.ResetTipsAction(labware_id="cool-labware"))
+        wells = _legacy_wells(0)
+        for _ in range(96):
+            nozzle_map = rand.choice(nozzle_maps)
+            _configure(subject, nozzle_map)
+            expected = _legacy_next_tip(wells, nozzle_map)
+            result = TipView(subject.state).get_next_tip(
+                labware_id="cool-labware",
+                num_tips=nozzle_map.tip_count,
+                starting_tip_name=None,
+                nozzle_map=nozzle_map,
+            )
+            assert result == expected
+            if result is None:
+                break
+            _pick_up(subject, result)
+            _legacy_set_used_tips(wells, COLUMNS, nozzle_map, result)
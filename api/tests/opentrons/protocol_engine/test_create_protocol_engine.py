@@ -1,4 +1,7 @@
 """Smoke tests for the ProtocolEngine creation factory."""
+import asyncio
+from datetime import timedelta
+
 import pytest
 from pytest_lazyfixture import lazy_fixture  # type: ignore[import-untyped]
 
@@ -14,6 +17,7 @@ from opentrons.protocol_engine import (
     ProtocolEngine,
     Config as EngineConfig,
     DeckType,
+    commands,
     create_protocol_engine,
 )
 from opentrons.protocol_engine.types import DeckSlotLocation, LoadedLabware
@@ -176,3 +180,32 @@ async def test_create_engine_initializes_state_with_door_state(
     )
     state = engine.state_view
     assert state.commands.get_is_door_blocking() is True
+
+
+async def test_create_engine_with_virtual_clock(
+    hardware_api: HardwareAPI,
+) -> None:
+    """It should let delays pass instantly, while still timestamping them."""
+    engine = await create_protocol_engine(
+        hardware_api=hardware_api,
+        config=EngineConfig(
+            # Choice of robot and deck type are arbitrary.
+            robot_type="OT-2 Standard",
+            deck_type=DeckType.OT2_SHORT_TRASH,
+            use_virtual_clock=True,
+        ),
+    )
+    command = engine.add_command(
+        commands.WaitForDurationCreate(
+            params=commands.WaitForDurationParams(seconds=3600)
+        )
+    )
+
+    engine.play()
+    await asyncio.wait_for(engine.wait_until_complete(), timeout=10)
+    await engine.discard()
+
+    result = engine.state_view.commands.get(command.id)
+    assert result.status == commands.CommandStatus.SUCCEEDED
+    assert result.startedAt is not None and result.completedAt is not None
+    assert result.completedAt - result.startedAt >= timedelta(seconds=3600)
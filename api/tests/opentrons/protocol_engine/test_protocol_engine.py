@@ -5,7 +5,7 @@ from typing import Any
 from unittest.mock import sentinel
 
 import pytest
-from decoy import Decoy
+from decoy import Decoy, matchers
 
 from opentrons_shared_data.robot.dev_types import RobotType
 from opentrons.ordered_set import OrderedSet
@@ -618,6 +618,38 @@ async def test_finish_with_defaults(
     )
 
 
+async def test_discard(
+    decoy: Decoy,
+    action_dispatcher: ActionDispatcher,
+    plugin_starter: PluginStarter,
+    queue_worker: QueueWorker,
+    subject: ProtocolEngine,
+    hardware_stopper: HardwareStopper,
+    door_watcher: DoorWatcher,
+) -> None:
+    """It should stop the engine's background tasks without touching the hardware."""
+    await subject.discard()
+
+    decoy.verify(
+        queue_worker.cancel(),
+        await queue_worker.join(),
+        door_watcher.stop(),
+        await plugin_starter.stop(),
+    )
+    decoy.verify(
+        await hardware_stopper.do_halt(disengage_before_stopping=matchers.Anything()),
+        times=0,
+    )
+    decoy.verify(
+        await hardware_stopper.do_stop_and_recover(
+            drop_tips_after_run=matchers.Anything(),
+            post_run_hardware_state=matchers.Anything(),
+        ),
+        times=0,
+    )
+    decoy.verify(action_dispatcher.dispatch(matchers.Anything()), times=0)
+
+
 @pytest.mark.parametrize(
     argnames=["stopped_by_estop", "expected_drop_tips", "expected_end_state"],
     argvalues=[
@@ -0,0 +1,122 @@
+"""Smoke tests for running transfers as bulk liquid handling commands."""
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from opentrons.protocol_engine import EngineStatus, WellLocation, commands
+from opentrons.protocol_reader import ProtocolReader
+from opentrons.protocol_runner import create_simulating_runner
+
+
+PLATE_TRANSFER_PROTOCOL = """\
+metadata = {{"apiLevel": "{api_level}"}}
+
+def run(ctx):
+    tip_rack = ctx.load_labware("opentrons_96_tiprack_300ul", 1)
+    source = ctx.load_labware("nest_12_reservoir_15ml", 2)
+    plate = ctx.load_labware("corning_96_wellplate_360ul_flat", 3)
+    pipette = ctx.load_instrument("p300_single_gen2", "left", tip_racks=[tip_rack])
+
+    pipette.transfer(
+        50, source["A1"], plate.wells(), new_tip="once", blow_out=True, blowout_location="destination well"
+    )
+    pipette.distribute(20, source["A2"], plate.columns()[0])
+    pipette.consolidate(20, plate.columns()[1], source["A3"])
+"""
+
+
+async def simulate_and_get_commands(protocol_file: Path) -> List[commands.Command]:
+    """Simulate a protocol, make sure it succeeds, and return its commands."""
+    protocol_source = await ProtocolReader().read_saved(
+        files=[protocol_file],
+        directory=None,
+    )
+    subject = await create_simulating_runner(
+        robot_type="OT-2 Standard",
+        protocol_config=protocol_source.config,
+    )
+    result = await subject.run(
+        deck_configuration=[],
+        protocol_source=protocol_source,
+        run_time_param_values=None,
+    )
+    assert result.state_summary.errors == []
+    assert result.state_summary.status == EngineStatus.SUCCEEDED
+    return result.commands
+
+
+_Step = Tuple[str, str, Optional[float], float, WellLocation]
+
+
+def _liquid_handling_steps(result_commands: List[commands.Command]) -> List[_Step]:
+    """Return every aspirate, dispense, and blow-out, whether bulk or not."""
+    steps: List[_Step] = []
+    for command in result_commands:
+        if isinstance(command, commands.BulkLiquidHandling):
+            steps += [
+                (
+                    step.stepType,
+                    step.wellName,
+                    getattr(step, "volume", None),
+                    step.flowRate,
+                    step.wellLocation,
+                )
+                for step in command.params.steps
+            ]
+        elif isinstance(
+            command, (commands.Aspirate, commands.Dispense, commands.BlowOut)
+        ):
+            steps.append(
+                (
+                    command.commandType.lower(),
+                    command.params.wellName,
+                    getattr(command.params, "volume", None),
+                    command.params.flowRate,
+                    command.params.wellLocation,
+                )
+            )
+    return steps
+
+
+async def test_transfers_use_bulk_liquid_handling(tmp_path: Path) -> None:
+    """Transfers should run the same steps with far fewer commands from 2.18."""
+    individual_path = tmp_path / "individual.py"
+    individual_path.write_text(PLATE_TRANSFER_PROTOCOL.format(api_level="2.17"))
+    bulk_path = tmp_path / "bulk.py"
+    bulk_path.write_text(PLATE_TRANSFER_PROTOCOL.format(api_level="2.18"))
+
+    individual_commands = await simulate_and_get_commands(individual_path)
+    bulk_commands = await simulate_and_get_commands(bulk_path)
+
+    assert not any(
+        isinstance(command, commands.BulkLiquidHandling)
+        for command in individual_commands
+    )
+    assert _liquid_handling_steps(bulk_commands) == _liquid_handling_steps(
+        individual_commands
+    )
+    # One command for the transfer's 96 aspirates, dispenses, and blow-outs with
+    # a single tip, then one each for the distribute and the consolidate.
+    # Blowing the distribute's disposal volume into the trash isn't into a well,
+    # so it's still its own command.
+    assert [
+        command.commandType
+        for command in bulk_commands
+        if not isinstance(command, (commands.Home, commands.LoadLabware))
+    ] == [
+        "loadPipette",
+        "pickUpTip",
+        "bulkLiquidHandling",
+        "moveToAddressableAreaForDropTip",
+        "dropTipInPlace",
+        "pickUpTip",
+        "bulkLiquidHandling",
+        "moveToAddressableAreaForDropTip",
+        "blowOutInPlace",
+        "moveToAddressableAreaForDropTip",
+        "dropTipInPlace",
+        "pickUpTip",
+        "bulkLiquidHandling",
+        "moveToAddressableAreaForDropTip",
+        "dropTipInPlace",
+    ]
+    assert len(individual_commands) > 10 * len(bulk_commands)
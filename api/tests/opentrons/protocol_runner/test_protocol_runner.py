@@ -312,6 +312,25 @@ def test_resume_from_recovery(
     decoy.verify(protocol_engine.resume_from_recovery(), times=1)
 
 
+@pytest.mark.parametrize(
+    "subject",
+    [
+        (lazy_fixture("json_runner_subject")),
+        (lazy_fixture("legacy_python_runner_subject")),
+        (lazy_fixture("live_runner_subject")),
+    ],
+)
+def test_get_command_timing(
+    decoy: Decoy,
+    protocol_engine: ProtocolEngine,
+    subject: AnyRunner,
+) -> None:
+    """It should get command timing from the underlying engine."""
+    decoy.when(protocol_engine.get_command_timing()).then_return([])
+
+    assert subject.get_command_timing() == []
+
+
 async def test_run_json_runner(
     decoy: Decoy,
     hardware_api: HardwareAPI,
@@ -8,9 +8,11 @@ from opentrons.protocol_api.core.legacy.deck import Deck
 from opentrons.protocols.api_support.deck_type import STANDARD_OT2_DECK
 from opentrons.protocols.api_support.types import APIVersion
 from opentrons.protocols.api_support.util import (
+    APIVersionError,
     AxisMaxSpeeds,
     build_edges,
     find_value_for_api_version,
+    requires_version,
 )
 from opentrons.hardware_control.types import Axis
 
@@ -187,3 +189,54 @@ def test_build_edges_right_pipette(ctx):
 )
 def test_find_value_for_api_version(data, level, desired):
     assert find_value_for_api_version(level, data) == desired
+
+
+class _Versioned:
+    def __init__(self, api_version):
+        self._api_version = api_version
+
+    @requires_version(2, 5)
+    def method(self):
+        return "method"
+
+    @property
+    @requires_version(2, 5)
+    def prop(self):
+        return "prop"
+
+
+class _Overriding(_Versioned):
+    def method(self):
+        return "override of " + super().method()
+
+
+@pytest.mark.parametrize("api_version", [APIVersion(2, 0), APIVersion(2, 4)])
+def test_requires_version_rejects_old_versions(api_version):
+    subject = _Versioned(api_version)
+
+    with pytest.raises(APIVersionError, match="added in 2.5"):
+        subject.method()
+    with pytest.raises(APIVersionError, match="added in 2.5"):
+        subject.prop
+    with pytest.raises(APIVersionError, match="added in 2.5"):
+        subject.method()
+
+
+@pytest.mark.parametrize("api_version", [APIVersion(1, 0), APIVersion(2, 5)])
+def test_requires_version_binds_checked_methods(api_version):
+    subject = _Versioned(api_version)
+    other = _Versioned(api_version)
+
+    assert subject.method() == "method"
+    assert subject.prop == "prop"
+    assert subject.__dict__["method"]() == "method"
+    assert "method" not in other.__dict__
+    assert "prop" not in subject.__dict__
+
+
+def test_requires_version_does_not_bind_over_overrides():
+    subject = _Overriding(APIVersion(2, 5))
+
+    assert subject.method() == "override of method"
+    assert subject.method() == "override of method"
+    assert "method" not in subject.__dict__
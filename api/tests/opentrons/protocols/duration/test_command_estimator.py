@@ -0,0 +1,267 @@
+"""Tests for the protocol engine command duration estimator."""
+from datetime import datetime
+from typing import Any, Optional
+
+import pytest
+
+from opentrons.protocol_engine import DeckPoint, commands as cmd
+from opentrons.protocols.duration import (
+    CommandDurationEstimator,
+    DurationEstimator,
+    estimate_duration,
+)
+from opentrons.protocols.duration import command_estimator
+from opentrons.protocols.duration.command_estimator import (
+    DROP_TIP_DURATION,
+    MAGNETIC_MODULE_MAGNET_SPEED,
+    PICK_UP_TIP_DURATION,
+    heater_shaker_ramp,
+)
+from opentrons.protocols.duration.estimator import START_MODULE_TEMPERATURE
+
+
+def _command(
+    command_cls: Any,
+    params: Any,
+    result: Optional[Any] = None,
+    command_id: str = "command-id",
+) -> cmd.Command:
+    command: cmd.Command = command_cls(
+        id=command_id,
+        key=command_id,
+        createdAt=datetime(year=2024, month=1, day=1),
+        status=cmd.CommandStatus.SUCCEEDED,
+        params=params,
+        result=result,
+    )
+    return command
+
+
+def _move_to_coordinates(x: float, y: float, z: float) -> cmd.Command:
+    return _command(
+        cmd.MoveToCoordinates,
+        cmd.MoveToCoordinatesParams(
+            pipetteId="pipette-id", coordinates=DeckPoint(x=x, y=y, z=z)
+        ),
+        cmd.MoveToCoordinatesResult(position=DeckPoint(x=x, y=y, z=z)),
+    )
+
+
+@pytest.fixture(params=["OT-2 Standard", "OT-3 Standard"])
+def subject(request: pytest.FixtureRequest) -> CommandDurationEstimator:
+    """Get an estimator for each type of robot."""
+    return CommandDurationEstimator(robot_type=request.param)
+
+
+def test_move_duration(subject: CommandDurationEstimator) -> None:
+    """It should time moves from the previous position with the motion planner."""
+    assert subject.estimate(_move_to_coordinates(0, 0, 100)) == 0
+
+    short_move = subject.estimate(_move_to_coordinates(10, 0, 100))
+    long_move = subject.estimate(_move_to_coordinates(300, 0, 100))
+    no_move = subject.estimate(_move_to_coordinates(300, 0, 100))
+
+    assert 0 < short_move < long_move
+    assert no_move == 0
+
+
+def test_move_duration_without_motion_planner(
+    subject: CommandDurationEstimator, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """It should time moves as trapezoids without the optional motion planner."""
+    subject.estimate(_move_to_coordinates(0, 0, 100))
+    planned = subject.estimate(_move_to_coordinates(300, 0, 100))
+
+    monkeypatch.setattr(command_estimator, "_has_motion_planner", lambda: False)
+    trapezoidal = subject.estimate(_move_to_coordinates(0, 0, 100))
+    short_move = subject.estimate(_move_to_coordinates(1, 0, 100))
+
+    assert trapezoidal == pytest.approx(planned, rel=0.1)
+    assert 0 < short_move < trapezoidal
+
+
+def test_position_unknown_after_home(subject: CommandDurationEstimator) -> None:
+    """It should not time the first move after a home."""
+    subject.estimate(_move_to_coordinates(0, 0, 100))
+    subject.estimate(_command(cmd.Home, cmd.HomeParams(), cmd.HomeResult()))
+
+    assert subject.estimate(_move_to_coordinates(300, 0, 100)) == 0
+
+
+def test_pipetting_duration(subject: CommandDurationEstimator) -> None:
+    """It should time plunger moves from volume and flow rate."""
+    assert (
+        subject.estimate(
+            _command(
+                cmd.AspirateInPlace,
+                cmd.AspirateInPlaceParams(
+                    pipetteId="pipette-id", volume=100, flowRate=50
+                ),
+                cmd.AspirateInPlaceResult(volume=80),
+            )
+        )
+        == 80 / 50
+    )
+    assert subject.estimate(
+        _command(
+            cmd.BulkLiquidHandling,
+            cmd.BulkLiquidHandlingParams(
+                pipetteId="pipette-id",
+                steps=[
+                    cmd.BulkDispenseStep(
+                        labwareId="labware-id", wellName="A1", volume=40, flowRate=20
+                    ),
+                    cmd.BulkDispenseStep(
+                        labwareId="labware-id", wellName="A2", volume=40, flowRate=10
+                    ),
+                ],
+            ),
+        )
+    ) == pytest.approx(40 / 20 + 40 / 10)
+
+
+def test_temperature_module_duration(subject: CommandDurationEstimator) -> None:
+    """It should spend a module's remaining ramp time waiting for it."""
+    ramp_duration = DurationEstimator.temperature_module(START_MODULE_TEMPERATURE, 4)
+
+    set_duration = subject.estimate(
+        _command(
+            cmd.temperature_module.SetTargetTemperature,
+            cmd.temperature_module.SetTargetTemperatureParams(
+                moduleId="module-id", celsius=4
+            ),
+        )
+    )
+    delay_duration = subject.estimate(
+        _command(cmd.WaitForDuration, cmd.WaitForDurationParams(seconds=10))
+    )
+    wait_duration = subject.estimate(
+        _command(
+            cmd.temperature_module.WaitForTemperature,
+            cmd.temperature_module.WaitForTemperatureParams(moduleId="module-id"),
+        )
+    )
+
+    assert set_duration == 0
+    assert delay_duration == 10
+    assert wait_duration == pytest.approx(ramp_duration - 10)
+
+
+def test_thermocycler_profile_duration(subject: CommandDurationEstimator) -> None:
+    """It should time each step of a profile as a ramp and then a hold."""
+    profile = [
+        cmd.thermocycler.RunProfileStepParams(celsius=95, holdSeconds=30),
+        cmd.thermocycler.RunProfileStepParams(celsius=60, holdSeconds=20),
+    ]
+
+    duration = subject.estimate(
+        _command(
+            cmd.thermocycler.RunProfile,
+            cmd.thermocycler.RunProfileParams(moduleId="module-id", profile=profile),
+        )
+    )
+
+    assert duration == pytest.approx(
+        DurationEstimator.thermocycler_handler(START_MODULE_TEMPERATURE, 95)
+        + 30
+        + DurationEstimator.thermocycler_handler(95, 60)
+        + 20
+    )
+
+
+def test_heater_shaker_duration(subject: CommandDurationEstimator) -> None:
+    """It should time Heater-Shaker temperature ramps, shaking, and latching."""
+    subject.estimate(
+        _command(
+            cmd.heater_shaker.SetTargetTemperature,
+            cmd.heater_shaker.SetTargetTemperatureParams(
+                moduleId="module-id", celsius=60
+            ),
+        )
+    )
+    shake_duration = subject.estimate(
+        _command(
+            cmd.heater_shaker.SetAndWaitForShakeSpeed,
+            cmd.heater_shaker.SetAndWaitForShakeSpeedParams(
+                moduleId="module-id", rpm=1000
+            ),
+        )
+    )
+    wait_duration = subject.estimate(
+        _command(
+            cmd.heater_shaker.WaitForTemperature,
+            cmd.heater_shaker.WaitForTemperatureParams(moduleId="module-id"),
+        )
+    )
+    latch_duration = subject.estimate(
+        _command(
+            cmd.heater_shaker.OpenLabwareLatch,
+            cmd.heater_shaker.OpenLabwareLatchParams(moduleId="module-id"),
+        )
+    )
+
+    assert shake_duration > 0
+    assert latch_duration > 0
+    assert wait_duration == pytest.approx(
+        heater_shaker_ramp(START_MODULE_TEMPERATURE, 60) - shake_duration
+    )
+
+
+def test_magnetic_module_duration(subject: CommandDurationEstimator) -> None:
+    """It should time magnet moves from the change in height."""
+    engage_duration = subject.estimate(
+        _command(
+            cmd.magnetic_module.Engage,
+            cmd.magnetic_module.EngageParams(moduleId="module-id", height=10),
+        )
+    )
+    re_engage_duration = subject.estimate(
+        _command(
+            cmd.magnetic_module.Engage,
+            cmd.magnetic_module.EngageParams(moduleId="module-id", height=4),
+        )
+    )
+    disengage_duration = subject.estimate(
+        _command(
+            cmd.magnetic_module.Disengage,
+            cmd.magnetic_module.DisengageParams(moduleId="module-id"),
+        )
+    )
+
+    assert engage_duration == pytest.approx(10 / MAGNETIC_MODULE_MAGNET_SPEED)
+    assert re_engage_duration == pytest.approx(6 / MAGNETIC_MODULE_MAGNET_SPEED)
+    assert disengage_duration == pytest.approx(4 / MAGNETIC_MODULE_MAGNET_SPEED)
+
+
+def test_estimate_duration() -> None:
+    """It should estimate each command, in order, and their total."""
+    commands = [
+        _command(
+            cmd.PickUpTip,
+            cmd.PickUpTipParams(
+                pipetteId="pipette-id", labwareId="tip-rack-id", wellName="A1"
+            ),
+            cmd.PickUpTipResult(position=DeckPoint(x=0, y=0, z=0)),
+            command_id="pick-up-tip",
+        ),
+        _command(
+            cmd.DropTip,
+            cmd.DropTipParams(
+                pipetteId="pipette-id", labwareId="trash-id", wellName="A1"
+            ),
+            cmd.DropTipResult(position=DeckPoint(x=100, y=100, z=0)),
+            command_id="drop-tip",
+        ),
+    ]
+
+    result = estimate_duration(commands, robot_type="OT-3 Standard")
+
+    assert [estimate.commandId for estimate in result.commands] == [
+        "pick-up-tip",
+        "drop-tip",
+    ]
+    assert result.commands[0].duration == PICK_UP_TIP_DURATION
+    assert result.commands[1].duration > DROP_TIP_DURATION
+    assert result.totalDuration == pytest.approx(
+        sum(estimate.duration for estimate in result.commands)
+    )
@@ -0,0 +1,132 @@
+import asyncio
+import os
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+import pytest
+
+from opentrons.system import log_control
+
+# A stand-in for journalctl, with one record per line of $JOURNAL and the
+# line number as each record's cursor. An empty $JOURNAL logs forever.
+# It first writes $JOURNAL_WARNINGS warning lines to stderr, if that's set.
+JOURNALCTL = f"""#!{sys.executable}
+import itertools, os, sys
+
+args = sys.argv[1:]
+for i in range(int(os.environ.get("JOURNAL_WARNINGS", 0))):
+    sys.stderr.write(f"Warning: journal file {{i}} is corrupted, ignoring\\n")
+lines = open(os.environ["JOURNAL"]).read().splitlines()
+if not lines:
+    for i in itertools.count():
+        sys.stdout.write(f"record {{i}}\\n")
+after = -1
+for arg in args:
+    if arg.startswith("--after-cursor="):
+        cursor = arg.split("=", 1)[1]
+        if not cursor.isdigit():
+            sys.stderr.write("Failed to seek to cursor: Invalid argument\\n")
+            sys.exit(1)
+        after = int(cursor)
+records = list(enumerate(lines))[after + 1 :]
+records = records[-int(args[args.index("-n") + 1]) :]
+for cursor, line in records:
+    sys.stdout.write(line + "\\n")
+if "--show-cursor" in args and records:
+    sys.stdout.write(f"-- cursor: {{records[-1][0]}}\\n")
+"""
+
+
+@pytest.fixture
+def journal(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    journalctl = bin_dir / "journalctl"
+    journalctl.write_text(JOURNALCTL)
+    journalctl.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    journal = tmp_path / "journal"
+    journal.write_text("")
+    monkeypatch.setenv("JOURNAL", str(journal))
+    return journal
+
+
+async def _read(
+    records: int, mode: str = "short-precise", after_cursor: Optional[str] = None
+) -> List[bytes]:
+    return [
+        chunk
+        async for chunk in await log_control.stream_records(
+            "opentrons-api", records, mode, after_cursor
+        )
+    ]
+
+
+async def test_stream_records_in_chunks(journal: Path) -> None:
+    lines = [f"record {i} " + "x" * 100 for i in range(2000)]
+    journal.write_text("\n".join(lines))
+
+    chunks = await _read(records=1500)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= log_control.STREAM_CHUNK_SIZE for chunk in chunks)
+    assert b"".join(chunks).decode().splitlines() == [
+        *lines[500:],
+        "-- cursor: 1999",
+    ]
+
+
+async def test_stream_records_after_cursor(journal: Path) -> None:
+    journal.write_text("first\nsecond\n")
+    output = b"".join(await _read(records=10)).decode()
+    assert output == "first\nsecond\n-- cursor: 1\n"
+
+    journal.write_text("first\nsecond\nthird\n")
+    output = b"".join(await _read(records=10, after_cursor="1")).decode()
+    assert output == "third\n-- cursor: 2\n"
+
+
+async def test_stream_json_records_without_cursor_line(journal: Path) -> None:
+    journal.write_text('{"__CURSOR": "0", "MESSAGE": "hi"}\n')
+
+    output = b"".join(await _read(records=10, mode="json")).decode()
+
+    assert output == '{"__CURSOR": "0", "MESSAGE": "hi"}\n'
+
+
+async def test_stream_records_stops_journalctl(journal: Path) -> None:
+    stream = await log_control.stream_records("opentrons-api", 10, "short-precise")
+
+    assert (await stream.__anext__()).startswith(b"record 0\n")
+    await asyncio.wait_for(stream.aclose(), timeout=5)
+
+
+async def test_stream_records_with_lots_of_warnings(
+    journal: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """It should keep reading journalctl's stderr, so it can't fill up and block."""
+    journal.write_text("first\nsecond\n")
+    # Far more than fits in a pipe buffer
+    monkeypatch.setenv("JOURNAL_WARNINGS", "20000")
+
+    output = await asyncio.wait_for(_read(records=10), timeout=30)
+
+    assert b"".join(output).decode() == "first\nsecond\n-- cursor: 1\n"
+
+
+async def test_stream_records_raises_before_streaming(journal: Path) -> None:
+    journal.write_text("first\n")
+
+    with pytest.raises(
+        log_control.LogReadError, match="Failed to seek to cursor: Invalid argument"
+    ):
+        await log_control.stream_records(
+            "opentrons-api", 10, "short-precise", "not-a-cursor"
+        )
+
+
+async def test_stream_records_without_output(journal: Path) -> None:
+    journal.write_text("first\n")
+
+    assert await _read(records=10, after_cursor="0") == []
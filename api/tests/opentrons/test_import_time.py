@@ -0,0 +1,64 @@
+"""Import-time regression tests.
+
+Short-lived entry points, like CLI invocations and notebooks, pay for everything
+`import opentrons` pulls in. These tests run imports in a fresh interpreter with
+`-X importtime` to make sure lightweight modules stay lightweight.
+"""
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+
+# Modules that take a large share of import time and that lightweight modules
+# must not import eagerly.
+HEAVY_MODULES = [
+    "opentrons.hardware_control",
+    "opentrons.drivers.serial_communication",
+    "opentrons.protocol_engine",
+]
+
+
+def _import_times(statement: str) -> Dict[str, int]:
+    """Run `statement` in a fresh interpreter.
+
+    Returns:
+        The cumulative import time, in microseconds, of every module imported.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        # Lines look like "import time:  <self us> | <cumulative us> | <module>".
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["opentrons", "opentrons.config", "opentrons.types"],
+)
+def test_lightweight_imports(module: str) -> None:
+    """Importing a lightweight module should not import the heavy ones."""
+    imported = _import_times(f"import {module}")
+
+    assert module in imported
+    for heavy_module in HEAVY_MODULES:
+        assert heavy_module not in imported
+
+
+def test_lazy_attributes() -> None:
+    """Names that used to be imported eagerly into `opentrons` should still work."""
+    import opentrons
+    from opentrons.hardware_control import API, ThreadManager
+
+    assert opentrons.HardwareAPI is API
+    assert opentrons.ThreadManager is ThreadManager
@@ -1,8 +1,9 @@
 import asyncio
+import os
 from pathlib import Path
 import time
 from multiprocessing import Process
-from typing import AsyncGenerator, Callable, Iterator, Union
+from typing import AsyncGenerator, Callable, Iterator, Optional, Union
 from collections import namedtuple
 
 from opentrons import APIVersion
@@ -37,6 +38,8 @@ from opentrons_shared_data.robot.dev_types import RobotType
 
 Protocol = namedtuple("Protocol", ["text", "filename", "filelike"])
 
+MODULE_SERVER_ENV = "OT_EMULATOR_module_server"
+
 
 class GCodeEngine:
     """
@@ -54,21 +57,29 @@ class GCodeEngine:
 
     URI_TEMPLATE = "socket://127.0.0.1:%s"
 
-    def __init__(self, emulator_settings: Settings) -> None:
+    def __init__(
+        self, emulator_settings: Settings, emulator_app: Optional[Process] = None
+    ) -> None:
+        """
+        :param emulator_settings: Settings of the emulated hardware
+        :param emulator_app: An emulator app process that was already started,
+            with start_emulator_app(emulator_settings). It is used by the next
+            run, instead of starting a new one, and is stopped after that run.
+        """
         self._config = emulator_settings
+        self._emulator_app = emulator_app
 
-    @contextmanager
-    def _emulate(self) -> Iterator[ThreadManager]:
-        """Context manager that starts emulated OT-2 hardware environment. A
-        hardware controller is returned."""
-        modules = self._config.modules
+    @staticmethod
+    def start_emulator_app(emulator_settings: Settings) -> Process:
+        """Start the emulator app and its module emulators in a daemon process."""
+        modules = emulator_settings.modules
 
         # Entry point for the emulator app process
         def _run_app():
             async def _async_entry():
                 await asyncio.gather(
-                    run_smoothie.run(self._config),
-                    run_app.run(self._config, modules=[m.value for m in modules]),
+                    run_smoothie.run(emulator_settings),
+                    run_app.run(emulator_settings, modules=[m.value for m in modules]),
                 )
 
             asyncio.run(_async_entry())
@@ -76,6 +87,16 @@ class GCodeEngine:
         proc = Process(target=_run_app)
         proc.daemon = True
         proc.start()
+        return proc
+
+    @contextmanager
+    def _emulate(self) -> Iterator[ThreadManager]:
+        """Context manager that starts emulated OT-2 hardware environment. A
+        hardware controller is returned."""
+        modules = self._config.modules
+
+        proc = self._emulator_app or self.start_emulator_app(self._config)
+        self._emulator_app = None
 
         # Entry point for process that waits for emulation to be ready.
         async def _wait_ready() -> None:
@@ -93,7 +114,10 @@ class GCodeEngine:
         ready_proc.start()
         ready_proc.join()
 
-        # Hardware controller
+        # Hardware controller. It finds modules through the module server
+        # from the environment's emulator settings, so point those at ours.
+        prev_module_server = os.environ.get(MODULE_SERVER_ENV)
+        os.environ[MODULE_SERVER_ENV] = self._config.module_server.json()
         conf = build_config({})
         emulator = ThreadManager(
             API.build_hardware_controller,
@@ -105,11 +129,17 @@ class GCodeEngine:
         while len(emulator.attached_modules) != len(modules):
             time.sleep(0.1)
 
-        yield emulator
-
-        # Finished. Stop the emulator
-        proc.kill()
-        proc.join()
+        try:
+            yield emulator
+        finally:
+            if prev_module_server is None:
+                del os.environ[MODULE_SERVER_ENV]
+            else:
+                os.environ[MODULE_SERVER_ENV] = prev_module_server
+            # Finished. Stop the emulator, even after a failed run, so its
+            # ports are free for the next one.
+            proc.kill()
+            proc.join()
 
     @staticmethod
     def _get_protocol(file_path: Path) -> Protocol:
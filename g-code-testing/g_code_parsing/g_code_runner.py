@@ -0,0 +1,202 @@
+"""Run many G-Code jobs at once, spread across worker processes.
+
+Each worker process owns a few blocks of emulator ports, so emulators of
+different workers never collide. While a worker runs one job, the emulator
+apps for its next jobs are already starting on its other port blocks, so a
+job rarely waits for an emulator to boot. Every job still gets a freshly
+started emulator, so its G-Code matches a serial run.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import os
+import queue
+import traceback
+from collections import deque
+from dataclasses import dataclass
+from multiprocessing.process import BaseProcess as Process
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from opentrons.hardware_control.emulation.settings import ProxySettings, Settings
+
+from g_code_parsing.g_code_engine import GCodeEngine
+
+# Every emulator port is moved up by this much per port block. The default
+# emulator ports (8989-9999) all fit in a range smaller than this,
+# so blocks can't overlap.
+PORT_BLOCK_SIZE = 1100
+# Leave the default ports (block 0) free for emulators started by hand.
+FIRST_PORT_BLOCK = 1
+MAX_PORT_BLOCKS = 50
+DEFAULT_WARM_EMULATORS = 1
+# How often the parent checks that its workers are still alive.
+RESULT_POLL_SECONDS = 5.0
+
+_PROXY_SETTINGS = [
+    "heatershaker_proxy",
+    "thermocycler_proxy",
+    "temperature_proxy",
+    "magdeck_proxy",
+]
+
+
+@dataclass(frozen=True)
+class GCodeJob:
+    """A G-Code run, and the emulator settings it needs."""
+
+    name: str
+    settings: Settings
+    execute: Callable[[GCodeEngine], str]
+
+
+@dataclass(frozen=True)
+class GCodeJobResult:
+    """The output of a G-Code job, or the traceback of its failure."""
+
+    name: str
+    output: Optional[str] = None
+    error: Optional[str] = None
+
+
+def settings_on_port_block(settings: Settings, port_block: int) -> Settings:
+    """Copy emulator settings, moving every port into the given block."""
+    offset = port_block * PORT_BLOCK_SIZE
+    moved = settings.copy(deep=True)
+    moved.smoothie.port += offset
+    moved.module_server.port += offset
+    for proxy_name in _PROXY_SETTINGS:
+        proxy: ProxySettings = getattr(moved, proxy_name)
+        proxy.emulator_port += offset
+        proxy.driver_port += offset
+    return moved
+
+
+def _run_job(job: GCodeJob, engine: GCodeEngine) -> GCodeJobResult:
+    try:
+        return GCodeJobResult(name=job.name, output=job.execute(engine))
+    except Exception:
+        return GCodeJobResult(name=job.name, error=traceback.format_exc())
+
+
+def _run_worker(
+    jobs: Sequence[GCodeJob],
+    job_indices: multiprocessing.Queue,
+    results: multiprocessing.Queue,
+    port_blocks: List[int],
+) -> None:
+    """Run jobs from the queue, starting emulators for the next jobs ahead of time."""
+    free_blocks = deque(port_blocks)
+    warm: Deque[Tuple[int, GCodeJob, GCodeEngine, Process, int]] = deque()
+
+    def _warm_next_job() -> bool:
+        index = job_indices.get()
+        if index is None:
+            return False
+        job = jobs[index]
+        port_block = free_blocks.popleft()
+        settings = settings_on_port_block(job.settings, port_block)
+        app = GCodeEngine.start_emulator_app(settings)
+        engine = GCodeEngine(settings, emulator_app=app)
+        warm.append((index, job, engine, app, port_block))
+        return True
+
+    more_jobs = True
+    while more_jobs and len(warm) < len(port_blocks):
+        more_jobs = _warm_next_job()
+    while warm:
+        index, job, engine, app, port_block = warm.popleft()
+        results.put((index, _run_job(job, engine)))
+        # a job that failed before it ran its emulator leaves it running
+        if app.is_alive():
+            app.kill()
+            app.join()
+        free_blocks.append(port_block)
+        if more_jobs:
+            more_jobs = _warm_next_job()
+
+
+def _collect_results(
+    jobs: Sequence[GCodeJob],
+    results: multiprocessing.Queue,
+    processes: Sequence[Process],
+) -> Dict[int, GCodeJobResult]:
+    """Wait for every job's result, unless every worker has stopped."""
+    job_results: Dict[int, GCodeJobResult] = {}
+    while len(job_results) < len(jobs):
+        try:
+            index, result = results.get(timeout=RESULT_POLL_SECONDS)
+        except queue.Empty:
+            if not any(process.is_alive() for process in processes):
+                missing = [
+                    job.name
+                    for index, job in enumerate(jobs)
+                    if index not in job_results
+                ]
+                raise RuntimeError(
+                    f"G-Code workers stopped before running: {', '.join(missing)}"
+                )
+        else:
+            job_results[index] = result
+    return job_results
+
+
+def run_g_code_jobs(
+    jobs: Sequence[GCodeJob],
+    workers: Optional[int] = None,
+    warm_emulators: int = DEFAULT_WARM_EMULATORS,
+) -> Dict[str, GCodeJobResult]:
+    """Run G-Code jobs in parallel worker processes.
+
+    :param jobs: The jobs to run, each with a unique name
+    :param workers: How many worker processes to run jobs in.
+        Defaults to the number of CPUs.
+    :param warm_emulators: How many emulators each worker starts ahead of time,
+        for the jobs after the one it is running
+    :return: Every job's result, by job name
+    """
+    if not jobs:
+        return {}
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    blocks_per_worker = warm_emulators + 1
+    if workers * blocks_per_worker > MAX_PORT_BLOCKS:
+        raise ValueError(
+            f"{workers} workers with {warm_emulators} warm emulators each "
+            f"need more than {MAX_PORT_BLOCKS} blocks of emulator ports"
+        )
+
+    # Jobs hold callables that can't be pickled, so workers are forked with the
+    # job list, and only job indices and results are passed between processes.
+    context = multiprocessing.get_context("fork")
+    job_indices: multiprocessing.Queue = context.Queue()
+    results: multiprocessing.Queue = context.Queue()
+    for index in range(len(jobs)):
+        job_indices.put(index)
+    for _ in range(workers):
+        job_indices.put(None)
+
+    processes = [
+        context.Process(
+            target=_run_worker,
+            args=(
+                jobs,
+                job_indices,
+                results,
+                [
+                    FIRST_PORT_BLOCK + worker * blocks_per_worker + block
+                    for block in range(blocks_per_worker)
+                ],
+            ),
+        )
+        for worker in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    try:
+        job_results = _collect_results(jobs, results, processes)
+    finally:
+        for process in processes:
+            process.join(timeout=RESULT_POLL_SECONDS)
+            if process.is_alive():
+                process.kill()
+    return {result.name: result for result in job_results.values()}
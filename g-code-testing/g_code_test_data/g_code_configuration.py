@@ -1,4 +1,6 @@
+import asyncio
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import (
     Callable,
@@ -17,6 +19,7 @@ from typing_extensions import (
 import pytest
 from _pytest.mark.structures import Mark
 from g_code_parsing.g_code_engine import GCodeEngine
+from g_code_parsing.g_code_runner import GCodeJob
 from g_code_parsing.g_code_program.supported_text_modes import SupportedTextModes
 from opentrons.hardware_control.emulation.settings import Settings, SmoothieSettings
 from opentrons.protocols.api_support.types import APIVersion
@@ -32,6 +35,13 @@ BUCKET_NAME = "g-code-comparison"
 COMPARISON_FILES_FOLDER_PATH = os.path.join(os.path.dirname(__file__), 'comparison_files')
 
 
+@lru_cache(maxsize=None)
+def _read_comparison_file(file_path: str) -> str:
+    """Read a comparison file once, however many times it's compared against."""
+    with open(file_path, "r") as file:
+        return ''.join(file.readlines()).strip()
+
+
 class SharedFunctionsMixin:
     """Functions that GCodeConfirmConfig classes share."""
     def add_mark(self, user_mark: Mark) -> None:
@@ -72,24 +82,32 @@ class ProtocolGCodeConfirmConfig(BaseModel, SharedFunctionsMixin):
 
     def get_comparison_file(self, version: APIVersion) -> str:
         """Pull comparison file and print it's content."""
-        file_path = self._get_full_path(version)
-        file = open(file_path, "r")
-        return ''.join(file.readlines()).strip()
+        return _read_comparison_file(self._get_full_path(version))
 
     async def update_comparison(self, version: APIVersion) -> str:
         """Run config and override the comparison file with output."""
         Path(os.path.dirname(self._get_full_path(version))).mkdir(parents=True, exist_ok=True)
         with open(self._get_full_path(version), 'w') as file:
             file.write(await self.execute(version))
+        _read_comparison_file.cache_clear()
         return "File uploaded successfully"
 
     def comparison_file_exists(self, version: APIVersion) -> bool:
         return os.path.exists(self._get_full_path(version))
 
-    async def execute(self, version: APIVersion):
-        async with GCodeEngine(self.settings).run_protocol(self.path, version) as program:
+    async def execute(self, version: APIVersion, engine: Optional[GCodeEngine] = None):
+        engine = engine or GCodeEngine(self.settings)
+        async with engine.run_protocol(self.path, version) as program:
             return program.get_text_explanation(SupportedTextModes.CONCISE)
 
+    def as_job(self, version: APIVersion) -> GCodeJob:
+        """Get a job that runs this configuration with g_code_runner."""
+        return GCodeJob(
+            name=self.get_configuration_paths(version),
+            settings=self.settings,
+            execute=lambda engine: asyncio.run(self.execute(version, engine)),
+        )
+
 
 class HTTPGCodeConfirmConfig(BaseModel, SharedFunctionsMixin):
     name: constr(regex=r'^[a-z0-9_]*$')
@@ -118,15 +136,24 @@ class HTTPGCodeConfirmConfig(BaseModel, SharedFunctionsMixin):
 
     def get_comparison_file(self) -> str:
         """Pull comparison file and print it's content."""
-        file = open(self._get_full_path(), "r")
-        return ''.join(file.readlines()).strip()
+        return _read_comparison_file(self._get_full_path())
 
     async def update_comparison(self) -> str:
         """Run config and override the comparison file with output."""
         with open(self._get_full_path(), 'w') as file:
             file.write(await self.execute())
+        _read_comparison_file.cache_clear()
         return "File uploaded successfully"
 
-    def execute(self):
-        with GCodeEngine(self.settings).run_http(self.executable) as program:
+    def execute(self, engine: Optional[GCodeEngine] = None):
+        engine = engine or GCodeEngine(self.settings)
+        with engine.run_http(self.executable) as program:
             return program.get_text_explanation(SupportedTextModes.CONCISE)
+
+    def as_job(self) -> GCodeJob:
+        """Get a job that runs this configuration with g_code_runner."""
+        return GCodeJob(
+            name=self.get_configuration_paths(),
+            settings=self.settings,
+            execute=self.execute,
+        )
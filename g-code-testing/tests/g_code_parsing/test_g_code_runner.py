@@ -0,0 +1,69 @@
+import pytest
+from opentrons.hardware_control.emulation.settings import Settings
+
+from g_code_parsing.g_code_engine import GCodeEngine
+from g_code_parsing.g_code_runner import (
+    FIRST_PORT_BLOCK,
+    MAX_PORT_BLOCKS,
+    GCodeJob,
+    run_g_code_jobs,
+    settings_on_port_block,
+)
+
+
+def _ports(settings: Settings) -> set:
+    return {
+        settings.smoothie.port,
+        settings.module_server.port,
+        *(
+            port
+            for proxy in (
+                settings.heatershaker_proxy,
+                settings.thermocycler_proxy,
+                settings.temperature_proxy,
+                settings.magdeck_proxy,
+            )
+            for port in (proxy.emulator_port, proxy.driver_port)
+        ),
+    }
+
+
+def test_port_blocks_do_not_overlap() -> None:
+    settings = Settings()
+    ports = [
+        _ports(settings_on_port_block(settings, block))
+        for block in range(FIRST_PORT_BLOCK, FIRST_PORT_BLOCK + MAX_PORT_BLOCKS)
+    ]
+
+    assert all(len(block_ports) == len(_ports(settings)) for block_ports in ports)
+    assert len(set.union(*ports)) == sum(len(block_ports) for block_ports in ports)
+    assert max(set.union(*ports)) < 2**16
+    assert settings.smoothie.port == Settings().smoothie.port
+
+
+def test_run_g_code_jobs_reports_results_by_name() -> None:
+    def _fail(engine: GCodeEngine) -> str:
+        raise RuntimeError("protocol failed")
+
+    jobs = [
+        GCodeJob(name="passes", settings=Settings(), execute=lambda engine: "G28.2"),
+        GCodeJob(name="fails", settings=Settings(), execute=_fail),
+    ]
+
+    results = run_g_code_jobs(jobs, workers=2)
+
+    assert results["passes"].output == "G28.2"
+    assert results["passes"].error is None
+    assert results["fails"].output is None
+    assert results["fails"].error is not None
+    assert "protocol failed" in results["fails"].error
+
+
+def test_run_g_code_jobs_limits_port_blocks() -> None:
+    jobs = [
+        GCodeJob(name=str(index), settings=Settings(), execute=lambda engine: "")
+        for index in range(MAX_PORT_BLOCKS)
+    ]
+
+    with pytest.raises(ValueError):
+        run_g_code_jobs(jobs, workers=MAX_PORT_BLOCKS)
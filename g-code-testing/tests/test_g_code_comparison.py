@@ -1,12 +1,47 @@
+import os
+from typing import Dict, List, Union
+
 import pytest
 from opentrons import APIVersion
 
 from g_code_parsing.g_code_differ import GCodeDiffer
+from g_code_parsing.g_code_runner import GCodeJob, GCodeJobResult, run_g_code_jobs
 from g_code_test_data.g_code_configuration import ProtocolGCodeConfirmConfig
 from g_code_test_data.protocol.protocol_configurations import PROTOCOL_CONFIGURATIONS
 from g_code_test_data.g_code_configuration import HTTPGCodeConfirmConfig
 from g_code_test_data.http.http_configurations import HTTP_CONFIGURATIONS
 
+# How many worker processes run the selected configurations.
+# Defaults to the number of CPUs.
+WORKERS_ENV = "G_CODE_WORKERS"
+
+
+@pytest.fixture(scope="session")
+def g_code_results(request: pytest.FixtureRequest) -> Dict[str, GCodeJobResult]:
+    """Run every selected configuration up front, in parallel."""
+    jobs: List[GCodeJob] = []
+    for item in request.session.items:
+        callspec = getattr(item, "callspec", None)
+        params = callspec.params if callspec else {}
+        if "g_code_configuration" not in params:
+            continue
+        configuration: Union[
+            ProtocolGCodeConfirmConfig, HTTPGCodeConfirmConfig
+        ] = params["g_code_configuration"]
+        if isinstance(configuration, ProtocolGCodeConfirmConfig):
+            jobs.append(configuration.as_job(params["version"]))
+        else:
+            jobs.append(configuration.as_job())
+    workers = os.environ.get(WORKERS_ENV)
+    return run_g_code_jobs(jobs, workers=int(workers) if workers else None)
+
+
+def _get_output(g_code_results: Dict[str, GCodeJobResult], name: str) -> str:
+    result = g_code_results[name]
+    assert result.error is None, result.error
+    assert result.output is not None
+    return result.output
+
 
 @pytest.mark.parametrize(
     "g_code_configuration",
@@ -15,9 +50,14 @@ from g_code_test_data.http.http_configurations import HTTP_CONFIGURATIONS
         for conf in HTTP_CONFIGURATIONS
     ],
 )
-def test_http(g_code_configuration: HTTPGCodeConfirmConfig):
+def test_http(
+    g_code_configuration: HTTPGCodeConfirmConfig,
+    g_code_results: Dict[str, GCodeJobResult],
+):
     expected_output = g_code_configuration.get_comparison_file()
-    actual_output = g_code_configuration.execute()
+    actual_output = _get_output(
+        g_code_results, g_code_configuration.get_configuration_paths()
+    )
     assert actual_output == expected_output, GCodeDiffer(
         actual_output, expected_output
     ).get_html_diff()
@@ -36,11 +76,15 @@ def test_http(g_code_configuration: HTTPGCodeConfirmConfig):
         for version in conf.versions
     ],
 )
-async def test_protocols(
-    g_code_configuration: ProtocolGCodeConfirmConfig, version: APIVersion
+def test_protocols(
+    g_code_configuration: ProtocolGCodeConfirmConfig,
+    version: APIVersion,
+    g_code_results: Dict[str, GCodeJobResult],
 ):
     expected_output = g_code_configuration.get_comparison_file(version)
-    actual_output = await g_code_configuration.execute(version)
+    actual_output = _get_output(
+        g_code_results, g_code_configuration.get_configuration_paths(version)
+    )
     assert actual_output == expected_output, GCodeDiffer(
         actual_output, expected_output
     ).get_html_diff()
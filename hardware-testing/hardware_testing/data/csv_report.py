@@ -1,9 +1,10 @@
 """CSV Report."""
+import atexit
 from datetime import datetime
 import enum
 from pathlib import Path
 from time import time
-from typing import Any, List, Union, Optional
+from typing import Any, Callable, List, Set, Union, Optional
 
 from hardware_testing import data as data_io
 
@@ -52,6 +53,22 @@ META_DATA_TEST_FIRMWARE = "firmware"
 
 RESULTS_OVERVIEW_TITLE = "RESULTS_OVERVIEW"
 
+# stored values are appended to the journal as they arrive, but the full report
+# is only rewritten this often, because rewriting it after every value is slow
+DEFAULT_SAVE_INTERVAL_SECONDS = 10.0
+JOURNAL_EXTENSION = "journal"
+
+# reports with values that are journaled but not yet in the report file,
+# kept alive until they are saved so that no values are lost at exit
+_UNSAVED_REPORTS: "Set[CSVReport]" = set()
+
+
+@atexit.register
+def _save_unsaved_reports() -> None:
+    # make sure every report has every value in it once the test exits
+    for report in list(_UNSAVED_REPORTS):
+        report.save_to_disk()
+
 
 class CSVLine:
     """CSV Line."""
@@ -61,6 +78,10 @@ class CSVLine:
         self._tag: str = tag
         self._data_types: List[Any] = data
         self._data: List[Any] = [None] * len(data)
+        self._has_result = CSVResult in data
+        self._on_result_changed: Optional[
+            Callable[[Optional[bool], Optional[bool]], None]
+        ] = None
         self._elapsed_time: Optional[float] = None
         self._start_time: Optional[float] = None
         self._stored = False
@@ -99,6 +120,12 @@ class CSVLine:
         """Get the number of data points saved in this line."""
         return len(self._data_types)
 
+    def watch_result(
+        self, on_change: Callable[[Optional[bool], Optional[bool]], None]
+    ) -> None:
+        """Call `on_change(before, after)` whenever `result_passed` changes."""
+        self._on_result_changed = on_change
+
     def cache_start_time(self, start_time: float) -> None:
         """Line cache start time."""
         self._start_time = start_time
@@ -114,7 +141,7 @@ class CSVLine:
     @property
     def result_passed(self) -> Optional[bool]:
         """Line result passed."""
-        if CSVResult in self._data_types:
+        if self._has_result:
             if CSVResult.FAIL in self._data:
                 return False
             elif CSVResult.PASS in self._data:
@@ -132,6 +159,7 @@ class CSVLine:
                 f"should equal {len(self._data_types)}"
             )
         assert self._start_time, "no start time saved"
+        result_before = self.result_passed
         self._elapsed_time = time() - self._start_time
         for i, expected_type in enumerate(self._data_types):
             if data[i] is None:
@@ -145,6 +173,9 @@ class CSVLine:
                         f'with value "{data[i]}" at index {i}'
                     )
         self._stored = bool(None not in self._data)
+        result_after = self.result_passed
+        if self._on_result_changed and result_before != result_after:
+            self._on_result_changed(result_before, result_after)
         if self._stored and print_results and CSVResult in self._data_types:
             print_csv_result(self.tag, CSVResult.from_bool(self.result_passed))
 
@@ -202,6 +233,20 @@ class CSVSection:
         """CSV Section init."""
         self._title = title
         self._lines_and_repeating_lines = lines
+        # results are refreshed after every stored value, so rather than checking
+        # every line each time, count how many lines have passed or failed
+        self._num_passed = 0
+        self._num_failed = 0
+        self._lines: List[CSVLine] = list()
+        for line in lines:
+            if isinstance(line, CSVLineRepeating):
+                for i in range(len(line)):
+                    self._lines.append(line[i])
+            else:
+                self._lines.append(line)
+        for flat_line in self._lines:
+            self._count_line_result(None, flat_line.result_passed)
+            flat_line.watch_result(self._count_line_result)
 
     def __getitem__(self, item: str) -> Union[CSVLine, CSVLineRepeating]:
         """CSV Section get item."""
@@ -210,21 +255,21 @@ class CSVSection:
                 return line
         raise ValueError(f"[{self._title}] unexpected line tag: {item}")
 
+    def _count_line_result(self, before: Optional[bool], after: Optional[bool]) -> None:
+        if before is True:
+            self._num_passed -= 1
+        elif before is False:
+            self._num_failed -= 1
+        if after is True:
+            self._num_passed += 1
+        elif after is False:
+            self._num_failed += 1
+
     def _get_earliest_line_timestamp(self) -> Optional[float]:
-        all_lines: List[CSVLine] = []
-        for line in self._lines_and_repeating_lines:
-            if isinstance(line, CSVLineRepeating):
-                for i in range(len(line)):
-                    all_lines.append(line[i])
-            else:
-                all_lines.append(line)
-        stamps = [line.timestamp for line in all_lines if line.timestamp is not None]
+        stamps = [line.timestamp for line in self._lines if line.timestamp is not None]
         min_timestamp: Optional[float] = None
         if stamps:
-            min_timestamp = min(
-                [line.timestamp for line in self.lines if line.timestamp is not None]
-            )
-            min_timestamp = round(min_timestamp, 1)
+            min_timestamp = round(min(stamps), 1)
         return min_timestamp
 
     def __str__(self) -> str:
@@ -242,14 +287,7 @@ class CSVSection:
     @property
     def lines(self) -> List[CSVLine]:
         """CSV Section lines."""
-        all_lines: List[CSVLine] = list()
-        for line in self._lines_and_repeating_lines:
-            if isinstance(line, CSVLineRepeating):
-                for i in range(len(line)):
-                    all_lines.append(line[i])
-            else:
-                all_lines.append(line)
-        return all_lines
+        return list(self._lines)
 
     @property
     def title(self) -> str:
@@ -267,10 +305,9 @@ class CSVSection:
     @property
     def result_passed(self) -> Optional[bool]:
         """CSV Section result passed."""
-        results = [line.result_passed for line in self.lines]
-        if False in results:
+        if self._num_failed:
             return False
-        elif True in results:
+        elif self._num_passed:
             return True
         else:
             return None
@@ -326,6 +363,7 @@ class CSVReport:
         run_id: Optional[str] = None,
         start_time: Optional[float] = None,
         validate_meta_data: bool = True,
+        save_interval: float = DEFAULT_SAVE_INTERVAL_SECONDS,
     ) -> None:
         """CSV Report init."""
         self._test_name = test_name
@@ -333,6 +371,8 @@ class CSVReport:
         self._validate_meta_data = validate_meta_data
         self._tag: Optional[str] = None
         self._file_name: Optional[str] = None
+        self._save_interval = save_interval
+        self._last_save_time = 0.0
         _section_meta = _generate_meta_data_section(validate_meta_data)
         _section_titles = [META_DATA_TITLE] + [s.title for s in sections]
         _section_results = _generate_results_overview_section(_section_titles)
@@ -350,20 +390,31 @@ class CSVReport:
             if isinstance(line, CSVLineRepeating):
                 raise ValueError(f'line "{args[1]}" is repeating, and must be indexed')
             line.store(*args[2])
+            index = ""
         elif len(args) == 4:
             r_line = self[args[0]][args[1]]
             if not isinstance(r_line, CSVLineRepeating):
                 raise ValueError(
                     f'line "{args[1]}" is not a repeating line and cannot be indexed'
                 )
-            r_line[args[2]].store(*args[3])
+            line = r_line[args[2]]
+            line.store(*args[3])
+            index = str(args[2])
         else:
             raise ValueError(f"unexpected arguments to Report(): {args}")
         # set the results of each section based on current
         self._refresh_results_overview_values()
-        # save to disk after storing new values
         if self._file_name:
-            self.save_to_disk()
+            # journal the new values, then only rewrite the report periodically
+            data_io.append_data_to_file(
+                self._test_name,
+                self._run_id,
+                self.journal_file_name,
+                f"{args[0]},{index},{line}\n",
+            )
+            _UNSAVED_REPORTS.add(self)
+            if time() - self._last_save_time >= self._save_interval:
+                self.save_to_disk()
 
     def __getitem__(self, item: str) -> CSVSection:
         """CSV Report get item."""
@@ -426,6 +477,17 @@ class CSVReport:
             raise RuntimeError("must set tag of report using `Report.set_tag()`")
         return self.parent / self._file_name
 
+    @property
+    def journal_file_name(self) -> str:
+        """Get the file-name of the journal of stored values.
+
+        Each line of the journal is the section title, the line index (empty
+        if the line isn't repeating), and then the line as it appears in the report.
+        """
+        if not self._file_name:
+            raise RuntimeError("must set tag of report using `Report.set_tag()`")
+        return f"{self._file_name}.{JOURNAL_EXTENSION}"
+
     def _cache_start_time(self, start_time: Optional[float] = None) -> None:
         checked_start_time = start_time if start_time else time()
         for section in self._sections:
@@ -483,12 +545,19 @@ class CSVReport:
             raise RuntimeError("must set tag of report using `Report.set_tag()`")
         _report_str = str(self)
         assert self._file_name, "must set tag before saving to disk"
+        self._last_save_time = time()
+        _UNSAVED_REPORTS.discard(self)
         return data_io.dump_data_to_file(
             self._test_name, self._run_id, self._file_name, _report_str + "\n"
         )
 
+    def _save_if_unsaved(self) -> None:
+        if self in _UNSAVED_REPORTS:
+            self.save_to_disk()
+
     def print_results(self) -> None:
         """Print overall results."""
+        self._save_if_unsaved()
         complete_msg = "complete" if self.completed else "incomplete"
         print(f"done, {complete_msg} report -> {self.file_path}")
         print("Overall Results:")
@@ -7,7 +7,7 @@ from typing_extensions import Final
 
 from opentrons.protocol_api import ProtocolContext
 
-from .record import GravimetricRecorder, GravimetricRecording
+from .record import GravimetricRecorder
 from .environment import read_environment_data, EnvironmentData, get_average_reading
 from hardware_testing.drivers import asair_sensor
 
@@ -102,20 +102,15 @@ def _build_measurement_data(
     simulating: bool = False,
 ) -> MeasurementData:
     # gather only samples of the specified tag
-    segment = GravimetricRecording(
-        [sample for sample in recorder.recording if sample.tag and sample.tag == tag]
-    )
+    segment = recorder.recording.get_tagged_samples(tag)
     if simulating and len(segment) == 1:
         segment.append(segment[0])
     if stable and not simulating:
         # try to isolate only "stable" scale readings if sample length >= 2
-        stable_only = GravimetricRecording(
-            [sample for sample in segment if sample.stable]
-        )
+        stable_only = segment.get_stable_samples()
         if len(stable_only) >= 2:
             segment = stable_only
 
-    recording_grams_as_list = segment.grams_as_list
     return MeasurementData(
         celsius_pipette=e_data.celsius_pipette,
         humidity_pipette=e_data.humidity_pipette,
@@ -125,11 +120,11 @@ def _build_measurement_data(
         celsius_liquid=e_data.celsius_liquid,
         grams_average=segment.average,
         grams_cv=segment.calculate_cv(),
-        grams_min=min(recording_grams_as_list),
-        grams_max=max(recording_grams_as_list),
+        grams_min=segment.min_grams,
+        grams_max=segment.max_grams,
         samples_start_time=segment.start_time,
         samples_duration=segment.duration,
-        samples_count=len(recording_grams_as_list),
+        samples_count=len(segment),
     )
 
 
@@ -1,11 +1,25 @@
 """Record weight measurements."""
 from contextlib import contextmanager
 from dataclasses import dataclass
-from statistics import stdev
+from statistics import StatisticsError
 from subprocess import Popen
 from threading import Thread, Event
 from time import sleep, time
-from typing import List, Optional, Callable, Generator
+from typing import (
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+    overload,
+)
+
+import numpy
 
 from hardware_testing.data import (
     dump_data_to_file,
@@ -21,6 +35,9 @@ SLEEP_TIME_IN_RECORD_LOOP_SIMULATING = 0.01
 
 SERVER_CMD = "python3 -m hardware_testing.tools.plot"
 
+INITIAL_RECORDING_CAPACITY = 1024
+CSV_CHUNK_SIZE = 4096
+
 
 @dataclass
 class GravimetricSample:
@@ -56,8 +73,46 @@ class GravimetricSample:
         return self.grams - start_grams
 
 
-class GravimetricRecording(List):
-    """Gravimetric Recording."""
+class GravimetricRecording:
+    """Gravimetric Recording.
+
+    Samples are stored column-wise (time, grams, stable, tag index) in arrays
+    that grow geometrically, so multi-hour recordings can be sliced and
+    analyzed without building a Python object per sample. Samples are only
+    published (counted in `len()`) after all of their columns are written,
+    so the recording can be read while a recorder thread appends to it.
+    """
+
+    def __init__(self, samples: Optional[Iterable[GravimetricSample]] = None) -> None:
+        """Gravimetric Recording."""
+        self._length = 0
+        self._time = numpy.empty(INITIAL_RECORDING_CAPACITY, dtype=numpy.float64)
+        self._grams = numpy.empty(INITIAL_RECORDING_CAPACITY, dtype=numpy.float64)
+        self._stable = numpy.empty(INITIAL_RECORDING_CAPACITY, dtype=numpy.bool_)
+        self._tag_index = numpy.empty(INITIAL_RECORDING_CAPACITY, dtype=numpy.int32)
+        self._tags: List[Optional[str]] = []
+        self._tag_indices: Dict[Optional[str], int] = {}
+        if samples is not None:
+            self.extend(samples)
+
+    @classmethod
+    def _from_columns(
+        cls,
+        time: "numpy.ndarray",
+        grams: "numpy.ndarray",
+        stable: "numpy.ndarray",
+        tag_index: "numpy.ndarray",
+        tags: List[Optional[str]],
+    ) -> "GravimetricRecording":
+        recording = cls()
+        recording._time = numpy.array(time, dtype=numpy.float64)
+        recording._grams = numpy.array(grams, dtype=numpy.float64)
+        recording._stable = numpy.array(stable, dtype=numpy.bool_)
+        recording._tag_index = numpy.array(tag_index, dtype=numpy.int32)
+        recording._tags = list(tags)
+        recording._tag_indices = {tag: i for i, tag in enumerate(tags)}
+        recording._length = len(recording._time)
+        return recording
 
     def __str__(self) -> str:
         """Get string."""
@@ -68,87 +123,220 @@ class GravimetricRecording(List):
             f"start_time={self.start_time})"
         )
 
+    def __len__(self) -> int:
+        """Get the number of samples."""
+        return self._length
+
+    def __iter__(self) -> Iterator[GravimetricSample]:
+        """Iterate over the samples."""
+        for i in range(len(self)):
+            yield self._sample_at(i)
+
+    @overload
+    def __getitem__(self, index: int) -> GravimetricSample:  # noqa: D105
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "GravimetricRecording":  # noqa: D105
+        ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[GravimetricSample, "GravimetricRecording"]:
+        """Get a sample, or a slice of the recording."""
+        if isinstance(index, slice):
+            return self._select(index)
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("GravimetricRecording index out of range")
+        return self._sample_at(index)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare samples."""
+        if not isinstance(other, GravimetricRecording):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def _sample_at(self, index: int) -> GravimetricSample:
+        return GravimetricSample(
+            time=float(self._time[index]),
+            grams=float(self._grams[index]),
+            stable=bool(self._stable[index]),
+            tag=self._tags[self._tag_index[index]],
+        )
+
+    def _columns(
+        self,
+    ) -> Tuple["numpy.ndarray", "numpy.ndarray", "numpy.ndarray", "numpy.ndarray"]:
+        # read the length first, so a concurrent append can't be half-included
+        length = len(self)
+        return (
+            self._time[:length],
+            self._grams[:length],
+            self._stable[:length],
+            self._tag_index[:length],
+        )
+
+    def _select(
+        self,
+        selection: Union[slice, "numpy.ndarray"],
+        columns: Optional[Tuple["numpy.ndarray", ...]] = None,
+    ) -> "GravimetricRecording":
+        time, grams, stable, tag_index = columns or self._columns()
+        return GravimetricRecording._from_columns(
+            time[selection],
+            grams[selection],
+            stable[selection],
+            tag_index[selection],
+            self._tags,
+        )
+
+    def _get_tag_index(self, tag: Optional[str]) -> int:
+        if tag not in self._tag_indices:
+            self._tags.append(tag)
+            self._tag_indices[tag] = len(self._tags) - 1
+        return self._tag_indices[tag]
+
+    def append(self, sample: GravimetricSample) -> None:
+        """Append a sample."""
+        index = len(self)
+        if index == len(self._time):
+            capacity = max(2 * index, INITIAL_RECORDING_CAPACITY)
+            self._time = numpy.resize(self._time, capacity)
+            self._grams = numpy.resize(self._grams, capacity)
+            self._stable = numpy.resize(self._stable, capacity)
+            self._tag_index = numpy.resize(self._tag_index, capacity)
+        self._time[index] = sample.time
+        self._grams[index] = sample.grams
+        self._stable[index] = sample.stable
+        self._tag_index[index] = self._get_tag_index(sample.tag)
+        self._length = index + 1
+
+    def extend(self, samples: Iterable[GravimetricSample]) -> None:
+        """Append samples."""
+        for sample in samples:
+            self.append(sample)
+
+    def clear(self) -> None:
+        """Delete all samples."""
+        self._length = 0
+
     @classmethod
     def load(cls, file_path: str) -> "GravimetricRecording":
         """Build a GravimetricRecording instance."""
         with open(file_path, "r") as f:
-            lines = f.readlines()
-
-        if len(lines) <= 1:
-            raise FileNotFoundError(f'File has no data saved yet: "{file_path}"')
-        expected_header = GravimetricSample.csv_header()
-        assert expected_header.strip() == lines[0].strip()
-        header_list = expected_header.split(",")
-        time_idx = header_list.index("time")
-        grams_idx = header_list.index("grams")
-        stable_idx = header_list.index("stable")
-        tag_idx = header_list.index("tag")
-        split_lines = [line.strip().split(",") for line in lines[1:] if line]
-
-        def _parse_tag(tag_from_csv: str) -> Optional[str]:
-            if not tag_from_csv:
-                return None
-            return tag_from_csv
-
-        return GravimetricRecording(
-            [
-                GravimetricSample(
-                    time=float(split_line[time_idx]),
-                    grams=float(split_line[grams_idx]),
-                    stable=bool(int(split_line[stable_idx])),
-                    tag=_parse_tag(split_line[tag_idx]),
+            header = f.readline()
+            expected_header = GravimetricSample.csv_header()
+            if not header:
+                raise FileNotFoundError(f'File has no data saved yet: "{file_path}"')
+            assert expected_header.strip() == header.strip()
+            header_list = expected_header.split(",")
+            time_idx = header_list.index("time")
+            grams_idx = header_list.index("grams")
+            stable_idx = header_list.index("stable")
+            tag_idx = header_list.index("tag")
+            recording = GravimetricRecording()
+            has_data = False
+            for line in f:
+                has_data = True
+                split_line = line.strip().split(",")
+                if len(split_line) <= 1:
+                    continue
+                recording.append(
+                    GravimetricSample(
+                        time=float(split_line[time_idx]),
+                        grams=float(split_line[grams_idx]),
+                        stable=bool(int(split_line[stable_idx])),
+                        tag=split_line[tag_idx] or None,
+                    )
                 )
-                for split_line in split_lines
-                if len(split_line) > 1
-            ]
-        )
+        if not has_data:
+            raise FileNotFoundError(f'File has no data saved yet: "{file_path}"')
+        return recording
 
     @property
     def start_time(self) -> float:
         """Get the starting time, in seconds."""
         assert len(self), "No samples recorded"
-        return self[0].time
+        return float(self._time[0])
 
     @property
     def end_time(self) -> float:
         """Get the ending time, in seconds."""
         assert len(self), "No samples recorded"
-        return self[-1].time
+        return float(self._time[len(self) - 1])
 
     @property
     def start_grams(self) -> float:
         """Get the starting weight, in grams."""
         assert len(self), "No samples recorded"
-        return self[0].grams
+        return float(self._grams[0])
 
     @property
     def end_grams(self) -> float:
         """Get the ending weight, in grams."""
         assert len(self), "No samples recorded"
-        return self[-1].grams
+        return float(self._grams[len(self) - 1])
 
     @property
     def duration(self) -> float:
         """Get the recording time duration, in seconds."""
         return self.end_time - self.start_time
 
+    @property
+    def times(self) -> "numpy.ndarray":
+        """Get the recorded times, in seconds, as a read-only array."""
+        return self._read_only(self._columns()[0])
+
+    @property
+    def grams(self) -> "numpy.ndarray":
+        """Get the recorded weights, in grams, as a read-only array."""
+        return self._read_only(self._columns()[1])
+
+    @property
+    def stable(self) -> "numpy.ndarray":
+        """Get whether each recorded weight was stable, as a read-only array."""
+        return self._read_only(self._columns()[2])
+
+    @staticmethod
+    def _read_only(column: "numpy.ndarray") -> "numpy.ndarray":
+        view = column.view()
+        view.flags.writeable = False
+        return view
+
     @property
     def grams_as_list(self) -> List[float]:
         """Get the recorded weights as a list of floats."""
-        return [s.grams for s in self]
+        grams: List[float] = self.grams.tolist()
+        return grams
 
     @property
     def average(self) -> float:
         """Get the average weight of the recording, in grams."""
         assert len(self), "No samples recorded"
-        _grams_list = self.grams_as_list
-        return sum(_grams_list) / len(_grams_list)
+        return float(numpy.mean(self.grams))
 
     @property
     def stdev(self) -> float:
         """Get the standard deviation of the recording."""
         assert len(self), "No samples recorded"
-        return stdev(self.grams_as_list)
+        if len(self) < 2:
+            raise StatisticsError("stdev requires at least two data points")
+        return float(numpy.std(self.grams, ddof=1))
+
+    @property
+    def min_grams(self) -> float:
+        """Get the lowest weight of the recording, in grams."""
+        assert len(self), "No samples recorded"
+        return float(numpy.min(self.grams))
+
+    @property
+    def max_grams(self) -> float:
+        """Get the highest weight of the recording, in grams."""
+        assert len(self), "No samples recorded"
+        return float(numpy.max(self.grams))
 
     def calculate_cv(self) -> float:
         """Calculate the percent CV of the recording."""
@@ -158,12 +346,38 @@ class GravimetricRecording(List):
         """Calculate the percent D of the recording."""
         return (self.average - target) / target
 
+    def iter_csv_lines(
+        self, start_time: float, chunk_size: int = CSV_CHUNK_SIZE
+    ) -> Iterator[str]:
+        """Iterate over the recording's CSV lines, without building the whole file."""
+        yield GravimetricSample.csv_header() + "\n"
+        time, grams, stable, tag_index = self._columns()
+        tags = [tag if tag else "" for tag in self._tags]
+        for chunk_start in range(0, len(time), chunk_size):
+            chunk = slice(chunk_start, chunk_start + chunk_size)
+            # python floats, so values are formatted the same as GravimetricSample
+            for t, rel_t, g, s, ti in zip(
+                time[chunk].tolist(),
+                (time[chunk] - start_time).tolist(),
+                grams[chunk].tolist(),
+                stable[chunk].tolist(),
+                tag_index[chunk].tolist(),
+            ):
+                unstable_grams = "" if s else str(g)
+                stable_grams = str(g) if s else ""
+                yield (
+                    f"{t},{rel_t},{g},"
+                    f"{unstable_grams},{stable_grams},{int(s)},{tags[ti]}\n"
+                )
+        yield "\n"
+
+    def write_csv(self, stream: TextIO, start_time: float) -> None:
+        """Write the recording to an open CSV file."""
+        stream.writelines(self.iter_csv_lines(start_time))
+
     def as_csv(self, start_time: float) -> str:
         """Convert the recording into a string that can be saved to a CSV file."""
-        csv_file_str = GravimetricSample.csv_header() + "\n"
-        for s in self:
-            csv_file_str += s.as_csv(start_time) + "\n"
-        return csv_file_str + "\n"
+        return "".join(self.iter_csv_lines(start_time))
 
     def _get_nearest_sample_index(self, _time: float, round_to: str = "closest") -> int:
         if _time < self.start_time or _time > self.end_time:
@@ -171,20 +385,41 @@ class GravimetricRecording(List):
                 f"Time ({_time}) is not within recording "
                 f"(start={self.start_time}, end={self.end_time})"
             )
-        for i in range(len(self) - 1):
-            diff_before = _time - self[i].time
-            diff_after = self[i + 1].time - _time
-            if diff_before >= 0 and diff_after >= 0:
-                if round_to == "down" or (
-                    round_to == "closest" and diff_before < diff_after
-                ):
-                    return i
-                else:
-                    return i + 1
-        raise ValueError(
-            f"Unable to find time ({_time}) in recording "
-            f"(start={self.start_time}, end={self.end_time})"
-        )
+        time = self._columns()[0]
+        # the first pair of neighboring samples that the time falls between
+        i = max(int(numpy.searchsorted(time, _time, side="left")) - 1, 0)
+        if i + 1 >= len(time):
+            raise ValueError(
+                f"Unable to find time ({_time}) in recording "
+                f"(start={self.start_time}, end={self.end_time})"
+            )
+        diff_before = _time - time[i]
+        diff_after = time[i + 1] - _time
+        if round_to == "down" or (round_to == "closest" and diff_before < diff_after):
+            return i
+        else:
+            return i + 1
+
+    def _get_stable_segment_bounds(self) -> List[Tuple[int, int]]:
+        """Get the start and end (exclusive) index of every run of stable samples."""
+        stable = self._columns()[2]
+        padded = numpy.zeros(len(stable) + 2, dtype=numpy.int8)
+        padded[1:-1] = stable
+        edges = numpy.diff(padded)
+        starts = numpy.flatnonzero(edges == 1)
+        ends = numpy.flatnonzero(edges == -1)
+        return list(zip(starts.tolist(), ends.tolist()))
+
+    def get_stable_segments(
+        self, min_duration: float = 0.0
+    ) -> List["GravimetricRecording"]:
+        """Get each uninterrupted run of stable samples, of at least a duration."""
+        time = self._columns()[0]
+        return [
+            self[start:end]
+            for start, end in self._get_stable_segment_bounds()
+            if time[end - 1] - time[start] >= min_duration
+        ]
 
     def get_time_slice(
         self, start: float, duration: float, stable: bool = False, timeout: float = 3
@@ -195,23 +430,20 @@ class GravimetricRecording(List):
         avail_timeout_idx = self._get_nearest_sample_index(
             start + timeout, round_to="up"
         )
-        available_samples = GravimetricRecording(
-            self[avail_start_idx : avail_timeout_idx + 1]
-        )
+        available_samples = self[avail_start_idx : avail_timeout_idx + 1]
         if not stable:
             end_idx = available_samples._get_nearest_sample_index(start + duration)
-            return GravimetricRecording(available_samples[: end_idx + 1])
+            return available_samples[: end_idx + 1]
         else:
             # only include the first stable segment of samples
-            # once the samples become unstable, stop including
-            stable_samples = GravimetricRecording()
-            for s in available_samples:
-                if s.stable:
-                    stable_samples.append(s)
-                    if stable_samples.duration >= duration:
-                        return stable_samples
-                elif len(stable_samples):
-                    stable_samples = GravimetricRecording()
+            # that lasts the full duration, ending at the first sample
+            # where that duration is reached
+            time = available_samples._columns()[0]
+            for seg_start, seg_end in available_samples._get_stable_segment_bounds():
+                seg_time = time[seg_start:seg_end]
+                reached = numpy.flatnonzero(seg_time - seg_time[0] >= duration)
+                if len(reached):
+                    return available_samples[seg_start : seg_start + reached[0] + 1]
             raise RuntimeError(
                 f"Unable to slice recording into stable piece"
                 f"(start={start}, duration={duration})"
@@ -219,13 +451,15 @@ class GravimetricRecording(List):
 
     def get_tagged_samples(self, tag: str) -> "GravimetricRecording":
         """Get samples with given tag."""
-        return GravimetricRecording(
-            [sample for sample in self if sample.tag and sample.tag == tag]
-        )
+        if not tag or tag not in self._tag_indices:
+            return GravimetricRecording()
+        columns = self._columns()
+        return self._select(columns[3] == self._tag_indices[tag], columns)
 
     def get_stable_samples(self) -> "GravimetricRecording":
         """Get stable samples."""
-        return GravimetricRecording([sample for sample in self if sample.stable])
+        columns = self._columns()
+        return self._select(columns[2], columns)
 
 
 class GravimetricRecorderConfig:
@@ -1,8 +1,10 @@
 """Post process script csvs."""
 import csv
 import os
-from typing import List, Dict, Tuple
-from math import isclose
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Dict, Optional, Tuple
+
+import numpy
 
 COL_TRIAL_CONVERSION = {
     1: "E",
@@ -20,52 +22,110 @@ COL_TRIAL_CONVERSION = {
     13: "AO",
 }
 
+SAMPLE_PERIOD_SECONDS = 0.001
+MENISCUS_REL_TOL = 0.001
+
+# mount speed, plunger speed, and threshold (pascals) of a pressure capture
+CaptureSettings = Tuple[float, float, float]
+
+
+class PressureCapture:
+    """The settings and pressure readings of a single trial."""
+
+    def __init__(self, settings: CaptureSettings, pressures: numpy.ndarray) -> None:
+        """Pressure capture."""
+        self.settings = settings
+        self.pressures = pressures
+
+    @classmethod
+    def load(cls, file_path: str) -> "PressureCapture":
+        """Load a capture saved by the pressure sensor's LogListener.
+
+        The first row is a heading, the second holds the capture's settings,
+        and every following row is a (time, pressure) reading.
+        """
+        with open(file_path, newline="") as capture_csv:
+            capture_csv.readline()
+            settings_row = next(csv.reader([capture_csv.readline()]))
+            settings = (
+                float(settings_row[2]),
+                float(settings_row[3]),
+                float(settings_row[4]),
+            )
+            pressures = numpy.array(
+                [reading.split(",")[1] for reading in capture_csv],
+                dtype=numpy.float64,
+            )
+        return cls(settings, pressures)
+
+
+def load_pressure_captures(
+    file_paths: List[str], max_workers: Optional[int] = None
+) -> List[PressureCapture]:
+    """Load pressure captures in parallel, in the order they were given."""
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(PressureCapture.load, file_paths))
+
+
+def _align_to_longest_tip(
+    capture: PressureCapture,
+    tip_offset: float,
+    min_tip_offset: float,
+    mount_speed: float,
+    plunger_speed: float,
+    max_results_len: int,
+) -> Tuple[float, float]:
+    """Drop readings from the start of a trial until it lines up with the longest tip.
 
-def process_csv_directory(  # noqa: C901
-    data_directory: str, tips: List[int], trials: int, make_graph: bool = False
+    The capture's length is kept by repeating its last reading. Each dropped
+    reading moves the tip offset by one sample of mount travel, so the offsets
+    are accumulated one sample at a time, as they are measured.
+
+    Returns:
+        The trial's aligned tip offset and plunger offset.
+    """
+    offset_steps = numpy.full(max_results_len + 1, SAMPLE_PERIOD_SECONDS * mount_speed)
+    offset_steps[0] = tip_offset
+    offsets = numpy.subtract.accumulate(offset_steps)
+    aligned = numpy.flatnonzero(offsets <= min_tip_offset)
+    dropped = int(aligned[0]) if len(aligned) else max_results_len
+    if not dropped:
+        return tip_offset, 0
+    pressures = capture.pressures
+    capture.pressures = numpy.concatenate(
+        (pressures[dropped:], numpy.full(min(dropped, len(pressures)), pressures[-1]))
+    )
+    return float(offsets[dropped]), dropped * SAMPLE_PERIOD_SECONDS * plunger_speed * -1
+
+
+def process_csv_directory(
+    data_directory: str,
+    tips: List[int],
+    trials: int,
+    make_graph: bool = False,
+    max_workers: Optional[int] = None,
 ) -> None:
     """Post process script csvs."""
     csv_files: List[str] = os.listdir(data_directory)
     summary: str = [f for f in csv_files if "CSVReport" in f][0]
     final_report_file: str = f"{data_directory}/final_report.csv"
-    # initialize our data structs
     pressure_csvs = [f for f in csv_files if "pressure_sensor_data" in f]
-    pressure_results_files: Dict[int, List[str]] = {}
-    pressure_results: Dict[int, Dict[int, List[float]]] = {}
-    results_settings: Dict[int, Dict[int, Tuple[float, float, float]]] = {}
-    tip_offsets: Dict[int, List[float]] = {}
-    p_offsets: Dict[int, List[float]] = {}
+    tip_offsets: Dict[int, List[float]] = {tip: [] for tip in tips}
+    p_offsets: Dict[int, List[float]] = {tip: [0] * trials for tip in tips}
     meniscus_travel: float = 0
-    for tip in tips:
-        pressure_results_files[tip] = [f for f in pressure_csvs if f"tip{tip}" in f]
-        pressure_results[tip] = {}
-        results_settings[tip] = {}
-        tip_offsets[tip] = []
-        p_offsets[tip] = [i * 0 for i in range(trials)]
-        for trial in range(trials):
-            pressure_results[tip][trial] = []
-            results_settings[tip][trial] = (0.0, 0.0, 0.0)
-    max_results_len = 0
-
-    # read in all of the pressure csvs into one big struct so we can process them
-    for tip in tips:
-        for trial in range(trials):
-            with open(
-                f"{data_directory}/{pressure_results_files[tip][trial]}", newline=""
-            ) as trial_csv:
-                trial_reader = csv.reader(trial_csv)
-                i = 0
-                for row in trial_reader:
-                    if i == 1:
-                        results_settings[tip][trial] = (
-                            float(row[2]),
-                            float(row[3]),
-                            float(row[4]),
-                        )
-                    if i > 1:
-                        pressure_results[tip][trial].append(float(row[1]))
-                    i += 1
-                max_results_len = max([i - 2, max_results_len])
+
+    # read in all of the pressure csvs at once, so we can process them
+    trial_files = [
+        f"{data_directory}/{[f for f in pressure_csvs if f'tip{tip}' in f][trial]}"
+        for tip in tips
+        for trial in range(trials)
+    ]
+    loaded = load_pressure_captures(trial_files, max_workers=max_workers)
+    captures: Dict[int, List[PressureCapture]] = {
+        tip: loaded[t * trials : (t + 1) * trials] for t, tip in enumerate(tips)
+    }
+    max_results_len = max(len(c.pressures) for c in loaded)
+
     # start writing the final report csv
     with open(f"{data_directory}/{summary}", newline="") as summary_csv:
         summary_reader = csv.reader(summary_csv)
@@ -113,57 +173,52 @@ def process_csv_directory(  # noqa: C901
                 for tip in tips:
                     min_tip_offset = min(tip_offsets[tip])
                     for trial in range(trials):
-                        for i in range(max_results_len):
-                            if tip_offsets[tip][trial] > min_tip_offset:
-                                # drop this pressure result
-                                pressure_results[tip][trial].pop(0)
-                                # we don't want to change the length of this array so just
-                                # stretch out the last value
-                                pressure_results[tip][trial].append(
-                                    pressure_results[tip][trial][-1]
-                                )
-                                # decrement the offset while this is true
-                                # so we can account for it later
-                                tip_offsets[tip][trial] -= (
-                                    0.001 * results_settings[tip][0][0]
-                                )
-                                # keep track of how this effects the plunger start position
-                                p_offsets[tip][trial] = (
-                                    (i + 1) * 0.001 * results_settings[tip][0][1] * -1
-                                )
-                            else:
-                                # we've lined up this trial so move to the next
-                                break
+                        (
+                            tip_offsets[tip][trial],
+                            p_offsets[tip][trial],
+                        ) = _align_to_longest_tip(
+                            captures[tip][trial],
+                            tip_offsets[tip][trial],
+                            min_tip_offset,
+                            mount_speed=captures[tip][0].settings[0],
+                            plunger_speed=captures[tip][0].settings[1],
+                            max_results_len=max_results_len,
+                        )
+
+            # the time is accumulated sample by sample, like it is measured
+            time_steps = numpy.full(max_results_len, SAMPLE_PERIOD_SECONDS)
+            time_steps[:1] = 0.0
+            time = numpy.cumsum(time_steps)
+            # python floats, which the csv writer formats the same way as f-strings
+            time_column = time.tolist()
             # write the processed test data
             for tip in tips:
-                time = 0.0
                 final_report_writer.writerow(pressure_header_row)
-                meniscus_time = (meniscus_travel + min_tip_offset) / results_settings[
-                    tip
-                ][0][0]
-                for i in range(max_results_len):
-                    pressure_row: List[str] = [f"{time}"]
-                    if isclose(
-                        time,
-                        meniscus_time,
-                        rel_tol=0.001,
-                    ):
-                        pressure_row.append("Meniscus")
-                    else:
-                        pressure_row.append("")
-                    for trial in range(trials):
-                        if i < len(pressure_results[tip][trial]):
-                            pressure_row.append(f"{pressure_results[tip][trial][i]}")
-                        else:
-                            pressure_row.append("")
-                        pressure_row.append(
-                            f"{results_settings[tip][trial][0] * time - tip_offsets[tip][trial]}"
-                        )
-                        pressure_row.append(
-                            f"{abs(results_settings[tip][trial][1]) * time + p_offsets[tip][trial]}"
-                        )
-                    final_report_writer.writerow(pressure_row)
-                    time += 0.001
+                mount_speed = captures[tip][0].settings[0]
+                meniscus_time = (meniscus_travel + min_tip_offset) / mount_speed
+                # math.isclose(), for every sample at once
+                at_meniscus = numpy.abs(time - meniscus_time) <= MENISCUS_REL_TOL * (
+                    numpy.maximum(numpy.abs(time), abs(meniscus_time))
+                )
+                columns: List[List[Any]] = [
+                    time_column,
+                    ["Meniscus" if m else "" for m in at_meniscus.tolist()],
+                ]
+                for trial in range(trials):
+                    capture = captures[tip][trial]
+                    pressures = capture.pressures.tolist()
+                    columns.append(
+                        pressures + [""] * (max_results_len - len(pressures))
+                    )
+                    columns.append(
+                        (capture.settings[0] * time - tip_offsets[tip][trial]).tolist()
+                    )
+                    columns.append(
+                        (
+                            abs(capture.settings[1]) * time + p_offsets[tip][trial]
+                        ).tolist()
+                    )
+                final_report_writer.writerows(zip(*columns))
 
 
 if __name__ == "__main__":
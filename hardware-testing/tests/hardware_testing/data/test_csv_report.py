@@ -0,0 +1,148 @@
+"""Test CSV Report."""
+import gc
+from datetime import datetime
+from pathlib import Path
+import pytest
+
+from hardware_testing.data import csv_report
+from hardware_testing.data.csv_report import (
+    CSVLine,
+    CSVLineRepeating,
+    CSVReport,
+    CSVResult,
+    CSVSection,
+)
+
+NUM_VALUES = 300
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _FakeDatetime:
+    @staticmethod
+    def utcnow() -> datetime:
+        return datetime(year=2024, month=1, day=1)
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> _FakeClock:
+    """Save reports to a temporary directory, with a clock we control."""
+    monkeypatch.setenv("TESTING_DATA_DIR", str(tmp_path))
+    fake_clock = _FakeClock()
+    monkeypatch.setattr(csv_report, "time", fake_clock)
+    monkeypatch.setattr(csv_report, "datetime", _FakeDatetime)
+    return fake_clock
+
+
+def _create_report(tag: str, save_interval: float) -> CSVReport:
+    report = CSVReport(
+        test_name="test-csv-report",
+        run_id="run-id",
+        sections=[
+            CSVSection(
+                title="MEASUREMENTS",
+                lines=[
+                    CSVLineRepeating(
+                        repeat=NUM_VALUES, tag="reading", data=[float, CSVResult]
+                    ),
+                    CSVLine(tag="summary", data=[str]),
+                ],
+            )
+        ],
+        save_interval=save_interval,
+    )
+    report.set_tag(tag)
+    return report
+
+
+def _store_values(report: CSVReport, clock: _FakeClock) -> None:
+    for i in range(NUM_VALUES):
+        clock.now += 0.1
+        report("MEASUREMENTS", "reading", i, [i * 1.5, CSVResult.from_bool(i != 7)])
+    clock.now += 0.1
+    report("MEASUREMENTS", "summary", ["done"])
+
+
+def test_report_saved_periodically_is_identical(clock: _FakeClock) -> None:
+    """It should save the same report as when it is rewritten after every value."""
+    rewritten = _create_report("rewritten", save_interval=0)
+    journaled = _create_report("journaled", save_interval=60)
+
+    _store_values(rewritten, clock)
+    clock.now -= (NUM_VALUES + 1) * 0.1
+    _store_values(journaled, clock)
+    expected = rewritten.file_path.read_text().replace("rewritten", "journaled")
+    journaled_before_exit = journaled.file_path.read_text()
+    journaled.print_results()
+
+    assert journaled.file_path.read_text() == expected
+    assert journaled_before_exit != expected
+
+
+def test_report_journal(clock: _FakeClock) -> None:
+    """It should append every stored value to the journal."""
+    report = _create_report("journal", save_interval=60)
+
+    _store_values(report, clock)
+
+    journal = (report.parent / report.journal_file_name).read_text().splitlines()
+    readings = report["MEASUREMENTS"]["reading"]
+    assert isinstance(readings, CSVLineRepeating)
+    assert len(journal) == NUM_VALUES + 1
+    assert journal[0] == f"MEASUREMENTS,0,{readings[0]}"
+    assert journal[-1] == f"MEASUREMENTS,,{report['MEASUREMENTS']['summary']}"
+
+
+def test_report_rewrites_periodically(
+    clock: _FakeClock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """It should only rewrite the report once per save interval."""
+    report = _create_report("periodic", save_interval=10)
+    start_time = clock.now
+    saved_times = []
+    save_to_disk = report.save_to_disk
+
+    def _save_to_disk() -> Path:
+        saved_times.append(clock.now)
+        return save_to_disk()
+
+    monkeypatch.setattr(report, "save_to_disk", _save_to_disk)
+    _store_values(report, clock)
+
+    assert [round(t - start_time) for t in saved_times] == [10, 20, 30]
+
+
+def test_unsaved_reports_saved_at_exit(clock: _FakeClock) -> None:
+    """It should save reports with unsaved values when the test exits."""
+    unsaved = _create_report("unsaved", save_interval=60)
+    saved = _create_report("saved", save_interval=60)
+    _store_values(unsaved, clock)
+    _store_values(saved, clock)
+    saved.print_results()
+    saved_text = saved.file_path.read_text()
+    clock.now += 1
+
+    csv_report._save_unsaved_reports()
+
+    assert unsaved.file_path.read_text().count("done") == 1
+    assert saved.file_path.read_text() == saved_text
+
+
+def test_unreferenced_reports_saved_at_exit(clock: _FakeClock) -> None:
+    """It should save every stored value, even if the report is no longer used."""
+    report = _create_report("unreferenced", save_interval=60)
+    _store_values(report, clock)
+    file_path = report.file_path
+    expected_text = str(report) + "\n"
+
+    del report
+    gc.collect()
+    csv_report._save_unsaved_reports()
+
+    assert file_path.read_text() == expected_text
@@ -0,0 +1 @@
+"""Gravimetric tests."""
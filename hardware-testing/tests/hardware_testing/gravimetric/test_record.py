@@ -0,0 +1,128 @@
+"""Test gravimetric recordings."""
+import statistics
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from hardware_testing.gravimetric.measurement.record import (
+    GravimetricRecording,
+    GravimetricSample,
+)
+
+# (stable, tag) for each sample, recorded every 0.5 seconds
+SAMPLES = [
+    (False, None),
+    (True, "aspirate"),
+    (True, "aspirate"),
+    (False, "aspirate"),
+    (True, "dispense"),
+    (True, "dispense"),
+    (True, "dispense"),
+    (True, "dispense"),
+    (False, None),
+]
+
+
+@pytest.fixture
+def recording() -> GravimetricRecording:
+    """Get a recording with a couple of stable segments."""
+    return GravimetricRecording(
+        [
+            GravimetricSample(time=100 + i * 0.5, grams=i * 1.1, stable=s, tag=t)
+            for i, (s, t) in enumerate(SAMPLES)
+        ]
+    )
+
+
+def _times(recording: GravimetricRecording) -> List[float]:
+    return [sample.time for sample in recording]
+
+
+def test_list_interface(recording: GravimetricRecording) -> None:
+    """It should behave like the list of samples it used to be."""
+    assert len(recording) == len(SAMPLES)
+    assert recording[0] == GravimetricSample(time=100, grams=0, stable=False, tag=None)
+    assert recording[-1].time == recording.end_time == 104
+    assert _times(recording[1:3]) == [100.5, 101]
+    recording.append(recording[0])
+    assert len(recording) == len(SAMPLES) + 1
+    recording.clear()
+    assert len(recording) == 0
+
+
+def test_statistics(recording: GravimetricRecording) -> None:
+    """It should match the statistics of the samples' weights."""
+    grams = [sample.grams for sample in recording]
+
+    assert recording.grams_as_list == grams
+    assert recording.average == pytest.approx(statistics.mean(grams))
+    assert recording.stdev == pytest.approx(statistics.stdev(grams))
+    assert recording.min_grams == min(grams)
+    assert recording.max_grams == max(grams)
+    with pytest.raises(statistics.StatisticsError):
+        recording[:1].stdev
+
+
+def test_tagged_and_stable_samples(recording: GravimetricRecording) -> None:
+    """It should select samples by tag and stability."""
+    assert _times(recording.get_tagged_samples("aspirate")) == [100.5, 101, 101.5]
+    assert len(recording.get_tagged_samples("missing")) == 0
+    assert len(recording.get_tagged_samples("")) == 0
+    assert len(recording.get_stable_samples()) == 6
+    assert [
+        _times(segment) for segment in recording.get_stable_segments(min_duration=1)
+    ] == [[102, 102.5, 103, 103.5]]
+
+
+@pytest.mark.parametrize(
+    "time,round_to,expected",
+    [
+        (100, "closest", 0),
+        (100.2, "closest", 0),
+        (100.3, "closest", 1),
+        (100.3, "down", 0),
+        (100.2, "up", 1),
+        (104, "closest", 8),
+    ],
+)
+def test_get_nearest_sample_index(
+    recording: GravimetricRecording, time: float, round_to: str, expected: int
+) -> None:
+    """It should find the sample nearest to a time."""
+    assert recording._get_nearest_sample_index(time, round_to) == expected
+
+
+def test_get_time_slice(recording: GravimetricRecording) -> None:
+    """It should slice the recording by time."""
+    # like before, the slice starts from the sample before the start time
+    assert _times(recording.get_time_slice(start=100.5, duration=1)) == [
+        100,
+        100.5,
+        101,
+        101.5,
+    ]
+    assert _times(
+        recording.get_time_slice(start=100.5, duration=1, stable=True, timeout=3.5)
+    ) == [102, 102.5, 103]
+    with pytest.raises(RuntimeError):
+        recording.get_time_slice(start=100, duration=1, stable=True, timeout=1.5)
+    with pytest.raises(ValueError):
+        recording.get_time_slice(start=99, duration=1)
+
+
+def test_csv(recording: GravimetricRecording, tmp_path: Path) -> None:
+    """It should write the same CSV as its samples, and load it back."""
+    start_time = 90.0
+    expected = "".join(
+        [GravimetricSample.csv_header() + "\n"]
+        + [sample.as_csv(start_time) + "\n" for sample in recording]
+        + ["\n"]
+    )
+    file_path = tmp_path / "recording.csv"
+    with open(file_path, "w") as f:
+        recording.write_csv(f, start_time)
+
+    assert recording.as_csv(start_time) == expected
+    assert file_path.read_text() == expected
+    assert GravimetricRecording.load(str(file_path)) == recording
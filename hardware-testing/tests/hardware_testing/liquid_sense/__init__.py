@@ -0,0 +1 @@
+"""Liquid sense tests."""
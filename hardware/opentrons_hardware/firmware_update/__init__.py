@@ -5,7 +5,12 @@ from .initiator import (
     FirmwareUpdateInitiator,
 )
 from .downloader import FirmwareUpdateDownloader
-from .hex_file import from_hex_file_path, from_hex_file, HexRecordProcessor
+from .hex_file import (
+    from_hex_file_path,
+    from_hex_file,
+    load_firmware_image,
+    HexRecordProcessor,
+)
 from .eraser import FirmwareUpdateEraser
 from .run import RunUpdate
 from .utils import check_firmware_updates, UpdateChecker
@@ -31,6 +36,7 @@ __all__ = [
     "FirmwareUpdateEraser",
     "from_hex_file_path",
     "from_hex_file",
+    "load_firmware_image",
     "HexRecordProcessor",
     "RunUpdate",
     "check_firmware_updates",
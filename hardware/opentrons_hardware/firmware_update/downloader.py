@@ -2,6 +2,9 @@
 import asyncio
 import binascii
 import logging
+from dataclasses import dataclass
+
+from opentrons_shared_data.errors.exceptions import FirmwareUpdateFailedError
 
 from opentrons_hardware.firmware_bindings import NodeId
 from opentrons_hardware.firmware_bindings.constants import ErrorCode
@@ -12,17 +15,31 @@ from opentrons_hardware.drivers.can_bus.can_messenger import (
     WaitableCallback,
 )
 from opentrons_hardware.firmware_update.errors import ErrorResponse, TimeoutResponse
-from opentrons_hardware.firmware_update.hex_file import HexRecordProcessor
+from opentrons_hardware.firmware_update.hex_file import ChunkSource
 from opentrons_hardware.firmware_bindings.messages import (
     message_definitions,
     payloads,
     fields,
 )
-from typing import AsyncIterator
+from typing import AsyncIterator, Dict
 
 logger = logging.getLogger(__name__)
 
 
+DEFAULT_WINDOW_SIZE = 1
+"""Send one chunk at a time, waiting for each chunk's ack."""
+
+
+@dataclass
+class _ChunkInFlight:
+    """A chunk that was sent and has not been acknowledged yet."""
+
+    data: bytes
+    message: message_definitions.FirmwareUpdateData
+    attempts: int
+    deadline: float
+
+
 class FirmwareUpdateDownloader:
     """Class that downloads FW using CAN messages."""
 
@@ -30,63 +47,108 @@ class FirmwareUpdateDownloader:
         """Constructor."""
         self._messenger = messenger
 
-    async def run(
+    async def run(  # noqa: C901
         self,
         node_id: NodeId,
-        hex_processor: HexRecordProcessor,
+        hex_processor: ChunkSource,
         ack_wait_seconds: float,
         retries: int = 3,
+        window_size: int = DEFAULT_WINDOW_SIZE,
     ) -> AsyncIterator[float]:
         """Download hex record chunks to node.
 
+        Up to window_size chunks are sent before their acks arrive. Acks are
+        matched to chunks by address, and a chunk whose ack times out or
+        reports an error is sent again on its own. Nodes must accept data
+        for any address in any order to use a window larger than 1.
+
         Args:
             node_id: The target node id.
             hex_processor: The producer of hex chunks.
             ack_wait_seconds: Number of seconds to wait for an ACK.
             retries: Number of attempts when sending a chunk.
+            window_size: Number of chunks that can wait for an ACK at once.
 
         Returns:
             None
         """
-        chunks = list(hex_processor.process(fields.FirmwareUpdateDataField.NUM_BYTES))
-        total_chunks = len(chunks)
+        if window_size < 1:
+            raise ValueError(f"window_size must be at least 1, not {window_size}")
+        chunk_size = fields.FirmwareUpdateDataField.NUM_BYTES
+        total_chunks = hex_processor.count_chunks(chunk_size)
+        chunks = hex_processor.process(chunk_size)
+        loop = asyncio.get_running_loop()
         with WaitableCallback(self._messenger) as reader:
+            in_flight: Dict[int, _ChunkInFlight] = {}
             num_messages = 0
+            num_acked = 0
             crc32 = 0
-            for chunk in chunks:
-                passed = False
-                for retry in range(retries):
-                    logger.debug(
-                        f"Sending chunk {num_messages} to address {chunk.address:x} retry: {retry}."
+
+            async def _send(address: int, data: bytes, attempts: int) -> None:
+                logger.debug(f"Sending chunk to address {address:x} retry: {attempts}.")
+                data_message = message_definitions.FirmwareUpdateData(
+                    payload=payloads.FirmwareUpdateData.create(
+                        address=address, data=data
                     )
-                    # Create and send message from this chunk
+                )
+                in_flight[address] = _ChunkInFlight(
+                    data=data,
+                    message=data_message,
+                    attempts=attempts + 1,
+                    deadline=loop.time() + ack_wait_seconds,
+                )
+                await self._messenger.send(node_id=node_id, message=data_message)
+
+            async def _retry(chunk: _ChunkInFlight, error: Exception) -> None:
+                if chunk.attempts >= retries:
+                    raise error
+                await _send(
+                    chunk.message.payload.address.value, chunk.data, chunk.attempts
+                )
+
+            while True:
+                for chunk in chunks:
                     data = bytes(chunk.data)
-                    data_message = message_definitions.FirmwareUpdateData(
-                        payload=payloads.FirmwareUpdateData.create(
-                            address=chunk.address, data=data
-                        )
-                    )
-                    await self._messenger.send(node_id=node_id, message=data_message)
-                    try:
-                        # Wait for ack.
-                        await asyncio.wait_for(
-                            self._wait_data_message_ack(node_id, reader),
-                            ack_wait_seconds,
-                        )
-                        passed = True
+                    await _send(chunk.address, data, 0)
+                    crc32 = binascii.crc32(data, crc32)
+                    num_messages += 1
+                    if len(in_flight) >= window_size:
                         break
-                    except asyncio.TimeoutError:
-                        logger.warning(
-                            f"Firmware update data ack timed out for chunk {num_messages}"
-                        )
+                if not in_flight:
+                    break
 
-                # message was not successful
-                if not passed:
-                    raise TimeoutResponse(data_message, node_id)
+                deadline = min(sent.deadline for sent in in_flight.values())
+                try:
+                    response = await asyncio.wait_for(
+                        self._wait_data_message_ack(node_id, reader),
+                        max(deadline - loop.time(), 0),
+                    )
+                except asyncio.TimeoutError:
+                    for address, expired in list(in_flight.items()):
+                        if expired.deadline <= loop.time():
+                            logger.warning(
+                                f"Firmware update data ack timed out for address {address:x}"
+                            )
+                            await _retry(
+                                expired, TimeoutResponse(expired.message, node_id)
+                            )
+                    continue
 
-                crc32 = binascii.crc32(data, crc32)
-                num_messages += 1
-                yield num_messages / total_chunks
+                acked = in_flight.get(response.payload.address.value)
+                if acked is None:
+                    # A second ack for a chunk that was already acked.
+                    continue
+                if response.payload.error_code.value != ErrorCode.ok:
+                    logger.warning(
+                        f"Firmware update data ack for address "
+                        f"{response.payload.address.value:x} "
+                        f"reported {response.payload.error_code.value}"
+                    )
+                    await _retry(acked, ErrorResponse(response, node_id))
+                    continue
+                in_flight.pop(response.payload.address.value)
+                num_acked += 1
+                yield num_acked / total_chunks
 
             # Create and send firmware update complete message.
             complete_message = message_definitions.FirmwareUpdateComplete(
@@ -104,16 +166,20 @@ class FirmwareUpdateDownloader:
                 raise TimeoutResponse(complete_message, node_id)
 
     @staticmethod
-    async def _wait_data_message_ack(node_id: NodeId, reader: WaitableCallback) -> None:
+    async def _wait_data_message_ack(
+        node_id: NodeId, reader: WaitableCallback
+    ) -> message_definitions.FirmwareUpdateDataAcknowledge:
         """Wait for response to data."""
         async for response, arbitration_id in reader:
             if arbitration_id.parts.originating_node_id == node_id:
                 if isinstance(
                     response, message_definitions.FirmwareUpdateDataAcknowledge
                 ):
-                    if response.payload.error_code.value != ErrorCode.ok:
-                        raise ErrorResponse(response, node_id)
-                    break
+                    return response
+        raise FirmwareUpdateFailedError(
+            message="CAN messages stopped before a firmware update data ack",
+            detail={"node": node_id.application_for().name},
+        )
 
     @staticmethod
     async def _wait_update_complete_ack(
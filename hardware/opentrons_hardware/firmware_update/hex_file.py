@@ -1,16 +1,27 @@
 """Hex file tools."""
 from __future__ import annotations
+from collections import OrderedDict
 from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
-from typing import Iterable, List, Generator, TextIO
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Generator,
+    Optional,
+    TextIO,
+    Tuple,
+)
 import binascii
+import hashlib
 import struct
 import logging
 
 from opentrons_shared_data.errors.exceptions import FirmwareUpdateFailedError
 
-from typing_extensions import Final
+from typing_extensions import Final, Protocol
 
 
 log = logging.getLogger(__name__)
@@ -105,12 +116,12 @@ class BadChunkSizeException(FirmwareUpdateFailedError):
 def from_hex_file_path(file_path: Path) -> Iterable[HexRecord]:
     """A generator that processes a hex file at file_path."""
     with open(file_path) as hex_file:
-        return from_hex_file(hex_file)
+        yield from from_hex_file(hex_file)
 
 
 def from_hex_file(hex_file: TextIO) -> Iterable[HexRecord]:
     """A generator that processes a hex file contents."""
-    for idx, line in enumerate(hex_file.readlines()):
+    for idx, line in enumerate(hex_file):
         yield process_line(line, idx, hex_file.name)
 
 
@@ -188,6 +199,76 @@ class Chunk:
     data: List[int]
 
 
+class ChunkSource(Protocol):
+    """Anything that can split firmware into chunks for download."""
+
+    def count_chunks(self, chunk_size: int) -> int:
+        """Count the chunks that process would generate."""
+        ...
+
+    def process(self, chunk_size: int) -> Iterator[Chunk]:
+        """Generate the chunks."""
+        ...
+
+
+@dataclass(frozen=True)
+class ImageRegion:
+    """An address-contiguous run of firmware bytes."""
+
+    address: int
+    data: bytes
+
+
+@dataclass(frozen=True)
+class FirmwareImage:
+    """The binary contents of a hex file."""
+
+    filename: str
+    start_address: int
+    regions: Tuple[ImageRegion, ...]
+
+    def count_chunks(self, chunk_size: int) -> int:
+        """Count the chunks that process would generate.
+
+        Args:
+            chunk_size: The number of bytes in each chunk.
+
+        Returns:
+            The number of chunks.
+        """
+        if chunk_size <= 0:
+            raise BadChunkSizeException(self.filename, chunk_size)
+        return sum(-(-len(region.data) // chunk_size) for region in self.regions)
+
+    def process(self, chunk_size: int) -> Generator[Chunk, None, None]:
+        """Split the regions into chunks.
+
+        Args:
+            chunk_size: The number of bytes in each chunk.
+
+        Returns:
+            Generates chunks.
+        """
+        if chunk_size <= 0:
+            raise BadChunkSizeException(self.filename, chunk_size)
+        for region in self.regions:
+            for offset in range(0, len(region.data), chunk_size):
+                yield Chunk(
+                    address=region.address + offset,
+                    data=list(region.data[offset : offset + chunk_size]),
+                )
+
+
+class _RereadRecords:
+    """Hex records that are parsed again from their file on every pass."""
+
+    def __init__(self, read: Callable[[], Iterable[HexRecord]]) -> None:
+        self._read = read
+
+    def __iter__(self) -> Iterator[HexRecord]:
+        return iter(self._read())
+
+
 class HexRecordProcessor:
     """Process an iterable of hex records.
 
@@ -195,7 +276,12 @@ class HexRecordProcessor:
     """
 
     def __init__(self, records: Iterable[HexRecord], filename: str) -> None:
-        """Constructor."""
+        """Constructor.
+
+        The records are streamed, and read once by each call to count_chunks,
+        process and to_image. Pass a collection, or use from_file_path or
+        from_file, to call more than one of them.
+        """
         self._records = records
         self._start_address: int = 0
         self._filename = filename
@@ -203,12 +289,19 @@ class HexRecordProcessor:
     @classmethod
     def from_file_path(cls, file_path: Path) -> HexRecordProcessor:
         """Construct from file."""
-        return HexRecordProcessor(from_hex_file_path(file_path), str(file_path))
+        return HexRecordProcessor(
+            _RereadRecords(lambda: from_hex_file_path(file_path)), str(file_path)
+        )
 
     @classmethod
     def from_file(cls, hex_file: TextIO) -> HexRecordProcessor:
         """Construct from file."""
-        return HexRecordProcessor(from_hex_file(hex_file), hex_file.name)
+
+        def _read() -> Iterable[HexRecord]:
+            hex_file.seek(0)
+            return from_hex_file(hex_file)
+
+        return HexRecordProcessor(_RereadRecords(_read), hex_file.name)
 
     @property
     def start_address(self) -> int:
@@ -218,7 +311,29 @@ class HexRecordProcessor:
         """
         return self._start_address
 
-    def process(self, chunk_size: int) -> Generator[Chunk, None, None]:  # noqa: C901
+    def count_chunks(self, chunk_size: int) -> int:
+        """Count the chunks that process would generate.
+
+        Args:
+            chunk_size: The number of bytes in each chunk.
+
+        Returns:
+            The number of chunks.
+        """
+        if chunk_size <= 0:
+            raise BadChunkSizeException(self._filename, chunk_size)
+        num_chunks = 0
+        region_size = 0
+        region_end: Optional[int] = None
+        for addr, data in self._data():
+            if addr != region_end:
+                num_chunks += -(-region_size // chunk_size)
+                region_size = 0
+            region_size += len(data)
+            region_end = addr + len(data)
+        return num_chunks + -(-region_size // chunk_size)
+
+    def process(self, chunk_size: int) -> Generator[Chunk, None, None]:
         """Process the records.
 
         Args:
@@ -230,34 +345,63 @@ class HexRecordProcessor:
         """
         if chunk_size <= 0:
             raise BadChunkSizeException(self._filename, chunk_size)
+        # The data read but not yet sent, and its address
+        buffer = bytearray()
+        buffer_addr = 0
+        for addr, data in self._data():
+            if buffer and addr != (buffer_addr + len(buffer)):
+                # This new record is not contiguous. Send what we have.
+                yield Chunk(address=buffer_addr, data=list(buffer))
+                buffer = bytearray()
+            if not buffer:
+                buffer_addr = addr
+            buffer.extend(data)
+            while len(buffer) >= chunk_size:
+                yield Chunk(address=buffer_addr, data=list(buffer[:chunk_size]))
+                del buffer[:chunk_size]
+                buffer_addr += chunk_size
+        if buffer:
+            yield Chunk(address=buffer_addr, data=list(buffer))
+
+    def to_image(self) -> FirmwareImage:
+        """Merge the data records into address-contiguous regions.
+
+        Returns:
+            The firmware image.
+        """
+        regions: List[ImageRegion] = []
+        # The accumulated data of the region being read
+        buffer = bytearray()
+        # The start address of the region being read
+        region_addr = 0
+
+        for addr, data in self._data():
+            if not buffer:
+                # There's nothing in our buffer. This record's address will be
+                # the next region's address.
+                region_addr = addr
+            elif addr != (region_addr + len(buffer)):
+                # This new record is not contiguous. Close the previous region.
+                regions.append(ImageRegion(region_addr, bytes(buffer)))
+                buffer = bytearray()
+                region_addr = addr
+            buffer.extend(data)
+        if buffer:
+            regions.append(ImageRegion(region_addr, bytes(buffer)))
+        return FirmwareImage(
+            filename=self._filename,
+            start_address=self._start_address,
+            regions=tuple(regions),
+        )
 
+    def _data(self) -> Iterator[Tuple[int, bytes]]:
+        """Generate the absolute address and contents of each data record."""
         # Address offset set by the StartLinearAddress record type
         address_offset = 0
-        # The accumulated buffer that will yield a new Chunk
-        buffer: List[int] = []
-        # The start address of the next yielded Chunk
-        chunk_addr = 0
 
         for record in self._records:
             if record.record_type == RecordType.Data:
-                addr = record.address + address_offset
-                if not buffer:
-                    # There's nothing in our buffer. This record's address will be
-                    # the next chunk's address.
-                    chunk_addr = addr
-                elif addr != (chunk_addr + len(buffer)):
-                    # This new record is not contiguous. Yield the previous one.
-                    yield Chunk(address=chunk_addr, data=buffer)
-                    buffer = []
-                    chunk_addr = addr
-
-                for byte in record.data:
-                    buffer.append(byte)
-                    if len(buffer) == chunk_size:
-                        # Yield chunk.
-                        yield Chunk(address=chunk_addr, data=buffer)
-                        chunk_addr += len(buffer)
-                        buffer = []
+                yield record.address + address_offset, record.data
             elif record.record_type == RecordType.StartLinearAddress:
                 self._start_address = struct.unpack(">L", record.data)[0]
                 log.debug(f"Start address {self._start_address}")
@@ -265,9 +409,6 @@ class HexRecordProcessor:
                 address_offset = struct.unpack(">H", record.data)[0] << 16
                 log.debug(f"New offset to {address_offset}")
             elif record.record_type == RecordType.EOF:
-                if len(buffer):
-                    # Still something in our buffer. Yield it.
-                    yield Chunk(address=chunk_addr, data=buffer)
                 log.debug("Got EOF.")
                 break
             elif (
@@ -276,3 +417,33 @@ class HexRecordProcessor:
             ):
                 # x86 specific. Ignoring.
                 log.warning(f"Found record type {record.record_type}. Ignoring.")
+
+
+IMAGE_CACHE_SIZE: Final = 16
+"""The number of parsed hex files kept in memory."""
+
+_image_cache: "OrderedDict[bytes, FirmwareImage]" = OrderedDict()
+
+
+def load_firmware_image(file_path: Path) -> FirmwareImage:
+    """Read the hex file at file_path into a firmware image.
+
+    Images are cached by a hash of the file contents, so a file is only
+    parsed again after it changes.
+    """
+    with open(file_path, "rb") as hex_file:
+        contents = hex_file.read()
+    digest = hashlib.sha256(contents).digest()
+    image = _image_cache.get(digest)
+    if image is not None:
+        _image_cache.move_to_end(digest)
+        return image
+    records = (
+        process_line(line, idx, str(file_path))
+        for idx, line in enumerate(contents.decode().splitlines(keepends=True))
+    )
+    image = HexRecordProcessor(records, str(file_path)).to_image()
+    _image_cache[digest] = image
+    if len(_image_cache) > IMAGE_CACHE_SIZE:
+        _image_cache.popitem(last=False)
+    return image
@@ -2,7 +2,9 @@
 import logging
 import asyncio
 import os
-from typing import Optional, Dict, Tuple, AsyncIterator, Any
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Dict, Tuple, AsyncIterator, Any, Generator
 
 
 from opentrons_shared_data.errors.exceptions import (
@@ -29,7 +31,12 @@ from opentrons_hardware.firmware_update import (
     FirmwareUpdateInitiator,
     FirmwareUpdateDownloader,
     FirmwareUpdateEraser,
-    HexRecordProcessor,
+)
+from opentrons_hardware.firmware_update.downloader import DEFAULT_WINDOW_SIZE
+from opentrons_hardware.firmware_update.hex_file import (
+    Chunk,
+    FirmwareImage,
+    load_firmware_image,
 )
 from opentrons_hardware.firmware_update.errors import BootloaderNotReady
 from opentrons_hardware.firmware_update.target import Target
@@ -37,6 +44,7 @@ from .types import FirmwareUpdateStatus, StatusElement
 
 logger = logging.getLogger(__name__)
 DFU_PID = "df11"
+ERASED_FLASH_BYTE = 0xFF
 
 
 async def find_dfu_device(pid: str, expected_device_count: int) -> str:
@@ -157,6 +165,41 @@ async def upload_via_dfu(
         return False, res
 
 
+@dataclass(frozen=True)
+class CanUpdatePlan:
+    """The chunks of a firmware image that have to be sent to a node."""
+
+    image: FirmwareImage
+    skip_erased_chunks: bool
+
+    def count_chunks(self, chunk_size: int) -> int:
+        """Count the chunks that process would generate."""
+        if not self.skip_erased_chunks:
+            return self.image.count_chunks(chunk_size)
+        return sum(1 for _ in self.process(chunk_size))
+
+    def process(self, chunk_size: int) -> Generator[Chunk, None, None]:
+        """Generate the chunks to send."""
+        for chunk in self.image.process(chunk_size):
+            if self.skip_erased_chunks and _is_erased(chunk):
+                continue
+            yield chunk
+
+
+def _is_erased(chunk: Chunk) -> bool:
+    return chunk.data.count(ERASED_FLASH_BYTE) == len(chunk.data)
+
+
+def plan_can_update(image: FirmwareImage, erase: Optional[bool]) -> CanUpdatePlan:
+    """Plan the download of a firmware image to a node.
+
+    Flash that was just erased already holds 0xFF, so chunks of only 0xFF
+    (like the padding between sections) don't have to be sent. Without an
+    erase the old contents are unknown, so every chunk is sent.
+    """
+    return CanUpdatePlan(image=image, skip_erased_chunks=bool(erase))
+
+
 class RunUpdate:
     """Class for updating robot microcontroller firmware."""
 
@@ -169,6 +212,7 @@ class RunUpdate:
         timeout_seconds: float,
         erase: Optional[bool] = True,
         erase_timeout_seconds: float = 60,
+        window_size: int = DEFAULT_WINDOW_SIZE,
     ) -> None:
         """Initialize RunUpdate class.
 
@@ -178,6 +222,7 @@ class RunUpdate:
             retry_count: Number of times to retry.
             timeout_seconds: How much to wait for responses.
             erase: Whether to erase flash before updating.
+            window_size: Number of firmware chunks sent ahead of their acks.
 
         Returns:
             None
@@ -189,6 +234,7 @@ class RunUpdate:
         self._timeout_seconds = timeout_seconds
         self._erase = erase
         self._erase_timeout_seconds = erase_timeout_seconds
+        self._window_size = window_size
         self._status_dict = {
             target: (FirmwareUpdateStatus.queued, 0) for target in update_details.keys()
         }
@@ -344,6 +390,7 @@ class RunUpdate:
         timeout_seconds: float,
         erase: Optional[bool] = True,
         erase_timeout_seconds: float = 60,
+        window_size: int = DEFAULT_WINDOW_SIZE,
     ) -> None:
         """Perform a firmware update on a node target."""
         if not os.path.exists(filepath):
@@ -365,24 +412,24 @@ class RunUpdate:
         target = Target.from_single_node(node_id)
         logger.info(f"Downloading {filepath} to {target.bootloader_node}.")
         downloader = FirmwareUpdateDownloader(messenger)
-        with open(filepath) as f:
-            hex_processor = HexRecordProcessor.from_file(f)
-            async for download_progress in downloader.run(
-                node_id=target.bootloader_node,
-                hex_processor=hex_processor,
-                ack_wait_seconds=timeout_seconds,
-                retries=retry_count,
-            ):
-                await self._status_queue.put(
+        plan = plan_can_update(load_firmware_image(Path(filepath)), erase)
+        async for download_progress in downloader.run(
+            node_id=target.bootloader_node,
+            hex_processor=plan,
+            ack_wait_seconds=timeout_seconds,
+            retries=retry_count,
+            window_size=window_size,
+        ):
+            await self._status_queue.put(
+                (
+                    node_id,
                     (
-                        node_id,
-                        (
-                            FirmwareUpdateStatus.updating,
-                            download_start_progress
-                            + (0.9 - download_start_progress) * download_progress,
-                        ),
-                    )
+                        FirmwareUpdateStatus.updating,
+                        download_start_progress
+                        + (0.9 - download_start_progress) * download_progress,
+                    ),
                 )
+            )
 
         logger.info(f"Restarting FW on {target.system_node}.")
         await messenger.send(
@@ -404,6 +451,7 @@ class RunUpdate:
                 timeout_seconds=self._timeout_seconds,
                 erase=self._erase,
                 erase_timeout_seconds=self._erase_timeout_seconds,
+                window_size=self._window_size,
             )
             for target, filepath in self._update_details.items()
             if target in NodeId
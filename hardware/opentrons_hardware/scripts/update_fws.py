@@ -13,6 +13,7 @@ from opentrons_hardware.drivers.binary_usb import (
 )
 from opentrons_hardware.drivers.can_bus import build
 from opentrons_hardware.firmware_bindings import NodeId, USBTarget, FirmwareTarget
+from opentrons_hardware.firmware_update.downloader import DEFAULT_WINDOW_SIZE
 from opentrons_hardware.firmware_update.run import RunUpdate
 from .can_args import add_can_args, build_settings
 
@@ -83,6 +84,7 @@ async def run(args: argparse.Namespace) -> None:
             retry_count=retry_count,
             timeout_seconds=timeout_seconds,
             erase=erase,
+            window_size=args.window_size,
         )
         async for progress in updater.run_updates():
             logger.info(f"{progress[0]} is {progress[1][0]} and {progress[1][1]} done")
@@ -110,6 +112,12 @@ def main() -> None:
     parser.add_argument(
         "--timeout-seconds", help="Number of seconds to wait.", type=float, default=10
     )
+    parser.add_argument(
+        "--window-size",
+        help="Number of firmware chunks to send before waiting for their acks.",
+        type=int,
+        default=DEFAULT_WINDOW_SIZE,
+    )
     parser.add_argument(
         "--no-erase",
         help="Don't erase existing application from flash.",
@@ -1,10 +1,15 @@
 """Tests for the firmware downloader."""
+import asyncio
 import binascii
-from typing import List
+import contextlib
+import time
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple, cast
 
 import pytest
 from mock import AsyncMock, MagicMock, call
+from opentrons_hardware.drivers.can_bus import CanDriver, CanMessage, CanMessenger
 from opentrons_hardware.firmware_bindings import (
+    FunctionCode,
     NodeId,
     utils,
     ArbitrationId,
@@ -24,16 +29,15 @@ from opentrons_hardware.firmware_bindings.messages.fields import ErrorCodeField
 
 from opentrons_hardware.firmware_update import downloader
 from opentrons_hardware.firmware_update.errors import ErrorResponse, TimeoutResponse
-from opentrons_hardware.firmware_update.hex_file import HexRecordProcessor, Chunk
+from opentrons_hardware.firmware_update.hex_file import (
+    Chunk,
+    HexRecord,
+    HexRecordProcessor,
+    RecordType,
+)
 from tests.conftest import MockCanMessageNotifier
 
 
-@pytest.fixture
-def mock_hex_processor() -> MagicMock:
-    """Mock hex file record producer."""
-    return MagicMock(spec=HexRecordProcessor)
-
-
 @pytest.fixture
 def chunks() -> List[Chunk]:
     """Data chunks produced by hex processor."""
@@ -44,6 +48,14 @@ def chunks() -> List[Chunk]:
     ]
 
 
+@pytest.fixture
+def mock_hex_processor(chunks: List[Chunk]) -> MagicMock:
+    """Mock hex file record producer."""
+    mock = MagicMock(spec=HexRecordProcessor)
+    mock.count_chunks.return_value = len(chunks)
+    return mock
+
+
 @pytest.fixture
 def crc32(chunks: List[Chunk]) -> int:
     """crc32 of data chunks."""
@@ -299,3 +311,229 @@ async def test_messaging_complete_no_response(
             NodeId.gantry_y_bootloader, mock_hex_processor, 0.5
         ):
             pass
+
+
+class SimulatedBootloader:
+    """A bootloader node on a virtual CAN bus.
+
+    Data acks are sent back after a delay, each on its own, like a node
+    that receives a frame while it is still writing the previous one.
+    """
+
+    def __init__(
+        self,
+        driver: CanDriver,
+        node_id: NodeId,
+        ack_delay: float,
+        dropped_acks: Set[int],
+        error_acks: Set[int],
+    ) -> None:
+        """Constructor."""
+        self._driver = driver
+        self._node_id = node_id
+        self._ack_delay = ack_delay
+        self._dropped_acks = dropped_acks
+        self._error_acks = error_acks
+        self.flash: Dict[int, bytes] = {}
+        self.complete: Optional[payloads.FirmwareUpdateComplete] = None
+        self.data_messages = 0
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def start(self) -> None:
+        """Start handling messages."""
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop handling messages."""
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+
+    async def _run(self) -> None:
+        async for can_message in self._driver:
+            parts = can_message.arbitration_id.parts
+            if parts.node_id != self._node_id:
+                continue
+            if parts.message_id == FirmwareUpdateData.message_id:
+                self._handle_data(
+                    cast(
+                        payloads.FirmwareUpdateData,
+                        payloads.FirmwareUpdateData.build(can_message.data),
+                    )
+                )
+            elif parts.message_id == FirmwareUpdateComplete.message_id:
+                self.complete = cast(
+                    payloads.FirmwareUpdateComplete,
+                    payloads.FirmwareUpdateComplete.build(can_message.data),
+                )
+                await self._send(
+                    FirmwareUpdateCompleteAcknowledge(
+                        payload=payloads.FirmwareUpdateAcknowledge(
+                            error_code=ErrorCodeField(ErrorCode.ok)
+                        )
+                    )
+                )
+
+    def _handle_data(self, payload: payloads.FirmwareUpdateData) -> None:
+        self.data_messages += 1
+        address = payload.address.value
+        if address in self._dropped_acks:
+            self._dropped_acks.remove(address)
+            return
+        if address in self._error_acks:
+            self._error_acks.remove(address)
+            error_code = ErrorCode.bad_checksum
+        else:
+            self.flash[address] = payload.data.value[: payload.num_bytes.value]
+            error_code = ErrorCode.ok
+        ack = FirmwareUpdateDataAcknowledge(
+            payload=payloads.FirmwareUpdateDataAcknowledge(
+                address=payload.address, error_code=ErrorCodeField(error_code)
+            )
+        )
+        asyncio.get_running_loop().call_later(
+            self._ack_delay, lambda: asyncio.ensure_future(self._send(ack))
+        )
+
+    async def _send(self, message: MessageDefinition) -> None:
+        await self._driver.send(
+            CanMessage(
+                arbitration_id=ArbitrationId(
+                    parts=ArbitrationIdParts(
+                        message_id=message.message_id,
+                        node_id=NodeId.host,
+                        function_code=FunctionCode.network_management,
+                        originating_node_id=self._node_id,
+                    )
+                ),
+                data=message.payload.serialize(),
+            )
+        )
+
+
+@pytest.fixture
+def firmware_image() -> bytes:
+    """Firmware image downloaded to the simulated node."""
+    return bytes(i % 251 for i in range(48 * 30 + 16))
+
+
+@pytest.fixture
+def hex_processor(firmware_image: bytes) -> HexRecordProcessor:
+    """Hex records holding the firmware image."""
+    records = [
+        HexRecord(
+            byte_count=len(firmware_image[i : i + 16]),
+            address=i,
+            record_type=RecordType.Data,
+            data=firmware_image[i : i + 16],
+            checksum=0,
+        )
+        for i in range(0, len(firmware_image), 16)
+    ]
+    records.append(
+        HexRecord(
+            byte_count=0, address=0, record_type=RecordType.EOF, data=b"", checksum=0
+        )
+    )
+    return HexRecordProcessor(records, "firmware.hex")
+
+
+@pytest.fixture
+async def virtual_bus_messenger() -> AsyncIterator[CanMessenger]:
+    """A host messenger on a virtual CAN bus."""
+    driver = await CanDriver.build(
+        channel="firmware_update", interface="virtual", bitrate=0
+    )
+    messenger = CanMessenger(driver)
+    messenger.start()
+    yield messenger
+    await messenger.stop()
+    driver.shutdown()
+
+
+async def _download_to_simulated_node(
+    messenger: CanMessenger,
+    hex_processor: HexRecordProcessor,
+    window_size: int,
+    dropped_acks: Set[int],
+    error_acks: Set[int],
+) -> Tuple[SimulatedBootloader, float]:
+    """Download the hex records to a simulated node, timing the download."""
+    node_driver = await CanDriver.build(
+        channel="firmware_update", interface="virtual", bitrate=0
+    )
+    node = SimulatedBootloader(
+        node_driver,
+        NodeId.gantry_y_bootloader,
+        ack_delay=0.01,
+        dropped_acks=dropped_acks,
+        error_acks=error_acks,
+    )
+    node.start()
+    try:
+        start = time.monotonic()
+        progress = [
+            progress
+            async for progress in downloader.FirmwareUpdateDownloader(messenger).run(
+                NodeId.gantry_y_bootloader,
+                hex_processor,
+                ack_wait_seconds=0.2,
+                window_size=window_size,
+            )
+        ]
+        elapsed = time.monotonic() - start
+    finally:
+        await node.stop()
+        node_driver.shutdown()
+    assert progress == sorted(progress)
+    assert progress[-1] == 1
+    return node, elapsed
+
+
+@pytest.mark.parametrize("window_size", [1, 4, 16])
+async def test_download_to_simulated_node(
+    virtual_bus_messenger: CanMessenger,
+    hex_processor: HexRecordProcessor,
+    firmware_image: bytes,
+    window_size: int,
+) -> None:
+    """It should write the whole image, resending chunks whose ack was lost or an error."""
+    node, _ = await _download_to_simulated_node(
+        virtual_bus_messenger,
+        hex_processor,
+        window_size,
+        dropped_acks={0x30, 0x300},
+        error_acks={0x60},
+    )
+
+    assert b"".join(data for _, data in sorted(node.flash.items())) == firmware_image
+    assert node.data_messages == hex_processor.count_chunks(48) + 3
+    assert node.complete is not None
+    assert node.complete.num_messages.value == hex_processor.count_chunks(48)
+    assert node.complete.crc32.value == binascii.crc32(firmware_image)
+
+
+async def test_windowed_download_is_faster(
+    virtual_bus_messenger: CanMessenger, hex_processor: HexRecordProcessor
+) -> None:
+    """It should not wait out each ack's delay when several chunks are in flight."""
+    _, stop_and_wait = await _download_to_simulated_node(
+        virtual_bus_messenger, hex_processor, 1, set(), set()
+    )
+    _, windowed = await _download_to_simulated_node(
+        virtual_bus_messenger, hex_processor, 8, set(), set()
+    )
+
+    assert windowed < stop_and_wait / 2
+
+
+async def test_window_size_must_be_positive(
+    subject: downloader.FirmwareUpdateDownloader, mock_hex_processor: MagicMock
+) -> None:
+    """It should reject a window with no room for a chunk."""
+    with pytest.raises(ValueError):
+        async for progress in subject.run(
+            NodeId.gantry_y_bootloader, mock_hex_processor, 10, window_size=0
+        ):
+            pass
@@ -1,5 +1,6 @@
 """Tests for hex file processing."""
-from typing import Iterable, List
+from pathlib import Path
+from typing import Iterable, Iterator, List
 
 import pytest
 from opentrons_hardware.firmware_update import hex_file
@@ -250,6 +251,7 @@ def test_process(
 
     assert list(subject.process(size)) == expected
     assert subject.start_address == 0x8090A0B0
+    assert subject.count_chunks(size) == len(expected)
 
 
 def test_process_failure_zero_size(hex_records: Iterable[hex_file.HexRecord]) -> None:
@@ -257,3 +259,71 @@ def test_process_failure_zero_size(hex_records: Iterable[hex_file.HexRecord]) ->
     subject = hex_file.HexRecordProcessor(records=hex_records, filename="dummy-name")
     with pytest.raises(hex_file.BadChunkSizeException):
         list(subject.process(0))
+
+
+def _data_line(address: int, data: bytes) -> str:
+    record = bytes([len(data), address >> 8, address & 0xFF, 0]) + data
+    return f":{record.hex().upper()}{(-sum(record)) & 0xFF:02X}\n"
+
+
+def test_load_firmware_image(tmp_path: Path) -> None:
+    """It should parse a hex file once, until its contents change."""
+    hex_path = tmp_path / "firmware.hex"
+    hex_path.write_text(
+        ":020000040800F2\n"
+        + _data_line(0x0, b"\x00\x01\x02\x03")
+        + _data_line(0x4, b"\x04\x05")
+        + _data_line(0x10, b"\x06")
+        + ":00000001FF\n"
+    )
+
+    image = hex_file.load_firmware_image(hex_path)
+    assert image.regions == (
+        hex_file.ImageRegion(address=0x08000000, data=b"\x00\x01\x02\x03\x04\x05"),
+        hex_file.ImageRegion(address=0x08000010, data=b"\x06"),
+    )
+    assert list(image.process(4)) == list(
+        hex_file.HexRecordProcessor.from_file_path(hex_path).process(4)
+    )
+    assert hex_file.load_firmware_image(hex_path) is image
+
+    hex_path.write_text(_data_line(0x0, b"\x07") + ":00000001FF\n")
+    assert hex_file.load_firmware_image(hex_path).regions == (
+        hex_file.ImageRegion(address=0x0, data=b"\x07"),
+    )
+
+
+def test_process_streams_records(hex_records: Iterable[hex_file.HexRecord]) -> None:
+    """It should only read the records needed for the next chunk."""
+    records = list(hex_records)
+    records_read = 0
+
+    def _stream() -> Iterator[hex_file.HexRecord]:
+        nonlocal records_read
+        for record in records:
+            records_read += 1
+            yield record
+
+    subject = hex_file.HexRecordProcessor(records=_stream(), filename="dummy-name")
+    chunks = subject.process(4)
+
+    assert next(chunks) == hex_file.Chunk(address=0x10, data=[0, 1, 2, 3])
+    assert records_read == 1
+
+
+def test_from_file_path_reads_file_per_pass(tmp_path: Path) -> None:
+    """It should count and then process the chunks of a hex file."""
+    hex_path = tmp_path / "firmware.hex"
+    hex_path.write_text(
+        _data_line(0x0, b"\x00\x01\x02\x03\x04")
+        + _data_line(0x10, b"\x05")
+        + ":00000001FF\n"
+    )
+    subject = hex_file.HexRecordProcessor.from_file_path(hex_path)
+
+    assert subject.count_chunks(4) == 3
+    assert list(subject.process(4)) == [
+        hex_file.Chunk(address=0x0, data=[0, 1, 2, 3]),
+        hex_file.Chunk(address=0x4, data=[4]),
+        hex_file.Chunk(address=0x10, data=[5]),
+    ]
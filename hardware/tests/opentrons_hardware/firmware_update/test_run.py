@@ -1,7 +1,7 @@
 """Tests for run module."""
 import os
 from pathlib import Path
-from typing import Iterator, Dict
+from typing import Iterator, Dict, List
 
 import mock
 import pytest
@@ -15,9 +15,14 @@ from opentrons_hardware.firmware_update import (
     FirmwareUpdateInitiator,
     FirmwareUpdateDownloader,
     FirmwareUpdateEraser,
-    HexRecordProcessor,
     RunUpdate,
 )
+from opentrons_hardware.firmware_update.hex_file import (
+    Chunk,
+    FirmwareImage,
+    ImageRegion,
+)
+from opentrons_hardware.firmware_update.run import CanUpdatePlan, plan_can_update
 from opentrons_hardware.firmware_update.target import Target
 
 
@@ -51,9 +56,9 @@ def mock_eraser_run() -> Iterator[AsyncMock]:
 
 
 @pytest.fixture
-def mock_hex_record_builder() -> Iterator[MagicMock]:
-    """Mock builder function."""
-    with mock.patch.object(HexRecordProcessor, "from_file") as p:
+def mock_image_loader() -> Iterator[MagicMock]:
+    """Mock firmware image loader."""
+    with mock.patch("opentrons_hardware.firmware_update.run.load_firmware_image") as p:
         yield p
 
 
@@ -69,7 +74,7 @@ async def test_run_update(
     mock_initiator_run: AsyncMock,
     mock_downloader_run: AsyncMock,
     mock_eraser_run: AsyncMock,
-    mock_hex_record_builder: MagicMock,
+    mock_image_loader: MagicMock,
     should_erase: bool,
     mock_path_exists: MagicMock,
     hex_file_path: str,
@@ -78,8 +83,8 @@ async def test_run_update(
     mock_can_messenger = AsyncMock()
     mock_usb_messenger = AsyncMock()
 
-    mock_hex_record_processor = MagicMock()
-    mock_hex_record_builder.return_value = mock_hex_record_processor
+    mock_image = MagicMock()
+    mock_image_loader.return_value = mock_image
 
     target = Target.from_single_node(NodeId.head)
     update_details: Dict[FirmwareTarget, str] = {
@@ -114,9 +119,10 @@ async def test_run_update(
         mock_eraser_run.assert_not_called()
     mock_downloader_run.assert_called_once_with(
         node_id=target.bootloader_node,
-        hex_processor=mock_hex_record_processor,
+        hex_processor=CanUpdatePlan(image=mock_image, skip_erased_chunks=should_erase),
         ack_wait_seconds=11,
         retries=12,
+        window_size=1,
     )
     mock_can_messenger.send.assert_called_once_with(
         node_id=target.bootloader_node, message=FirmwareUpdateStartApp()
@@ -128,7 +134,7 @@ async def test_run_updates(
     mock_initiator_run: AsyncMock,
     mock_downloader_run: AsyncMock,
     mock_eraser_run: AsyncMock,
-    mock_hex_record_builder: MagicMock,
+    mock_image_loader: MagicMock,
     should_erase: bool,
 ) -> None:
     """It should call all the functions."""
@@ -136,8 +142,8 @@ async def test_run_updates(
     mock_usb_messenger = AsyncMock()
     hex_file_1 = str()
     hex_file_2 = str()
-    mock_hex_record_processor = MagicMock()
-    mock_hex_record_builder.return_value = mock_hex_record_processor
+    mock_image = MagicMock()
+    mock_image_loader.return_value = mock_image
     target_1 = Target.from_single_node(NodeId.gantry_x)
     target_2 = Target.from_single_node(NodeId.gantry_y)
     update_details: Dict[FirmwareTarget, str] = {
@@ -178,16 +184,22 @@ async def test_run_updates(
         [
             mock.call(
                 node_id=target_1.bootloader_node,
-                hex_processor=mock_hex_record_processor,
+                hex_processor=CanUpdatePlan(
+                    image=mock_image, skip_erased_chunks=should_erase
+                ),
                 ack_wait_seconds=5,
                 retries=3,
+                window_size=1,
             ),
             mock.call().__aiter__(),
             mock.call(
                 node_id=target_2.bootloader_node,
-                hex_processor=mock_hex_record_processor,
+                hex_processor=CanUpdatePlan(
+                    image=mock_image, skip_erased_chunks=should_erase
+                ),
                 ack_wait_seconds=5,
                 retries=3,
+                window_size=1,
             ),
             mock.call().__aiter__(),
         ]
@@ -203,3 +215,41 @@ async def test_run_updates(
             ),
         ]
     )
+
+
+@pytest.mark.parametrize(
+    argnames=["erase", "expected"],
+    argvalues=[
+        [
+            True,
+            [
+                Chunk(address=0x8000, data=[1, 2, 3, 0xFF]),
+                Chunk(address=0x8008, data=[0xFF, 0xFF, 4]),
+                Chunk(address=0x9000, data=[5]),
+            ],
+        ],
+        [
+            False,
+            [
+                Chunk(address=0x8000, data=[1, 2, 3, 0xFF]),
+                Chunk(address=0x8004, data=[0xFF, 0xFF, 0xFF, 0xFF]),
+                Chunk(address=0x8008, data=[0xFF, 0xFF, 4]),
+                Chunk(address=0x9000, data=[5]),
+            ],
+        ],
+    ],
+)
+def test_plan_can_update(erase: bool, expected: List[Chunk]) -> None:
+    """It should only skip chunks of erased flash after an erase."""
+    image = FirmwareImage(
+        filename="image.hex",
+        start_address=0x8000,
+        regions=(
+            ImageRegion(address=0x8000, data=bytes([1, 2, 3] + [0xFF] * 7 + [4])),
+            ImageRegion(address=0x9000, data=bytes([5])),
+        ),
+    )
+    plan = plan_can_update(image, erase)
+
+    assert list(plan.process(4)) == expected
+    assert plan.count_chunks(4) == len(expected)
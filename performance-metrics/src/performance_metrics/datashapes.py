@@ -2,6 +2,7 @@
 
 from enum import Enum
 import dataclasses
+import struct
 from typing import Tuple
 
 
@@ -37,6 +38,13 @@ class RobotContextState(Enum):
         raise ValueError(f"Invalid state id: {state_id}")
 
 
+class StorageFormat(Enum):
+    """Enum representing the on-disk formats the tracked data can be flushed in."""
+
+    CSV = "csv"
+    BINARY = "binary"
+
+
 @dataclasses.dataclass(frozen=True)
 class RawContextData:
     """Represents raw duration data with context state information.
@@ -65,3 +73,18 @@ class RawContextData:
             self.func_start,
             self.duration_end - self.duration_start,
         )
+
+    @classmethod
+    def binary_struct(cls) -> struct.Struct:
+        """Returns the fixed-size little-endian record layout used for binary storage.
+
+        Each record holds the same columns as `headers`, in the same order.
+        """
+        return _RAW_CONTEXT_DATA_STRUCT
+
+    def binary_row(self) -> bytes:
+        """Returns the raw context data packed as a binary record."""
+        return _RAW_CONTEXT_DATA_STRUCT.pack(*self.csv_row())
+
+
+_RAW_CONTEXT_DATA_STRUCT = struct.Struct("<Bqq")
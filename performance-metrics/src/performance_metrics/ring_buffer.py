@@ -0,0 +1,136 @@
+"""Fixed-size, preallocated storage for tracked robot context data."""
+
+from array import array
+from threading import Lock
+from typing import Iterator, NamedTuple
+
+from performance_metrics.datashapes import RawContextData, RobotContextState
+
+
+class RawContextDataColumns(NamedTuple):
+    """A chronologically ordered, column-oriented copy of stored context data.
+
+    Attributes:
+    - state_ids (array): The state ID of each sample.
+    - func_starts (array): The function start time of each sample.
+    - duration_starts (array): The duration measurement start time of each sample.
+    - duration_ends (array): The duration measurement end time of each sample.
+    """
+
+    state_ids: "array[int]"
+    func_starts: "array[int]"
+    duration_starts: "array[int]"
+    duration_ends: "array[int]"
+
+    def __len__(self) -> int:
+        """Returns the number of samples in the columns."""
+        return len(self.state_ids)
+
+    def csv_rows(self) -> Iterator[tuple[int, int, int]]:
+        """Yields the samples in the same shape as `RawContextData.csv_row`."""
+        for state_id, func_start, duration_start, duration_end in zip(
+            self.state_ids, self.func_starts, self.duration_starts, self.duration_ends
+        ):
+            yield state_id, func_start, duration_end - duration_start
+
+
+class RawContextDataRingBuffer:
+    """A ring buffer of context data samples backed by preallocated arrays.
+
+    Samples are stored column-wise in fixed-size integer arrays, so recording a
+    sample never allocates. When the buffer is full, the oldest sample is
+    overwritten and counted in `dropped`.
+
+    Recording and draining are guarded by a lock, because tracked functions may
+    run on the hardware thread as well as on the event loop thread.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError(f"Capacity must be positive, got {capacity}")
+        self._capacity = capacity
+        self._state_ids = array("B", bytes(capacity))
+        self._func_starts = array("q", bytes(8 * capacity))
+        self._duration_starts = array("q", bytes(8 * capacity))
+        self._duration_ends = array("q", bytes(8 * capacity))
+        self._next_index = 0
+        self._count = 0
+        self._dropped = 0
+        self._lock = Lock()
+
+    @property
+    def capacity(self) -> int:
+        """The maximum number of samples held before old ones are overwritten."""
+        return self._capacity
+
+    @property
+    def dropped(self) -> int:
+        """The number of samples overwritten before they could be drained."""
+        return self._dropped
+
+    def __len__(self) -> int:
+        """Returns the number of samples currently held."""
+        return self._count
+
+    def __getitem__(self, index: int) -> RawContextData:
+        """Returns the sample at the given position, oldest first."""
+        with self._lock:
+            if index < 0:
+                index += self._count
+            if not 0 <= index < self._count:
+                raise IndexError("RawContextDataRingBuffer index out of range")
+            physical_index = (self._next_index - self._count + index) % self._capacity
+            return RawContextData(
+                func_start=self._func_starts[physical_index],
+                duration_start=self._duration_starts[physical_index],
+                duration_end=self._duration_ends[physical_index],
+                state=RobotContextState.from_id(self._state_ids[physical_index]),
+            )
+
+    def __iter__(self) -> Iterator[RawContextData]:
+        """Iterates over the held samples, oldest first."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def append(
+        self,
+        func_start: int,
+        duration_start: int,
+        duration_end: int,
+        state: RobotContextState,
+    ) -> None:
+        """Records a sample, overwriting the oldest one if the buffer is full."""
+        with self._lock:
+            index = self._next_index
+            self._state_ids[index] = state.state_id
+            self._func_starts[index] = func_start
+            self._duration_starts[index] = duration_start
+            self._duration_ends[index] = duration_end
+            self._next_index = (index + 1) % self._capacity
+            if self._count == self._capacity:
+                self._dropped += 1
+            else:
+                self._count += 1
+
+    def drain(self) -> RawContextDataColumns:
+        """Returns a chronologically ordered copy of the held samples and clears them."""
+        with self._lock:
+            start = (self._next_index - self._count) % self._capacity
+            end = start + self._count
+            if end <= self._capacity:
+                columns = RawContextDataColumns(
+                    self._state_ids[start:end],
+                    self._func_starts[start:end],
+                    self._duration_starts[start:end],
+                    self._duration_ends[start:end],
+                )
+            else:
+                wrapped_end = end - self._capacity
+                columns = RawContextDataColumns(
+                    self._state_ids[start:] + self._state_ids[:wrapped_end],
+                    self._func_starts[start:] + self._func_starts[:wrapped_end],
+                    self._duration_starts[start:] + self._duration_starts[:wrapped_end],
+                    self._duration_ends[start:] + self._duration_ends[:wrapped_end],
+                )
+            self._count = 0
+            return columns
@@ -1,35 +1,95 @@
 """Module for tracking robot context and execution duration for different operations."""
 
 import csv
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
 import os
 
 from functools import wraps
 from time import perf_counter_ns, clock_gettime_ns, CLOCK_REALTIME
-from typing import Callable, TypeVar
+from types import TracebackType
+from typing import Any, Callable, Optional, Type, TypeVar, Union
 from typing_extensions import ParamSpec
-from collections import deque
 from performance_metrics.datashapes import (
     RawContextData,
     RobotContextState,
+    StorageFormat,
+)
+from performance_metrics.ring_buffer import (
+    RawContextDataColumns,
+    RawContextDataRingBuffer,
 )
 
 P = ParamSpec("P")
 R = TypeVar("R")
 
+DEFAULT_BUFFER_CAPACITY = 10_000
+
+
+class _TrackedBlock:
+    """A sync and async context manager that tracks the duration of its body."""
+
+    def __init__(
+        self, storage: RawContextDataRingBuffer, state: RobotContextState
+    ) -> None:
+        self._storage = storage
+        self._state = state
+        self._function_start_time = 0
+        self._duration_start_time = 0
+
+    def __enter__(self) -> None:
+        self._function_start_time = clock_gettime_ns(CLOCK_REALTIME)
+        self._duration_start_time = perf_counter_ns()
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self._storage.append(
+            self._function_start_time,
+            self._duration_start_time,
+            perf_counter_ns(),
+            self._state,
+        )
+
+    async def __aenter__(self) -> None:
+        self.__enter__()
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.__exit__(exc_type, exc_val, exc_tb)
+
 
 class RobotContextTracker:
     """Tracks and stores robot context and execution duration for different operations."""
 
-    def __init__(self, storage_file_path: Path, should_track: bool = False) -> None:
-        """Initializes the RobotContextTracker with an empty storage list."""
-        self._storage: deque[RawContextData] = deque()
+    def __init__(
+        self,
+        storage_file_path: Path,
+        should_track: bool = False,
+        storage_format: StorageFormat = StorageFormat.CSV,
+        buffer_capacity: int = DEFAULT_BUFFER_CAPACITY,
+    ) -> None:
+        """Initializes the RobotContextTracker with an empty, preallocated storage buffer."""
+        self._storage = RawContextDataRingBuffer(buffer_capacity)
         self._storage_file_path = storage_file_path
+        self._storage_format = storage_format
         self._should_track = should_track
+        self._writer: Optional[ThreadPoolExecutor] = None
 
     def track(self, state: RobotContextState) -> Callable:  # type: ignore
         """Decorator factory for tracking the execution duration and state of robot operations.
 
+        Coroutine functions are timed until the coroutine finishes, not until it is created.
+
         Args:
             state: The state to track for the decorated function.
 
@@ -41,35 +101,95 @@ class RobotContextTracker:
             if not self._should_track:
                 return func
 
+            storage = self._storage
+
+            if inspect.iscoroutinefunction(func):
+
+                @wraps(func)
+                async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+                    function_start_time = clock_gettime_ns(CLOCK_REALTIME)
+                    duration_start_time = perf_counter_ns()
+                    try:
+                        return await func(*args, **kwargs)
+                    finally:
+                        storage.append(
+                            function_start_time,
+                            duration_start_time,
+                            perf_counter_ns(),
+                            state,
+                        )
+
+                return async_wrapper  # type: ignore[return-value]
+
             @wraps(func)
             def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
                 function_start_time = clock_gettime_ns(CLOCK_REALTIME)
                 duration_start_time = perf_counter_ns()
                 try:
-                    result = func(*args, **kwargs)
+                    return func(*args, **kwargs)
                 finally:
-                    duration_end_time = perf_counter_ns()
-                    self._storage.append(
-                        RawContextData(
-                            function_start_time,
-                            duration_start_time,
-                            duration_end_time,
-                            state,
-                        )
+                    storage.append(
+                        function_start_time,
+                        duration_start_time,
+                        perf_counter_ns(),
+                        state,
                     )
-                return result
 
             return wrapper
 
         return inner_decorator
 
-    def store(self) -> None:
-        """Returns the stored context data and clears the storage list."""
-        stored_data = self._storage.copy()
-        self._storage.clear()
-        rows_to_write = [context_data.csv_row() for context_data in stored_data]
+    def track_block(
+        self, state: RobotContextState
+    ) -> Union[_TrackedBlock, "nullcontext[None]"]:
+        """Returns a context manager tracking the duration of the block it wraps.
+
+        The returned object can be used with both `with` and `async with`.
+
+        Args:
+            state: The state to track for the block.
+        """
+        if not self._should_track:
+            return nullcontext()
+        return _TrackedBlock(self._storage, state)
+
+    def store(self, wait: bool = True) -> None:
+        """Flushes the stored context data to the storage file and clears the storage buffer.
+
+        The samples are copied out of the buffer immediately, and then formatted and
+        written by a background thread, so tracking can continue while the write
+        happens. Writes are performed in the order `store` is called.
+
+        Args:
+            wait: Whether to block until the data has been written.
+        """
+        data = self._storage.drain()
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="performance-metrics-writer"
+            )
+        write_result = self._writer.submit(self._write, data)
+        if wait:
+            write_result.result()
+
+    def close(self) -> None:
+        """Waits for any pending writes and stops the background writer thread."""
+        if self._writer is not None:
+            self._writer.shutdown(wait=True)
+            self._writer = None
+
+    def _write(self, data: RawContextDataColumns) -> None:
         os.makedirs(self._storage_file_path.parent, exist_ok=True)
-        with open(self._storage_file_path, "a") as storage_file:
-            writer = csv.writer(storage_file)
-            writer.writerow(RawContextData.headers())
-            writer.writerows(rows_to_write)
+        if self._storage_format == StorageFormat.BINARY:
+            record = RawContextData.binary_struct()
+            buffer = bytearray(record.size * len(data))
+            for index, row in enumerate(data.csv_rows()):
+                record.pack_into(buffer, index * record.size, *row)
+            with open(self._storage_file_path, "ab") as storage_file:
+                storage_file.write(buffer)
+        else:
+            with open(self._storage_file_path, "a", newline="") as storage_file:
+                writer = csv.writer(storage_file)
+                if storage_file.tell() == 0:
+                    writer.writerow(RawContextData.headers())
+                writer.writerows(data.csv_rows())
@@ -3,9 +3,14 @@
 import asyncio
 from pathlib import Path
 import pytest
+from typing import Callable
 from performance_metrics.robot_context_tracker import RobotContextTracker
-from performance_metrics.datashapes import RobotContextState
-from time import sleep
+from performance_metrics.datashapes import (
+    RawContextData,
+    RobotContextState,
+    StorageFormat,
+)
+from time import perf_counter, sleep
 
 # Corrected times in seconds
 STARTING_TIME = 0.001
@@ -249,3 +254,188 @@ async def test_storing_to_file(tmp_path: Path) -> None:
         assert (
             len(lines) == 4
         ), "All stored data + header should be written to the file."
+
+
+@pytest.mark.asyncio
+async def test_async_operation_timed_until_completion(
+    robot_context_tracker: RobotContextTracker,
+) -> None:
+    """Tests that async operations are timed until they finish, not until they are created."""
+    sleep_time = 0.05
+
+    @robot_context_tracker.track(state=RobotContextState.RUNNING_PROTOCOL)
+    async def async_running_operation() -> int:
+        await asyncio.sleep(sleep_time)
+        return 42
+
+    assert await async_running_operation() == 42
+
+    duration_data = robot_context_tracker._storage[0]
+    measured_duration = duration_data.duration_end - duration_data.duration_start
+    assert measured_duration >= sleep_time * 1e9
+
+
+def test_sync_block_tracking(robot_context_tracker: RobotContextTracker) -> None:
+    """Tests tracking a block of synchronous code."""
+    with robot_context_tracker.track_block(state=RobotContextState.CALIBRATING):
+        sleep(CALIBRATING_TIME)
+
+    assert len(robot_context_tracker._storage) == 1
+    duration_data = robot_context_tracker._storage[0]
+    assert duration_data.state == RobotContextState.CALIBRATING
+    assert (
+        duration_data.duration_end - duration_data.duration_start
+        >= CALIBRATING_TIME * 1e9
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_block_tracking(robot_context_tracker: RobotContextTracker) -> None:
+    """Tests tracking a block of asynchronous code, including failures."""
+    async with robot_context_tracker.track_block(state=RobotContextState.CALIBRATING):
+        await asyncio.sleep(CALIBRATING_TIME)
+
+    with pytest.raises(RuntimeError):
+        async with robot_context_tracker.track_block(
+            state=RobotContextState.SHUTTING_DOWN
+        ):
+            raise RuntimeError("Simulated async block failure")
+
+    assert len(robot_context_tracker._storage) == 2
+    assert robot_context_tracker._storage[0].state == RobotContextState.CALIBRATING
+    assert (
+        robot_context_tracker._storage[0].duration_end
+        - robot_context_tracker._storage[0].duration_start
+        >= CALIBRATING_TIME * 1e9
+    )
+    assert robot_context_tracker._storage[1].state == RobotContextState.SHUTTING_DOWN
+
+
+def test_no_tracking_is_passthrough(tmp_path: Path) -> None:
+    """Tests that disabled tracking adds no wrapper around functions or blocks."""
+    robot_context_tracker = RobotContextTracker(tmp_path, should_track=False)
+
+    def operation() -> None:
+        pass
+
+    assert robot_context_tracker.track(RobotContextState.STARTING_UP)(operation) is (
+        operation
+    )
+    with robot_context_tracker.track_block(state=RobotContextState.STARTING_UP):
+        operation()
+
+    assert len(robot_context_tracker._storage) == 0
+
+
+def test_storage_overwrites_oldest_when_full(tmp_path: Path) -> None:
+    """Tests that the storage buffer keeps only the most recent samples."""
+    robot_context_tracker = RobotContextTracker(
+        tmp_path, should_track=True, buffer_capacity=3
+    )
+    states = [
+        RobotContextState.STARTING_UP,
+        RobotContextState.CALIBRATING,
+        RobotContextState.ANALYZING_PROTOCOL,
+        RobotContextState.RUNNING_PROTOCOL,
+        RobotContextState.SHUTTING_DOWN,
+    ]
+    for state in states:
+        with robot_context_tracker.track_block(state=state):
+            pass
+
+    assert len(robot_context_tracker._storage) == 3
+    assert robot_context_tracker._storage.dropped == 2
+    assert [data.state for data in robot_context_tracker._storage] == states[2:]
+
+
+def test_storing_to_file_writes_header_once(tmp_path: Path) -> None:
+    """Tests that repeated flushes append rows without repeating the header."""
+    file_path = tmp_path / "test_file.csv"
+    robot_context_tracker = RobotContextTracker(
+        file_path, should_track=True, buffer_capacity=2
+    )
+
+    for _ in range(3):
+        with robot_context_tracker.track_block(state=RobotContextState.CALIBRATING):
+            pass
+        robot_context_tracker.store()
+    robot_context_tracker.store()
+
+    with open(file_path, "r") as file:
+        lines = file.read().splitlines()
+    assert lines[0] == ",".join(RawContextData.headers())
+    assert len(lines) == 4
+    assert all(
+        line.startswith(f"{RobotContextState.CALIBRATING.state_id},")
+        for line in lines[1:]
+    )
+
+
+def test_storing_to_binary_file(tmp_path: Path) -> None:
+    """Tests flushing the tracked data as binary records from the background writer."""
+    file_path = tmp_path / "test_file.bin"
+    robot_context_tracker = RobotContextTracker(
+        file_path, should_track=True, storage_format=StorageFormat.BINARY
+    )
+
+    with robot_context_tracker.track_block(state=RobotContextState.STARTING_UP):
+        sleep(STARTING_TIME)
+    robot_context_tracker.store(wait=False)
+    with robot_context_tracker.track_block(state=RobotContextState.SHUTTING_DOWN):
+        sleep(SHUTTING_DOWN_TIME)
+    robot_context_tracker.store(wait=False)
+    robot_context_tracker.close()
+
+    records = list(RawContextData.binary_struct().iter_unpack(file_path.read_bytes()))
+    assert [record[0] for record in records] == [
+        RobotContextState.STARTING_UP.state_id,
+        RobotContextState.SHUTTING_DOWN.state_id,
+    ]
+    assert records[0][2] >= STARTING_TIME * 1e9
+    assert records[1][2] >= SHUTTING_DOWN_TIME * 1e9
+
+
+def test_untracked_functions_are_not_wrapped(tmp_path: Path) -> None:
+    """Tests that a disabled tracker adds no per-call overhead at all."""
+    robot_context_tracker = RobotContextTracker(
+        tmp_path / "overhead.csv", should_track=False
+    )
+
+    def operation() -> None:
+        pass
+
+    tracked_operation = robot_context_tracker.track(
+        state=RobotContextState.RUNNING_PROTOCOL
+    )(operation)
+
+    assert tracked_operation is operation
+
+
+def test_per_call_overhead(tmp_path: Path) -> None:
+    """Tests that tracking keeps a trivial function cheap to call.
+
+    The bound is orders of magnitude above the expected overhead, so it only
+    catches regressions like writing to disk on every call.
+    """
+    calls = 10_000
+    robot_context_tracker = RobotContextTracker(
+        tmp_path / "overhead.csv", should_track=True, buffer_capacity=calls
+    )
+
+    def operation() -> None:
+        pass
+
+    tracked_operation = robot_context_tracker.track(
+        state=RobotContextState.RUNNING_PROTOCOL
+    )(operation)
+
+    def time_calls(func: Callable[[], None]) -> float:
+        start = perf_counter()
+        for _ in range(calls):
+            func()
+        return perf_counter() - start
+
+    baseline = min(time_calls(operation) for _ in range(3))
+    tracked = min(time_calls(tracked_operation) for _ in range(3))
+
+    assert (tracked - baseline) / calls < 200e-6
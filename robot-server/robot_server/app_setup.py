@@ -25,6 +25,7 @@ from .persistence.fastapi_dependencies import (
 )
 from .router import router
 from .service.logging import initialize_logging
+from .service.startup_profiler import initialize_startup_profiler, startup_phase
 from .service.task_runner import (
     initialize_task_runner,
     clean_up_task_runner,
@@ -33,11 +34,13 @@ from .settings import get_settings
 from .runs.dependencies import (
     start_light_control_task,
     mark_light_control_startup_finished,
+    clean_up_engine_store,
 )
 
 from .service.notifications import (
     initialize_notifications,
     clean_up_notification_client,
+    clean_up_runs_publisher,
 )
 
 log = logging.getLogger(__name__)
@@ -75,6 +78,7 @@ app.include_router(router=router)
 @app.on_event("startup")
 async def on_startup() -> None:
     """Handle app startup."""
+    initialize_startup_profiler(app_state=app.state)
     settings = get_settings()
 
     if settings.persistence_directory == "automatically_make_temporary":
@@ -106,9 +110,12 @@ async def on_startup() -> None:
             fbl_mark_persistence_init_complete
         ],
     )
-    await initialize_notifications(
-        app_state=app.state,
-    )
+    # Hardware and persistence are initializing in background tasks by now,
+    # so this overlaps with them.
+    with startup_phase(app.state, "notifications"):
+        await initialize_notifications(
+            app_state=app.state,
+        )
 
 
 @app.on_event("shutdown")
@@ -123,6 +130,8 @@ async def on_shutdown() -> None:
         clean_up_hardware(app.state),
         clean_up_persistence(app.state),
         clean_up_task_runner(app.state),
+        clean_up_engine_store(app.state),
+        clean_up_runs_publisher(app.state),
         clean_up_notification_client(app.state),
         return_exceptions=True,
     )
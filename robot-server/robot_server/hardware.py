@@ -54,6 +54,7 @@ from .subsystems.firmware_update_manager import (
 )
 from .subsystems.models import SubSystem
 from .service.task_runner import TaskRunner, get_task_runner
+from .service.startup_profiler import startup_phase
 
 from .robot.control.estop_handler import EstopHandler
 
@@ -392,12 +393,13 @@ async def _postinit_ot2_tasks(
     callbacks: Iterable[PostInitCallback],
 ) -> None:
     """Tasks to run on an initialized OT-2 before it is ready to use."""
-    try:
-        await _home_on_boot(hardware.wrapped())
-    finally:
-        for callback in callbacks:
-            if not callback[1]:
-                await callback[0](app_state, hardware.wrapped())
+    with startup_phase(app_state, "hardware_postinit"):
+        try:
+            await _home_on_boot(hardware.wrapped())
+        finally:
+            for callback in callbacks:
+                if not callback[1]:
+                    await callback[0](app_state, hardware.wrapped())
 
 
 async def _home_on_boot(hardware: HardwareControlAPI) -> None:
@@ -456,13 +458,15 @@ async def _postinit_ot3_tasks(
     hardware = cast("OT3API", hardware_tm)
 
     try:
-        await _do_updates(hardware, update_manager)
-        await hardware.cache_instruments()
-        await _home_on_boot(hardware)
-        await hardware.set_status_bar_state(StatusBarState.ACTIVATION)
-        for callback in callbacks:
-            if not callback[1]:
-                await callback[0](app_state, hardware_tm.wrapped())
+        with startup_phase(app_state, "firmware_updates"):
+            await _do_updates(hardware, update_manager)
+        with startup_phase(app_state, "hardware_postinit"):
+            await hardware.cache_instruments()
+            await _home_on_boot(hardware)
+            await hardware.set_status_bar_state(StatusBarState.ACTIVATION)
+            for callback in callbacks:
+                if not callback[1]:
+                    await callback[0](app_state, hardware_tm.wrapped())
 
     except Exception:
         log.exception("Hardware initialization failure")
@@ -583,14 +587,15 @@ async def _initialize_hardware_api(
     app_settings = get_settings()
     systemd_available = IS_ROBOT and ARCHITECTURE != SystemArchitecture.HOST
     try:
-        if should_use_ot3():
-            hardware = await _initialize_ot3_robot(
-                app_state, app_settings, systemd_available
-            )
-        else:
-            hardware = await _initialize_ot2_robot(
-                app_state, app_settings, systemd_available
-            )
+        with startup_phase(app_state, "hardware_init"):
+            if should_use_ot3():
+                hardware = await _initialize_ot3_robot(
+                    app_state, app_settings, systemd_available
+                )
+            else:
+                hardware = await _initialize_ot2_robot(
+                    app_state, app_settings, systemd_available
+                )
 
         _hw_api_accessor.set_on(app_state, hardware)
 
@@ -43,6 +43,34 @@ class HealthLinks(BaseModel):
     )
 
 
+class StartupPhase(BaseModel):
+    """Timing of one phase of the server's startup."""
+
+    name: str = Field(
+        ...,
+        description="Which phase of startup this is.",
+        examples=["hardware_init"],
+    )
+    start_seconds: float = Field(
+        ...,
+        description="When this phase started, in seconds since server startup began.",
+    )
+    duration_seconds: typing.Optional[float] = Field(
+        None,
+        description=(
+            "How long this phase took, in seconds."
+            " Omitted if this phase is still in progress."
+        ),
+    )
+    succeeded: typing.Optional[bool] = Field(
+        None,
+        description=(
+            "Whether this phase completed successfully."
+            " Omitted if this phase is still in progress."
+        ),
+    )
+
+
 class Health(BaseResponseBody):
     """Information about the server and system."""
 
@@ -103,3 +131,10 @@ class Health(BaseResponseBody):
         examples=["OT2CEP20190604A02"],
     )
     links: HealthLinks
+    startup_phases: typing.Optional[typing.List[StartupPhase]] = Field(
+        None,
+        description=(
+            "Timing of each phase of the server's startup, in the order they started."
+            " Some phases run concurrently, so their durations can overlap."
+        ),
+    )
@@ -1,7 +1,7 @@
 """HTTP routes and handlers for /health endpoints."""
 from dataclasses import dataclass
 from fastapi import APIRouter, Depends, status
-from typing import Dict, cast
+from typing import Dict, Optional, cast
 import logging
 import json
 
@@ -15,10 +15,14 @@ from robot_server.persistence.fastapi_dependencies import (
     get_sql_engine as ensure_sql_engine_is_ready,
 )
 from robot_server.service.legacy.models import V1BasicResponse
+from robot_server.service.startup_profiler import (
+    StartupProfiler,
+    get_startup_profiler,
+)
 
 from opentrons_shared_data.robot.dev_types import RobotType
 
-from .models import Health, HealthLinks
+from .models import Health, HealthLinks, StartupPhase
 
 _log = logging.getLogger(__name__)
 
@@ -127,6 +131,7 @@ async def get_health(
     sql_engine: object = Depends(ensure_sql_engine_is_ready),
     versions: ComponentVersions = Depends(get_versions),
     robot_type: RobotType = Depends(get_robot_type),
+    startup_profiler: Optional[StartupProfiler] = Depends(get_startup_profiler),
 ) -> Health:
     """Get information about the health of the robot server.
 
@@ -162,4 +167,17 @@ async def get_health(
         robot_model=robot_type,
         links=health_links,
         robot_serial=(await hardware.get_serial_number()),
+        startup_phases=(
+            [
+                StartupPhase(
+                    name=phase.name,
+                    start_seconds=phase.start,
+                    duration_seconds=phase.duration,
+                    succeeded=phase.succeeded,
+                )
+                for phase in startup_profiler.get_phases()
+            ]
+            if startup_profiler is not None
+            else None
+        ),
     )
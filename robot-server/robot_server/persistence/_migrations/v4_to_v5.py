@@ -0,0 +1,91 @@
+"""Migrate the persistence directory from schema 4 to 5.
+
+Summary of changes from schema 4:
+
+- The JSON in `analysis.completed_analysis` and `run_command.command` is now stored
+  compressed, as binary. See `compressed_json`.
+"""
+
+from contextlib import ExitStack
+from pathlib import Path
+import shutil
+
+import sqlalchemy
+
+from ..compressed_json import compress_json
+from ..database import sql_engine_ctx, sqlite_rowid
+from ..tables import schema_4, schema_5
+from .._folder_migrator import Migration
+from ._util import copy_rows_unmodified
+
+_DB_FILE = "robot_server.db"
+
+
+class Migration4to5(Migration):  # noqa: D101
+    def migrate(self, source_dir: Path, dest_dir: Path) -> None:
+        """Migrate the persistence directory from schema 4 to 5."""
+        # Copy over all existing directories and files to new version,
+        # except the database, which is rebuilt with the new column types.
+        for item in source_dir.iterdir():
+            if item.name == _DB_FILE:
+                continue
+            if item.is_dir():
+                shutil.copytree(src=item, dst=dest_dir / item.name)
+            else:
+                shutil.copy(src=item, dst=dest_dir / item.name)
+
+        with ExitStack() as exit_stack:
+            source_engine = exit_stack.enter_context(
+                sql_engine_ctx(source_dir / _DB_FILE)
+            )
+            schema_4.metadata.create_all(source_engine)
+
+            dest_engine = exit_stack.enter_context(sql_engine_ctx(dest_dir / _DB_FILE))
+            schema_5.metadata.create_all(dest_engine)
+
+            source_transaction = exit_stack.enter_context(source_engine.begin())
+            dest_transaction = exit_stack.enter_context(dest_engine.begin())
+
+            for source_table, dest_table in [
+                (schema_4.protocol_table, schema_5.protocol_table),
+                (schema_4.run_table, schema_5.run_table),
+                (schema_4.action_table, schema_5.action_table),
+            ]:
+                copy_rows_unmodified(
+                    source_table,
+                    dest_table,
+                    source_transaction,
+                    dest_transaction,
+                    order_by_rowid=True,
+                )
+
+            _copy_rows_compressing_json(
+                schema_4.analysis_table,
+                schema_5.analysis_table,
+                "completed_analysis",
+                source_transaction,
+                dest_transaction,
+            )
+            _copy_rows_compressing_json(
+                schema_4.run_command_table,
+                schema_5.run_command_table,
+                "command",
+                source_transaction,
+                dest_transaction,
+            )
+
+
+def _copy_rows_compressing_json(
+    source_table: sqlalchemy.Table,
+    dest_table: sqlalchemy.Table,
+    json_column: str,
+    source_transaction: sqlalchemy.engine.Connection,
+    dest_transaction: sqlalchemy.engine.Connection,
+) -> None:
+    """Like `copy_rows_unmodified()`, but compressing one JSON column."""
+    select = sqlalchemy.select(source_table).order_by(sqlite_rowid)
+    insert = sqlalchemy.insert(dest_table)
+    for row in source_transaction.execute(select).mappings():
+        dest_transaction.execute(
+            insert, {**row, json_column: compress_json(row[json_column])}
+        )
@@ -0,0 +1,70 @@
+"""Migrate the persistence directory from schema 5 to 6.
+
+Summary of changes from schema 5:
+
+- Adds a new "analysis_command" table, with one row per command of each analysis.
+- The commands of each analysis are moved out of `analysis.completed_analysis`
+  and into that new table.
+"""
+
+import json
+from contextlib import ExitStack
+from pathlib import Path
+import shutil
+
+import sqlalchemy
+
+from ..compressed_json import compress_json, decompress_json
+from ..database import sql_engine_ctx, sqlite_rowid
+from ..tables import schema_6
+from .._folder_migrator import Migration
+
+_DB_FILE = "robot_server.db"
+
+
+class Migration5to6(Migration):  # noqa: D101
+    def migrate(self, source_dir: Path, dest_dir: Path) -> None:
+        """Migrate the persistence directory from schema 5 to 6."""
+        # Copy over all existing directories and files to new version
+        for item in source_dir.iterdir():
+            if item.is_dir():
+                shutil.copytree(src=item, dst=dest_dir / item.name)
+            else:
+                shutil.copy(src=item, dst=dest_dir / item.name)
+        dest_db_file = dest_dir / _DB_FILE
+
+        with ExitStack() as exit_stack:
+            dest_engine = exit_stack.enter_context(sql_engine_ctx(dest_db_file))
+            schema_6.metadata.create_all(dest_engine)
+            dest_transaction = exit_stack.enter_context(dest_engine.begin())
+            _move_analysis_commands(dest_transaction)
+
+
+def _move_analysis_commands(transaction: sqlalchemy.engine.Connection) -> None:
+    select_analyses = sqlalchemy.select(
+        schema_6.analysis_table.c.id, schema_6.analysis_table.c.completed_analysis
+    ).order_by(sqlite_rowid)
+    insert_command = sqlalchemy.insert(schema_6.analysis_command_table)
+
+    for row in transaction.execute(select_analyses).all():
+        # Pydantic serialized these documents with json.dumps(),
+        # so round-tripping them through the json module leaves them as they were.
+        completed_analysis = json.loads(decompress_json(row.completed_analysis))
+        commands = completed_analysis.pop("commands", [])
+        if commands:
+            transaction.execute(
+                insert_command,
+                [
+                    {
+                        "analysis_id": row.id,
+                        "index_in_analysis": index,
+                        "command": compress_json(json.dumps(command)),
+                    }
+                    for index, command in enumerate(commands)
+                ],
+            )
+        transaction.execute(
+            sqlalchemy.update(schema_6.analysis_table)
+            .where(schema_6.analysis_table.c.id == row.id)
+            .values(completed_analysis=compress_json(json.dumps(completed_analysis)))
+        )
@@ -0,0 +1,85 @@
+"""Compact encoding for the large JSON documents in the SQL database.
+
+Run commands and completed analyses are stored as zlib-compressed JSON.
+Most commands are only a few hundred bytes, which is too little text for
+zlib to find much repetition in, so compression is primed with a preset
+dictionary of the keys and values that nearly every command shares.
+
+The first byte of every encoded document says which dictionary it was
+compressed with. A dictionary must never change once documents have
+been stored with it; to improve it, add a new one under a new format byte.
+"""
+
+import zlib
+from typing import Dict
+
+from typing_extensions import Final
+
+
+# Fragments of commands and analyses as Pydantic serializes them. zlib's preset
+# dictionary works best with the most common strings at its end.
+_DICTIONARY_1: Final = b"".join(
+    [
+        b'"displayCategory": "wellPlate", "displayVolumeUnits": "\\u00b5L", ',
+        b'"totalLiquidVolume": ',
+        b'"shape": "circular", "diameter": ',
+        b'"ordering": [["A1", "B1", "C1", "D1", "E1", "F1", "G1", "H1"], ',
+        b'"cornerOffsetFromSlot": {"x": 0, "y": 0, "z": 0}, ',
+        b'"brand": {"brand": "Opentrons", "brandId": []}, ',
+        b'"definition": {"schemaVersion": 2, "version": 1, "namespace": "opentrons", ',
+        b'"metadata": {"displayName": "',
+        b'"parameters": {"format": "96Standard", "isTiprack": ',
+        b'"loadName": "opentrons_96_tiprack_300ul", "opentrons_flex_96_tiprack_',
+        b'"location": {"slotName": "',
+        b'"moduleId": "',
+        b'"pipetteName": "p300_single_gen2", "mount": "left", "mount": "right", ',
+        b'"commandType": "comment", "params": {"message": "',
+        b'"commandType": "loadLabware", "commandType": "loadPipette", ',
+        b'"commandType": "moveToWell", "commandType": "home", ',
+        b'"commandType": "touchTip", "commandType": "blowout", ',
+        b'"alternateDropLocation": false}, ',
+        b'"tipVolume": 0, "tipLength": 0, "tipDiameter": 0}, ',
+        b'"commandType": "pickUpTip", "commandType": "dropTip", ',
+        b'"commandType": "aspirate", "commandType": "dispense", ',
+        b'"flowRate": ',
+        b'"volume": ',
+        b'"labwareId": "',
+        b'"wellName": "A1", "wellLocation": {"origin": "bottom", ',
+        b'"offset": {"x": 0.0, "y": 0.0, "z": 1.0}}, ',
+        b'"wellLocation": {"origin": "top", "offset": {"x": 0.0, "y": 0.0, "z": 0.0}}, ',
+        b'"pipetteId": "',
+        b'"result": {"position": {"x": 0.0, "y": 0.0, "z": 0.0}',
+        b'"notes": [], ',
+        b'"intent": "protocol", ',
+        b'"startedAt": "20',
+        b'"completedAt": "20',
+        b'+00:00", ',
+        b'"status": "succeeded", "params": {',
+        b'"key": "',
+        b'{"id": "',
+        b'"createdAt": "20',
+    ]
+)
+
+_DICTIONARIES: Final[Dict[int, bytes]] = {1: _DICTIONARY_1}
+_LATEST_FORMAT: Final = 1
+
+COMPRESSION_LEVEL: Final = 6
+
+
+def compress_json(json_str: str) -> bytes:
+    """Encode a JSON document for storing in the SQL database."""
+    compressor = zlib.compressobj(
+        level=COMPRESSION_LEVEL, zdict=_DICTIONARIES[_LATEST_FORMAT]
+    )
+    return (
+        bytes([_LATEST_FORMAT])
+        + compressor.compress(json_str.encode("utf-8"))
+        + compressor.flush()
+    )
+
+
+def decompress_json(data: bytes) -> str:
+    """Decode a JSON document stored by `compress_json()`."""
+    decompressor = zlib.decompressobj(zdict=_DICTIONARIES[data[0]])
+    return (decompressor.decompress(data[1:]) + decompressor.flush()).decode("utf-8")
@@ -18,6 +18,7 @@ from server_utils.fastapi_utils.app_state import (
     get_app_state,
 )
 from robot_server.errors.error_responses import ErrorDetails
+from robot_server.service.startup_profiler import startup_phase
 
 from .database import create_sql_engine
 from .persistence_directory import (
@@ -72,7 +73,8 @@ def start_initializing_persistence(  # noqa: C901
 
     async def init_root_persistence_directory() -> Path:
         try:
-            return await prepare_root(persistence_directory_root)
+            with startup_phase(app_state, "persistence_root"):
+                return await prepare_root(persistence_directory_root)
         except Exception:
             _log.exception(
                 "Exception initializing persistence directory root in the background."
@@ -87,7 +89,8 @@ def start_initializing_persistence(  # noqa: C901
             assert root_prep_task is not None
             prepared_root = await root_prep_task
 
-            active_subdirectory = await prepare_active_subdirectory(prepared_root)
+            with startup_phase(app_state, "persistence_migration"):
+                active_subdirectory = await prepare_active_subdirectory(prepared_root)
             return active_subdirectory
 
         except Exception:
@@ -104,9 +107,10 @@ def start_initializing_persistence(  # noqa: C901
             assert subdirectory_prep_task is not None
             prepared_subdirectory = await subdirectory_prep_task
 
-            sql_engine = await to_thread.run_sync(
-                create_sql_engine, prepared_subdirectory / _DATABASE_FILE
-            )
+            with startup_phase(app_state, "sql_engine"):
+                sql_engine = await to_thread.run_sync(
+                    create_sql_engine, prepared_subdirectory / _DATABASE_FILE
+                )
             return sql_engine
 
         except Exception:
@@ -1,6 +1,7 @@
 """Create or reset the server's persistence directory."""
 
 
+from functools import partial
 from pathlib import Path
 from logging import getLogger
 from shutil import rmtree
@@ -11,7 +12,7 @@ from typing_extensions import Final
 from anyio import Path as AsyncPath, to_thread
 
 from ._folder_migrator import MigrationOrchestrator
-from ._migrations import up_to_3, v3_to_v4
+from ._migrations import up_to_3, v3_to_v4, v4_to_v5, v5_to_v6
 
 
 _TEMP_PERSISTENCE_DIR_PREFIX: Final = "opentrons-robot-server-"
@@ -51,6 +52,8 @@ async def prepare_active_subdirectory(prepared_root: Path) -> Path:
         migrations=[
             up_to_3.MigrationUpTo3(subdirectory="3"),
             v3_to_v4.Migration3to4(subdirectory="4"),
+            v4_to_v5.Migration4to5(subdirectory="5"),
+            v5_to_v6.Migration5to6(subdirectory="6"),
         ],
         temp_file_prefix="temp-",
     )
@@ -71,9 +74,13 @@ async def prepare_root(persistence_directory_root: Optional[Path]) -> Path:
     directory.
     """
     if persistence_directory_root is None:
-        # It's bad for this blocking I/O to be in this async function,
-        # but we don't have an async mkdtemp().
-        new_temporary_directory = Path(mkdtemp(prefix=_TEMP_PERSISTENCE_DIR_PREFIX))
+        # We don't have an async mkdtemp(), so run it in a worker thread to avoid
+        # blocking the event loop while hardware initializes concurrently.
+        new_temporary_directory = Path(
+            await to_thread.run_sync(
+                partial(mkdtemp, prefix=_TEMP_PERSISTENCE_DIR_PREFIX)
+            )
+        )
         _log.info(
             f"Using auto-created temporary directory {new_temporary_directory}"
             f" for persistence."
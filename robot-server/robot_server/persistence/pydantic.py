@@ -4,6 +4,8 @@ import json
 from typing import Type, TypeVar, List, Sequence
 from pydantic import BaseModel, parse_raw_as, parse_obj_as
 
+from .compressed_json import compress_json, decompress_json
+
 
 _BaseModelT = TypeVar("_BaseModelT", bound=BaseModel)
 
@@ -23,6 +25,11 @@ def pydantic_list_to_json(obj_list: Sequence[BaseModel]) -> str:
     return json.dumps([obj.dict(by_alias=True, exclude_none=True) for obj in obj_list])
 
 
+def pydantic_to_compressed_json(obj: BaseModel) -> bytes:
+    """Serialize a Pydantic object for storing compressed in the SQL database."""
+    return compress_json(pydantic_to_json(obj))
+
+
 def json_to_pydantic(model: Type[_BaseModelT], json_str: str) -> _BaseModelT:
     """Parse a Pydantic object stored in the SQL database."""
     return parse_raw_as(model, json_str)
@@ -31,3 +38,8 @@ def json_to_pydantic(model: Type[_BaseModelT], json_str: str) -> _BaseModelT:
 def json_to_pydantic_list(model: Type[_BaseModelT], json_str: str) -> List[_BaseModelT]:
     """Parse a list of Pydantic objects stored in the SQL database."""
     return [parse_obj_as(model, obj_dict) for obj_dict in json.loads(json_str)]
+
+
+def compressed_json_to_pydantic(model: Type[_BaseModelT], data: bytes) -> _BaseModelT:
+    """Parse a Pydantic object stored compressed in the SQL database."""
+    return json_to_pydantic(model, decompress_json(data))
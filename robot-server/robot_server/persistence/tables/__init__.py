@@ -1,10 +1,11 @@
 """SQL database schemas."""
 
 # Re-export the latest schema.
-from .schema_4 import (
+from .schema_6 import (
     metadata,
     protocol_table,
     analysis_table,
+    analysis_command_table,
     run_table,
     run_command_table,
     action_table,
@@ -15,6 +16,7 @@ __all__ = [
     "metadata",
     "protocol_table",
     "analysis_table",
+    "analysis_command_table",
     "run_table",
     "run_command_table",
     "action_table",
@@ -3,6 +3,7 @@
 from enum import Enum
 
 from opentrons.protocol_engine.types import RunTimeParameter, RunTimeParamValuesType
+from opentrons.protocols.duration import DurationEstimate
 from opentrons_shared_data.robot.dev_types import RobotType
 from pydantic import BaseModel, Field
 from typing import List, Optional, Union, NamedTuple
@@ -160,6 +161,15 @@ class CompletedAnalysis(BaseModel):
             " but it won't have more than one element."
         ),
     )
+    estimatedDuration: Optional[DurationEstimate] = Field(
+        default=None,
+        description=(
+            "How long each command, and the whole protocol, is expected to take."
+            " This is only estimated when the robot's internal"
+            " `enableAnalysisDurationEstimates` setting is on."
+            " It will be `null` or omitted otherwise."
+        ),
+    )
 
 
 class RunTimeParameterAnalysisData(NamedTuple):
@@ -13,6 +13,7 @@ import sqlalchemy
 
 from opentrons.protocol_engine import (
     Command,
+    CommandSlice,
     ErrorOccurrence,
     LoadedPipette,
     LoadedLabware,
@@ -20,6 +21,7 @@ from opentrons.protocol_engine import (
     Liquid,
 )
 from opentrons.protocol_engine.types import RunTimeParamValuesType
+from opentrons.protocols.duration import DurationEstimate
 
 from .analysis_models import (
     AnalysisSummary,
@@ -145,6 +147,7 @@ class AnalysisStore:
         pipettes: List[LoadedPipette],
         errors: List[ErrorOccurrence],
         liquids: List[Liquid],
+        estimated_duration: Optional[DurationEstimate] = None,
     ) -> None:
         """Promote a pending analysis to completed, adding details of its results.
 
@@ -161,6 +164,7 @@ class AnalysisStore:
                 the completed analysis result is `OK` or `NOT_OK`.
             liquids: See `CompletedAnalysis.liquids`.
             robot_type: See `CompletedAnalysis.robotType`.
+            estimated_duration: See `CompletedAnalysis.estimatedDuration`.
         """
         protocol_id = self._pending_store.get_protocol_id(analysis_id=analysis_id)
 
@@ -186,6 +190,7 @@ class AnalysisStore:
             pipettes=pipettes,
             errors=errors,
             liquids=liquids,
+            estimatedDuration=estimated_duration,
         )
         completed_analysis_resource = CompletedAnalysisResource(
             id=completed_analysis.id,
@@ -235,6 +240,41 @@ class AnalysisStore:
         else:
             raise AnalysisNotFoundError(analysis_id=analysis_id)
 
+    async def get_summary_as_document(self, analysis_id: str) -> str:
+        """Like `get_as_document()`, but leaving out the analysis's commands.
+
+        Raises:
+            AnalysisNotFoundError: If there is no completed analysis with the given ID.
+        """
+        summary_document = await self._completed_store.get_summary_by_id_as_document(
+            analysis_id=analysis_id
+        )
+        if summary_document is not None:
+            return summary_document
+        else:
+            raise AnalysisNotFoundError(analysis_id=analysis_id)
+
+    async def get_commands_slice(
+        self, analysis_id: str, cursor: int, length: int
+    ) -> CommandSlice:
+        """Get a slice of a completed protocol analysis's commands.
+
+        Args:
+            analysis_id: The analysis to pull commands from.
+            cursor: The index of the first command to return.
+            length: The maximum number of commands to return.
+
+        Raises:
+            AnalysisNotFoundError: If there is no completed analysis with the given ID.
+        """
+        command_slice = await self._completed_store.get_commands_slice(
+            analysis_id=analysis_id, cursor=cursor, length=length
+        )
+        if command_slice is not None:
+            return command_slice
+        else:
+            raise AnalysisNotFoundError(analysis_id=analysis_id)
+
     def get_summaries_by_protocol(self, protocol_id: str) -> List[AnalysisSummary]:
         """Get summaries of all analyses for a protocol, in order from oldest first.
 
@@ -3,7 +3,8 @@ from __future__ import annotations
 
 import asyncio
 import json
-from typing import Dict, List, Optional
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence
 from logging import getLogger
 from dataclasses import dataclass
 
@@ -11,9 +12,17 @@ import sqlalchemy
 import anyio
 from pydantic import parse_raw_as
 
+from opentrons.protocol_engine import CommandSlice
+from opentrons.protocol_engine.commands import Command
+
 from robot_server.persistence.database import sqlite_rowid
-from robot_server.persistence.tables import analysis_table
-from robot_server.persistence.pydantic import json_to_pydantic, pydantic_to_json
+from robot_server.persistence.tables import analysis_table, analysis_command_table
+from robot_server.persistence.compressed_json import decompress_json
+from robot_server.persistence.pydantic import (
+    compressed_json_to_pydantic,
+    json_to_pydantic,
+    pydantic_to_compressed_json,
+)
 
 from .analysis_models import CompletedAnalysis, RunTimeParameterAnalysisData
 from .analysis_memcache import MemoryCache
@@ -48,8 +57,11 @@ class CompletedAnalysisResource:
         Avoid calling this from inside a SQL transaction, since it might be slow.
         """
 
-        def serialize_completed_analysis() -> str:
-            return pydantic_to_json(self.completed_analysis)
+        def serialize_completed_analysis() -> bytes:
+            # The commands are stored separately. See `to_command_sql_values()`.
+            return pydantic_to_compressed_json(
+                self.completed_analysis.copy(exclude={"commands"})
+            )
 
         def serialize_rtp_dict() -> str:
             return json.dumps(self.run_time_parameter_values_and_defaults)
@@ -72,11 +84,35 @@ class CompletedAnalysisResource:
             "run_time_parameter_values_and_defaults": serialized_rtp_dict,
         }
 
+    async def to_command_sql_values(self) -> List[Dict[str, object]]:
+        """Return this analysis's commands as dicts for a SQLAlchemy insert.
+
+        Like `to_sql_values()`, this is offloaded to a worker thread.
+        """
+
+        def serialize_commands() -> List[Dict[str, object]]:
+            return [
+                {
+                    "analysis_id": self.id,
+                    "index_in_analysis": index,
+                    "command": pydantic_to_compressed_json(command),
+                }
+                for index, command in enumerate(self.completed_analysis.commands)
+            ]
+
+        return await anyio.to_thread.run_sync(
+            serialize_commands,
+            cancellable=True,
+        )
+
     @classmethod
     async def from_sql_row(
-        cls, sql_row: sqlalchemy.engine.Row, current_analyzer_version: str
+        cls,
+        sql_row: sqlalchemy.engine.Row,
+        compressed_commands: Sequence[bytes],
+        current_analyzer_version: str,
     ) -> CompletedAnalysisResource:
-        """Extract the data from a SQLAlchemy row object.
+        """Extract the data from a SQLAlchemy row object and its command rows.
 
         This potentially involves heavy parsing, so it's offloaded to a worker thread.
 
@@ -98,7 +134,12 @@ class CompletedAnalysisResource:
         assert isinstance(protocol_id, str)
 
         def parse_completed_analysis() -> CompletedAnalysis:
-            return json_to_pydantic(CompletedAnalysis, sql_row.completed_analysis)
+            return json_to_pydantic(
+                CompletedAnalysis,
+                _document_with_commands(
+                    sql_row.completed_analysis, compressed_commands
+                ),
+            )
 
         completed_analysis = await anyio.to_thread.run_sync(
             parse_completed_analysis,
@@ -198,9 +239,14 @@ class CompletedAnalysisStore:
                     result = transaction.execute(statement).one()
                 except sqlalchemy.exc.NoResultFound:
                     return None
+                compressed_commands = _select_compressed_commands(
+                    transaction, [analysis_id]
+                )
 
             resource = await CompletedAnalysisResource.from_sql_row(
-                result, self._current_analyzer_version
+                result,
+                compressed_commands[analysis_id],
+                self._current_analyzer_version,
             )
             self._memcache.insert(resource.id, resource)
 
@@ -218,12 +264,96 @@ class CompletedAnalysisStore:
 
         with self._sql_engine.begin() as transaction:
             try:
-                document: str = transaction.execute(statement).scalar_one()
+                compressed_summary: bytes = transaction.execute(statement).scalar_one()
             except sqlalchemy.exc.NoResultFound:
                 # No analysis with this ID.
                 return None
+            compressed_commands = _select_compressed_commands(
+                transaction, [analysis_id]
+            )
+
+        return _document_with_commands(
+            compressed_summary, compressed_commands[analysis_id]
+        )
+
+    async def get_summary_by_id_as_document(self, analysis_id: str) -> Optional[str]:
+        """Return the analysis with the given ID without its commands, if it exists.
+
+        This is like `get_by_id_as_document()`, except the document has no `commands`,
+        so it's cheap to read no matter how long the protocol is.
+        """
+        statement = sqlalchemy.select(analysis_table.c.completed_analysis).where(
+            analysis_table.c.id == analysis_id
+        )
 
-        return document
+        with self._sql_engine.begin() as transaction:
+            try:
+                compressed_summary: bytes = transaction.execute(statement).scalar_one()
+            except sqlalchemy.exc.NoResultFound:
+                # No analysis with this ID.
+                return None
+
+        return decompress_json(compressed_summary)
+
+    async def get_commands_slice(
+        self, analysis_id: str, cursor: int, length: int
+    ) -> Optional[CommandSlice]:
+        """Return a slice of the commands of the analysis with the given ID, if it exists.
+
+        Args:
+            analysis_id: The analysis to pull commands from.
+            cursor: The index of the first command to return. It's clamped to the
+                commands that exist.
+            length: The maximum number of commands to return.
+        """
+        async with self._memcache_lock:
+            try:
+                cached = self._memcache.get(analysis_id)
+            except KeyError:
+                pass
+            else:
+                commands = cached.completed_analysis.commands
+                actual_cursor = max(0, min(cursor, len(commands) - 1))
+                return CommandSlice(
+                    cursor=actual_cursor,
+                    total_length=len(commands),
+                    commands=commands[actual_cursor : actual_cursor + length],
+                )
+
+        select_exists = sqlalchemy.select(analysis_table.c.id).where(
+            analysis_table.c.id == analysis_id
+        )
+        select_count = sqlalchemy.select(sqlalchemy.func.count()).where(
+            analysis_command_table.c.analysis_id == analysis_id
+        )
+
+        with self._sql_engine.begin() as transaction:
+            if transaction.execute(select_exists).first() is None:
+                return None
+            count_result: int = transaction.execute(select_count).scalar_one()
+
+            # Clamp to [0, count_result).
+            actual_cursor = max(0, min(cursor, count_result - 1))
+
+            select_slice = (
+                sqlalchemy.select(analysis_command_table.c.command)
+                .where(
+                    analysis_command_table.c.analysis_id == analysis_id,
+                    analysis_command_table.c.index_in_analysis >= actual_cursor,
+                    analysis_command_table.c.index_in_analysis < actual_cursor + length,
+                )
+                .order_by(analysis_command_table.c.index_in_analysis)
+            )
+            slice_result = transaction.execute(select_slice).scalars().all()
+
+        return CommandSlice(
+            cursor=actual_cursor,
+            total_length=count_result,
+            commands=[
+                compressed_json_to_pydantic(Command, command)  # type: ignore[arg-type]
+                for command in slice_result
+            ],
+        )
 
     async def get_rtp_values_and_defaults_by_analysis_id(
         self, analysis_id: str
@@ -305,9 +435,12 @@ class CompletedAnalysisStore:
                 )
                 with self._sql_engine.begin() as transaction:
                     results = transaction.execute(statement).all()
+                    compressed_commands = _select_compressed_commands(
+                        transaction, uncached_analyses
+                    )
                 for r in results:
                     resource = await CompletedAnalysisResource.from_sql_row(
-                        r, self._current_analyzer_version
+                        r, compressed_commands[r.id], self._current_analyzer_version
                     )
                     local_memcache[resource.id] = resource
                     self._memcache.insert(resource.id, resource)
@@ -354,6 +487,9 @@ class CompletedAnalysisStore:
         analyses_to_delete = analyses_ids[: -MAX_ANALYSES_TO_STORE + 1]
         for analysis_id in analyses_to_delete:
             self._memcache.remove(analysis_id)
+        delete_commands_statement = analysis_command_table.delete().where(
+            analysis_command_table.c.analysis_id.in_(analyses_to_delete)
+        )
         delete_statement = analysis_table.delete().where(
             analysis_table.c.id.in_(analyses_to_delete)
         )
@@ -361,9 +497,46 @@ class CompletedAnalysisStore:
         insert_statement = analysis_table.insert().values(
             await completed_analysis_resource.to_sql_values()
         )
+        command_values = await completed_analysis_resource.to_command_sql_values()
         with self._sql_engine.begin() as transaction:
+            transaction.execute(delete_commands_statement)
             transaction.execute(delete_statement)
             transaction.execute(insert_statement)
+            if command_values:
+                transaction.execute(analysis_command_table.insert(), command_values)
         self._memcache.insert(
             completed_analysis_resource.id, completed_analysis_resource
         )
+
+
+def _select_compressed_commands(
+    transaction: sqlalchemy.engine.Connection, analysis_ids: Iterable[str]
+) -> Dict[str, List[bytes]]:
+    """Return the stored commands of each given analysis, in order."""
+    statement = (
+        sqlalchemy.select(
+            analysis_command_table.c.analysis_id, analysis_command_table.c.command
+        )
+        .where(analysis_command_table.c.analysis_id.in_(analysis_ids))
+        .order_by(analysis_command_table.c.index_in_analysis)
+    )
+    compressed_commands: Dict[str, List[bytes]] = defaultdict(list)
+    for row in transaction.execute(statement):
+        compressed_commands[row.analysis_id].append(row.command)
+    return compressed_commands
+
+
+def _document_with_commands(
+    compressed_summary: bytes, compressed_commands: Sequence[bytes]
+) -> str:
+    """Rebuild a whole analysis document from its stored summary and commands.
+
+    The stored summary is a JSON object with no `commands` key, so the commands
+    can be spliced in as its last key without parsing anything.
+    """
+    summary = decompress_json(compressed_summary).rstrip()
+    assert summary.endswith("}")
+    summary_body = summary[:-1].rstrip()
+    separator = "" if summary_body.endswith("{") else ", "
+    commands = ", ".join(decompress_json(command) for command in compressed_commands)
+    return f'{summary_body}{separator}"commands": [{commands}]}}'
@@ -2,10 +2,15 @@
 import logging
 from typing import Optional
 
+import anyio
+
 from opentrons import protocol_runner
+from opentrons.config import feature_flags
 from opentrons.protocol_engine.errors import ErrorOccurrence
 from opentrons.protocol_engine.types import RunTimeParamValuesType
+from opentrons.protocols.duration import estimate_duration
 import opentrons.util.helpers as datetime_helper
+from opentrons_shared_data.robot.dev_types import RobotTypeEnum
 
 import robot_server.errors.error_mappers as em
 
@@ -69,9 +74,21 @@ class ProtocolAnalyzer:
 
         log.info(f'Completed analysis "{analysis_id}".')
 
+        robot_type = protocol_resource.source.robot_type
+        if feature_flags.enable_analysis_duration_estimates(
+            RobotTypeEnum.robot_literal_to_enum(robot_type)
+        ):
+            # Estimating takes about as long as the analysis itself,
+            # so keep it off the event loop.
+            estimated_duration = await anyio.to_thread.run_sync(
+                estimate_duration, result.commands, robot_type
+            )
+        else:
+            estimated_duration = None
+
         await self._analysis_store.update(
             analysis_id=analysis_id,
-            robot_type=protocol_resource.source.robot_type,
+            robot_type=robot_type,
             run_time_parameters=result.parameters,
             commands=result.commands,
             labware=result.state_summary.labware,
@@ -79,4 +96,5 @@ class ProtocolAnalyzer:
             pipettes=result.state_summary.pipettes,
             errors=result.state_summary.errors,
             liquids=result.state_summary.liquids,
+            estimated_duration=estimated_duration,
         )
@@ -16,6 +16,7 @@ from opentrons.protocol_reader import ProtocolReader, ProtocolSource
 from robot_server.persistence.database import sqlite_rowid
 from robot_server.persistence.tables import (
     analysis_table,
+    analysis_command_table,
     protocol_table,
     run_table,
 )
@@ -342,6 +343,15 @@ class ProtocolStore:
         return [_convert_sql_row_to_dataclass(sql_row=row) for row in all_rows]
 
     def _sql_remove(self, protocol_id: str) -> None:
+        delete_analysis_commands_statement = sqlalchemy.delete(
+            analysis_command_table
+        ).where(
+            analysis_command_table.c.analysis_id.in_(
+                sqlalchemy.select(analysis_table.c.id).where(
+                    analysis_table.c.protocol_id == protocol_id
+                )
+            )
+        )
         delete_analyses_statement = sqlalchemy.delete(analysis_table).where(
             analysis_table.c.protocol_id == protocol_id
         )
@@ -360,6 +370,7 @@ class ProtocolStore:
             # * Merge the Store classes or otherwise give them access to each other.
             # * Switch from SQLAlchemy Core to ORM and use cascade deletes.
             try:
+                transaction.execute(delete_analysis_commands_statement)
                 transaction.execute(delete_analyses_statement)
                 result = transaction.execute(delete_protocol_statement)
             except sqlalchemy.exc.IntegrityError as e:
@@ -6,11 +6,12 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Union, Tuple
 
+from opentrons.protocol_engine import Command
 from opentrons.protocol_engine.types import RunTimeParamValuesType
 from opentrons_shared_data.robot import user_facing_robot_type
-from typing_extensions import Literal
+from typing_extensions import Final, Literal
 
-from fastapi import APIRouter, Depends, File, UploadFile, status, Form
+from fastapi import APIRouter, Depends, File, UploadFile, status, Form, Query
 from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel, Field
 
@@ -61,6 +62,8 @@ from .dependencies import (
 
 log = logging.getLogger(__name__)
 
+_DEFAULT_COMMAND_LIST_LENGTH: Final = 20
+
 
 class ProtocolNotFound(ErrorDetails):
     """An error returned when a given protocol cannot be found."""
@@ -756,3 +759,135 @@ async def get_protocol_analysis_as_document(
         ) from error
 
     return PlainTextResponse(content=analysis, media_type="application/json")
+
+
+@protocols_router.get(
+    path="/protocols/{protocolId}/analyses/{analysisId}/summaryAsDocument",
+    summary="[Experimental] Get one of a protocol's analyses without its commands",
+    description=(
+        "**Warning:** This endpoint is experimental. We may change or remove it without warning."
+        "\n\n"
+        "This returns the same JSON data as"
+        " `GET /protocols/{protocolId}/analyses/{analysisId}/asDocument`,"
+        " except without the `commands` list. Its response time doesn't depend on"
+        " how many commands the analysis has."
+        " Use `GET /protocols/{protocolId}/analyses/{analysisId}/commands`"
+        " to get the commands a page at a time."
+        "\n\n"
+        "For a *pending* analysis, this returns a 404 response."
+    ),
+    responses={
+        status.HTTP_404_NOT_FOUND: {
+            "model": ErrorBody[Union[ProtocolNotFound, AnalysisNotFound]]
+        },
+    },
+)
+async def get_protocol_analysis_summary_as_document(
+    protocolId: str,
+    analysisId: str,
+    protocol_store: ProtocolStore = Depends(get_protocol_store),
+    analysis_store: AnalysisStore = Depends(get_analysis_store),
+) -> PlainTextResponse:
+    """Get a protocol analysis by analysis ID, without its commands.
+
+    Arguments:
+        protocolId: The ID of the protocol, pulled from the URL.
+        analysisId: The ID of the analysis, pulled from the URL.
+        protocol_store: Protocol resource storage.
+        analysis_store: Analysis resource storage.
+    """
+    if not protocol_store.has(protocolId):
+        raise ProtocolNotFound(detail=f"Protocol {protocolId} not found").as_error(
+            status.HTTP_404_NOT_FOUND
+        )
+
+    _check_analysis_belongs_to_protocol(protocolId, analysisId, analysis_store)
+
+    try:
+        analysis_summary = await analysis_store.get_summary_as_document(analysisId)
+    except AnalysisNotFoundError as error:
+        raise AnalysisNotFound(detail=str(error)).as_error(
+            status.HTTP_404_NOT_FOUND
+        ) from error
+
+    return PlainTextResponse(content=analysis_summary, media_type="application/json")
+
+
+@PydanticResponse.wrap_route(
+    protocols_router.get,
+    path="/protocols/{protocolId}/analyses/{analysisId}/commands",
+    summary="Get a page of one of a protocol's analysis's commands",
+    description=(
+        "Get the commands of a completed analysis, in order,"
+        " a page at a time, like `GET /runs/{runId}/commands`."
+        "\n\n"
+        "For a *pending* analysis, this returns a 404 response."
+    ),
+    responses={
+        status.HTTP_200_OK: {"model": SimpleMultiBody[Command]},
+        status.HTTP_404_NOT_FOUND: {
+            "model": ErrorBody[Union[ProtocolNotFound, AnalysisNotFound]]
+        },
+    },
+)
+async def get_protocol_analysis_commands(
+    protocolId: str,
+    analysisId: str,
+    cursor: int = Query(
+        0,
+        description="The index of the first command in the list to return.",
+    ),
+    pageLength: int = Query(
+        _DEFAULT_COMMAND_LIST_LENGTH,
+        description="The maximum number of commands in the list to return.",
+    ),
+    protocol_store: ProtocolStore = Depends(get_protocol_store),
+    analysis_store: AnalysisStore = Depends(get_analysis_store),
+) -> PydanticResponse[SimpleMultiBody[Command]]:
+    """Get a page of a completed protocol analysis's commands.
+
+    Arguments:
+        protocolId: The ID of the protocol, pulled from the URL.
+        analysisId: The ID of the analysis, pulled from the URL.
+        cursor: Cursor index for the collection response.
+        pageLength: Maximum number of items to return.
+        protocol_store: Protocol resource storage.
+        analysis_store: Analysis resource storage.
+    """
+    if not protocol_store.has(protocolId):
+        raise ProtocolNotFound(detail=f"Protocol {protocolId} not found").as_error(
+            status.HTTP_404_NOT_FOUND
+        )
+
+    _check_analysis_belongs_to_protocol(protocolId, analysisId, analysis_store)
+
+    try:
+        command_slice = await analysis_store.get_commands_slice(
+            analysisId, cursor=cursor, length=pageLength
+        )
+    except AnalysisNotFoundError as error:
+        raise AnalysisNotFound(detail=str(error)).as_error(
+            status.HTTP_404_NOT_FOUND
+        ) from error
+
+    return await PydanticResponse.create(
+        content=SimpleMultiBody.construct(
+            data=command_slice.commands,
+            meta=MultiBodyMeta(
+                cursor=command_slice.cursor, totalLength=command_slice.total_length
+            ),
+        )
+    )
+
+
+def _check_analysis_belongs_to_protocol(
+    protocol_id: str, analysis_id: str, analysis_store: AnalysisStore
+) -> None:
+    """Raise a 404 if the analysis isn't one of the protocol's analyses."""
+    if not any(
+        summary.id == analysis_id
+        for summary in analysis_store.get_summaries_by_protocol(protocol_id)
+    ):
+        raise AnalysisNotFound(
+            detail=f"Analysis {analysis_id} not found for protocol {protocol_id}"
+        ).as_error(status.HTTP_404_NOT_FOUND)
@@ -116,7 +116,10 @@ async def get_engine_store(
 
     if engine_store is None:
         engine_store = EngineStore(
-            hardware_api=hardware_api, robot_type=robot_type, deck_type=deck_type
+            hardware_api=hardware_api,
+            robot_type=robot_type,
+            deck_type=deck_type,
+            use_virtual_clock=get_settings().use_virtual_clock,
         )
         _engine_store_accessor.set_on(app_state, engine_store)
         # Provide the engine store to the light controller
@@ -125,6 +128,16 @@ async def get_engine_store(
     return engine_store
 
 
+async def clean_up_engine_store(app_state: AppState) -> None:
+    """Clean up the `EngineStore` stored on `app_state`, if there is one.
+
+    Intended to be called just once, when the server shuts down.
+    """
+    engine_store = _engine_store_accessor.get_from(app_state)
+    if engine_store is not None:
+        await engine_store.clean_up()
+
+
 async def get_is_okay_to_create_maintenance_run(
     engine_store: EngineStore = Depends(get_engine_store),
 ) -> bool:
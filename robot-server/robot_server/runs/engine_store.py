@@ -1,5 +1,7 @@
 """In-memory storage of ProtocolEngine instances."""
-from typing import List, NamedTuple, Optional, Callable
+import asyncio
+import logging
+from typing import Dict, List, NamedTuple, Optional, Callable
 
 from opentrons.protocol_engine.types import PostRunHardwareState
 from opentrons_shared_data.robot.dev_types import RobotType
@@ -31,13 +33,19 @@ from opentrons.protocol_engine import (
     create_protocol_engine,
 )
 
+from opentrons.protocol_engine.resources import DeckDataProvider, ModuleDataProvider
+
 from robot_server.protocols.protocol_store import ProtocolResource
 from opentrons.protocol_engine.types import (
     DeckConfigurationType,
+    ModuleOffsetData,
     RunTimeParamValuesType,
 )
 
 
+_log = logging.getLogger(__name__)
+
+
 class EngineConflictError(RuntimeError):
     """An error raised if an active engine is already initialized.
 
@@ -58,6 +66,38 @@ class RunnerEnginePair(NamedTuple):
     engine: ProtocolEngine
 
 
+class _PublisherNotifier:
+    """Forwards an engine's state change notifications to its run's publishers.
+
+    A spare engine is built before the run that will use it exists,
+    so it's pointed at the run's publishers once it's taken.
+    """
+
+    def __init__(self) -> None:
+        self.notify_publishers: Optional[Callable[[], None]] = None
+
+    def __call__(self) -> None:
+        if self.notify_publishers is not None:
+            self.notify_publishers()
+
+
+class _EngineParams(NamedTuple):
+    """Everything that a run's engine is built with that can differ between runs."""
+
+    config: ProtocolEngineConfig
+    load_fixed_trash: bool
+    deck_configuration: DeckConfigurationType
+    module_calibration_offsets: Dict[str, ModuleOffsetData]
+
+
+class _SpareEngine(NamedTuple):
+    """An idle engine, built ahead of time for the next run."""
+
+    params: _EngineParams
+    engine: ProtocolEngine
+    notifier: _PublisherNotifier
+
+
 def get_estop_listener(engine_store: "EngineStore") -> HardwareEventHandler:
     """Create a callback for estop events."""
 
@@ -80,6 +120,7 @@ class EngineStore:
         hardware_api: HardwareControlAPI,
         robot_type: RobotType,
         deck_type: DeckType,
+        use_virtual_clock: bool = False,
     ) -> None:
         """Initialize an engine storage interface.
 
@@ -88,12 +129,20 @@ class EngineStore:
                 construction.
             robot_type: Passed along to `opentrons.protocol_engine.Config`.
             deck_type: Passed along to `opentrons.protocol_engine.Config`.
+            use_virtual_clock: Whether runs should let delays pass instantly,
+                if `hardware_api` is a simulator.
         """
         self._hardware_api = hardware_api
         self._robot_type = robot_type
         self._deck_type = deck_type
+        self._use_virtual_clock = use_virtual_clock and hardware_api.is_simulator
         self._default_engine: Optional[ProtocolEngine] = None
         self._runner_engine_pair: Optional[RunnerEnginePair] = None
+        self._deck_data = DeckDataProvider(deck_type)
+        # Runs usually look like the run before them, so after creating a run's
+        # engine, we build another one just like it for the next run to take.
+        self._spare_engine: Optional[_SpareEngine] = None
+        self._spare_engine_task: Optional["asyncio.Task[None]"] = None
         hardware_api.register_callback(get_estop_listener(self))
 
     @property
@@ -145,6 +194,7 @@ class EngineStore:
                     deck_type=self._deck_type,
                     block_on_door_open=False,
                 ),
+                deck_data=self._deck_data,
             )
             self._default_engine = engine
 
@@ -181,17 +231,23 @@ class EngineStore:
         else:
             load_fixed_trash = False
 
-        engine = await create_protocol_engine(
-            hardware_api=self._hardware_api,
-            config=ProtocolEngineConfig(
-                robot_type=self._robot_type,
-                deck_type=self._deck_type,
-                block_on_door_open=feature_flags.enable_door_safety_switch(
-                    RobotTypeEnum.robot_literal_to_enum(self._robot_type)
+        engine = await self._take_engine(
+            _EngineParams(
+                config=ProtocolEngineConfig(
+                    robot_type=self._robot_type,
+                    deck_type=self._deck_type,
+                    block_on_door_open=feature_flags.enable_door_safety_switch(
+                        RobotTypeEnum.robot_literal_to_enum(self._robot_type)
+                    ),
+                    enable_command_timing=feature_flags.enable_performance_metrics(
+                        RobotTypeEnum.robot_literal_to_enum(self._robot_type)
+                    ),
+                    use_virtual_clock=self._use_virtual_clock,
                 ),
+                load_fixed_trash=load_fixed_trash,
+                deck_configuration=deck_configuration,
+                module_calibration_offsets=ModuleDataProvider.load_module_calibrations(),
             ),
-            load_fixed_trash=load_fixed_trash,
-            deck_configuration=deck_configuration,
             notify_publishers=notify_publishers,
         )
 
@@ -244,6 +300,58 @@ class EngineStore:
 
         return engine.state_view.get_summary()
 
+    async def _take_engine(
+        self, params: _EngineParams, notify_publishers: Callable[[], None]
+    ) -> ProtocolEngine:
+        """Return the spare engine if it was built with `params`, or else a new one."""
+        if self._spare_engine_task is not None:
+            await self._spare_engine_task
+            self._spare_engine_task = None
+        spare, self._spare_engine = self._spare_engine, None
+
+        if spare is None or spare.params != params:
+            if spare is not None:
+                await spare.engine.discard()
+            spare = await self._build_engine(params)
+
+        spare.notifier.notify_publishers = notify_publishers
+        self._spare_engine_task = asyncio.create_task(
+            self._prepare_spare_engine(params)
+        )
+        return spare.engine
+
+    async def _prepare_spare_engine(self, params: _EngineParams) -> None:
+        try:
+            self._spare_engine = await self._build_engine(params)
+        except Exception:
+            _log.warning("Could not build a spare engine.", exc_info=True)
+
+    async def _build_engine(self, params: _EngineParams) -> _SpareEngine:
+        notifier = _PublisherNotifier()
+        engine = await create_protocol_engine(
+            hardware_api=self._hardware_api,
+            config=params.config,
+            load_fixed_trash=params.load_fixed_trash,
+            deck_configuration=params.deck_configuration,
+            notify_publishers=notifier,
+            deck_data=self._deck_data,
+            module_calibration_offsets=params.module_calibration_offsets,
+        )
+        return _SpareEngine(params=params, engine=engine, notifier=notifier)
+
+    async def clean_up(self) -> None:
+        """Stop building the spare engine, and discard it if it's been built.
+
+        Intended to be called just once, when the server shuts down.
+        """
+        if self._spare_engine_task is not None:
+            self._spare_engine_task.cancel()
+            await asyncio.gather(self._spare_engine_task, return_exceptions=True)
+            self._spare_engine_task = None
+        spare, self._spare_engine = self._spare_engine, None
+        if spare is not None:
+            await spare.engine.discard()
+
     async def clear(self) -> RunResult:
         """Remove the persisted ProtocolEngine.
 
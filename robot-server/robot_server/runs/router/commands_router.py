@@ -9,6 +9,7 @@ from fastapi import APIRouter, Depends, Query, status
 from pydantic import BaseModel, Field
 
 from opentrons.protocol_engine import (
+    CommandTypeTiming,
     ProtocolEngine,
     commands as pe_commands,
     errors as pe_errors,
@@ -21,6 +22,7 @@ from robot_server.service.json_api import (
     MultiBody,
     MultiBodyMeta,
     PydanticResponse,
+    ResponseList,
 )
 from robot_server.robot.control.dependencies import require_estop_in_good_state
 
@@ -63,6 +65,13 @@ class CommandNotAllowed(ErrorDetails):
     title: str = "Setup Command Not Allowed"
 
 
+class CommandTimingNotEnabled(ErrorDetails):
+    """An error if command timing was requested from an engine not recording it."""
+
+    id: Literal["CommandTimingNotEnabled"] = "CommandTimingNotEnabled"
+    title: str = "Command Timing Not Enabled"
+
+
 class CommandLinkMeta(BaseModel):
     """Metadata about a command resource referenced in `links`."""
 
@@ -364,3 +373,46 @@ async def get_run_command(
         content=SimpleBody.construct(data=command),
         status_code=status.HTTP_200_OK,
     )
+
+
+@PydanticResponse.wrap_route(
+    commands_router.get,
+    path="/runs/{runId}/commandTimings",
+    summary="Get per-command-type execution timing of the current run",
+    description=(
+        "Get latency histograms of every command type the current run has executed,"
+        " split into time spent waiting in the queue, time spent executing,"
+        " and time spent updating the run's state."
+        "\n\n"
+        "Timing is only recorded when the `enablePerformanceMetrics`"
+        " advanced setting was on when the run was created."
+    ),
+    responses={
+        status.HTTP_200_OK: {"model": SimpleBody[ResponseList[CommandTypeTiming]]},
+        status.HTTP_404_NOT_FOUND: {"model": ErrorBody[RunNotFound]},
+        status.HTTP_409_CONFLICT: {
+            "model": ErrorBody[Union[RunStopped, CommandTimingNotEnabled]]
+        },
+    },
+)
+async def get_run_command_timings(
+    protocol_engine: ProtocolEngine = Depends(get_current_run_engine_from_url),
+) -> PydanticResponse[SimpleBody[ResponseList[CommandTypeTiming]]]:
+    """Get the current run's per-command-type execution timing.
+
+    Arguments:
+        protocol_engine: The current run's ProtocolEngine.
+    """
+    command_timing = protocol_engine.get_command_timing()
+
+    if command_timing is None:
+        raise CommandTimingNotEnabled(
+            detail="Command timing is not being recorded for this run."
+        ).as_error(status.HTTP_409_CONFLICT)
+
+    return await PydanticResponse.create(
+        content=SimpleBody.construct(
+            data=ResponseList.construct(__root__=command_timing)
+        ),
+        status_code=status.HTTP_200_OK,
+    )
@@ -192,7 +192,8 @@ class RunDataManager:
         )
         await self._runs_publisher.initialize(
             get_current_command=self.get_current_command,
-            get_state_summary=self._get_good_state_summary,
+            get_run_status=self._get_run_status,
+            get_command_count=self._get_command_count,
             run_id=run_id,
         )
 
@@ -396,6 +397,23 @@ class RunDataManager:
         summary = self._get_state_summary(run_id)
         return summary if isinstance(summary, StateSummary) else None
 
+    def _get_run_status(self, run_id: str) -> Optional[EngineStatus]:
+        if run_id == self._engine_store.current_run_id:
+            # Much cheaper than building the current run's whole state summary.
+            return self._engine_store.engine.state_view.commands.get_status()
+        summary = self._get_good_state_summary(run_id)
+        return summary.status if summary is not None else None
+
+    def _get_command_count(self, run_id: str) -> Optional[int]:
+        if run_id == self._engine_store.current_run_id:
+            return self._engine_store.engine.state_view.commands.get_count()
+        if self._get_good_state_summary(run_id) is None:
+            return None
+        # The store counts commands without loading any of them.
+        return self._run_store.get_commands_slice(
+            run_id=run_id, length=0, cursor=None
+        ).total_length
+
     def _get_run_time_parameters(self, run_id: str) -> List[RunTimeParameter]:
         if run_id == self._engine_store.current_run_id:
             return self._engine_store.runner.run_time_parameters
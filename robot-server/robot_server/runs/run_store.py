@@ -27,7 +27,9 @@ from robot_server.persistence.tables import (
     action_table,
 )
 from robot_server.persistence.pydantic import (
+    compressed_json_to_pydantic,
     json_to_pydantic,
+    pydantic_to_compressed_json,
     pydantic_to_json,
     json_to_pydantic_list,
     pydantic_list_to_json,
@@ -164,7 +166,7 @@ class RunStore:
                         "run_id": run_id,
                         "index_in_run": command_index,
                         "command_id": command.id,
-                        "command": pydantic_to_json(command),
+                        "command": pydantic_to_compressed_json(command),
                     },
                 )
 
@@ -432,7 +434,7 @@ class RunStore:
             slice_result = transaction.execute(select_slice).all()
 
         sliced_commands: List[Command] = [
-            json_to_pydantic(Command, row.command)  # type: ignore[arg-type]
+            compressed_json_to_pydantic(Command, row.command)  # type: ignore[arg-type]
             for row in slice_result
         ]
 
@@ -470,7 +472,7 @@ class RunStore:
             if command is None:
                 raise CommandNotFoundError(command_id=command_id)
 
-        return json_to_pydantic(Command, command)  # type: ignore[arg-type]
+        return compressed_json_to_pydantic(Command, command)  # type: ignore[arg-type]
 
     def remove(self, run_id: str) -> None:
         """Remove a run by its unique identifier.
@@ -1,12 +1,17 @@
-from fastapi import APIRouter, Query, Response
-from typing import Dict
+from fastapi import APIRouter, Query, Response, status
+from starlette.responses import StreamingResponse
+from typing import Dict, Optional
 
 from opentrons.system import log_control
 
+from robot_server.errors.error_responses import LegacyErrorResponse
 from robot_server.service.legacy.models.logs import LogIdentifier, LogFormat
 
 router = APIRouter()
 
+# journald cursors are semicolon-separated fields, like "s=0123abcd;i=4f2;..."
+CURSOR_PATTERN = r"^[a-z]=[0-9a-f]+(;[a-z]=[0-9a-f]+)*$"
+
 IDENTIFIER_TO_SYSLOG_ID: Dict[LogIdentifier, str] = {
     LogIdentifier.api: "opentrons-api",
     LogIdentifier.serial: log_control.SERIAL_SPECIAL,
@@ -26,7 +31,16 @@ IDENTIFIER_TO_SYSLOG_ID: Dict[LogIdentifier, str] = {
         ' like "aspirated 5 µL from well A1...", you probably want the'
         " *protocol analysis commands* (`GET /protocols/{id}/analyses/{id}`)"
         " or *run commands* (`GET /runs/{id}/commands`) instead."
+        "\n\n"
+        "The logs are streamed as they are read. To only get records"
+        " written since an earlier request, pass the cursor of the last"
+        " record you got as `cursor`. Text logs end with a"
+        " `-- cursor: <cursor>` line, and JSON records have a"
+        " `__CURSOR` field."
     ),
+    responses={
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": LegacyErrorResponse},
+    },
 )
 async def get_logs(
     log_identifier: LogIdentifier,
@@ -38,16 +52,28 @@ async def get_logs(
         gt=0,
         le=log_control.MAX_RECORDS,
     ),
-) -> Response:
+    cursor: Optional[str] = Query(
+        None,
+        title="Only retrieve records after the record at this cursor",
+        regex=CURSOR_PATTERN,
+    ),
+) -> StreamingResponse:
     syslog_id = IDENTIFIER_TO_SYSLOG_ID[log_identifier]
     modes = {
         LogFormat.json: ("json", "application/json"),
         LogFormat.text: ("short-precise", "text/plain"),
     }
     format_type, media_type = modes[format]
-    output = await log_control.get_records_dumb(syslog_id, records, format_type)
-    return Response(
-        content=output.decode("utf-8"),
+    try:
+        stream = await log_control.stream_records(
+            syslog_id, records, format_type, cursor
+        )
+    except (log_control.LogReadError, OSError) as e:
+        raise LegacyErrorResponse.from_exc(e).as_error(
+            status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+    return StreamingResponse(
+        stream,
         media_type=media_type,
         headers=dict(response.headers),
     )
@@ -9,8 +9,12 @@ from .notification_client import (
 from .publisher_notifier import PublisherNotifier, get_notify_publishers
 from .publishers import (
     MaintenanceRunsPublisher,
+    NotifyRunStateBody,
+    RunStateCommandSummary,
     RunsPublisher,
+    clean_up_runs_publisher,
     get_maintenance_runs_publisher,
+    get_run_state_topic,
     get_runs_publisher,
 )
 from .change_notifier import ChangeNotifier
@@ -22,9 +26,14 @@ __all__ = [
     # notification "route" equivalents
     "MaintenanceRunsPublisher",
     "RunsPublisher",
+    # pushed message payloads
+    "NotifyRunStateBody",
+    "RunStateCommandSummary",
+    "get_run_state_topic",
     # initialization and teardown
     "initialize_notifications",
     "clean_up_notification_client",
+    "clean_up_runs_publisher",
     # for use by FastAPI
     "get_notification_client",
     "get_notify_publishers",
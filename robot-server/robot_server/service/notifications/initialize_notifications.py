@@ -7,5 +7,5 @@ from .publisher_notifier import initialize_publisher_notifier
 
 async def initialize_notifications(app_state: AppState) -> None:
     """Initialize the notification system for the given app state."""
-    initialize_notification_client(app_state)
+    await initialize_notification_client(app_state)
     await initialize_publisher_notifier(app_state)
@@ -7,7 +7,7 @@ from fastapi import Depends
 from typing import Any, Dict, Optional
 from enum import Enum
 
-from ..json_api import NotifyRefetchBody, NotifyUnsubscribeBody
+from ..json_api import BaseResponseBody, NotifyRefetchBody, NotifyUnsubscribeBody
 from server_utils.fastapi_utils.app_state import (
     AppState,
     AppStateAccessor,
@@ -96,6 +96,17 @@ class NotificationClient:
         """
         await to_thread.run_sync(self.publish_advise_unsubscribe, topic)
 
+    async def publish_message_async(
+        self, topic: str, message: BaseResponseBody
+    ) -> None:
+        """Asynchronously publish a message on a specific topic to the MQTT broker.
+
+        Args:
+            topic: The topic to publish the message on.
+            message: The message to publish.
+        """
+        await to_thread.run_sync(self.publish_message, topic, message)
+
     def publish_advise_refetch(
         self,
         topic: str,
@@ -132,6 +143,28 @@ class NotificationClient:
             retain=self._retain_message,
         )
 
+    def publish_message(
+        self,
+        topic: str,
+        message: BaseResponseBody,
+    ) -> None:
+        """Publish a message on a specific topic to the MQTT broker.
+
+        Unlike refetch and unsubscribe flags, the message carries data itself,
+        so subscribers can update without a round trip through the HTTP API.
+
+        Args:
+            topic: The topic to publish the message on.
+            message: The message to publish.
+        """
+        payload = message.json()
+        self._client.publish(
+            topic=topic,
+            payload=payload,
+            qos=self._default_qos,
+            retain=self._retain_message,
+        )
+
     def _on_connect(
         self,
         client: mqtt.Client,
@@ -180,7 +213,7 @@ _notification_client_accessor: AppStateAccessor[NotificationClient] = AppStateAc
 ]("notification_client")
 
 
-def initialize_notification_client(app_state: AppState) -> None:
+async def initialize_notification_client(app_state: AppState) -> None:
     """Create a new `NotificationClient` and store it on `app_state`.
 
     Intended to be called just once, when the server starts up.
@@ -189,7 +222,9 @@ def initialize_notification_client(app_state: AppState) -> None:
     _notification_client_accessor.set_on(app_state, notification_client)
 
     try:
-        notification_client.connect()
+        # Connecting is blocking network I/O. Do it in a worker thread so it doesn't
+        # stall the hardware and persistence initialization running on the event loop.
+        await to_thread.run_sync(notification_client.connect)
     except Exception as error:
         log.info(f"Could not successfully connect to notification server: {error}")
 
@@ -7,7 +7,14 @@ from .maintenance_runs_publisher import (
     MaintenanceRunsPublisher,
     get_maintenance_runs_publisher,
 )
-from .runs_publisher import RunsPublisher, get_runs_publisher
+from .runs_publisher import (
+    NotifyRunStateBody,
+    RunStateCommandSummary,
+    RunsPublisher,
+    clean_up_runs_publisher,
+    get_run_state_topic,
+    get_runs_publisher,
+)
 
 __all__ = [
     # publish "route" equivalents
@@ -16,4 +23,10 @@ __all__ = [
     # for use by FastAPI
     "get_maintenance_runs_publisher",
     "get_runs_publisher",
+    # teardown
+    "clean_up_runs_publisher",
+    # pushed message payloads
+    "NotifyRunStateBody",
+    "RunStateCommandSummary",
+    "get_run_state_topic",
 ]
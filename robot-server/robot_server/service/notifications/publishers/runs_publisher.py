@@ -1,27 +1,37 @@
 import asyncio
+from datetime import datetime
 from fastapi import Depends
 from dataclasses import dataclass
-from typing import Callable, Optional
+from typing import Awaitable, Callable, Dict, Optional
 
-from opentrons.protocol_engine import CurrentCommand, StateSummary, EngineStatus
+from pydantic import BaseModel, Field
+
+from opentrons.protocol_engine import CurrentCommand, EngineStatus
 
 from server_utils.fastapi_utils.app_state import (
     AppState,
     AppStateAccessor,
     get_app_state,
 )
+from robot_server.settings import get_settings
+from ...json_api import BaseResponseBody
 from ..notification_client import NotificationClient, get_notification_client
 from ..publisher_notifier import PublisherNotifier, get_publisher_notifier
 from ..topics import Topics
 
 
+DEFAULT_PUBLISH_INTERVAL = 0.1
+"""The minimum time, in seconds, between messages published to one topic."""
+
+
 @dataclass
 class RunHooks:
     """Generated during a protocol run. Utilized by RunsPublisher."""
 
     run_id: str
     get_current_command: Callable[[str], Optional[CurrentCommand]]
-    get_state_summary: Callable[[str], Optional[StateSummary]]
+    get_run_status: Callable[[str], Optional[EngineStatus]]
+    get_command_count: Callable[[str], Optional[int]]
 
 
 @dataclass
@@ -29,23 +39,90 @@ class EngineStateSlice:
     """Protocol Engine state relevant to RunsPublisher."""
 
     current_command: Optional[CurrentCommand] = None
-    state_summary_status: Optional[EngineStatus] = None
+    run_status: Optional[EngineStatus] = None
+
+
+@dataclass
+class _PendingPublish:
+    """A publish waiting out the rest of its topic's publish interval."""
+
+    task: "asyncio.Task[None]"
+    publish: Callable[[], Awaitable[None]]
+
+
+class RunStateCommandSummary(BaseModel):
+    """The currently executing command, as pushed in a `NotifyRunStateBody`."""
+
+    id: str = Field(..., description="The command's unique identifier.")
+    key: str = Field(..., description="The command's tracking key.")
+    createdAt: datetime = Field(..., description="When the command was created.")
+    index: int = Field(..., description="The command's index in the run.")
+
+
+class NotifyRunStateBody(BaseResponseBody):
+    """A notification response that pushes a compact summary of the run's state.
+
+    Clients subscribed to a run's state topic can update from this directly,
+    instead of refetching `/runs/{runId}` and `/runs/{runId}/commands`.
+    """
+
+    runId: str = Field(..., description="The run's unique identifier.")
+    status: EngineStatus = Field(..., description="The run's current status.")
+    currentCommand: Optional[RunStateCommandSummary] = Field(
+        None,
+        description=(
+            "The currently executing command,"
+            " or the most recently executed one if none is executing."
+            " Omitted if the run hasn't executed any commands."
+        ),
+    )
+    commandCount: int = Field(
+        ..., description="The total number of commands in the run."
+    )
+
+
+def get_run_state_topic(run_id: str) -> str:
+    """Get the topic that `NotifyRunStateBody` messages for a run are pushed on.
+
+    Subscribing to this topic is opt-in. Clients that don't subscribe keep
+    receiving refetch flags on the run's other topics, as before.
+    """
+    return f"{Topics.RUNS}/{run_id}/state"
 
 
 class RunsPublisher:
-    """Publishes protocol runs topics."""
+    """Publishes protocol runs topics.
+
+    Messages are coalesced per topic: the first change publishes right away,
+    and further changes within `publish_interval` seconds are rolled into a single
+    publish at the end of the interval. A run can change state many times a
+    second, and clients only need to know that they should refetch.
+
+    Alongside the refetch flags, each run's state topic (see `get_run_state_topic`)
+    has compact `NotifyRunStateBody` payloads pushed to it, so clients that opt in
+    by subscribing to it don't need to refetch at all.
+    """
 
     def __init__(
-        self, client: NotificationClient, publisher_notifier: PublisherNotifier
+        self,
+        client: NotificationClient,
+        publisher_notifier: PublisherNotifier,
+        publish_interval: float = DEFAULT_PUBLISH_INTERVAL,
     ) -> None:
         """Returns a configured Runs Publisher."""
         self._client = client
         self._publisher_notifier = publisher_notifier
+        self._publish_interval = publish_interval
         self._run_data_manager_polling = asyncio.Event()
         self._poller: Optional[asyncio.Task[None]] = None
+
         #  Variables and callbacks related to PE state changes.
         self._run_hooks: Optional[RunHooks] = None
         self._engine_state_slice: Optional[EngineStateSlice] = None
+        # When each topic last had a message published, in event loop time.
+        self._last_publish_times: Dict[str, float] = {}
+        # Messages waiting out the rest of their topic's publish interval.
+        self._pending_publishes: Dict[str, _PendingPublish] = {}
 
         self._publisher_notifier.register_publish_callbacks(
             [self._handle_current_command_change, self._handle_engine_status_change]
@@ -55,76 +132,186 @@ class RunsPublisher:
         self,
         run_id: str,
         get_current_command: Callable[[str], Optional[CurrentCommand]],
-        get_state_summary: Callable[[str], Optional[StateSummary]],
+        get_run_status: Callable[[str], Optional[EngineStatus]],
+        get_command_count: Callable[[str], Optional[int]],
     ) -> None:
         """Initialize RunsPublisher with necessary information derived from the current run.
 
+        The callbacks are called on every engine state change, so they should be cheap.
+
         Args:
             run_id: ID of the current run.
             get_current_command: Callback to get the currently executing command, if any.
-            get_state_summary: Callback to get the current run's state summary, if any.
+            get_run_status: Callback to get the current run's engine status, if any.
+            get_command_count: Callback to get the current run's number of commands, if any.
         """
         self._run_hooks = RunHooks(
             run_id=run_id,
             get_current_command=get_current_command,
-            get_state_summary=get_state_summary,
+            get_run_status=get_run_status,
+            get_command_count=get_command_count,
         )
         self._engine_state_slice = EngineStateSlice()
 
         await self._publish_runs_advise_refetch_async()
+        await self._publish_run_state()
 
     async def clean_up_current_run(self) -> None:
         """Publish final refetch and unsubscribe flags."""
         await self._publish_runs_advise_refetch_async()
+        await self._publish_run_state()
+        # Clients are about to be told to unsubscribe, so don't hold anything back.
+        await self._flush_pending_publishes()
         await self._publish_runs_advise_unsubscribe_async()
 
+    async def clean_up(self) -> None:
+        """Cancel any pending publishes without sending them.
+
+        Intended to be called just once, when the server shuts down.
+        """
+        pending_publishes = self._pending_publishes
+        self._pending_publishes = {}
+        for pending_publish in pending_publishes.values():
+            pending_publish.task.cancel()
+        await asyncio.gather(
+            *(pending_publish.task for pending_publish in pending_publishes.values()),
+            return_exceptions=True,
+        )
+
     async def _publish_current_command(self) -> None:
         """Publishes the equivalent of GET /runs/:runId/commands?cursor=null&pageLength=1."""
-        await self._client.publish_advise_refetch_async(
-            topic=Topics.RUNS_CURRENT_COMMAND
-        )
+        await self._publish_refetch(topic=Topics.RUNS_CURRENT_COMMAND)
 
     async def _publish_runs_advise_refetch_async(self) -> None:
         """Publish a refetch flag for relevant runs topics."""
         if self._run_hooks is not None:
-            await self._client.publish_advise_refetch_async(topic=Topics.RUNS)
-            await self._client.publish_advise_refetch_async(
-                topic=f"{Topics.RUNS}/{self._run_hooks.run_id}"
+            await self._publish_refetch(topic=Topics.RUNS)
+            await self._publish_refetch(topic=f"{Topics.RUNS}/{self._run_hooks.run_id}")
+
+    async def _publish_refetch(self, topic: str) -> None:
+        """Publish a refetch flag to `topic`, at most once per publish interval."""
+
+        async def publish() -> None:
+            await self._client.publish_advise_refetch_async(topic=topic)
+
+        await self._publish_coalesced(topic=topic, publish=publish)
+
+    async def _publish_run_state(self) -> None:
+        """Push the current run's state to its state topic, at most once per publish interval."""
+        if self._run_hooks is not None:
+            run_hooks = self._run_hooks
+            topic = get_run_state_topic(run_hooks.run_id)
+
+            async def publish() -> None:
+                # Built when it's actually sent, so a coalesced publish has the
+                # latest state rather than the state when it was scheduled.
+                message = self._build_run_state(run_hooks)
+                if message is not None:
+                    await self._client.publish_message_async(
+                        topic=topic, message=message
+                    )
+
+            await self._publish_coalesced(topic=topic, publish=publish)
+
+    @staticmethod
+    def _build_run_state(run_hooks: RunHooks) -> Optional[NotifyRunStateBody]:
+        run_id = run_hooks.run_id
+        run_status = run_hooks.get_run_status(run_id)
+        command_count = run_hooks.get_command_count(run_id)
+        if run_status is None or command_count is None:
+            return None
+
+        current_command = run_hooks.get_current_command(run_id)
+        # Skip validation, since every field comes straight from engine state.
+        return NotifyRunStateBody.construct(
+            runId=run_id,
+            status=run_status,
+            currentCommand=(
+                RunStateCommandSummary.construct(
+                    id=current_command.command_id,
+                    key=current_command.command_key,
+                    createdAt=current_command.created_at,
+                    index=current_command.index,
+                )
+                if current_command is not None
+                else None
+            ),
+            commandCount=command_count,
+        )
+
+    async def _publish_coalesced(
+        self, topic: str, publish: Callable[[], Awaitable[None]]
+    ) -> None:
+        """Call `publish` for `topic` now, or at the end of the topic's publish interval."""
+        if topic in self._pending_publishes:
+            # The pending publish will cover this change, too.
+            return
+        now = asyncio.get_running_loop().time()
+        last_publish_time = self._last_publish_times.get(topic)
+        if last_publish_time is None or (
+            now - last_publish_time >= self._publish_interval
+        ):
+            self._last_publish_times[topic] = now
+            await publish()
+        else:
+            delay = last_publish_time + self._publish_interval - now
+            self._pending_publishes[topic] = _PendingPublish(
+                task=asyncio.create_task(
+                    self._publish_later(topic=topic, delay=delay, publish=publish)
+                ),
+                publish=publish,
             )
 
+    async def _publish_later(
+        self, topic: str, delay: float, publish: Callable[[], Awaitable[None]]
+    ) -> None:
+        await asyncio.sleep(delay)
+        del self._pending_publishes[topic]
+        self._last_publish_times[topic] = asyncio.get_running_loop().time()
+        await publish()
+
+    async def _flush_pending_publishes(self) -> None:
+        """Publish all pending messages right away."""
+        pending_publishes = self._pending_publishes
+        self._pending_publishes = {}
+        for topic, pending_publish in pending_publishes.items():
+            pending_publish.task.cancel()
+            self._last_publish_times[topic] = asyncio.get_running_loop().time()
+            await pending_publish.publish()
+
     async def _publish_runs_advise_unsubscribe_async(self) -> None:
         """Publish an unsubscribe flag for relevant runs topics."""
         if self._run_hooks is not None:
             await self._client.publish_advise_unsubscribe_async(
                 topic=f"{Topics.RUNS}/{self._run_hooks.run_id}"
             )
+            await self._client.publish_advise_unsubscribe_async(
+                topic=get_run_state_topic(self._run_hooks.run_id)
+            )
 
     async def _handle_current_command_change(self) -> None:
-        """Publish a refetch flag if the current command has changed."""
+        """Publish a refetch flag and the run's state if the current command has changed."""
         if self._run_hooks is not None and self._engine_state_slice is not None:
             current_command = self._run_hooks.get_current_command(
                 self._run_hooks.run_id
             )
             if self._engine_state_slice.current_command != current_command:
                 await self._publish_current_command()
+                await self._publish_run_state()
                 self._engine_state_slice.current_command = current_command
 
     async def _handle_engine_status_change(self) -> None:
-        """Publish a refetch flag if the engine status has changed."""
+        """Publish a refetch flag and the run's state if the engine status has changed."""
         if self._run_hooks is not None and self._engine_state_slice is not None:
-            current_state_summary = self._run_hooks.get_state_summary(
-                self._run_hooks.run_id
-            )
+            run_status = self._run_hooks.get_run_status(self._run_hooks.run_id)
 
             if (
-                current_state_summary is not None
-                and self._engine_state_slice.state_summary_status
-                != current_state_summary.status
+                run_status is not None
+                and self._engine_state_slice.run_status != run_status
             ):
                 await self._publish_runs_advise_refetch_async()
-                self._engine_state_slice.state_summary_status = (
-                    current_state_summary.status
-                )
+                await self._publish_run_state()
+                self._engine_state_slice.run_status = run_status
 
 
 _runs_publisher_accessor: AppStateAccessor[RunsPublisher] = AppStateAccessor[
@@ -142,8 +329,20 @@ async def get_runs_publisher(
 
     if runs_publisher is None:
         runs_publisher = RunsPublisher(
-            client=notification_client, publisher_notifier=publisher_notifier
+            client=notification_client,
+            publisher_notifier=publisher_notifier,
+            publish_interval=get_settings().runs_publish_interval,
         )
         _runs_publisher_accessor.set_on(app_state, runs_publisher)
 
     return runs_publisher
+
+
+async def clean_up_runs_publisher(app_state: AppState) -> None:
+    """Clean up the `RunsPublisher` stored on `app_state`, if there is one.
+
+    Intended to be called just once, when the server shuts down.
+    """
+    runs_publisher = _runs_publisher_accessor.get_from(app_state)
+    if runs_publisher is not None:
+        await runs_publisher.clean_up()
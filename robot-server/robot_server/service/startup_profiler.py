@@ -0,0 +1,97 @@
+"""Timing of the server's startup phases."""
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional
+
+from fastapi import Depends
+
+from server_utils.fastapi_utils.app_state import (
+    AppState,
+    AppStateAccessor,
+    get_app_state,
+)
+
+
+@dataclass(frozen=True)
+class StartupPhaseTiming:
+    """When one phase of server startup ran, and how long it took.
+
+    Attributes:
+        name: A short identifier for the phase, like `"hardware_init"`.
+        start: When the phase started, in seconds since server startup began.
+        duration: How long the phase took, in seconds,
+            or `None` if it's still in progress.
+        succeeded: Whether the phase completed without raising,
+            or `None` if it's still in progress.
+    """
+
+    name: str
+    start: float
+    duration: Optional[float]
+    succeeded: Optional[bool]
+
+
+class StartupProfiler:
+    """Records the timing of named startup phases, which may overlap."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._origin = clock()
+        # Dicts are insertion-ordered, so phases are reported in the order they began.
+        self._phases: Dict[str, StartupPhaseTiming] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as the startup phase `name`.
+
+        This works around `await`s, so it can time async work, too.
+        """
+        start = self._clock() - self._origin
+        self._phases[name] = StartupPhaseTiming(
+            name=name, start=start, duration=None, succeeded=None
+        )
+        succeeded = False
+        try:
+            yield
+            succeeded = True
+        finally:
+            self._phases[name] = StartupPhaseTiming(
+                name=name,
+                start=start,
+                duration=self._clock() - self._origin - start,
+                succeeded=succeeded,
+            )
+
+    def get_phases(self) -> List[StartupPhaseTiming]:
+        """Return every phase that has started so far, in the order they started."""
+        return list(self._phases.values())
+
+
+_startup_profiler_accessor = AppStateAccessor[StartupProfiler]("startup_profiler")
+
+
+def initialize_startup_profiler(app_state: AppState) -> None:
+    """Start timing server startup.
+
+    This should be called once, as early as possible in server startup.
+    """
+    _startup_profiler_accessor.set_on(app_state, StartupProfiler())
+
+
+@contextmanager
+def startup_phase(app_state: AppState, name: str) -> Iterator[None]:
+    """Time the enclosed block as a startup phase, if startup is being profiled."""
+    profiler = _startup_profiler_accessor.get_from(app_state)
+    if profiler is None:
+        yield
+    else:
+        with profiler.phase(name):
+            yield
+
+
+async def get_startup_profiler(
+    app_state: AppState = Depends(get_app_state),
+) -> Optional[StartupProfiler]:
+    """Get the server's startup profiler, if startup was profiled."""
+    return _startup_profiler_accessor.get_from(app_state)
@@ -94,5 +94,24 @@ class RobotServerSettings(BaseSettings):
         ),
     )
 
+    use_virtual_clock: bool = Field(
+        default=False,
+        description=(
+            "When the hardware is simulated, let protocol delays pass instantly"
+            " instead of in real time. Run commands are timestamped as if the"
+            " delays had been waited out. Has no effect on real hardware."
+        ),
+    )
+
+    runs_publish_interval: float = Field(
+        default=0.1,
+        ge=0,
+        description=(
+            "The minimum time, in seconds, between notifications published to"
+            " one runs topic. Changes within this interval are coalesced into a"
+            " single notification at its end."
+        ),
+    )
+
     class Config:
         env_prefix = "OT_ROBOT_SERVER_"
@@ -6,7 +6,12 @@ from starlette.testclient import TestClient
 
 from opentrons.protocol_api import MAX_SUPPORTED_VERSION, MIN_SUPPORTED_VERSION
 
+from robot_server.app import app
 from robot_server.health.router import ComponentVersions, get_versions, _get_version
+from robot_server.service.startup_profiler import (
+    StartupProfiler,
+    get_startup_profiler,
+)
 
 
 def test_get_health(
@@ -84,6 +89,38 @@ def test_get_health_with_none_version(
     assert text == expected
 
 
+def test_get_health_with_startup_phases(
+    api_client: TestClient, hardware: MagicMock
+) -> None:
+    """Test GET /health reports the timing of server startup phases."""
+    hardware.fw_version = "FW111"
+    hardware.board_revision = "BR2.1"
+    hardware.get_serial_number.return_value = None
+    clock = iter([100.0, 100.5, 102.0])
+    startup_profiler = StartupProfiler(clock=lambda: next(clock))
+    with startup_profiler.phase("hardware_init"):
+        pass
+
+    async def get_startup_profiler_override() -> StartupProfiler:
+        return startup_profiler
+
+    app.dependency_overrides[get_startup_profiler] = get_startup_profiler_override
+    try:
+        resp = api_client.get("/health")
+    finally:
+        del app.dependency_overrides[get_startup_profiler]
+
+    assert resp.status_code == 200
+    assert resp.json()["startup_phases"] == [
+        {
+            "name": "hardware_init",
+            "start_seconds": 0.5,
+            "duration_seconds": 1.5,
+            "succeeded": True,
+        },
+    ]
+
+
 @pytest.fixture
 def mock_version_file_contents() -> Iterator[MagicMock]:
     """Returns a mock for version file contents."""
@@ -17,6 +17,7 @@ class DevServer:
         persistence_directory: Optional[Path] = None,
         maximum_runs: Optional[int] = None,
         maximum_unused_protocols: Optional[int] = None,
+        use_virtual_clock: bool = False,
     ) -> None:
         """Initialize a dev server."""
         self.port: str = port
@@ -35,6 +36,7 @@ class DevServer:
 
         self.maximum_runs = maximum_runs
         self.maximum_unused_protocols = maximum_unused_protocols
+        self.use_virtual_clock = use_virtual_clock
 
     def __enter__(self) -> DevServer:
         return self
@@ -64,6 +66,8 @@ class DevServer:
             env["OT_ROBOT_SERVER_maximum_unused_protocols"] = str(
                 self.maximum_unused_protocols
             )
+        if self.use_virtual_clock:
+            env["OT_ROBOT_SERVER_use_virtual_clock"] = "true"
 
         # In order to collect coverage we run using `coverage`.
         # `-a` is to append to existing `.coverage` file.
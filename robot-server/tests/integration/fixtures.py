@@ -1,5 +1,6 @@
 """Fixtures to be used by Tavern tests."""
 
+from typing import Any, Dict
 
 from box import Box
 from requests import Response
@@ -33,6 +34,7 @@ def check_health_response(response: Response) -> None:
         "robot_serial": "simulator",
     }
     got = response.json()
+    _check_startup_phases(got)
 
     assert got == expected, f"health response failed:\n {got}"
 
@@ -64,10 +66,20 @@ def check_ot3_health_response(response: Response) -> None:
         "robot_serial": "simulator",
     }
     got = response.json()
+    _check_startup_phases(got)
 
     assert got == expected, f"health response failed:\n {got}"
 
 
+def _check_startup_phases(got: Dict[str, Any]) -> None:
+    """Check and remove the startup timing, which differs on every run."""
+    startup_phases = got.pop("startup_phases")
+    assert isinstance(startup_phases, list), f"bad startup_phases: {startup_phases}"
+    for phase in startup_phases:
+        assert isinstance(phase["name"], str)
+        assert phase["start_seconds"] >= 0
+
+
 def get_module_id(response: Response, module_model: ModuleModel) -> Box:
     """Get the first module id that matches module_model."""
     modules = response.json()["data"]
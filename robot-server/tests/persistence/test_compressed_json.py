@@ -0,0 +1,57 @@
+"""Tests for compressed_json."""
+
+import json
+
+import pytest
+
+from robot_server.persistence.compressed_json import compress_json, decompress_json
+
+
+@pytest.mark.parametrize(
+    "json_str",
+    [
+        "",
+        "{}",
+        json.dumps(
+            {
+                "id": "command-id",
+                "commandType": "aspirate",
+                "params": {"pipetteId": "pipette-id", "volume": 42.0},
+                "status": "succeeded",
+                "notes": [],
+            }
+        ),
+        json.dumps({"message": "non-ASCII µL 🧪"}),
+    ],
+)
+def test_round_trip(json_str: str) -> None:
+    """It should decompress to exactly what was compressed."""
+    assert decompress_json(compress_json(json_str)) == json_str
+
+
+def test_compresses_small_commands() -> None:
+    """Even a single small command should shrink, thanks to the preset dictionary."""
+    command = json.dumps(
+        {
+            "id": "d7c2ba91-1d6c-4d8b-a8b1-fa4d47a2e7c5",
+            "createdAt": "2024-03-01T12:00:00.000000+00:00",
+            "commandType": "dropTip",
+            "key": "b3e0b5d5b7a3f6c0f9d1c9a2e7b8c4d1",
+            "status": "succeeded",
+            "params": {
+                "pipetteId": "pipette-id",
+                "labwareId": "labware-id",
+                "wellName": "A1",
+                "wellLocation": {
+                    "origin": "top",
+                    "offset": {"x": 0.0, "y": 0.0, "z": 0.0},
+                },
+                "alternateDropLocation": False,
+            },
+            "result": {"position": {"x": 14.38, "y": 74.24, "z": 99.0}},
+            "startedAt": "2024-03-01T12:00:00.000000+00:00",
+            "completedAt": "2024-03-01T12:00:00.000000+00:00",
+            "notes": [],
+        }
+    )
+    assert len(compress_json(command)) < len(command) / 2
@@ -8,6 +8,7 @@ from typing import List, NamedTuple
 import pytest
 from decoy import Decoy
 from opentrons.protocol_engine.types import RunTimeParamValuesType
+from opentrons.protocols.duration import CommandDurationEstimate, DurationEstimate
 
 from sqlalchemy.engine import Engine as SQLEngine
 
@@ -255,6 +256,46 @@ async def test_update_adds_details_and_completes_analysis(
     }
 
 
+async def test_update_adds_estimated_duration(
+    subject: AnalysisStore, protocol_store: ProtocolStore
+) -> None:
+    """It should store the analysis's duration estimate, if there is one."""
+    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
+    estimated_duration = DurationEstimate(
+        totalDuration=1.5,
+        commands=[
+            CommandDurationEstimate(
+                commandId="command-id", commandType="home", duration=1.5
+            )
+        ],
+    )
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id")
+    await subject.update(
+        analysis_id="analysis-id",
+        robot_type="OT-2 Standard",
+        run_time_parameters=[],
+        labware=[],
+        pipettes=[],
+        modules=[],
+        commands=[],
+        errors=[],
+        liquids=[],
+        estimated_duration=estimated_duration,
+    )
+
+    result = await subject.get("analysis-id")
+    result_as_document = await subject.get_as_document("analysis-id")
+
+    assert isinstance(result, CompletedAnalysis)
+    assert result.estimatedDuration == estimated_duration
+    assert json.loads(result_as_document)["estimatedDuration"] == {
+        "totalDuration": 1.5,
+        "commands": [
+            {"commandId": "command-id", "commandType": "home", "duration": 1.5}
+        ],
+    }
+
+
 async def test_update_adds_rtp_values_and_defaults_to_completed_store(
     decoy: Decoy, sql_engine: SQLEngine, protocol_store: ProtocolStore
 ) -> None:
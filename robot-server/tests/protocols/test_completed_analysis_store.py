@@ -8,11 +8,14 @@ import pytest
 from sqlalchemy.engine import Engine
 from decoy import Decoy
 
+from robot_server.persistence.compressed_json import compress_json
 from robot_server.persistence.tables import analysis_table
 from robot_server.protocols.completed_analysis_store import (
     CompletedAnalysisResource,
     CompletedAnalysisStore,
+    _document_with_commands,
 )
+from opentrons.protocol_engine import commands as pe_commands
 from opentrons.protocol_reader import (
     ProtocolSource,
     JsonProtocolConfig,
@@ -82,6 +85,7 @@ def _completed_analysis_resource(
     analysis_id: str,
     protocol_id: str,
     rtp_values_and_defaults: Optional[Dict[str, RunTimeParameterAnalysisData]] = None,
+    commands: Optional[List[pe_commands.Command]] = None,
 ) -> CompletedAnalysisResource:
     return CompletedAnalysisResource(
         analysis_id,
@@ -94,7 +98,7 @@ def _completed_analysis_resource(
             pipettes=[],
             labware=[],
             modules=[],
-            commands=[],
+            commands=commands or [],
             errors=[],
             liquids=[],
         ),
@@ -175,6 +179,98 @@ async def test_get_by_analysis_id_as_document(
     }
 
 
+def _wait_for_resume(index: int) -> pe_commands.WaitForResume:
+    return pe_commands.WaitForResume(
+        id=f"command-id-{index}",
+        key=f"command-key-{index}",
+        status=pe_commands.CommandStatus.SUCCEEDED,
+        createdAt=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+        params=pe_commands.WaitForResumeParams(message=f"message {index}"),
+    )
+
+
+async def test_get_by_analysis_id_with_commands(
+    subject: CompletedAnalysisStore,
+    memcache: MemoryCache[str, CompletedAnalysisResource],
+    protocol_store: ProtocolStore,
+    decoy: Decoy,
+) -> None:
+    """It should store commands in their own rows and put them back in order."""
+    commands: List[pe_commands.Command] = [_wait_for_resume(i) for i in range(5)]
+    resource = _completed_analysis_resource(
+        "analysis-id", "protocol-id", commands=commands
+    )
+    protocol_store.insert(make_dummy_protocol_resource("protocol-id"))
+    await subject.make_room_and_add(resource)
+    decoy.when(memcache.get("analysis-id")).then_raise(KeyError())
+
+    assert await subject.get_by_id("analysis-id") == resource
+
+    document = await subject.get_by_id_as_document("analysis-id")
+    assert document is not None
+    assert [command["id"] for command in json.loads(document)["commands"]] == [
+        f"command-id-{i}" for i in range(5)
+    ]
+
+    summary = await subject.get_summary_by_id_as_document("analysis-id")
+    assert summary is not None
+    assert json.loads(summary) == {
+        key: value for key, value in json.loads(document).items() if key != "commands"
+    }
+
+
+@pytest.mark.parametrize(
+    ("cursor", "length", "expected_cursor", "expected_indices"),
+    [
+        (0, 2, 0, [0, 1]),
+        (3, 20, 3, [3, 4]),
+        (10, 2, 4, [4]),
+        (-1, 1, 0, [0]),
+    ],
+)
+@pytest.mark.parametrize("cached", [True, False])
+async def test_get_commands_slice(
+    subject: CompletedAnalysisStore,
+    memcache: MemoryCache[str, CompletedAnalysisResource],
+    protocol_store: ProtocolStore,
+    decoy: Decoy,
+    cached: bool,
+    cursor: int,
+    length: int,
+    expected_cursor: int,
+    expected_indices: List[int],
+) -> None:
+    """It should return a page of commands, from the database or from the cache."""
+    commands: List[pe_commands.Command] = [_wait_for_resume(i) for i in range(5)]
+    resource = _completed_analysis_resource(
+        "analysis-id", "protocol-id", commands=commands
+    )
+    protocol_store.insert(make_dummy_protocol_resource("protocol-id"))
+    await subject.make_room_and_add(resource)
+
+    if cached:
+        decoy.when(memcache.get("analysis-id")).then_return(resource)
+    else:
+        decoy.when(memcache.get("analysis-id")).then_raise(KeyError())
+
+    result = await subject.get_commands_slice("analysis-id", cursor, length)
+
+    assert result is not None
+    assert result.cursor == expected_cursor
+    assert result.total_length == 5
+    assert result.commands == [commands[i] for i in expected_indices]
+
+
+async def test_get_commands_slice_not_found(
+    subject: CompletedAnalysisStore,
+    memcache: MemoryCache[str, CompletedAnalysisResource],
+    decoy: Decoy,
+) -> None:
+    """It should return None if there is no analysis with the given ID."""
+    decoy.when(memcache.get("analysis-id")).then_raise(KeyError())
+    assert await subject.get_commands_slice("analysis-id", 0, 20) is None
+
+
 async def test_get_ids_by_protocol(
     subject: CompletedAnalysisStore, protocol_store: ProtocolStore
 ) -> None:
@@ -358,3 +454,21 @@ async def test_add_makes_room_for_new_analysis(
     ]
     for analysis_id in removed_ids:
         decoy.verify(memcache.remove(analysis_id))
+
+
+@pytest.mark.parametrize(
+    ("summary", "expected"),
+    [
+        ('{"id": "analysis-id"}', '{"id": "analysis-id", "commands": [{"id": 1}]}'),
+        ("{}", '{"commands": [{"id": 1}]}'),
+        ("{ }\n", '{"commands": [{"id": 1}]}'),
+    ],
+)
+def test_document_with_commands(summary: str, expected: str) -> None:
+    """It should splice the commands into any summary object, even an empty one."""
+    document = _document_with_commands(
+        compress_json(summary), [compress_json('{"id": 1}')]
+    )
+
+    assert document == expected
+    assert json.loads(document)["commands"] == [{"id": 1}]
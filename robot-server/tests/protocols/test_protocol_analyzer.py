@@ -16,6 +16,7 @@ from opentrons.protocol_engine import (
     types as pe_types,
 )
 import opentrons.protocol_runner as protocol_runner
+from opentrons.protocols.duration import CommandDurationEstimate, DurationEstimate
 from opentrons.protocol_reader import ProtocolSource, JsonProtocolConfig
 import opentrons.util.helpers as datetime_helper
 
@@ -68,13 +69,20 @@ def subject(
     )
 
 
+@pytest.mark.parametrize("enable_duration_estimates", [True, False])
 async def test_analyze(
     decoy: Decoy,
+    monkeypatch: pytest.MonkeyPatch,
     analysis_store: AnalysisStore,
     subject: ProtocolAnalyzer,
+    enable_duration_estimates: bool,
 ) -> None:
     """It should be able to analyze a protocol."""
     robot_type: RobotType = "OT-3 Standard"
+    monkeypatch.setenv(
+        "OT_API_FF_enableAnalysisDurationEstimates",
+        "true" if enable_duration_estimates else "false",
+    )
 
     protocol_resource = ProtocolResource(
         protocol_id="protocol-id",
@@ -177,6 +185,20 @@ async def test_analyze(
             pipettes=[analysis_pipette],
             errors=[analysis_error],
             liquids=[],
+            estimated_duration=(
+                DurationEstimate(
+                    totalDuration=0,
+                    commands=[
+                        CommandDurationEstimate(
+                            commandId="command-id",
+                            commandType="waitForResume",
+                            duration=0,
+                        )
+                    ],
+                )
+                if enable_duration_estimates
+                else None
+            ),
         ),
     )
 
@@ -7,6 +7,7 @@ from decoy import Decoy, matchers
 from fastapi import UploadFile
 from pathlib import Path
 
+from opentrons.protocol_engine import CommandSlice, commands as pe_commands
 from opentrons.protocol_engine.types import RunTimeParamValuesType
 from opentrons.protocols.api_support.types import APIVersion
 
@@ -66,6 +67,8 @@ from robot_server.protocols.router import (
     get_protocol_analyses,
     get_protocol_analysis_by_id,
     get_protocol_analysis_as_document,
+    get_protocol_analysis_summary_as_document,
+    get_protocol_analysis_commands,
 )
 
 
@@ -1523,3 +1526,124 @@ async def test_update_protocol_analyses_with_forced_reanalysis(
         AnalysisSummary(id="analysis-id-2", status=AnalysisStatus.PENDING),
     ]
     assert result.status_code == 201
+
+
+async def test_get_protocol_analysis_summary_as_document(
+    decoy: Decoy,
+    protocol_store: ProtocolStore,
+    analysis_store: AnalysisStore,
+) -> None:
+    """It should get a single analysis by ID, without its commands."""
+    decoy.when(protocol_store.has("protocol-id")).then_return(True)
+    decoy.when(analysis_store.get_summaries_by_protocol("protocol-id")).then_return(
+        [AnalysisSummary(id="analysis-id", status=AnalysisStatus.COMPLETED)]
+    )
+    decoy.when(await analysis_store.get_summary_as_document("analysis-id")).then_return(
+        '{"id": "analysis-id"}'
+    )
+
+    result = await get_protocol_analysis_summary_as_document(
+        protocolId="protocol-id",
+        analysisId="analysis-id",
+        protocol_store=protocol_store,
+        analysis_store=analysis_store,
+    )
+
+    assert result.status_code == 200
+    assert result.body.decode(result.charset) == '{"id": "analysis-id"}'
+
+
+async def test_get_protocol_analysis_commands(
+    decoy: Decoy,
+    protocol_store: ProtocolStore,
+    analysis_store: AnalysisStore,
+) -> None:
+    """It should get a page of an analysis's commands."""
+    command = pe_commands.WaitForResume(
+        id="command-id",
+        key="command-key",
+        status=pe_commands.CommandStatus.SUCCEEDED,
+        createdAt=datetime(year=2021, month=1, day=1),
+        params=pe_commands.WaitForResumeParams(message="hello"),
+    )
+    decoy.when(protocol_store.has("protocol-id")).then_return(True)
+    decoy.when(analysis_store.get_summaries_by_protocol("protocol-id")).then_return(
+        [AnalysisSummary(id="analysis-id", status=AnalysisStatus.COMPLETED)]
+    )
+    decoy.when(
+        await analysis_store.get_commands_slice("analysis-id", cursor=3, length=1)
+    ).then_return(CommandSlice(commands=[command], cursor=3, total_length=10))
+
+    result = await get_protocol_analysis_commands(
+        protocolId="protocol-id",
+        analysisId="analysis-id",
+        cursor=3,
+        pageLength=1,
+        protocol_store=protocol_store,
+        analysis_store=analysis_store,
+    )
+
+    assert result.status_code == 200
+    assert result.content.data == [command]
+    assert result.content.meta == MultiBodyMeta(cursor=3, totalLength=10)
+
+
+async def test_get_protocol_analysis_commands_analysis_not_found(
+    decoy: Decoy,
+    protocol_store: ProtocolStore,
+    analysis_store: AnalysisStore,
+) -> None:
+    """It should 404 if the analysis does not exist or is pending."""
+    decoy.when(protocol_store.has("protocol-id")).then_return(True)
+    decoy.when(analysis_store.get_summaries_by_protocol("protocol-id")).then_return(
+        [AnalysisSummary(id="analysis-id", status=AnalysisStatus.COMPLETED)]
+    )
+    decoy.when(
+        await analysis_store.get_commands_slice("analysis-id", cursor=0, length=20)
+    ).then_raise(AnalysisNotFoundError("oh no"))
+
+    with pytest.raises(ApiError) as exc_info:
+        await get_protocol_analysis_commands(
+            protocolId="protocol-id",
+            analysisId="analysis-id",
+            cursor=0,
+            pageLength=20,
+            protocol_store=protocol_store,
+            analysis_store=analysis_store,
+        )
+
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.content["errors"][0]["id"] == "AnalysisNotFound"
+
+
+async def test_get_protocol_analysis_of_other_protocol(
+    decoy: Decoy,
+    protocol_store: ProtocolStore,
+    analysis_store: AnalysisStore,
+) -> None:
+    """It should 404 if the analysis belongs to a different protocol."""
+    decoy.when(protocol_store.has("protocol-id")).then_return(True)
+    decoy.when(analysis_store.get_summaries_by_protocol("protocol-id")).then_return(
+        [AnalysisSummary(id="analysis-id", status=AnalysisStatus.COMPLETED)]
+    )
+
+    with pytest.raises(ApiError) as summary_exc_info:
+        await get_protocol_analysis_summary_as_document(
+            protocolId="protocol-id",
+            analysisId="other-analysis-id",
+            protocol_store=protocol_store,
+            analysis_store=analysis_store,
+        )
+    with pytest.raises(ApiError) as commands_exc_info:
+        await get_protocol_analysis_commands(
+            protocolId="protocol-id",
+            analysisId="other-analysis-id",
+            cursor=0,
+            pageLength=20,
+            protocol_store=protocol_store,
+            analysis_store=analysis_store,
+        )
+
+    for exc_info in (summary_exc_info, commands_exc_info):
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.content["errors"][0]["id"] == "AnalysisNotFound"
@@ -6,6 +6,8 @@ from decoy import Decoy, matchers
 
 from opentrons.protocol_engine import (
     CommandSlice,
+    CommandTimingHistogram,
+    CommandTypeTiming,
     CurrentCommand,
     ProtocolEngine,
     CommandNote,
@@ -29,6 +31,7 @@ from robot_server.runs.router.commands_router import (
     get_run_command,
     get_run_commands,
     get_current_run_engine_from_url,
+    get_run_command_timings,
 )
 
 
@@ -448,3 +451,46 @@ async def test_get_run_command_missing(
     assert exc_info.value.content["errors"][0]["detail"] == matchers.StringMatching(
         "oh no"
     )
+
+
+async def test_get_run_command_timings(
+    decoy: Decoy,
+    mock_protocol_engine: ProtocolEngine,
+) -> None:
+    """It should return the engine's per-command-type timing histograms."""
+    histogram = CommandTimingHistogram(
+        count=1,
+        totalSec=0.5,
+        minSec=0.5,
+        maxSec=0.5,
+        bucketUpperBoundsSec=[1.0],
+        bucketCounts=[1, 0],
+    )
+    command_timing = [
+        CommandTypeTiming(
+            commandType="home",
+            queueWait=histogram,
+            execute=histogram,
+            stateUpdate=histogram,
+        )
+    ]
+    decoy.when(mock_protocol_engine.get_command_timing()).then_return(command_timing)
+
+    result = await get_run_command_timings(protocol_engine=mock_protocol_engine)
+
+    assert result.content.data.__root__ == command_timing
+    assert result.status_code == 200
+
+
+async def test_get_run_command_timings_not_enabled(
+    decoy: Decoy,
+    mock_protocol_engine: ProtocolEngine,
+) -> None:
+    """It should 409 if the engine is not recording command timing."""
+    decoy.when(mock_protocol_engine.get_command_timing()).then_return(None)
+
+    with pytest.raises(ApiError) as exc_info:
+        await get_run_command_timings(protocol_engine=mock_protocol_engine)
+
+    assert exc_info.value.status_code == 409
+    assert exc_info.value.content["errors"][0]["id"] == "CommandTimingNotEnabled"
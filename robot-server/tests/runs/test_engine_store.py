@@ -1,6 +1,8 @@
 """Tests for the EngineStore interface."""
+import asyncio
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Callable, List
 import pytest
 from decoy import Decoy, matchers
 
@@ -10,7 +12,12 @@ from opentrons_shared_data.robot.dev_types import RobotType
 from opentrons.types import DeckSlotName
 from opentrons.hardware_control import HardwareControlAPI, API
 from opentrons.hardware_control.types import EstopStateNotification, EstopState
-from opentrons.protocol_engine import ProtocolEngine, StateSummary, types as pe_types
+from opentrons.protocol_engine import (
+    ProtocolEngine,
+    StateSummary,
+    create_protocol_engine,
+    types as pe_types,
+)
 from opentrons.protocol_runner import (
     RunResult,
     LiveRunner,
@@ -19,6 +26,7 @@ from opentrons.protocol_runner import (
 from opentrons.protocol_reader import ProtocolReader, ProtocolSource
 
 from robot_server.protocols.protocol_store import ProtocolResource
+from robot_server.runs import engine_store
 from robot_server.runs.engine_store import (
     EngineStore,
     EngineConflictError,
@@ -232,6 +240,135 @@ async def test_clear_idle_engine(subject: EngineStore) -> None:
         subject.runner
 
 
+@pytest.fixture
+def created_engines(monkeypatch: pytest.MonkeyPatch) -> List[ProtocolEngine]:
+    """Record every engine that the subject builds, in order."""
+    engines: List[ProtocolEngine] = []
+
+    async def _create_protocol_engine(**kwargs: Any) -> ProtocolEngine:
+        engine = await create_protocol_engine(**kwargs)
+        engines.append(engine)
+        return engine
+
+    monkeypatch.setattr(engine_store, "create_protocol_engine", _create_protocol_engine)
+    return engines
+
+
+async def _create_and_clear(
+    subject: EngineStore,
+    run_id: str,
+    deck_configuration: pe_types.DeckConfigurationType,
+    notify_publishers: Callable[[], None] = mock_notify_publishers,
+) -> ProtocolEngine:
+    await subject.create(
+        run_id=run_id,
+        labware_offsets=[],
+        deck_configuration=deck_configuration,
+        protocol=None,
+        notify_publishers=notify_publishers,
+    )
+    engine = subject.engine
+    await subject.clear()
+    return engine
+
+
+async def test_create_takes_spare_engine(
+    subject: EngineStore, created_engines: List[ProtocolEngine]
+) -> None:
+    """It should build the next run's engine ahead of time."""
+    first = await _create_and_clear(subject, "run-id-1", deck_configuration=[])
+    second = await _create_and_clear(subject, "run-id-2", deck_configuration=[])
+
+    assert created_engines[:2] == [first, second]
+
+
+async def test_create_discards_mismatched_spare_engine(
+    decoy: Decoy,
+    hardware_api: HardwareControlAPI,
+    subject: EngineStore,
+    created_engines: List[ProtocolEngine],
+) -> None:
+    """It should not reuse a spare engine built for a different deck configuration."""
+    await _create_and_clear(subject, "run-id-1", deck_configuration=[])
+    second = await _create_and_clear(
+        subject,
+        "run-id-2",
+        deck_configuration=[("cutout1", "singleStandardSlot", None)],
+    )
+
+    spare = created_engines[1]
+    assert second is created_engines[2]
+    # Discarding the spare shouldn't touch the hardware. Only the two runs'
+    # engines, which were cleared, should have halted it.
+    assert not spare.state_view.commands.get_is_stopped()
+    decoy.verify(
+        await hardware_api.halt(disengage_before_stopping=False),
+        times=2,
+    )
+
+
+async def test_clean_up_discards_spare_engine(subject: EngineStore) -> None:
+    """It should stop building the spare engine, and discard it, on shutdown."""
+    await _create_and_clear(subject, "run-id-1", deck_configuration=[])
+
+    await subject.clean_up()
+
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+async def test_spare_engine_notifies_its_run(
+    decoy: Decoy, subject: EngineStore
+) -> None:
+    """It should point a spare engine's notifications at the run that takes it."""
+    notify_publishers = decoy.mock(name="notify_publishers")
+
+    await _create_and_clear(subject, "run-id-1", deck_configuration=[])
+    await subject.create(
+        run_id="run-id-2",
+        labware_offsets=[],
+        deck_configuration=[],
+        protocol=None,
+        notify_publishers=notify_publishers,
+    )
+    subject.engine.play()
+
+    decoy.verify(notify_publishers(), ignore_extra_args=True)
+
+
+@pytest.mark.parametrize(
+    ("use_virtual_clock", "is_simulator", "expected_use_virtual_clock"),
+    [(True, True, True), (True, False, False), (False, True, False)],
+)
+async def test_create_engine_with_virtual_clock(
+    decoy: Decoy,
+    hardware_api: HardwareControlAPI,
+    use_virtual_clock: bool,
+    is_simulator: bool,
+    expected_use_virtual_clock: bool,
+) -> None:
+    """It should only give runs a virtual clock if the hardware is simulated."""
+    decoy.when(hardware_api.is_simulator).then_return(is_simulator)
+    subject = EngineStore(
+        hardware_api=hardware_api,
+        robot_type="OT-2 Standard",
+        deck_type=pe_types.DeckType.OT2_SHORT_TRASH,
+        use_virtual_clock=use_virtual_clock,
+    )
+
+    await subject.create(
+        run_id="run-id",
+        labware_offsets=[],
+        deck_configuration=[],
+        protocol=None,
+        notify_publishers=mock_notify_publishers,
+    )
+
+    assert (
+        subject.engine.state_view.config.use_virtual_clock is expected_use_virtual_clock
+    )
+    await subject.clean_up()
+
+
 async def test_get_default_engine_idempotent(subject: EngineStore) -> None:
     """It should create and retrieve the same default ProtocolEngine."""
     result = await subject.get_default_engine()
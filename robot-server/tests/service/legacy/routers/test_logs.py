@@ -3,7 +3,18 @@ import json
 import pytest
 from mock import patch
 
-from opentrons.system.log_control import MAX_RECORDS, DEFAULT_RECORDS
+from opentrons.system.log_control import MAX_RECORDS, DEFAULT_RECORDS, LogReadError
+
+
+def _stream(*chunks):
+    async def mock_stream_records(identifier, records, mode, cursor):
+        async def _chunks():
+            for chunk in chunks:
+                yield chunk
+
+        return _chunks()
+
+    return mock_stream_records
 
 
 def test_get_serial_log_with_defaults(api_client):
@@ -11,16 +22,13 @@ def test_get_serial_log_with_defaults(api_client):
     res_bytes = logs.encode("utf-8")
     expected = res_bytes.decode("utf-8")
 
-    async def mock_get_records_dumb(identifier, records, format_type):
-        return res_bytes
-
-    with patch("opentrons.system.log_control.get_records_dumb") as m:
-        m.side_effect = mock_get_records_dumb
+    with patch("opentrons.system.log_control.stream_records") as m:
+        m.side_effect = _stream(res_bytes)
         response = api_client.get("/logs/serial.log")
         body = response.text
         assert response.status_code == 200
         assert body == expected
-        m.assert_called_once_with("ALL_SERIAL", DEFAULT_RECORDS, "short-precise")
+        m.assert_called_once_with("ALL_SERIAL", DEFAULT_RECORDS, "short-precise", None)
 
 
 @pytest.mark.parametrize(
@@ -42,11 +50,8 @@ def test_get_serial_log_with_params(
     else:
         expected = logs
 
-    async def mock_get_records_dumb(identifier, records, mode):
-        return res_bytes
-
-    with patch("opentrons.system.log_control.get_records_dumb") as m:
-        m.side_effect = mock_get_records_dumb
+    with patch("opentrons.system.log_control.stream_records") as m:
+        m.side_effect = _stream(res_bytes)
         response = api_client.get(
             f"/logs/serial.log?format={format_param}&records={records_param}"
         )
@@ -57,7 +62,7 @@ def test_get_serial_log_with_params(
         assert body == expected
         assert response.status_code == 200
 
-        m.assert_called_once_with("ALL_SERIAL", records_param, mode_param)
+        m.assert_called_once_with("ALL_SERIAL", records_param, mode_param, None)
 
 
 @pytest.mark.parametrize(
@@ -68,11 +73,8 @@ def test_get_serial_log_with_invalid_params(api_client, format_param, records_pa
     logs = '{"serial": "serial logs"}'
     res_bytes = logs.encode("utf-8")
 
-    async def mock_get_records_dumb(identifier, records, format_type):
-        return res_bytes
-
-    with patch("opentrons.system.log_control.get_records_dumb") as m:
-        m.side_effect = mock_get_records_dumb
+    with patch("opentrons.system.log_control.stream_records") as m:
+        m.side_effect = _stream(res_bytes)
         response = api_client.get(
             f"/logs/serial.log?format={format_param}&records={records_param}"
         )
@@ -85,16 +87,15 @@ def test_get_api_log_with_defaults(api_client):
     res_bytes = logs.encode("utf-8")
     expected = res_bytes.decode("utf-8")
 
-    async def mock_get_records_dumb(identifier, records, format_type):
-        return res_bytes
-
-    with patch("opentrons.system.log_control.get_records_dumb") as m:
-        m.side_effect = mock_get_records_dumb
+    with patch("opentrons.system.log_control.stream_records") as m:
+        m.side_effect = _stream(res_bytes)
         response = api_client.get("/logs/api.log")
         body = response.text
         assert response.status_code == 200
         assert body == expected
-        m.assert_called_once_with("opentrons-api", DEFAULT_RECORDS, "short-precise")
+        m.assert_called_once_with(
+            "opentrons-api", DEFAULT_RECORDS, "short-precise", None
+        )
 
 
 @pytest.mark.parametrize(
@@ -114,11 +115,8 @@ def test_get_api_log_with_params(api_client, format_param, records_param, mode_p
     else:
         expected = logs
 
-    async def mock_get_records_dumb(identifier, records, format_type):
-        return res_bytes
-
-    with patch("opentrons.system.log_control.get_records_dumb") as m:
-        m.side_effect = mock_get_records_dumb
+    with patch("opentrons.system.log_control.stream_records") as m:
+        m.side_effect = _stream(res_bytes)
         response = api_client.get(
             f"/logs/api.log?format={format_param}&records={records_param}"
         )
@@ -128,7 +126,7 @@ def test_get_api_log_with_params(api_client, format_param, records_param, mode_p
             body = response.text
         assert response.status_code == 200
         assert body == expected
-        m.assert_called_once_with("opentrons-api", records_param, mode_param)
+        m.assert_called_once_with("opentrons-api", records_param, mode_param, None)
 
 
 @pytest.mark.parametrize(
@@ -148,11 +146,8 @@ def test_get_odd_log_with_params(api_client, format_param, records_param, mode_p
     else:
         expected = logs
 
-    async def mock_get_records_dumb(identifier, records, format_type):
-        return res_bytes
-
-    with patch("opentrons.system.log_control.get_records_dumb") as m:
-        m.side_effect = mock_get_records_dumb
+    with patch("opentrons.system.log_control.stream_records") as m:
+        m.side_effect = _stream(res_bytes)
         response = api_client.get(
             f"/logs/touchscreen.log?format={format_param}&records={records_param}"
         )
@@ -162,7 +157,9 @@ def test_get_odd_log_with_params(api_client, format_param, records_param, mode_p
             body = response.text
         assert response.status_code == 200
         assert body == expected
-        m.assert_called_once_with("opentrons-robot-app", records_param, mode_param)
+        m.assert_called_once_with(
+            "opentrons-robot-app", records_param, mode_param, None
+        )
 
 
 def test_get_odd_log_with_defaults(api_client):
@@ -170,17 +167,14 @@ def test_get_odd_log_with_defaults(api_client):
     res_bytes = logs.encode("utf-8")
     expected = res_bytes.decode("utf-8")
 
-    async def mock_get_records_dumb(identifier, records, format_type):
-        return res_bytes
-
-    with patch("opentrons.system.log_control.get_records_dumb") as m:
-        m.side_effect = mock_get_records_dumb
+    with patch("opentrons.system.log_control.stream_records") as m:
+        m.side_effect = _stream(res_bytes)
         response = api_client.get("/logs/touchscreen.log")
         body = response.text
         assert response.status_code == 200
         assert body == expected
         m.assert_called_once_with(
-            "opentrons-robot-app", DEFAULT_RECORDS, "short-precise"
+            "opentrons-robot-app", DEFAULT_RECORDS, "short-precise", None
         )
 
 
@@ -192,13 +186,39 @@ def test_get_api_log_with_invalid_params(api_client, format_param, records_param
     logs = '{"api": "application programing interface logs"}'
     res_bytes = logs.encode("utf-8")
 
-    async def mock_get_records_dumb(identifier, records, format_type):
-        return res_bytes
-
-    with patch("opentrons.system.log_control.get_records_dumb") as m:
-        m.side_effect = mock_get_records_dumb
+    with patch("opentrons.system.log_control.stream_records") as m:
+        m.side_effect = _stream(res_bytes)
         response = api_client.get(
             f"/logs/api.log?format={format_param}&records={records_param}"
         )
         assert response.status_code == 422
         m.assert_not_called()
+
+
+def test_get_log_after_cursor(api_client):
+    chunks = [b"-- Logs begin\n", b"new records\n", b"-- cursor: s=2;i=9\n"]
+
+    with patch("opentrons.system.log_control.stream_records") as m:
+        m.side_effect = _stream(*chunks)
+        response = api_client.get("/logs/api.log?cursor=s=1;i=4")
+        assert response.status_code == 200
+        assert response.content == b"".join(chunks)
+        m.assert_called_once_with(
+            "opentrons-api", DEFAULT_RECORDS, "short-precise", "s=1;i=4"
+        )
+
+
+def test_get_log_invalid_cursor(api_client):
+    with patch("opentrons.system.log_control.stream_records") as m:
+        m.side_effect = _stream(b"")
+        response = api_client.get("/logs/api.log?cursor=not a cursor")
+        assert response.status_code == 422
+        m.assert_not_called()
+
+
+def test_get_log_journalctl_error(api_client):
+    with patch("opentrons.system.log_control.stream_records") as m:
+        m.side_effect = LogReadError("Failed to seek to cursor: Invalid argument")
+        response = api_client.get("/logs/api.log?cursor=s=1;i=4")
+        assert response.status_code == 500
+        assert "Failed to seek to cursor" in response.json()["message"]
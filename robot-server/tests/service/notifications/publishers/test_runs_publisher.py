@@ -1,9 +1,17 @@
 """Tests for runs publisher."""
+import asyncio
+import time
 import pytest
 from datetime import datetime
 from unittest.mock import MagicMock, AsyncMock
 
-from robot_server.service.notifications import RunsPublisher, Topics
+from robot_server.service.notifications import (
+    NotifyRunStateBody,
+    RunStateCommandSummary,
+    RunsPublisher,
+    Topics,
+    get_run_state_topic,
+)
 from opentrons.protocol_engine import CurrentCommand, EngineStatus
 
 
@@ -33,9 +41,11 @@ def publisher_notifier() -> AsyncMock:
 async def runs_publisher(
     notification_client: AsyncMock, publisher_notifier: AsyncMock
 ) -> RunsPublisher:
-    """Instantiate RunsPublisher."""
+    """Instantiate RunsPublisher, without coalescing publishes."""
     return RunsPublisher(
-        client=notification_client, publisher_notifier=publisher_notifier
+        client=notification_client,
+        publisher_notifier=publisher_notifier,
+        publish_interval=0,
     )
 
 
@@ -45,18 +55,22 @@ async def test_initialize(
 ) -> None:
     """It should initialize the runs_publisher with required parameters and callbacks."""
     run_id = "1234"
-    get_current_command = AsyncMock()
-    get_state_summary = AsyncMock()
+    get_current_command = MagicMock()
+    get_run_status = MagicMock()
+    get_command_count = MagicMock()
 
-    await runs_publisher.initialize(run_id, get_current_command, get_state_summary)
+    await runs_publisher.initialize(
+        run_id, get_current_command, get_run_status, get_command_count
+    )
 
     assert runs_publisher._run_hooks
     assert runs_publisher._run_hooks.run_id == run_id
     assert runs_publisher._run_hooks.get_current_command == get_current_command
-    assert runs_publisher._run_hooks.get_state_summary == get_state_summary
+    assert runs_publisher._run_hooks.get_run_status == get_run_status
+    assert runs_publisher._run_hooks.get_command_count == get_command_count
     assert runs_publisher._engine_state_slice
     assert runs_publisher._engine_state_slice.current_command is None
-    assert runs_publisher._engine_state_slice.state_summary_status is None
+    assert runs_publisher._engine_state_slice.run_status is None
 
     notification_client.publish_advise_refetch_async.assert_any_await(topic=Topics.RUNS)
     notification_client.publish_advise_refetch_async.assert_any_await(
@@ -69,7 +83,7 @@ async def test_clean_up_current_run(
     runs_publisher: RunsPublisher, notification_client: AsyncMock
 ) -> None:
     """It should publish to appropriate topics at the end of a run."""
-    await runs_publisher.initialize("1234", AsyncMock(), AsyncMock())
+    await runs_publisher.initialize("1234", MagicMock(), MagicMock(), MagicMock())
 
     await runs_publisher.clean_up_current_run()
 
@@ -88,7 +102,7 @@ async def test_handle_current_command_change(
 ) -> None:
     """It should handle command changes appropriately."""
     await runs_publisher.initialize(
-        "1234", lambda _: mock_curent_command("command1"), AsyncMock()
+        "1234", lambda _: mock_curent_command("command1"), MagicMock(), MagicMock()
     )
 
     assert runs_publisher._run_hooks
@@ -117,25 +131,21 @@ async def test_handle_engine_status_change(
 ) -> None:
     """It should handle engine status changes appropriately."""
     await runs_publisher.initialize(
-        "1234", lambda _: mock_curent_command("command1"), AsyncMock()
+        "1234", lambda _: mock_curent_command("command1"), MagicMock(), MagicMock()
     )
 
     assert runs_publisher._run_hooks
     assert runs_publisher._engine_state_slice
 
     runs_publisher._run_hooks.run_id = "1234"
-    runs_publisher._run_hooks.get_state_summary = MagicMock(
-        return_value=MagicMock(status=EngineStatus.IDLE)
-    )
-    runs_publisher._engine_state_slice.state_summary_status = EngineStatus.IDLE
+    runs_publisher._run_hooks.get_run_status = MagicMock(return_value=EngineStatus.IDLE)
+    runs_publisher._engine_state_slice.run_status = EngineStatus.IDLE
 
     await runs_publisher._handle_engine_status_change()
 
     assert notification_client.publish_advise_refetch_async.call_count == 2
 
-    runs_publisher._run_hooks.get_state_summary.return_value = MagicMock(
-        status=EngineStatus.RUNNING
-    )
+    runs_publisher._run_hooks.get_run_status.return_value = EngineStatus.RUNNING
 
     await runs_publisher._handle_engine_status_change()
 
@@ -143,3 +153,237 @@ async def test_handle_engine_status_change(
     notification_client.publish_advise_refetch_async.assert_any_await(
         topic=f"{Topics.RUNS}/1234"
     )
+
+
+@pytest.mark.asyncio
+async def test_publish_run_state(
+    runs_publisher: RunsPublisher, notification_client: AsyncMock
+) -> None:
+    """It should push the run's state to its state topic when the run changes."""
+    await runs_publisher.initialize(
+        "1234",
+        MagicMock(return_value=None),
+        MagicMock(return_value=EngineStatus.IDLE),
+        MagicMock(return_value=0),
+    )
+
+    notification_client.publish_message_async.assert_awaited_once_with(
+        topic=get_run_state_topic("1234"),
+        message=NotifyRunStateBody(
+            runId="1234", status=EngineStatus.IDLE, commandCount=0
+        ),
+    )
+
+    assert runs_publisher._run_hooks
+    runs_publisher._run_hooks.get_current_command = MagicMock(
+        return_value=mock_curent_command("command1")
+    )
+    runs_publisher._run_hooks.get_run_status = MagicMock(
+        return_value=EngineStatus.RUNNING
+    )
+    runs_publisher._run_hooks.get_command_count = MagicMock(return_value=3)
+
+    await runs_publisher._handle_current_command_change()
+
+    notification_client.publish_message_async.assert_awaited_with(
+        topic=get_run_state_topic("1234"),
+        message=NotifyRunStateBody(
+            runId="1234",
+            status=EngineStatus.RUNNING,
+            currentCommand=RunStateCommandSummary(
+                id="command1",
+                key="1",
+                createdAt=datetime(year=2021, month=1, day=1),
+                index=0,
+            ),
+            commandCount=3,
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_publish_run_state_without_status(
+    runs_publisher: RunsPublisher, notification_client: AsyncMock
+) -> None:
+    """It should not push the run's state if the run's status isn't available."""
+    await runs_publisher.initialize(
+        "1234",
+        MagicMock(return_value=None),
+        MagicMock(return_value=None),
+        MagicMock(return_value=None),
+    )
+
+    notification_client.publish_message_async.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_coalesced_run_state_is_latest(
+    notification_client: AsyncMock, publisher_notifier: AsyncMock
+) -> None:
+    """A held-back run state push should carry the state at the time it's sent."""
+    subject = RunsPublisher(
+        client=notification_client,
+        publisher_notifier=publisher_notifier,
+        publish_interval=0.05,
+    )
+    await subject.initialize(
+        "1234",
+        MagicMock(return_value=None),
+        MagicMock(return_value=EngineStatus.RUNNING),
+        MagicMock(return_value=0),
+    )
+
+    for index in range(3):
+        assert subject._run_hooks
+        subject._run_hooks.get_current_command = MagicMock(
+            return_value=mock_curent_command(f"command{index}")
+        )
+        subject._run_hooks.get_command_count = MagicMock(return_value=index + 1)
+        await subject._handle_current_command_change()
+
+    await asyncio.sleep(0.1)
+
+    assert notification_client.publish_message_async.await_count == 2
+    message = notification_client.publish_message_async.await_args.kwargs["message"]
+    assert message.currentCommand.id == "command2"
+    assert message.commandCount == 3
+
+
+@pytest.mark.asyncio
+async def test_coalesce_publishes(
+    notification_client: AsyncMock, publisher_notifier: AsyncMock
+) -> None:
+    """It should publish at most once per topic per publish interval."""
+    subject = RunsPublisher(
+        client=notification_client,
+        publisher_notifier=publisher_notifier,
+        publish_interval=0.05,
+    )
+    await subject.initialize("1234", MagicMock(), MagicMock(), MagicMock())
+    notification_client.publish_advise_refetch_async.reset_mock()
+
+    for command_id in ["command1", "command2", "command3"]:
+        assert subject._run_hooks
+        subject._run_hooks.get_current_command = MagicMock(
+            return_value=mock_curent_command(command_id)
+        )
+        await subject._handle_current_command_change()
+
+    # The first change is published right away, and the rest are held back.
+    assert notification_client.publish_advise_refetch_async.await_count == 1
+
+    await asyncio.sleep(0.1)
+
+    # The held-back changes are published together at the end of the interval.
+    assert notification_client.publish_advise_refetch_async.await_count == 2
+    notification_client.publish_advise_refetch_async.assert_awaited_with(
+        topic=Topics.RUNS_CURRENT_COMMAND
+    )
+
+
+@pytest.mark.asyncio
+async def test_clean_up_flushes_pending_publishes(
+    notification_client: AsyncMock, publisher_notifier: AsyncMock
+) -> None:
+    """It should publish held-back refetch flags before unsubscribing."""
+    subject = RunsPublisher(
+        client=notification_client,
+        publisher_notifier=publisher_notifier,
+        publish_interval=60,
+    )
+    await subject.initialize(
+        "1234",
+        MagicMock(return_value=mock_curent_command("command1")),
+        MagicMock(),
+        MagicMock(),
+    )
+    await subject._handle_current_command_change()
+    assert subject._run_hooks
+    subject._run_hooks.get_current_command = MagicMock(
+        return_value=mock_curent_command("command2")
+    )
+    await subject._handle_current_command_change()
+    notification_client.publish_advise_refetch_async.reset_mock()
+
+    await subject.clean_up_current_run()
+
+    notification_client.publish_advise_refetch_async.assert_any_await(
+        topic=Topics.RUNS_CURRENT_COMMAND
+    )
+    notification_client.publish_advise_refetch_async.assert_any_await(
+        topic=f"{Topics.RUNS}/1234"
+    )
+    notification_client.publish_advise_unsubscribe_async.assert_any_await(
+        topic=f"{Topics.RUNS}/1234"
+    )
+    notification_client.publish_advise_unsubscribe_async.assert_any_await(
+        topic=get_run_state_topic("1234")
+    )
+
+
+@pytest.mark.asyncio
+async def test_clean_up_cancels_pending_publishes(
+    notification_client: AsyncMock, publisher_notifier: AsyncMock
+) -> None:
+    """It should drop held-back publishes when the server shuts down."""
+    subject = RunsPublisher(
+        client=notification_client,
+        publisher_notifier=publisher_notifier,
+        publish_interval=60,
+    )
+    await subject.initialize(
+        "1234",
+        MagicMock(return_value=mock_curent_command("command1")),
+        MagicMock(),
+        MagicMock(),
+    )
+    await subject._handle_current_command_change()
+    assert subject._run_hooks
+    subject._run_hooks.get_current_command = MagicMock(
+        return_value=mock_curent_command("command2")
+    )
+    await subject._handle_current_command_change()
+    pending_tasks = [
+        pending_publish.task for pending_publish in subject._pending_publishes.values()
+    ]
+    assert pending_tasks
+    notification_client.publish_advise_refetch_async.reset_mock()
+
+    await subject.clean_up()
+
+    assert all(task.cancelled() for task in pending_tasks)
+    notification_client.publish_advise_refetch_async.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_publishing_benchmark(
+    notification_client: AsyncMock, publisher_notifier: AsyncMock
+) -> None:
+    """Publishing should stay cheap over a 10,000 command run."""
+    command_count = 10_000
+    subject = RunsPublisher(
+        client=notification_client, publisher_notifier=publisher_notifier
+    )
+    current_command = mock_curent_command("command0")
+    await subject.initialize(
+        "1234",
+        lambda _: current_command,
+        lambda _: EngineStatus.RUNNING,
+        lambda _: command_count,
+    )
+
+    start = time.process_time()
+    for index in range(command_count):
+        current_command = mock_curent_command(f"command{index}")
+        await subject._handle_current_command_change()
+        await subject._handle_engine_status_change()
+    cpu_time = time.process_time() - start
+    await subject.clean_up_current_run()
+
+    # Every state change is checked, but the burst collapses into a handful
+    # of publishes per topic.
+    assert notification_client.publish_advise_refetch_async.await_count < 10
+    assert notification_client.publish_message_async.await_count < 10
+    # This is loose on purpose; it's here to catch per-change work creeping back
+    # in, like building a state summary on every change.
+    assert cpu_time / command_count < 0.001
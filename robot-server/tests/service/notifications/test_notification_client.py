@@ -0,0 +1,126 @@
+"""Tests for the notification client."""
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import paho.mqtt.client as mqtt
+import pytest
+from unittest.mock import MagicMock
+
+from opentrons.protocol_engine import CurrentCommand, EngineStatus
+
+from robot_server.service.notifications import (
+    NotificationClient,
+    NotifyRunStateBody,
+    RunsPublisher,
+    Topics,
+    get_run_state_topic,
+)
+
+
+class _FakeBroker:
+    """A local stand-in for the MQTT broker.
+
+    It records everything published to it, in order, and plays the part of the
+    paho client that `NotificationClient` wraps.
+    """
+
+    def __init__(self) -> None:
+        self.published: List[Tuple[str, Dict[str, Any]]] = []
+
+    def client(self, *args: Any, **kwargs: Any) -> MagicMock:
+        fake_client = MagicMock()
+        fake_client.publish.side_effect = self._publish
+        return fake_client
+
+    def _publish(self, topic: str, payload: str, qos: int, retain: bool) -> None:
+        self.published.append((topic, json.loads(payload)))
+
+    def received(self, topic: str) -> List[Dict[str, Any]]:
+        """Get every payload that a subscriber to `topic` would have received."""
+        return [payload for t, payload in self.published if t == topic]
+
+
+@pytest.fixture
+def broker(monkeypatch: pytest.MonkeyPatch) -> _FakeBroker:
+    """Route the notification client's publishes to a fake broker."""
+    fake_broker = _FakeBroker()
+    monkeypatch.setattr(mqtt, "Client", fake_broker.client)
+    return fake_broker
+
+
+async def test_publish_advise_refetch(broker: _FakeBroker) -> None:
+    """It should publish a refetch flag."""
+    subject = NotificationClient()
+
+    await subject.publish_advise_refetch_async(topic=Topics.RUNS)
+
+    assert broker.received(Topics.RUNS) == [{"refetch": True}]
+
+
+async def test_publish_message(broker: _FakeBroker) -> None:
+    """It should publish a message's data, omitting unset fields."""
+    subject = NotificationClient()
+
+    await subject.publish_message_async(
+        topic="robot-server/runs/run-id/state",
+        message=NotifyRunStateBody(
+            runId="run-id", status=EngineStatus.RUNNING, commandCount=2
+        ),
+    )
+
+    assert broker.received("robot-server/runs/run-id/state") == [
+        {"runId": "run-id", "status": "running", "commandCount": 2}
+    ]
+
+
+async def test_run_state_subscriber_needs_no_refetch(broker: _FakeBroker) -> None:
+    """A run state subscriber should be able to follow a run from payloads alone."""
+    commands: List[CurrentCommand] = []
+    status = EngineStatus.IDLE
+
+    def get_current_command(run_id: str) -> Optional[CurrentCommand]:
+        return commands[-1] if commands else None
+
+    def get_run_status(run_id: str) -> EngineStatus:
+        return status
+
+    def get_command_count(run_id: str) -> int:
+        return len(commands)
+
+    subject = RunsPublisher(
+        client=NotificationClient(),
+        publisher_notifier=MagicMock(),
+        publish_interval=0,
+    )
+    await subject.initialize(
+        "run-id", get_current_command, get_run_status, get_command_count
+    )
+
+    status = EngineStatus.RUNNING
+    for index in range(3):
+        commands.append(
+            CurrentCommand(
+                command_id=f"command-{index}",
+                command_key=f"key-{index}",
+                created_at=datetime(year=2024, month=1, day=1),
+                index=index,
+            )
+        )
+        await subject._handle_current_command_change()
+    status = EngineStatus.SUCCEEDED
+    await subject._handle_engine_status_change()
+    await subject.clean_up_current_run()
+
+    run_states = [
+        payload
+        for payload in broker.received(get_run_state_topic("run-id"))
+        if "unsubscribe" not in payload
+    ]
+    assert run_states[0] == {"runId": "run-id", "status": "idle", "commandCount": 0}
+    latest = NotifyRunStateBody.parse_obj(run_states[-1])
+    assert latest.status == EngineStatus.SUCCEEDED
+    assert latest.commandCount == 3
+    assert latest.currentCommand is not None
+    assert latest.currentCommand.id == "command-2"
+    assert broker.received(get_run_state_topic("run-id"))[-1] == {"unsubscribe": True}
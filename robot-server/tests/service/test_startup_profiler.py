@@ -0,0 +1,85 @@
+"""Tests for robot_server.service.startup_profiler."""
+from typing import List
+
+import pytest
+
+from server_utils.fastapi_utils.app_state import AppState
+
+from robot_server.service.startup_profiler import (
+    StartupPhaseTiming,
+    StartupProfiler,
+    get_startup_profiler,
+    initialize_startup_profiler,
+    startup_phase,
+)
+
+
+class _FakeClock:
+    def __init__(self, times: List[float]) -> None:
+        self._times = iter(times)
+
+    def __call__(self) -> float:
+        return next(self._times)
+
+
+def test_phases_are_timed_relative_to_startup() -> None:
+    """It should time phases relative to profiler creation, in start order."""
+    subject = StartupProfiler(clock=_FakeClock([10.0, 11.0, 12.0, 14.0, 17.0]))
+
+    with subject.phase("first"):
+        with subject.phase("second"):
+            pass
+
+    assert subject.get_phases() == [
+        StartupPhaseTiming(name="first", start=1.0, duration=6.0, succeeded=True),
+        StartupPhaseTiming(name="second", start=2.0, duration=2.0, succeeded=True),
+    ]
+
+
+def test_phase_in_progress() -> None:
+    """It should report a phase that hasn't finished yet."""
+    subject = StartupProfiler(clock=_FakeClock([0.0, 1.0, 3.0]))
+
+    with subject.phase("ongoing"):
+        assert subject.get_phases() == [
+            StartupPhaseTiming(name="ongoing", start=1.0, duration=None, succeeded=None)
+        ]
+
+
+def test_phase_failure() -> None:
+    """It should mark a phase as failed if it raises, and propagate the error."""
+    subject = StartupProfiler(clock=_FakeClock([0.0, 1.0, 3.0]))
+
+    with pytest.raises(RuntimeError, match="oh no"):
+        with subject.phase("failing"):
+            raise RuntimeError("oh no")
+
+    assert subject.get_phases() == [
+        StartupPhaseTiming(name="failing", start=1.0, duration=2.0, succeeded=False)
+    ]
+
+
+async def test_startup_phase_without_profiler() -> None:
+    """It should run the block untimed if startup isn't being profiled."""
+    app_state = AppState()
+    ran = False
+
+    with startup_phase(app_state, "untimed"):
+        ran = True
+
+    assert ran
+    assert await get_startup_profiler(app_state) is None
+
+
+async def test_startup_phase_with_profiler() -> None:
+    """It should record phases to the profiler stored on the app state."""
+    app_state = AppState()
+    initialize_startup_profiler(app_state)
+
+    with startup_phase(app_state, "timed"):
+        pass
+
+    profiler = await get_startup_profiler(app_state)
+    assert profiler is not None
+    assert [phase.name for phase in profiler.get_phases()] == ["timed"]
+    assert profiler.get_phases()[0].succeeded is True
@@ -3,7 +3,7 @@ import pytest
 from mock import MagicMock, patch
 from fastapi import status
 from fastapi.testclient import TestClient
-from typing import Iterator
+from typing import AsyncIterator, Iterator
 
 from robot_server.versioning import API_VERSION_HEADER, API_VERSION
 
@@ -11,8 +11,15 @@ from robot_server.versioning import API_VERSION_HEADER, API_VERSION
 @pytest.fixture
 def mock_log_control() -> Iterator[MagicMock]:
     """Patch out the log retrieval logic."""
-    with patch("opentrons.system.log_control.get_records_dumb") as p:
-        p.return_value = b""
+
+    async def _stream_records(*args: object) -> AsyncIterator[bytes]:
+        async def _chunks() -> AsyncIterator[bytes]:
+            yield b""
+
+        return _chunks()
+
+    with patch("opentrons.system.log_control.stream_records") as p:
+        p.side_effect = _stream_records
         yield p
 
 
@@ -6,6 +6,7 @@ export type PipettingRunTimeCommand =
   | AspirateRunTimeCommand
   | BlowoutInPlaceRunTimeCommand
   | BlowoutRunTimeCommand
+  | BulkLiquidHandlingRunTimeCommand
   | ConfigureForVolumeRunTimeCommand
   | DispenseInPlaceRunTimeCommand
   | DispenseRunTimeCommand
@@ -22,6 +23,7 @@ export type PipettingCreateCommand =
   | AspirateCreateCommand
   | AspirateInPlaceCreateCommand
   | BlowoutCreateCommand
+  | BulkLiquidHandlingCreateCommand
   | BlowoutInPlaceCreateCommand
   | ConfigureForVolumeCreateCommand
   | DispenseCreateCommand
@@ -110,6 +112,17 @@ export interface BlowoutInPlaceRunTimeCommand
   result?: BasicLiquidHandlingResult
 }
 
+export interface BulkLiquidHandlingCreateCommand
+  extends CommonCommandCreateInfo {
+  commandType: 'bulkLiquidHandling'
+  params: BulkLiquidHandlingParams
+}
+export interface BulkLiquidHandlingRunTimeCommand
+  extends CommonCommandRunTimeInfo,
+    BulkLiquidHandlingCreateCommand {
+  result?: BulkLiquidHandlingResult
+}
+
 export interface TouchTipCreateCommand extends CommonCommandCreateInfo {
   commandType: 'touchTip'
   params: TouchTipParams
@@ -249,6 +262,16 @@ export interface AspirateInPlaceParams {
   volume: number
   flowRate: number // µL/s
 }
+export type BulkLiquidHandlingStep =
+  | (Omit<AspDispAirgapParams, 'pipetteId'> & { stepType: 'aspirate' })
+  | (Omit<DispenseParams, 'pipetteId'> & { stepType: 'dispense' })
+  | (Omit<BlowoutParams, 'pipetteId'> & { stepType: 'blowout' })
+
+export interface BulkLiquidHandlingParams {
+  pipetteId: string
+  steps: BulkLiquidHandlingStep[]
+}
+
 interface FlowRateParams {
   flowRate: number // µL/s
 }
@@ -288,6 +311,12 @@ interface BasicLiquidHandlingResult {
   volume: number // Amount of liquid in uL handled in the operation
 }
 
+interface BulkLiquidHandlingResult {
+  position: { x: number; y: number; z: number }
+  // volume is omitted for blowout steps
+  steps: Array<{ volume?: number }>
+}
+
 interface TipPresenceResult {
   // ot2 should alwasy return unknown
   status?: 'present' | 'absent' | 'unknown'
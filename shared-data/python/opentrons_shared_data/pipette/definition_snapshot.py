@@ -0,0 +1,52 @@
+"""A single-file snapshot of the version 2 pipette definition files.
+
+The version 2 pipette definitions are split across hundreds of small JSON files,
+one per config type, channel count, model, version and liquid class. Reading them
+one at a time is slow on the robot's filesystem, so packaging bundles them into
+one snapshot file that can be loaded with a single read.
+
+This module only depends on the standard library, so that it can be loaded by
+setup.py at build time, before the package's dependencies are installed.
+"""
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+DEFINITIONS_PATH = Path("pipette") / "definitions" / "2"
+"""The version 2 pipette definitions, relative to the shared data root."""
+
+SNAPSHOT_PATH = Path("pipette") / "definitions" / "2.snapshot.json"
+"""The snapshot of `DEFINITIONS_PATH`, relative to the shared data root."""
+
+PipetteDefinitionSnapshot = Dict[str, Dict[str, Any]]
+"""Parsed definition files, keyed by `snapshot_key`."""
+
+
+def snapshot_key(relative_path: Path) -> str:
+    """Get the snapshot key for a definition file.
+
+    Args:
+        relative_path: The path to the definition file, relative to
+            `DEFINITIONS_PATH`. For example, `general/single_channel/p50/3_5.json`.
+    """
+    return relative_path.with_suffix("").as_posix()
+
+
+def build_snapshot(shared_data_root: Path) -> PipetteDefinitionSnapshot:
+    """Read every version 2 pipette definition file under `shared_data_root`."""
+    definitions_root = shared_data_root / DEFINITIONS_PATH
+    return {
+        snapshot_key(path.relative_to(definitions_root)): json.loads(
+            path.read_text(encoding="utf-8")
+        )
+        for path in sorted(definitions_root.glob("**/*.json"))
+    }
+
+
+def write_snapshot(shared_data_root: Path, target: Path) -> None:
+    """Build a snapshot of the definitions under `shared_data_root` into `target`."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(
+        json.dumps(build_snapshot(shared_data_root), separators=(",", ":")),
+        encoding="utf-8",
+    )
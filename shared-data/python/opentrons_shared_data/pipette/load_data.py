@@ -1,5 +1,6 @@
 import json
 import os
+from pathlib import Path
 
 from typing import Dict, Any, Union, Optional, List
 from typing_extensions import Literal
@@ -7,6 +8,12 @@ from functools import lru_cache
 
 from .. import load_shared_data, get_shared_data_root
 
+from .definition_snapshot import (
+    DEFINITIONS_PATH,
+    SNAPSHOT_PATH,
+    PipetteDefinitionSnapshot,
+    snapshot_key,
+)
 from .pipette_definition import (
     PipetteConfigurations,
     PipetteLiquidPropertiesDefinition,
@@ -26,6 +33,23 @@ from .types import (
 LoadedConfiguration = Dict[str, Union[str, Dict[str, Any]]]
 
 
+@lru_cache(maxsize=1)
+def _load_snapshot() -> Optional[PipetteDefinitionSnapshot]:
+    """Load the packaged definition snapshot, if there is one.
+
+    Packaged builds include a snapshot of every definition file, which is much
+    faster to load than the files themselves. Running from a source checkout,
+    there's no snapshot, and definitions are read file by file.
+    """
+    try:
+        snapshot: PipetteDefinitionSnapshot = json.loads(
+            load_shared_data(SNAPSHOT_PATH)
+        )
+    except FileNotFoundError:
+        return None
+    return snapshot
+
+
 def _get_configuration_dictionary(
     config_type: Literal["general", "geometry", "liquid"],
     channels: PipetteChannelType,
@@ -35,11 +59,7 @@ def _get_configuration_dictionary(
 ) -> LoadedConfiguration:
     if liquid_class:
         config_path = (
-            get_shared_data_root()
-            / "pipette"
-            / "definitions"
-            / "2"
-            / config_type
+            Path(config_type)
             / channels.name.lower()
             / model.value
             / liquid_class.name
@@ -47,16 +67,18 @@ def _get_configuration_dictionary(
         )
     else:
         config_path = (
-            get_shared_data_root()
-            / "pipette"
-            / "definitions"
-            / "2"
-            / config_type
+            Path(config_type)
             / channels.name.lower()
             / model.value
             / f"{version.major}_{version.minor}.json"
         )
-    return json.loads(load_shared_data(config_path))
+
+    snapshot = _load_snapshot()
+    if snapshot is not None and snapshot_key(config_path) in snapshot:
+        return snapshot[snapshot_key(config_path)]
+    return json.loads(
+        load_shared_data(get_shared_data_root() / DEFINITIONS_PATH / config_path)
+    )
 
 
 @lru_cache(maxsize=None)
@@ -1,8 +1,10 @@
+import importlib.util
 import json
 import os
 import sys
 
 from pathlib import Path
+from types import ModuleType
 from typing import List
 
 from setuptools.command import build_py, sdist
@@ -50,6 +52,34 @@ def get_shared_data_files() -> List[Path]:
     return to_include
 
 
+def _load_definition_snapshot_module() -> ModuleType:
+    # Load the module straight from its file, because importing it through the
+    # package would need the package's dependencies, which aren't installed yet.
+    module_path = (
+        Path(HERE) / "opentrons_shared_data" / "pipette" / "definition_snapshot.py"
+    )
+    spec = importlib.util.spec_from_file_location("definition_snapshot", module_path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _write_pipette_definition_snapshot(cmd, data_dir: Path) -> None:
+    """Bundle the pipette definitions into a single file, for faster loading."""
+    definition_snapshot = _load_definition_snapshot_module()
+    if not (Path(DATA_ROOT) / definition_snapshot.DEFINITIONS_PATH).is_dir():
+        # Building from an sdist, which already contains the snapshot.
+        return
+    target = data_dir / definition_snapshot.SNAPSHOT_PATH
+    cmd.mkpath(str(target.parent))
+    cmd.execute(
+        definition_snapshot.write_snapshot,
+        args=(Path(DATA_ROOT), target),
+        msg=f"writing pipette definition snapshot -> {target}",
+    )
+
+
 def _minimize_and_write_json(data_file: Path, target_file: Path) -> None:
     contents = json.dumps(
         json.loads(data_file.read_text(encoding="utf-8")),
@@ -74,6 +104,9 @@ class SDistWithData(sdist.sdist):
                 args=(data_file, target_file),
                 msg=f"copying and minimizing {data_file} -> {target_file}",
             )
+        _write_pipette_definition_snapshot(
+            self, Path(base_dir) / "opentrons_shared_data" / DEST_BASE_PATH
+        )
 
         super().make_release_tree(base_dir, files)
 
@@ -103,6 +136,12 @@ class BuildWithData(build_py.build_py):
         )
         return files
 
+    def run(self) -> None:
+        super().run()
+        _write_pipette_definition_snapshot(
+            self, Path(self.build_lib) / "opentrons_shared_data" / DEST_BASE_PATH
+        )
+
 
 def get_version():
     buildno = os.getenv("BUILD_NUMBER")
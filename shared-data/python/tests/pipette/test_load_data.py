@@ -1,6 +1,10 @@
+import json
 import pytest
-from typing import Dict, Any, cast
+from pathlib import Path
+from typing import Dict, Any, Iterator, cast
+from opentrons_shared_data import get_shared_data_root
 from opentrons_shared_data.pipette import (
+    definition_snapshot,
     load_data,
     pipette_load_name_conversions,
     dev_types,
@@ -101,3 +105,71 @@ def test_update_pipette_configuration(
             assert (
                 updated_configurations_dict["liquid_properties"][liquid_class][k] == v
             )
+
+
+@pytest.fixture
+def clear_definition_caches() -> Iterator[None]:
+    """Make sure definitions loaded in a test aren't reused by other tests."""
+    # Grab these before tests get a chance to monkeypatch them.
+    load_snapshot = load_data._load_snapshot
+    geometry = load_data._geometry
+    liquid = load_data._liquid
+    physical = load_data._physical
+
+    def _clear() -> None:
+        load_snapshot.cache_clear()
+        geometry.cache_clear()
+        liquid.cache_clear()
+        physical.cache_clear()
+
+    _clear()
+    yield
+    _clear()
+
+
+def test_build_definition_snapshot(tmp_path: Path) -> None:
+    """The snapshot should contain every definition file, as-is."""
+    target = tmp_path / definition_snapshot.SNAPSHOT_PATH
+    definition_snapshot.write_snapshot(get_shared_data_root(), target)
+    snapshot = json.loads(target.read_text())
+
+    definitions_root = get_shared_data_root() / definition_snapshot.DEFINITIONS_PATH
+    definition_files = list(definitions_root.glob("**/*.json"))
+    assert len(snapshot) == len(definition_files)
+    for definition_file in definition_files:
+        key = definition_snapshot.snapshot_key(
+            definition_file.relative_to(definitions_root)
+        )
+        assert snapshot[key] == json.loads(definition_file.read_text())
+
+
+def test_load_definition_from_snapshot(
+    monkeypatch: pytest.MonkeyPatch, clear_definition_caches: None
+) -> None:
+    """Definitions should be read from the snapshot when there is one."""
+    snapshot = definition_snapshot.build_snapshot(get_shared_data_root())
+    snapshot["geometry/single_channel/p50/3_3"]["nozzleOffset"] = [1.0, 2.0, 3.0]
+    monkeypatch.setattr(load_data, "_load_snapshot", lambda: snapshot)
+
+    definition = load_data.load_definition(
+        PipetteModelType.p50,
+        PipetteChannelType.SINGLE_CHANNEL,
+        PipetteVersionType(major=3, minor=3),
+    )
+
+    assert definition.nozzle_offset == [1.0, 2.0, 3.0]
+
+
+def test_load_definition_without_snapshot(
+    monkeypatch: pytest.MonkeyPatch, clear_definition_caches: None
+) -> None:
+    """Definitions should be read file by file when there's no snapshot."""
+    monkeypatch.setattr(load_data, "_load_snapshot", lambda: None)
+
+    definition = load_data.load_definition(
+        PipetteModelType.p50,
+        PipetteChannelType.SINGLE_CHANNEL,
+        PipetteVersionType(major=3, minor=3),
+    )
+
+    assert definition.nozzle_offset == [-8.0, -22.0, -259.15]